@@ -0,0 +1,222 @@
+"""
+Command line interface of the performance benchmarks.
+
+Run the benchmarks and store the results:
+
+    python performance/perf.py run --output performance/results/baseline.json
+
+Compare two sets of results, the command fails if any benchmark got slower than the threshold:
+
+    python performance/perf.py compare performance/results/baseline.json performance/results/new.json
+"""
+
+from __future__ import annotations
+import argparse
+import datetime
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import suite
+import metaheuristic_designer as mhd
+from metaheuristic_designer.utils import NumpyEncoder
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "latest.json")
+
+
+def _git_commit():
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, cwd=os.path.dirname(__file__), timeout=10)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _metadata(args):
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        package_version = version("metaheuristic-designer")
+    except PackageNotFoundError:
+        package_version = None
+
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "package_version": package_version,
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "kernel_backends": mhd.kernel_backends(),
+        "settings": {
+            "pop_sizes": args.pop_sizes,
+            "dims": args.dims,
+            "generations": args.generations,
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+        },
+    }
+
+
+def _summarize(runs):
+    """
+    Keeps the median of each measurement among the repetitions of a benchmark.
+    """
+
+    summary = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+    summary["repeat"] = len(runs)
+    return summary
+
+
+def run(args):
+    if args.quick:
+        args.pop_sizes = [20]
+        args.dims = [10]
+        args.generations = 5
+        args.repeat = 1
+        args.min_time = 0.02
+
+    cases = {}
+    cases.update(suite.algorithm_cases(args.pop_sizes, args.dims, args.generations))
+    cases.update(suite.operator_cases(args.dims, max(args.pop_sizes), args.min_time))
+    cases.update(suite.selection_cases(args.pop_sizes, args.min_time))
+
+    if args.filter:
+        pattern = re.compile(args.filter)
+        cases = {name: case for name, case in cases.items() if pattern.search(name)}
+
+    results = {}
+    for idx, (name, case) in enumerate(cases.items()):
+        try:
+            summary = _summarize([case() for _ in range(args.repeat)])
+        except Exception as err:
+            summary = {"error": f"{type(err).__name__}: {err}"}
+
+        results[name] = summary
+        if not args.silent:
+            metric = suite.compared_metric(name)
+            value = f"{summary[metric]:12.3f}" if metric in summary else summary["error"]
+            print(f"[{idx + 1}/{len(cases)}] {name:60s} {metric} = {value}")
+
+    output = {"metadata": _metadata(args), "results": results}
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as output_file:
+        json.dump(output, output_file, indent=2, cls=NumpyEncoder)
+
+    print(f"Results stored in {args.output}")
+    return 0
+
+
+def compare_results(baseline, new, threshold=0.1, min_difference=0.0):
+    """
+    Compares two sets of results, returning the benchmarks whose compared metric
+    changed more than the given relative threshold.
+
+    Parameters
+    ----------
+    baseline: dict
+        Results used as reference.
+    new: dict
+        Results that will be compared with the reference.
+    threshold: float, optional
+        Relative change above which a benchmark is considered to be slower or faster.
+    min_difference: float, optional
+        Absolute change below which differences are ignored, to avoid flagging noise in very fast benchmarks.
+
+    Returns
+    -------
+    comparison: list
+        List of tuples (name, metric, baseline value, new value, ratio, status) for the benchmarks in both sets,
+        where status is "regression", "improvement" or "ok".
+    """
+
+    comparison = []
+    for name in baseline["results"]:
+        if name not in new["results"]:
+            continue
+
+        metric = suite.compared_metric(name)
+        base_value = baseline["results"][name].get(metric)
+        new_value = new["results"][name].get(metric)
+        if base_value is None or new_value is None or base_value <= 0:
+            continue
+
+        ratio = new_value / base_value
+        status = "ok"
+        if abs(new_value - base_value) >= min_difference:
+            if ratio > 1 + threshold:
+                status = "regression"
+            elif ratio < 1 / (1 + threshold):
+                status = "improvement"
+
+        comparison.append((name, metric, base_value, new_value, ratio, status))
+
+    return comparison
+
+
+def compare(args):
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    with open(args.new) as new_file:
+        new = json.load(new_file)
+
+    if baseline["metadata"].get("platform") != new["metadata"].get("platform"):
+        print("Warning: the results were obtained in different platforms, the comparison may not be meaningful.")
+
+    comparison = compare_results(baseline, new, args.threshold, args.min_difference)
+
+    n_regressions = 0
+    for name, metric, base_value, new_value, ratio, status in comparison:
+        if status == "regression":
+            n_regressions += 1
+        if status != "ok" or args.all:
+            print(f"{status.upper():12s} {name:60s} {metric}: {base_value:10.3f} -> {new_value:10.3f} ({ratio:6.2f}x)")
+
+    missing = sorted(set(baseline["results"]) - set(new["results"]))
+    if missing:
+        print(f"{len(missing)} benchmarks of the baseline were not found in the new results.")
+
+    print(f"{len(comparison)} benchmarks compared, {n_regressions} regressions (threshold {args.threshold:.0%}).")
+    return 1 if n_regressions > 0 else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Performance benchmarks of metaheuristic-designer.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks and store the results as JSON.")
+    run_parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="File where the results are stored.")
+    run_parser.add_argument("--pop-sizes", type=int, nargs="+", default=[20, 100, 500], help="Population sizes of the grid.")
+    run_parser.add_argument("--dims", type=int, nargs="+", default=[10, 100, 1000], help="Dimensions of the grid.")
+    run_parser.add_argument("--generations", type=int, default=30, help="Generations run by each algorithm.")
+    run_parser.add_argument("--repeat", type=int, default=3, help="Number of times each benchmark is repeated.")
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="Minimum time spent in each microbenchmark.")
+    run_parser.add_argument("-k", "--filter", help="Regular expression to select the benchmarks by name.")
+    run_parser.add_argument("--quick", action="store_true", help="Run a small grid, to check that the benchmarks work.")
+    run_parser.add_argument("--silent", action="store_true", help="Don't show the progress.")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two sets of results.")
+    compare_parser.add_argument("baseline", help="Results used as reference.")
+    compare_parser.add_argument("new", help="Results to compare with the reference.")
+    compare_parser.add_argument("-t", "--threshold", type=float, default=0.1, help="Relative slowdown considered a regression.")
+    compare_parser.add_argument("--min-difference", type=float, default=0.0, help="Ignore absolute differences below this value.")
+    compare_parser.add_argument("--all", action="store_true", help="Show every benchmark, not only the ones that changed.")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+"""
+Definition of the performance benchmarks of the framework.
+
+Each benchmark is a function without arguments that returns a dictionary of measurements. The benchmarks are
+grouped in cases with a name like "algorithm/GA/pop=100/dim=10", which are the keys used in the stored results.
+"""
+
+from __future__ import annotations
+import time
+import numpy as np
+from metaheuristic_designer import Individual
+from metaheuristic_designer.algorithms import GeneralAlgorithm
+from metaheuristic_designer.benchmarks import Sphere, MaxOnes
+from metaheuristic_designer.initializers import UniformVectorInitializer, PermInitializer
+from metaheuristic_designer.operators import OperatorReal, OperatorPerm, OperatorBinary, real_ops_map, perm_ops_map, bin_ops_map
+from metaheuristic_designer.selectionMethods import ParentSelection, SurvivorSelection, parent_sel_map, surv_method_map
+from metaheuristic_designer.strategies import (
+    GA,
+    DE,
+    PSO,
+    SA,
+    CRO_SL,
+    DPCRO_SL,
+    GaussianUMDA,
+    GaussianPBIL,
+    CrossEntropyMethod,
+    BernoulliUMDA,
+    BernoulliPBIL,
+    BinomialUMDA,
+    BinomialPBIL,
+)
+import metaheuristic_designer as mhd
+
+# Metric used to detect regressions in each kind of benchmark
+COMPARED_METRICS = {
+    "algorithm": "overhead_per_gen_ms",
+    "operator": "time_per_call_us",
+    "parent_selection": "time_per_call_us",
+    "survivor_selection": "time_per_call_us",
+}
+
+
+class ObjectiveTimer:
+    """
+    Accumulates the time spent inside the objective function of an ObjectiveFunc instance,
+    replacing its 'objective', 'objective_batch' and 'objective_delta' methods with timed versions.
+    """
+
+    def __init__(self, objfunc):
+        self.elapsed = 0.0
+        self._depth = 0
+
+        methods = ["objective"]
+        if objfunc.supports_batch:
+            methods.append("objective_batch")
+        if objfunc.supports_delta:
+            methods.append("objective_delta")
+
+        for method_name in methods:
+            setattr(objfunc, method_name, self._timed(getattr(objfunc, method_name)))
+
+    def _timed(self, method):
+        def timed_method(*args, **kwargs):
+            # Nested calls (a batch evaluation calling the single one) are only counted once
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.elapsed += time.perf_counter() - start
+
+        return timed_method
+
+
+def time_calls(func, min_time=0.2, max_calls=100000):
+    """
+    Calls a function repeatedly until at least 'min_time' seconds have passed and returns the average time per call.
+    """
+
+    n_calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time and n_calls < max_calls:
+        func()
+        n_calls += 1
+        elapsed = time.perf_counter() - start
+
+    return {"time_per_call_us": 1e6 * elapsed / n_calls, "calls": n_calls}
+
+
+def _real_strategy(name, pop_size, dim):
+    initializer = UniformVectorInitializer(dim, -100, 100, pop_size=pop_size)
+    parent_sel = ParentSelection("Best", {"amount": max(2, pop_size // 5)})
+    survivor_sel = SurvivorSelection("(m+n)")
+    de_params = {"F": 0.7, "Cr": 0.8}
+    cro_params = {"rho": 0.6, "Fb": 0.95, "Fd": 0.1, "Pd": 0.9, "attempts": 3}
+    cro_operators = [
+        OperatorReal("DE/rand/1", de_params),
+        OperatorReal("DE/best/2", de_params),
+        OperatorReal("DE/current-to-best/1", de_params),
+        OperatorReal("Gauss", {"F": 0.1}),
+    ]
+
+    if name == "GA":
+        return GA(
+            initializer,
+            OperatorReal("Gauss", {"F": 0.1}),
+            OperatorReal("Multipoint"),
+            parent_sel,
+            survivor_sel,
+            {"pcross": 0.8, "pmut": 0.2},
+        )
+    elif name == "DE":
+        return DE(initializer, OperatorReal("DE/best/1", de_params))
+    elif name == "PSO":
+        return PSO(initializer, {"w": 0.7, "c1": 1.5, "c2": 1.5})
+    elif name == "SA":
+        initializer.pop_size = 1
+        return SA(initializer, OperatorReal("Gauss", {"F": 0.1}), {"iter": 10, "temp_init": 1, "alpha": 0.997})
+    elif name == "CRO_SL":
+        return CRO_SL(initializer, cro_operators, cro_params)
+    elif name == "DPCRO_SL":
+        dpcro_params = dict(cro_params, group_subs=True, dyn_method="fitness", dyn_metric="avg", dyn_steps=10, prob_amp=0.1)
+        return DPCRO_SL(initializer, cro_operators, dpcro_params)
+    elif name == "GaussianUMDA":
+        return GaussianUMDA(initializer, parent_sel, survivor_sel, params={"scale": 0.1, "noise": 1e-3})
+    elif name == "GaussianPBIL":
+        return GaussianPBIL(initializer, parent_sel, survivor_sel, params={"scale": 0.1, "lr": 0.3, "noise": 1e-3})
+    elif name == "CrossEntropyMethod":
+        return CrossEntropyMethod(initializer)
+
+
+def _discrete_strategy(name, pop_size, dim):
+    parent_sel = ParentSelection("Best", {"amount": max(2, pop_size // 5)})
+    survivor_sel = SurvivorSelection("(m+n)")
+
+    if name.startswith("Bernoulli"):
+        initializer = UniformVectorInitializer(dim, 0, 1, pop_size=pop_size, dtype=int)
+        strategy_class = BernoulliUMDA if name == "BernoulliUMDA" else BernoulliPBIL
+        return strategy_class(initializer, parent_sel, survivor_sel, params={"noise": 1e-3, "lr": 0.3})
+
+    initializer = UniformVectorInitializer(dim, 0, 4, pop_size=pop_size, dtype=int)
+    strategy_class = BinomialUMDA if name == "BinomialUMDA" else BinomialPBIL
+    return strategy_class(initializer, parent_sel, survivor_sel, params={"n": 4, "noise": 1e-3, "lr": 0.3})
+
+
+REAL_ALGORITHMS = ["GA", "DE", "PSO", "SA", "CRO_SL", "DPCRO_SL", "GaussianUMDA", "GaussianPBIL", "CrossEntropyMethod"]
+DISCRETE_ALGORITHMS = ["BernoulliUMDA", "BernoulliPBIL", "BinomialUMDA", "BinomialPBIL"]
+
+
+def run_algorithm(name, pop_size, dim, generations):
+    """
+    Runs an algorithm for a fixed number of generations, measuring the time spent in the objective
+    function and in the rest of the framework.
+    """
+
+    mhd.reset_seed(0)
+
+    if name in REAL_ALGORITHMS:
+        objfunc = Sphere(dim)
+        strategy = _real_strategy(name, pop_size, dim)
+    else:
+        objfunc = MaxOnes(dim)
+        strategy = _discrete_strategy(name, pop_size, dim)
+
+    timer = ObjectiveTimer(objfunc)
+    algorithm = GeneralAlgorithm(objfunc, strategy, {"stop_cond": "ngen", "ngen": generations, "verbose": False})
+
+    start = time.perf_counter()
+    algorithm.optimize()
+    wall_time = time.perf_counter() - start
+
+    overhead_time = wall_time - timer.elapsed
+    return {
+        "wall_time_s": wall_time,
+        "objective_time_s": timer.elapsed,
+        "overhead_time_s": overhead_time,
+        "overhead_fraction": overhead_time / wall_time,
+        "overhead_per_gen_ms": 1e3 * overhead_time / generations,
+        "evaluations": objfunc.counter,
+        "evals_per_sec": objfunc.counter / wall_time,
+    }
+
+
+def algorithm_cases(pop_sizes, dims, generations):
+    cases = {}
+    for name in REAL_ALGORITHMS + DISCRETE_ALGORITHMS:
+        for dim in dims:
+            # SA works on a single solution, the population size is irrelevant
+            for pop_size in [1] if name == "SA" else pop_sizes:
+                key = f"algorithm/{name}/pop={pop_size}/dim={dim}"
+                cases[key] = lambda name=name, pop_size=pop_size, dim=dim: run_algorithm(name, pop_size, dim, generations)
+
+    return cases
+
+
+def _operator_population(kind, pop_size, dim):
+    if kind == "perm":
+        initializer = PermInitializer(dim, pop_size=pop_size)
+        objfunc = MaxOnes(dim)
+    elif kind == "binary":
+        initializer = UniformVectorInitializer(dim, 0, 1, pop_size=pop_size, dtype=int)
+        objfunc = MaxOnes(dim)
+    else:
+        initializer = UniformVectorInitializer(dim, -100, 100, pop_size=pop_size)
+        objfunc = Sphere(dim)
+
+    population = [Individual(objfunc, indiv.genotype) for indiv in initializer.generate_population(objfunc)]
+    for indiv in population:
+        indiv.calculate_fitness()
+
+    return objfunc, initializer, population
+
+
+def run_operator(kind, method, pop_size, dim, min_time):
+    mhd.reset_seed(0)
+    operator_class = {"real": OperatorReal, "perm": OperatorPerm, "binary": OperatorBinary}[kind]
+    operator = operator_class(method, "default")
+    objfunc, initializer, population = _operator_population(kind, pop_size, dim)
+    best = max(population, key=lambda x: x.fitness)
+
+    counter = [0]
+
+    def apply_operator():
+        indiv = population[counter[0] % pop_size]
+        counter[0] += 1
+        operator.evolve(indiv, population, objfunc, best, initializer)
+
+    return time_calls(apply_operator, min_time)
+
+
+def operator_cases(dims, pop_size, min_time):
+    # The self-adaptive mutations need individuals with a vector of step sizes
+    operator_methods = {
+        "real": [method for method in real_ops_map if method not in ["mutate1sigma", "mutatensigmas"]],
+        "perm": list(perm_ops_map),
+        "binary": list(bin_ops_map),
+    }
+
+    cases = {}
+    for kind, methods in operator_methods.items():
+        for method in methods:
+            for dim in dims:
+                key = f"operator/{kind}/{method}/dim={dim}"
+                cases[key] = lambda kind=kind, method=method, dim=dim: run_operator(kind, method, pop_size, dim, min_time)
+
+    return cases
+
+
+_SELECTION_PARAMS = {
+    "amount": 20,
+    "p": 0.1,
+    "method": "FitnessProp",
+    "Fd": 0.1,
+    "Pd": 0.9,
+    "attempts": 3,
+}
+
+
+def run_selection(kind, method, pop_size, min_time):
+    mhd.reset_seed(0)
+    _, _, population = _operator_population("real", pop_size, 10)
+    _, _, offspring = _operator_population("real", pop_size, 10)
+
+    params = dict(_SELECTION_PARAMS, maxPopSize=pop_size)
+    if kind == "parent_selection":
+        selection = ParentSelection(method, params)
+        return time_calls(lambda: selection.select(population), min_time)
+
+    selection = SurvivorSelection(method, params)
+    return time_calls(lambda: selection.select(population, offspring), min_time)
+
+
+def selection_cases(pop_sizes, min_time):
+    # Several names refer to the same method, only the first one is measured
+    parent_methods = list({method: name for name, method in reversed(parent_sel_map.items())}.values())
+    survivor_methods = list({method: name for name, method in reversed(surv_method_map.items())}.values())
+
+    cases = {}
+    for pop_size in pop_sizes:
+        for method in parent_methods:
+            key = f"parent_selection/{method}/pop={pop_size}"
+            cases[key] = lambda method=method, pop_size=pop_size: run_selection("parent_selection", method, pop_size, min_time)
+        for method in survivor_methods:
+            key = f"survivor_selection/{method}/pop={pop_size}"
+            cases[key] = lambda method=method, pop_size=pop_size: run_selection("survivor_selection", method, pop_size, min_time)
+
+    return cases
+
+
+def compared_metric(case_name):
+    """
+    Returns the metric used to compare the results of a benchmark case, lower values are better.
+    """
+
+    return COMPARED_METRICS[case_name.split("/")[0]]
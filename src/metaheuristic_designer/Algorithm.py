@@ -3,9 +3,23 @@ from abc import ABC, abstractmethod
 import time
 import json
 import numpy as np
-import pyparsing as pp
-from .utils import NumpyEncoder
-import matplotlib.pyplot as plt
+from .utils import NumpyEncoder, RAND_GEN
+from .profiling import Profiler
+from .checkpoint import (
+    get_component_state,
+    set_component_state,
+    get_random_state,
+    set_random_state,
+    find_encodings,
+    write_checkpoint,
+    read_checkpoint,
+)
+from .Individual import Individual
+from .Operator import Operator
+from .History import History
+from .MetricsSink import MetricsSink
+from .histories import ListHistory, NullHistory, RingHistory, DecimatedHistory, DiskHistory
+from .evaluators import SerialEvaluator, ProcessEvaluator, ThreadEvaluator, SharedMemoryEvaluator, AsyncEvaluator
 
 
 class Algorithm(ABC):
@@ -23,6 +37,37 @@ class Algorithm(ABC):
         Search strategy that will iteratively optimize the function.
     params: ParamScheduler or dict, optional
         Dictionary of parameters to define the stopping condition and output of the algorithm.
+    name: str, optional
+        Name that is associated with the algorithm.
+    evaluator: Evaluator, optional
+        Evaluator used to calculate the fitness of the population. If not given, it is chosen with the
+        "parallel_backend" parameter: "process" for a pool of processes, "shared_memory" for a pool of processes
+        that receive the genotypes through shared memory, "thread" for a pool of threads (for objective functions
+        that release the GIL), "async" to evaluate the population concurrently in an event loop with at most
+        "max_concurrency" evaluations in progress (for objective functions that implement 'objective_async')
+        or "serial". By default, a process pool is used
+        when the "parallel" parameter is set and the population is evaluated serially otherwise.
+
+    The time spent in each phase of the algorithm and in the objective function is measured unless the "timing"
+    parameter is set to False. Setting "operator_timing" to True also measures the time spent in each operator,
+    and "profile_gens", a pair (first generation, generation after the last one), analyzes those generations
+    with cProfile, and with tracemalloc if "profile_memory" is True. The measurements are shown in the
+    reports and stored in the state of the algorithm.
+
+    If the "checkpoint_file" parameter is given, the state of the execution is written to that file every
+    "checkpoint_gens" generations and/or every "checkpoint_time" seconds (60 seconds if neither is given), and
+    once more when the algorithm ends. An execution can be continued from that file with :py:meth:`resume`.
+
+    The best solution and its fitness at each generation are recorded in the 'best_history' and 'fit_history'
+    attributes. The "history" parameter chooses how they are stored: "full" keeps every generation in memory,
+    "none" keeps nothing, "ring" keeps the last "history_size" generations, "decimate" keeps one generation
+    out of every "history_step" and "disk" streams every generation to the ".npy" files "{history_file}_best.npy"
+    and "{history_file}_fitness.npy". The "fit_history" parameter sets a different mode for the fitness history,
+    a :py:class:`History` object can also be given in both parameters.
+
+    The "metrics_sinks" parameter takes a list of :py:class:`MetricsSink` objects that receive a record with the
+    metrics of the execution (see :py:meth:`get_metrics`) every few generations, which is written to a file or
+    kept in memory to follow the execution from other programs.
     """
 
     def __init__(
@@ -31,6 +76,7 @@ class Algorithm(ABC):
         search_strategy: SearchStrategy,
         params: ParamScheduler | dict = None,
         name: str = None,
+        evaluator: Evaluator = None,
     ):
         """
         Constructor of the Search class
@@ -68,10 +114,56 @@ class Algorithm(ABC):
         # Parallel parameters
         self.parallel = params.get("parallel", False)
         self.threads = params.get("threads", 8)
+        self.max_concurrency = params.get("max_concurrency", 100)
+        self.parallel_backend = params.get("parallel_backend", "process" if self.parallel else "serial")
+
+        if evaluator is None:
+            if self.parallel_backend == "process":
+                evaluator = ProcessEvaluator(self.threads)
+            elif self.parallel_backend == "shared_memory":
+                evaluator = SharedMemoryEvaluator(self.threads)
+            elif self.parallel_backend == "thread":
+                evaluator = ThreadEvaluator(self.threads)
+            elif self.parallel_backend == "async":
+                evaluator = AsyncEvaluator(self.max_concurrency)
+            elif self.parallel_backend == "serial":
+                evaluator = SerialEvaluator()
+            else:
+                raise ValueError(
+                    f'Parallel backend "{self.parallel_backend}" not recognised, use "process", "shared_memory", "thread", "async" or "serial".'
+                )
+            self.parallel = self.parallel_backend != "serial"
+        self.evaluator = evaluator
+
+        # Instrumentation
+        self.profiler = Profiler(
+            enabled=params.get("timing", True),
+            operator_timing=params.get("operator_timing", False),
+            profile_gens=params.get("profile_gens", None),
+            profile_memory=params.get("profile_memory", False),
+        )
+
+        # Checkpoints
+        self.checkpoint_file = params.get("checkpoint_file", None)
+        self.checkpoint_gens = params.get("checkpoint_gens", None)
+        self.checkpoint_time = params.get("checkpoint_time", None)
+        if self.checkpoint_file is not None and self.checkpoint_gens is None and self.checkpoint_time is None:
+            self.checkpoint_time = 60
+
+        # Histories
+        self.history_mode = params.get("history", "full")
+        self.fit_history_mode = params.get("fit_history", self.history_mode)
+        self.history_size = params.get("history_size", 1000)
+        self.history_step = params.get("history_step", 10)
+        self.history_file = params.get("history_file", "history")
+        self.fit_history = self._build_history(self.fit_history_mode, "fitness")
+        self.best_history = self._build_history(self.history_mode, "best")
+
+        # Metrics sinks
+        metrics_sinks = params.get("metrics_sinks", [])
+        self.metrics_sinks = [metrics_sinks] if isinstance(metrics_sinks, MetricsSink) else list(metrics_sinks)
 
         # Metrics
-        self.fit_history = []
-        self.best_history = []
         self.progress = 0
         self.ended = False
         self.steps = 0
@@ -96,19 +188,43 @@ class Algorithm(ABC):
     def initializer(self, new_initializer):
         self.search_strategy.initializer = new_initializer
 
+    def _build_history(self, mode: str | History, name: str) -> History:
+        """
+        Creates the history used to record the values of each generation.
+        """
+
+        if isinstance(mode, History):
+            return mode
+
+        if mode == "full":
+            history = ListHistory(name)
+        elif mode == "none":
+            history = NullHistory(name)
+        elif mode == "ring":
+            history = RingHistory(self.history_size, name)
+        elif mode == "decimate":
+            history = DecimatedHistory(self.history_step, name)
+        elif mode == "disk":
+            history = DiskHistory(f"{self.history_file}_{name}.npy", name=name)
+        else:
+            raise ValueError(f'History mode "{mode}" not recognised, use "full", "none", "ring", "decimate" or "disk".')
+
+        return history
+
     def restart(self):
         """
         Resets the internal values of the algorithm and the number of evaluations of the fitness function.
         """
 
-        self.fit_history = []
-        self.best_history = []
+        self.fit_history.clear()
+        self.best_history.clear()
         self.progress = 0
         self.ended = False
         self.prev_best_fitness = None
         self.cpu_time_spent = 0
         self.real_time_spent = 0
-        self.objfunc.counter = 0
+        self.objfunc.reset_counters()
+        self.profiler.reset()
 
     def save_solution(self, file_name: str = "solution.csv"):
         """
@@ -270,9 +386,15 @@ class Algorithm(ABC):
         """
 
         self.restart()
-        initial_population = self.search_strategy.initialize(self.objfunc)
-        initial_population = self.search_strategy.evaluate_population(initial_population, self.objfunc, self.parallel, self.threads)
-        self.search_strategy.population = initial_population
+        self._attach_profiler()
+
+        with self.profiler.phase("initialize"):
+            self.evaluator.start(self.objfunc)
+            initial_population = self.search_strategy.initialize(self.objfunc)
+            initial_population = self.search_strategy.evaluate_population(
+                initial_population, self.objfunc, self.parallel, self.threads, self.evaluator
+            )
+            self.search_strategy.population = initial_population
 
     @abstractmethod
     def step(self, time_start: float = 0, verbose: bool = False) -> Tuple[Individual, float]:
@@ -312,33 +434,317 @@ class Algorithm(ABC):
         # initialize clocks
         real_time_start = time.time()
         cpu_time_start = time.process_time()
-        display_timer = time.time()
 
         # Initizalize search strategy
         self.initialize()
+        self._open_sinks(resume=False)
+
+        return self._run(real_time_start, cpu_time_start)
+
+    def resume(self, file_name: str = None) -> Tuple[Individual, float]:
+        """
+        Continues an execution of the algorithm from a checkpoint, until the stopping condition is met.
+
+        The algorithm must be created in the same way as the one that wrote the checkpoint (same objective
+        function, search strategy, operators and parameters). The execution continues exactly as it would have
+        without interruption, the time spent before the checkpoint counts towards the time limits.
+
+        Parameters
+        ----------
+        file_name: str, optional
+            Path to the checkpoint file, by default the one given in the "checkpoint_file" parameter.
+
+        Returns
+        -------
+        best_solution: Tuple[Individual, float]
+            A pair of the best individual with its fitness.
+        """
 
-        # Search until the stopping condition is met
-        self.update(real_time_start, cpu_time_start, pass_step=False)
+        self.load_checkpoint(file_name)
 
         if self.verbose:
-            self.step_info(real_time_start)
+            self.init_info()
+
+        # The clocks start as if the time spent before the checkpoint had just passed
+        real_time_start = time.time() - self.real_time_spent
+        cpu_time_start = time.process_time() - self.cpu_time_spent
+
+        # The stopping condition may have been changed to extend the execution
+        self.ended = self.stopping_condition(self.steps, real_time_start, cpu_time_start)
+
+        self.evaluator.start(self.objfunc)
+        self._attach_profiler()
+        self._open_sinks(resume=True)
+
+        return self._run(real_time_start, cpu_time_start, first_update=False)
+
+    def _run(self, real_time_start: float, cpu_time_start: float, first_update: bool = True) -> Tuple[Individual, float]:
+        """
+        Repeats steps of the algorithm until the stopping condition is met.
+        """
 
-        while not self.ended:
-            self.step(real_time_start)
+        display_timer = time.time()
+        checkpoint_gen = self.steps
+        checkpoint_timer = time.time()
 
-            self.update(real_time_start, cpu_time_start)
+        # Search until the stopping condition is met, the evaluator is released even if the execution fails
+        try:
+            if first_update:
+                self.update(real_time_start, cpu_time_start, pass_step=False)
+                self.emit_metrics(real_time_start, cpu_time_start)
 
-            # Display information
-            if self.verbose and time.time() - display_timer > self.v_timer:
+            if self.verbose:
                 self.step_info(real_time_start)
-                display_timer = time.time()
+
+            while not self.ended:
+                self.profiler.check_window(self.steps)
+
+                self.step(real_time_start)
+
+                with self.profiler.phase("update"):
+                    self.update(real_time_start, cpu_time_start)
+
+                # Send the metrics of this generation to the sinks
+                if self.metrics_sinks:
+                    with self.profiler.phase("metrics"):
+                        self.emit_metrics(real_time_start, cpu_time_start)
+
+                # Display information
+                if self.verbose and time.time() - display_timer > self.v_timer:
+                    self.step_info(real_time_start)
+                    display_timer = time.time()
+
+                # Store the state of the execution
+                if self.checkpoint_file is not None and not self.ended:
+                    gens_reached = self.checkpoint_gens is not None and self.steps - checkpoint_gen >= self.checkpoint_gens
+                    time_reached = self.checkpoint_time is not None and time.time() - checkpoint_timer >= self.checkpoint_time
+                    if gens_reached or time_reached:
+                        with self.profiler.phase("checkpoint"):
+                            self.real_time_spent = time.time() - real_time_start
+                            self.cpu_time_spent = time.process_time() - cpu_time_start
+                            self.save_checkpoint()
+                        checkpoint_gen = self.steps
+                        checkpoint_timer = time.time()
+            # The sinks receive the last generation even if it wasn't due
+            self.emit_metrics(real_time_start, cpu_time_start, final=True)
+        finally:
+            self.evaluator.shutdown()
+            self.profiler.detach()
+            for sink in self.metrics_sinks:
+                sink.close()
 
         # Store the time spent optimizing
         self.real_time_spent = time.time() - real_time_start
         self.cpu_time_spent = time.process_time() - cpu_time_start
 
+        if self.checkpoint_file is not None:
+            self.save_checkpoint()
+
         return self.best_solution()
 
+    def _open_sinks(self, resume: bool):
+        """
+        Prepares the metrics sinks for a new execution or for the continuation of one.
+        """
+
+        for sink in self.metrics_sinks:
+            sink.open(resume)
+            sink.last_generation = None
+
+    def get_metrics(self, names: Container[str] = None) -> dict:
+        """
+        Computes metrics that describe the current state of the execution.
+
+        The algorithm provides "generation", "evaluations", "evals_per_sec", "real_time", "cpu_time", "progress",
+        "best_fitness" and "phase_timings" (the time spent in each phase of the algorithm), the search strategy
+        adds its own metrics, like "diversity" or "operator_probabilities" (see :py:meth:`SearchStrategy.get_metrics`).
+
+        Parameters
+        ----------
+        names: Container[str], optional
+            Names of the metrics that will be computed, all of them if not given. The generation is always included.
+
+        Returns
+        -------
+        metrics: dict
+            The value of each metric requested.
+        """
+
+        metrics = {"generation": self.steps}
+
+        if names is None or "evaluations" in names:
+            metrics["evaluations"] = self.objfunc.counter
+        if names is None or "evals_per_sec" in names:
+            metrics["evals_per_sec"] = self.objfunc.counter / self.real_time_spent if self.real_time_spent > 0 else 0.0
+        if names is None or "real_time" in names:
+            metrics["real_time"] = self.real_time_spent
+        if names is None or "cpu_time" in names:
+            metrics["cpu_time"] = self.cpu_time_spent
+        if names is None or "progress" in names:
+            metrics["progress"] = self.progress
+        if names is None or "best_fitness" in names:
+            metrics["best_fitness"] = self.best_solution()[1]
+        if (names is None or "phase_timings" in names) and self.profiler.enabled:
+            metrics["phase_timings"] = {name: stats.wall_time for name, stats in self.profiler.phases.items()}
+
+        metrics.update(self.search_strategy.get_metrics(names))
+
+        return metrics
+
+    def emit_metrics(self, real_time_start: float, cpu_time_start: float, final: bool = False):
+        """
+        Sends a record with the current metrics to the sinks that expect one in this generation,
+        only the metrics requested by those sinks are computed.
+
+        Parameters
+        ----------
+        real_time_start: float
+            The time in seconds that passed since the algorithm was executed.
+        cpu_time_start: float
+            The time in seconds that the CPU has executed code in this algorithm.
+        final: bool, optional
+            Whether this is the last generation, which is sent to every sink that didn't receive it yet.
+        """
+
+        if final:
+            due = [sink for sink in self.metrics_sinks if sink.last_generation != self.steps]
+        else:
+            due = [sink for sink in self.metrics_sinks if sink.is_due(self.steps)]
+
+        if not due:
+            return
+
+        self.real_time_spent = time.time() - real_time_start
+        self.cpu_time_spent = time.process_time() - cpu_time_start
+
+        names = None
+        if all(sink.metrics is not None for sink in due):
+            names = set().union(*(sink.metrics for sink in due))
+
+        record = self.get_metrics(names)
+        for sink in due:
+            sink.write(sink.filter_record(record))
+            sink.last_generation = self.steps
+
+    def _attach_profiler(self):
+        """
+        Starts measuring the objective function and the operators of the algorithm.
+        """
+
+        self.profiler.attach(self.objfunc, self.search_strategy)
+
+    def _checkpoint_components(self) -> dict:
+        """
+        Components of the algorithm whose state is stored in the checkpoints, by attribute name.
+        """
+
+        return {"search_strategy": self.search_strategy}
+
+    def _checkpoint_references(self) -> dict:
+        # Objects that are stored in the checkpoints as references to the ones of the algorithm
+        references = {"objfunc": self.objfunc, "rand_gen": RAND_GEN}
+        for idx, encoding in enumerate(find_encodings(*self._checkpoint_components().values())):
+            references[f"encoding_{idx}"] = encoding
+
+        return references
+
+    def get_checkpoint_state(self) -> dict:
+        """
+        Gets everything needed to continue the execution of the algorithm as a dictionary.
+
+        This includes the state of the search strategy and its components, the histories and
+        counters of the algorithm and the state of the random number generators.
+
+        Returns
+        -------
+        state: dict
+            The state of the execution.
+        """
+
+        return {
+            "algorithm": {
+                "fit_history": self.fit_history,
+                "best_history": self.best_history,
+                "progress": self.progress,
+                "ended": self.ended,
+                "steps": self.steps,
+                "prev_best_fitness": self.prev_best_fitness,
+                "patience_left": self.patience_left,
+                "converged_steps": self.converged_steps,
+                "real_time_spent": self.real_time_spent,
+                "cpu_time_spent": self.cpu_time_spent,
+            },
+            "components": {name: get_component_state(component) for name, component in self._checkpoint_components().items()},
+            "objfunc": {
+                "counter": self.objfunc.counter,
+                "true_evaluations": self.objfunc.true_evaluations,
+                "cache_hits": self.objfunc.cache_hits,
+                "cache_misses": self.objfunc.cache_misses,
+                "cache": self.objfunc.cache,
+                "cache_size": self.objfunc.cache_size,
+            },
+            "random": get_random_state(),
+            "last_ids": {"individual": Individual._last_id, "operator": Operator._last_id},
+        }
+
+    def set_checkpoint_state(self, state: dict):
+        """
+        Restores the state of an execution obtained with :py:meth:`get_checkpoint_state`.
+
+        Parameters
+        ----------
+        state: dict
+            The state of the execution.
+        """
+
+        for name, value in state["algorithm"].items():
+            setattr(self, name, value)
+
+        components = self._checkpoint_components()
+        for name, component_state in state["components"].items():
+            set_component_state(components[name], component_state)
+
+        for name, value in state["objfunc"].items():
+            setattr(self.objfunc, name, value)
+
+        set_random_state(state["random"])
+        Individual._last_id = state["last_ids"]["individual"]
+        Operator._last_id = state["last_ids"]["operator"]
+
+    def save_checkpoint(self, file_name: str = None):
+        """
+        Writes the state of the execution to a binary file, so that it can be continued with :py:meth:`resume`.
+
+        Parameters
+        ----------
+        file_name: str, optional
+            Path to the checkpoint file, by default the one given in the "checkpoint_file" parameter.
+        """
+
+        if file_name is None:
+            file_name = self.checkpoint_file
+        if file_name is None:
+            raise ValueError("No file was given to store the checkpoint.")
+
+        write_checkpoint(file_name, self.get_checkpoint_state(), self._checkpoint_references())
+
+    def load_checkpoint(self, file_name: str = None):
+        """
+        Restores the state of an execution from a file written with :py:meth:`save_checkpoint`, without continuing it.
+
+        Parameters
+        ----------
+        file_name: str, optional
+            Path to the checkpoint file, by default the one given in the "checkpoint_file" parameter.
+        """
+
+        if file_name is None:
+            file_name = self.checkpoint_file
+        if file_name is None:
+            raise ValueError("No checkpoint file was given.")
+
+        self.set_checkpoint_state(read_checkpoint(file_name, self._checkpoint_references()))
+
     def get_state(
         self,
         show_best_solution: bool = True,
@@ -355,9 +761,11 @@ class Algorithm(ABC):
         show_best_solution: bool, optional
             Save the best solution found by the algorithm.
         show_fit_history: bool, optional
-            Save the fitness of the best individual of each iteration.
+            Save the fitness of the best individual of each iteration kept in the history, along with
+            the generations they belong to if some were discarded.
         show_gen_history: bool, optional
-            Save the best inividual for each iteration.
+            Save the best inividual for each iteration kept in the history, along with
+            the generations they belong to if some were discarded.
         show_pop: bool, optional
             Save the entire population of the last iteration.
         show_pop_details:bool, optional
@@ -374,20 +782,31 @@ class Algorithm(ABC):
             "progress": self.progress,
             "generation": self.steps,
             "evaluations": self.objfunc.counter,
+            "true_evaluations": self.objfunc.true_evaluations,
             "real_time_spent": self.real_time_spent,
             "cpu_time_spent": self.cpu_time_spent,
             "params": self.params,
         }
 
+        if self.objfunc.cache is not None:
+            data["fitness_cache"] = self.objfunc.cache_info()
+
+        if self.profiler.enabled:
+            data["timing"] = self.profiler.get_state(self.real_time_spent if self.real_time_spent > 0 else None)
+
         if show_best_solution:
             data["best_fitness"] = self.best_solution()[1]
             data["best_individual"] = self.search_strategy.best.get_state(show_speed=False, show_best=False)
 
         if show_fit_history:
-            data["fit_history"] = self.fit_history
+            data["fit_history"] = self.fit_history.to_array()
+            if len(self.fit_history) != self.fit_history.n_appended:
+                data["fit_history_generations"] = self.fit_history.generations
 
         if show_gen_history:
-            data["best_history"] = self.best_history
+            data["best_history"] = self.best_history.to_array()
+            if len(self.best_history) != self.best_history.n_appended:
+                data["best_history_generations"] = self.best_history.generations
 
         data["search_strat_state"] = self.search_strategy.get_state(show_pop, show_pop_details)
 
@@ -475,19 +894,28 @@ class Algorithm(ABC):
             Whether to display plots about the algorithm or not.
         """
 
-        print("Number of generations:", len(self.fit_history))
+        print("Number of generations:", self.fit_history.n_appended)
         print("Real time spent: ", round(self.real_time_spent, 5), "s", sep="")
         print("CPU time spent: ", round(self.cpu_time_spent, 5), "s", sep="")
         print("Number of fitness evaluations:", self.objfunc.counter)
+        if self.objfunc.cache is not None:
+            print("Fitness values taken from the cache:", self.objfunc.cache_hits)
 
         best_fitness = self.best_solution()[1]
         print("Best fitness:", best_fitness)
 
+        if self.profiler.enabled:
+            print()
+            self.profiler.report(self.real_time_spent if self.real_time_spent > 0 else None)
+            print()
+
         if show_plots:
+            import matplotlib.pyplot as plt
+
             # Plot fitness history
             plt.axhline(y=0, color="black", alpha=0.9)
             plt.axvline(x=0, color="black", alpha=0.9)
-            plt.plot(self.fit_history, "blue")
+            plt.plot(self.fit_history.generations, self.fit_history.to_array(), "blue")
             plt.xlabel("generations")
             plt.ylabel("fitness")
             plt.title(f"{self.search_strategy.name} fitness")
@@ -512,9 +940,17 @@ def parse_stopping_cond(condition_str: str) -> List[str | List]:
         The list of tokens representing the original string.
     """
 
+    conditions = ["neval", "ngen", "time_limit", "cpu_time_limit", "fit_target", "convergence"]
+
+    # A single condition doesn't need the parser, which avoids importing pyparsing
+    if condition_str.strip() in conditions:
+        return [condition_str.strip()]
+
+    import pyparsing as pp
+
     orop = pp.Literal("and")
     andop = pp.Literal("or")
-    condition = pp.oneOf(["neval", "ngen", "time_limit", "cpu_time_limit", "fit_target", "convergence"])
+    condition = pp.oneOf(conditions)
 
     expr = pp.infixNotation(condition, [(orop, 2, pp.opAssoc.RIGHT), (andop, 2, pp.opAssoc.RIGHT)])
 
@@ -0,0 +1,110 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+
+
+class Evaluator(ABC):
+    """
+    Abstract Evaluator class.
+
+    This class defines how the fitness of the individuals of a population is calculated.
+    Evaluators that hold resources (worker processes, threads, ...) acquire them in 'start'
+    and release them in 'shutdown', so that the same resources are reused every generation.
+
+    Parameters
+    ----------
+    name: str, optional
+        Name that is associated with the evaluator.
+    """
+
+    def __init__(self, name: str = None):
+        """
+        Constructor for the Evaluator class.
+        """
+
+        self.name = name
+        self.running = False
+
+    def __call__(self, population: List[Individual], objfunc: ObjectiveFunc) -> List[Individual]:
+        """
+        A shorthand for calling the 'evaluate' method.
+        """
+
+        return self.evaluate(population, objfunc)
+
+    def start(self, objfunc: ObjectiveFunc):
+        """
+        Prepares the evaluator to calculate the fitness of individuals.
+
+        Parameters
+        ----------
+        objfunc: ObjectiveFunc
+            Objective function that will be evaluated.
+        """
+
+        self.running = True
+
+    def shutdown(self):
+        """
+        Releases the resources held by the evaluator.
+        """
+
+        self.running = False
+
+    @abstractmethod
+    def evaluate(self, population: List[Individual], objfunc: ObjectiveFunc) -> List[Individual]:
+        """
+        Calculates the fitness of each individual in the population that has not been evaluated yet.
+
+        Parameters
+        ----------
+        population: List[Individual]
+            Individuals to be evaluated.
+        objfunc: ObjectiveFunc
+            Objective function being optimized.
+
+        Returns
+        -------
+        evaluated_population: List[Individual]
+            The population with the fitness of each individual calculated.
+        """
+
+    def _evaluate_pending(self, population: List[Individual], objfunc: ObjectiveFunc, evaluate: Callable) -> List[Individual]:
+        """
+        Calculates the fitness of the individuals of the population that have not been evaluated yet,
+        taking the values found in the fitness cache of the objective function and calculating the rest
+        with the function given.
+
+        Parameters
+        ----------
+        population: List[Individual]
+            Individuals to be evaluated.
+        objfunc: ObjectiveFunc
+            Objective function being optimized.
+        evaluate: Callable
+            Function that receives a list of individuals and returns the fitness of each of them.
+
+        Returns
+        -------
+        evaluated_population: List[Individual]
+            The population with the fitness of each individual calculated.
+        """
+
+        pending = [indiv for indiv in population if not indiv.fitness_calculated]
+
+        if pending:
+            for indiv, fit in zip(pending, objfunc.fitness_cached(pending, evaluate)):
+                indiv.fitness = fit
+
+        return population
+
+    def get_state(self) -> dict:
+        """
+        Gets the current state of the evaluator as a dictionary.
+
+        Returns
+        -------
+        state: dict
+            The complete state of the evaluator.
+        """
+
+        return {"name": self.name}
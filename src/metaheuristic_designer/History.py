@@ -0,0 +1,110 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+import numpy as np
+from numpy import ndarray
+
+
+class History(Sequence, ABC):
+    """
+    Abstract History class.
+
+    Record of a value (the fitness of the best individual, the best solution, ...) at each generation of an algorithm.
+    The implementations decide which of the values are kept and where they are stored, indexing the history
+    returns the values kept and :py:attr:`generations` tells the generation in which each one was recorded.
+
+    Parameters
+    ----------
+    name: str, optional
+        Name that is associated with the history.
+    """
+
+    def __init__(self, name: str = None):
+        """
+        Constructor for the History class.
+        """
+
+        self.name = name
+        self.n_appended = 0
+        self.last = None
+
+    def append(self, value: Any):
+        """
+        Records the value of a new generation.
+
+        Parameters
+        ----------
+        value: Any
+            Value that will be recorded.
+        """
+
+        self.record(value, self.n_appended)
+        self.last = value
+        self.n_appended += 1
+
+    def clear(self):
+        """
+        Discards every value recorded.
+        """
+
+        self.discard()
+        self.n_appended = 0
+        self.last = None
+
+    def to_array(self) -> ndarray:
+        """
+        Returns the values kept as an array, with the value of a generation in each row.
+
+        Returns
+        -------
+        values: ndarray
+            The values kept in the history.
+        """
+
+        values = list(self)
+        try:
+            return np.array(values)
+        except ValueError:
+            # Values of different shapes are stored as objects
+            array = np.empty(len(values), dtype=object)
+            for idx, value in enumerate(values):
+                array[idx] = value
+            return array
+
+    @property
+    @abstractmethod
+    def generations(self) -> ndarray:
+        """
+        Generation in which each of the values kept was recorded.
+        """
+
+    @abstractmethod
+    def record(self, value: Any, generation: int):
+        """
+        Stores the value of a generation if the history keeps it.
+
+        Parameters
+        ----------
+        value: Any
+            Value that will be recorded.
+        generation: int
+            Number of values recorded before this one.
+        """
+
+    @abstractmethod
+    def discard(self):
+        """
+        Removes the values stored.
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Number of values kept.
+        """
+
+    @abstractmethod
+    def __getitem__(self, idx: int | slice) -> Any:
+        """
+        Returns the values kept at the given positions.
+        """
@@ -47,6 +47,7 @@ class Individual:
         self._fitness = 0
         self.best_fitness = None
         self.fitness_calculated = False
+        self.objective_value = None
         self.best = genotype
 
         if encoding is None:
@@ -61,6 +62,7 @@ class Individual:
         copied_ind = Individual(self.objfunc, copy(self._genotype), copy(self.speed), encoding=self.encoding)
         copied_ind._fitness = self._fitness
         copied_ind.fitness_calculated = self.fitness_calculated
+        copied_ind.objective_value = self.objective_value
         copied_ind.best = copy(self.best)
         return copied_ind
 
@@ -79,6 +81,7 @@ class Individual:
         """
 
         self.fitness_calculated = False
+        self.objective_value = None
         self._genotype = vector
 
     def apply_speed(self) -> Individual:
@@ -0,0 +1,133 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class MetricsSink(ABC):
+    """
+    Abstract MetricsSink class.
+
+    Receives a record with the metrics of an algorithm every few generations and stores or publishes it.
+
+    The record is a dictionary that always includes the generation of the algorithm. Only the metrics named in
+    'metrics' are computed for this sink, which avoids computing expensive metrics (like the diversity of the
+    population) that no sink uses. The available metrics are listed in :py:meth:`Algorithm.get_metrics`.
+
+    Parameters
+    ----------
+    every: int, optional
+        Number of generations between two records.
+    metrics: Iterable[str], optional
+        Names of the metrics stored in each record, every metric available is stored if not given.
+    name: str, optional
+        Name that is associated with the sink.
+    """
+
+    def __init__(self, every: int = 1, metrics: Iterable[str] = None, name: str = None):
+        """
+        Constructor for the MetricsSink class.
+        """
+
+        if every <= 0:
+            raise ValueError("The number of generations between two records must be a positive integer.")
+
+        self.every = every
+        self.metrics = None if metrics is None else list(metrics)
+        self.name = name if name is not None else type(self).__name__
+        self.last_generation = None
+
+    def is_due(self, generation: int) -> bool:
+        """
+        Checks whether a record should be written in this generation.
+
+        Parameters
+        ----------
+        generation: int
+            Current generation of the algorithm.
+
+        Returns
+        -------
+        is_due: bool
+            Whether the sink expects a record.
+        """
+
+        return generation % self.every == 0
+
+    def filter_record(self, record: dict) -> dict:
+        """
+        Keeps the metrics of a record that this sink requested.
+
+        Parameters
+        ----------
+        record: dict
+            Record with the metrics computed for every sink.
+
+        Returns
+        -------
+        record: dict
+            Record with the generation and the metrics requested by this sink.
+        """
+
+        if self.metrics is None:
+            return record
+
+        return {name: value for name, value in record.items() if name == "generation" or name in self.metrics}
+
+    def open(self, resume: bool = False):
+        """
+        Prepares the sink at the start of an execution.
+
+        Parameters
+        ----------
+        resume: bool, optional
+            Whether a previous execution is being continued, in which case the records already written are kept.
+        """
+
+    def close(self):
+        """
+        Releases the resources of the sink at the end of an execution.
+        """
+
+    @abstractmethod
+    def write(self, record: dict):
+        """
+        Stores a record.
+
+        Parameters
+        ----------
+        record: dict
+            Metrics of the algorithm in the current generation.
+        """
+
+
+def flatten_record(record: dict, separator: str = ".") -> dict:
+    """
+    Converts a record with nested dictionaries (like the probability of each operator) into a flat
+    dictionary, whose keys join the nested keys with a separator.
+
+    Parameters
+    ----------
+    record: dict
+        Record with the metrics of an algorithm.
+    separator: str, optional
+        String placed between the nested keys.
+
+    Returns
+    -------
+    flat_record: dict
+        Dictionary without nested dictionaries.
+    """
+
+    flat_record = {}
+    for name, value in record.items():
+        if isinstance(value, dict):
+            for key, item in flatten_record(value, separator).items():
+                flat_record[f"{name}{separator}{key}"] = item
+        elif isinstance(value, np.ndarray):
+            flat_record[name] = value.tolist()
+        elif isinstance(value, np.generic):
+            flat_record[name] = value.item()
+        else:
+            flat_record[name] = value
+
+    return flat_record
@@ -1,9 +1,30 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+import hashlib
+import pickle
+import time
+import weakref
 import numpy as np
 from numpy import ndarray
 from .initializers import UniformVectorInitializer
 
+# Identifier of the content of each encoding used in the keys of the fitness cache, equivalent
+# encodings (for example, two instances of DefaultEncoding) share the same identifier.
+_encoding_fingerprints = weakref.WeakKeyDictionary()
+
+
+def _encoding_fingerprint(encoding: Encoding) -> Any:
+    fingerprint = _encoding_fingerprints.get(encoding)
+    if fingerprint is None:
+        try:
+            fingerprint = (type(encoding), hashlib.blake2b(pickle.dumps(encoding), digest_size=16).digest())
+        except (pickle.PicklingError, TypeError, AttributeError):
+            fingerprint = encoding
+        _encoding_fingerprints[encoding] = fingerprint
+
+    return fingerprint
+
 
 class ObjectiveFunc(ABC):
     """
@@ -13,6 +34,11 @@ class ObjectiveFunc(ABC):
     and implement the fitness function, random solution generation,
     mutation function and crossing of solutions.
 
+    Optionally, the fitness values can be stored in a cache (see :py:meth:`enable_cache`) so that
+    genotypes that have already been evaluated are not evaluated again. The attribute 'counter'
+    holds the number of fitness values requested, 'true_evaluations' the number of times the objective
+    function was actually evaluated and 'cache_hits' the number of values taken from the cache.
+
     Parameters
     ----------
     mode: str, optional
@@ -28,8 +54,17 @@ class ObjectiveFunc(ABC):
 
         self.name = name
         self.counter = 0
+        self.true_evaluations = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.factor = 1
 
+        self.cache = None
+        self.cache_size = 0
+
+        # Histogram of the time spent in each evaluation, only measured when a Profiler asks for it
+        self.latency = None
+
         self.mode = mode
         if mode not in ["max", "min"]:
             raise ValueError('Optimization objective (mode) must be "min" or "max".')
@@ -64,14 +99,477 @@ class ObjectiveFunc(ABC):
         """
 
         self.counter += 1
-        solution = indiv.encoding.decode(indiv.genotype)
+
+        key = self._cache_key(indiv.genotype, indiv.encoding, adjusted)
+        value = self._cache_get(key)
+        if value is None:
+            solution = indiv.encoding.decode(indiv.genotype)
+            if self.latency is None:
+                indiv.objective_value = self.objective(solution)
+            else:
+                start = time.perf_counter()
+                indiv.objective_value = self.objective(solution)
+                self.latency.record(time.perf_counter() - start)
+            value = self._adjust(indiv.objective_value, solution, adjusted)
+            self._cache_put(key, value)
+
+        return value
+
+    def fitness_delta(self, indiv: Individual, parent: Individual, adjusted: bool = True) -> float:
+        """
+        Returns the value of the objective function given an individual that was obtained by modifying
+        some components of another individual whose objective value is known, using 'objective_delta'.
+
+        The components that changed are found comparing the decoded solutions of both individuals. If the
+        objective function doesn't implement 'objective_delta' or the objective value of the parent is not
+        known, the individual is evaluated with the 'fitness' method.
+
+        Parameters
+        ----------
+        indiv: Individual
+            The individual for which the fitness will be calculated.
+        parent: Individual
+            The individual from which 'indiv' was obtained.
+        adjusted: bool, optional
+            Whether to adjust the fitness value or not.
+
+        Returns
+        -------
+        fitness: float
+            Fitness value of the individual.
+        """
+
+        old_value = parent.objective_value
+        if old_value is None and parent.fitness_calculated and type(self).penalize is ObjectiveFunc.penalize:
+            # Without penalties the objective value can be recovered from the fitness
+            old_value = self.factor * parent.fitness
+
+        if not self.supports_delta or old_value is None:
+            return self.fitness(indiv, adjusted)
+
+        old_solution = parent.encoding.decode(parent.genotype)
+        new_solution = indiv.encoding.decode(indiv.genotype)
+        if not isinstance(new_solution, ndarray) or not isinstance(old_solution, ndarray) or new_solution.shape != old_solution.shape:
+            return self.fitness(indiv, adjusted)
+
+        self.counter += 1
+
+        key = self._cache_key(indiv.genotype, indiv.encoding, adjusted)
+        value = self._cache_get(key)
+        if value is None:
+            changed_indices = np.flatnonzero(new_solution != old_solution)
+            start = time.perf_counter()
+            indiv.objective_value = self.objective_delta(old_solution, old_value, changed_indices, new_solution)
+            if self.latency is not None:
+                self.latency.record(time.perf_counter() - start)
+            value = self._adjust(indiv.objective_value, new_solution, adjusted)
+            self._cache_put(key, value)
+
+        return value
+
+    def solution_fitness(self, solution: Any, adjusted: bool = True) -> float:
+        """
+        Returns the value of the objective function given an already decoded solution.
+        Unlike the 'fitness' method, the evaluation counter is not updated.
+
+        Parameters
+        ----------
+        solution: Any
+            The decoded solution for which the fitness will be calculated.
+        adjusted: bool, optional
+            Whether to adjust the fitness value or not.
+
+        Returns
+        -------
+        fitness: float
+            Fitness value of the solution.
+        """
+
+        if self.latency is None:
+            return self._adjust(self.objective(solution), solution, adjusted)
+
+        start = time.perf_counter()
         value = self.objective(solution)
+        self.latency.record(time.perf_counter() - start)
 
+        return self._adjust(value, solution, adjusted)
+
+    def _adjust(self, value: float, solution: Any, adjusted: bool) -> float:
         if adjusted:
             value = self.factor * (value - self.penalize(solution))
 
         return value
 
+    async def fitness_async(self, indiv: Individual, adjusted: bool = True) -> float:
+        """
+        Coroutine that returns the value of the objective function given an individual using 'objective_async'.
+        It works in the same way as the 'fitness' method.
+
+        Parameters
+        ----------
+        indiv: Individual
+            The individual for which the fitness will be calculated.
+        adjusted: bool, optional
+            Whether to adjust the fitness value or not.
+
+        Returns
+        -------
+        fitness: float
+            Fitness value of the individual.
+        """
+
+        self.counter += 1
+
+        key = self._cache_key(indiv.genotype, indiv.encoding, adjusted)
+        value = self._cache_get(key)
+        if value is None:
+            solution = indiv.encoding.decode(indiv.genotype)
+            value = await self.solution_fitness_async(solution, adjusted)
+            self._cache_put(key, value)
+
+        return value
+
+    async def solution_fitness_async(self, solution: Any, adjusted: bool = True) -> float:
+        """
+        Coroutine that returns the value of the objective function given an already decoded solution.
+        Unlike the 'fitness_async' method, the evaluation counter is not updated.
+
+        Parameters
+        ----------
+        solution: Any
+            The decoded solution for which the fitness will be calculated.
+        adjusted: bool, optional
+            Whether to adjust the fitness value or not.
+
+        Returns
+        -------
+        fitness: float
+            Fitness value of the solution.
+        """
+
+        start = time.perf_counter()
+        value = await self.objective_async(solution)
+        if self.latency is not None:
+            self.latency.record(time.perf_counter() - start)
+
+        return self._adjust(value, solution, adjusted)
+
+    @property
+    def supports_delta(self) -> bool:
+        """
+        Whether the objective function provides its own implementation of 'objective_delta'.
+        """
+
+        return type(self).objective_delta is not ObjectiveFunc.objective_delta
+
+    @property
+    def supports_async(self) -> bool:
+        """
+        Whether the objective function provides its own implementation of 'objective_async'.
+        """
+
+        return type(self).objective_async is not ObjectiveFunc.objective_async
+
+    @property
+    def supports_batch(self) -> bool:
+        """
+        Whether the objective function provides its own implementation of 'objective_batch'.
+        """
+
+        return type(self).objective_batch is not ObjectiveFunc.objective_batch
+
+    def fitness_batch(self, population: List[Individual], adjusted: bool = True) -> ndarray:
+        """
+        Returns the value of the objective function for each individual of a population.
+
+        If the objective function implements 'objective_batch' the decoded solutions are stacked
+        in a matrix and evaluated with a single call, otherwise each individual is evaluated
+        one after the other.
+
+        Parameters
+        ----------
+        population: List[Individual]
+            The individuals for which the fitness will be calculated.
+        adjusted: bool, optional
+            Whether to adjust the fitness values or not.
+
+        Returns
+        -------
+        fitness: ndarray
+            Fitness value of each individual.
+        """
+
+        def evaluate(pending):
+            if self.supports_batch:
+                solutions = np.stack([indiv.encoding.decode(indiv.genotype) for indiv in pending])
+                return self.solution_fitness_batch(solutions, adjusted)
+
+            return [self.solution_fitness(indiv.encoding.decode(indiv.genotype), adjusted) for indiv in pending]
+
+        return self.fitness_cached(population, evaluate, adjusted)
+
+    def solution_fitness_batch(self, solutions: ndarray, adjusted: bool = True) -> ndarray:
+        """
+        Returns the value of the objective function for each row of a matrix of already decoded solutions.
+        Unlike the 'fitness_batch' method, the evaluation counter is not updated.
+
+        Parameters
+        ----------
+        solutions: ndarray
+            Matrix with one decoded solution in each row.
+        adjusted: bool, optional
+            Whether to adjust the fitness values or not.
+
+        Returns
+        -------
+        fitness: ndarray
+            Fitness value of each solution.
+        """
+
+        start = time.perf_counter()
+        values = np.asarray(self.objective_batch(solutions))
+        if self.latency is not None and len(values) > 0:
+            # Each solution is recorded with the mean latency of the batch
+            self.latency.record((time.perf_counter() - start) / len(values), len(values))
+
+        if adjusted:
+            values = self.factor * (values - self.penalize_batch(solutions))
+
+        return values
+
+    def enable_cache(self, max_size: int = 10000):
+        """
+        Stores the fitness of the evaluated genotypes so that they are not evaluated again.
+
+        The values are identified by a hash of the bytes of the genotype and its encoding. When the cache
+        is full, the value that was used least recently is discarded.
+
+        Parameters
+        ----------
+        max_size: int, optional
+            Maximum number of fitness values stored.
+        """
+
+        if max_size <= 0:
+            raise ValueError("The size of the cache must be a positive integer.")
+
+        if self.cache is None:
+            self.cache = OrderedDict()
+        self.cache_size = max_size
+
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def disable_cache(self):
+        """
+        Stops storing fitness values and discards the ones stored.
+        """
+
+        self.cache = None
+        self.cache_size = 0
+
+    def clear_cache(self):
+        """
+        Discards the fitness values stored in the cache.
+        """
+
+        if self.cache is not None:
+            self.cache.clear()
+
+    def reset_counters(self):
+        """
+        Sets the number of evaluations and the statistics of the cache to 0.
+        """
+
+        self.counter = 0
+        self.true_evaluations = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def cache_info(self) -> dict:
+        """
+        Returns the statistics of the fitness cache.
+
+        Returns
+        -------
+        info: dict
+            Number of values stored, maximum size, hits and misses of the cache.
+        """
+
+        return {
+            "enabled": self.cache is not None,
+            "size": 0 if self.cache is None else len(self.cache),
+            "max_size": self.cache_size,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "true_evaluations": self.true_evaluations,
+        }
+
+    def lookup_cache(self, population: List[Individual], adjusted: bool = True) -> Tuple[ndarray, ndarray, list]:
+        """
+        Looks for the fitness of each individual in the cache, counting each individual as a requested evaluation.
+
+        The values calculated for the individuals that were not found must be registered afterwards with
+        :py:meth:`record_evaluations`.
+
+        Parameters
+        ----------
+        population: List[Individual]
+            The individuals for which the fitness is requested.
+        adjusted: bool, optional
+            Whether the fitness values are adjusted or not.
+
+        Returns
+        -------
+        values: ndarray
+            Fitness value of each individual, NaN for the ones not found in the cache.
+        missing: ndarray
+            Positions of the individuals that need to be evaluated.
+        keys: list
+            Identifiers of the individuals that need to be evaluated in the cache.
+        """
+
+        self.counter += len(population)
+        values = np.full(len(population), np.nan)
+
+        if self.cache is None:
+            return values, np.arange(len(population)), [None] * len(population)
+
+        missing = []
+        keys = []
+        for idx, indiv in enumerate(population):
+            key = self._cache_key(indiv.genotype, indiv.encoding, adjusted)
+            value = self._cache_get(key)
+            if value is None:
+                missing.append(idx)
+                keys.append(key)
+            else:
+                values[idx] = value
+
+        return values, np.array(missing, dtype=int), keys
+
+    def record_evaluations(self, keys: list, values: ndarray):
+        """
+        Registers the fitness values calculated for the individuals that were not found in the cache.
+
+        Parameters
+        ----------
+        keys: list
+            Identifiers in the cache returned by :py:meth:`lookup_cache`.
+        values: ndarray
+            Fitness value calculated for each individual.
+        """
+
+        for key, value in zip(keys, values):
+            self._cache_put(key, value)
+
+    def _distinct_missing(self, keys: list) -> Tuple[ndarray, ndarray]:
+        """
+        Groups the individuals not found in the cache by their key, so that each distinct genotype is evaluated once.
+        Returns the positions of the first individual with each key and, for each individual, the position of the
+        first one with its key. The repeated individuals are counted as cache hits.
+        """
+
+        first_seen = {}
+        source = np.array([pos if key is None else first_seen.setdefault(key, pos) for pos, key in enumerate(keys)], dtype=int)
+        distinct = np.flatnonzero(source == np.arange(len(keys)))
+
+        n_repeated = len(keys) - distinct.size
+        self.cache_misses -= n_repeated
+        self.cache_hits += n_repeated
+
+        return distinct, source
+
+    def fitness_cached(self, population: List[Individual], evaluate: Callable, adjusted: bool = True) -> ndarray:
+        """
+        Returns the fitness of each individual of a population, taking the values found in the cache and
+        calculating the rest with the function given. Individuals with the same genotype are evaluated only once.
+
+        Parameters
+        ----------
+        population: List[Individual]
+            The individuals for which the fitness is requested.
+        evaluate: Callable
+            Function that receives a list of individuals and returns the fitness of each of them.
+        adjusted: bool, optional
+            Whether the fitness values are adjusted or not.
+
+        Returns
+        -------
+        fitness: ndarray
+            Fitness value of each individual.
+        """
+
+        values, missing, keys = self.lookup_cache(population, adjusted)
+
+        if missing.size > 0:
+            distinct, source = self._distinct_missing(keys)
+            computed = np.asarray(evaluate([population[missing[pos]] for pos in distinct]), dtype=float)
+
+            values[missing] = computed[np.searchsorted(distinct, source)]
+            self.record_evaluations([keys[pos] for pos in distinct], computed)
+
+        return values
+
+    async def fitness_cached_async(self, population: List[Individual], evaluate: Callable, adjusted: bool = True) -> ndarray:
+        """
+        Coroutine that works in the same way as :py:meth:`fitness_cached`, with a coroutine function that
+        calculates the fitness of the individuals not found in the cache.
+
+        Parameters
+        ----------
+        population: List[Individual]
+            The individuals for which the fitness is requested.
+        evaluate: Callable
+            Coroutine function that receives a list of individuals and returns the fitness of each of them.
+        adjusted: bool, optional
+            Whether the fitness values are adjusted or not.
+
+        Returns
+        -------
+        fitness: ndarray
+            Fitness value of each individual.
+        """
+
+        values, missing, keys = self.lookup_cache(population, adjusted)
+
+        if missing.size > 0:
+            distinct, source = self._distinct_missing(keys)
+            computed = np.asarray(await evaluate([population[missing[pos]] for pos in distinct]), dtype=float)
+
+            values[missing] = computed[np.searchsorted(distinct, source)]
+            self.record_evaluations([keys[pos] for pos in distinct], computed)
+
+        return values
+
+    def _cache_key(self, genotype: Any, encoding: Encoding, adjusted: bool) -> tuple:
+        if self.cache is None or not isinstance(genotype, ndarray) or genotype.dtype.hasobject:
+            return None
+
+        digest = hashlib.blake2b(np.ascontiguousarray(genotype).tobytes(), digest_size=16).digest()
+        return (_encoding_fingerprint(encoding), adjusted, genotype.dtype.str, genotype.shape, digest)
+
+    def _cache_get(self, key: tuple) -> float:
+        if key is None:
+            return None
+
+        value = self.cache.get(key)
+        if value is None:
+            self.cache_misses += 1
+        else:
+            self.cache.move_to_end(key)
+            self.cache_hits += 1
+
+        return value
+
+    def _cache_put(self, key: tuple, value: float):
+        self.true_evaluations += 1
+
+        if key is not None and self.cache is not None:
+            self.cache[key] = value
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
     @abstractmethod
     def objective(self, solution: Any) -> float:
         """
@@ -88,6 +586,74 @@ class ObjectiveFunc(ABC):
             Value of the objective function given a solution.
         """
 
+    def objective_batch(self, solutions: ndarray) -> ndarray:
+        """
+        Implementation of the objective function evaluated on many solutions at once.
+
+        If not implemented, the 'objective' method is called on each solution.
+
+        Parameters
+        ----------
+        solutions: ndarray
+            Matrix with one solution in each row.
+
+        Returns
+        -------
+        objective_values: ndarray
+            Value of the objective function for each solution.
+        """
+
+        return np.array([self.objective(solution) for solution in solutions])
+
+    def objective_delta(self, old_solution: Any, old_value: float, changed_indices: ndarray, new_solution: Any) -> float:
+        """
+        Implementation of the objective function for a solution that differs from another solution, whose
+        objective value is known, only in a few components. Implementing this method allows local search
+        strategies to evaluate small modifications of a solution in time proportional to the number of
+        components modified instead of the size of the solution.
+
+        If not implemented, the 'objective' method is called on the new solution.
+
+        Parameters
+        ----------
+        old_solution: Any
+            The solution that was modified.
+        old_value: float
+            Value of the objective function for the old solution.
+        changed_indices: ndarray
+            Positions of the components that differ between both solutions (in the flattened solution).
+        new_solution: Any
+            The solution for which the fitness will be calculated.
+
+        Returns
+        -------
+        objective_value: float
+            Value of the objective function given the new solution.
+        """
+
+        return self.objective(new_solution)
+
+    async def objective_async(self, solution: Any) -> float:
+        """
+        Implementation of the objective function as a coroutine, meant for objective functions that spend
+        most of their time waiting (for example, for the response of a simulation service), so that the
+        evaluation of many solutions can be overlapped.
+
+        If not implemented, the 'objective' method is called, which blocks the event loop until it finishes.
+
+        Parameters
+        ----------
+        solution: Any
+            The solution for which the fitness will be calculated.
+
+        Returns
+        -------
+        objective_value: float
+            Value of the objective function given a solution.
+        """
+
+        return self.objective(solution)
+
     @abstractmethod
     def repair_solution(self, solution: Any) -> Any:
         """
@@ -146,6 +712,28 @@ class ObjectiveFunc(ABC):
 
         return 0
 
+    def penalize_batch(self, solutions: ndarray) -> ndarray:
+        """
+        Gives a penalization to each row of a matrix of solutions.
+
+        If 'penalize' is not implemented always returns a vector of zeros.
+
+        Parameters
+        ----------
+        solutions: ndarray
+            Matrix with one solution in each row.
+
+        Returns
+        -------
+        penalties: ndarray
+            The penalty associated to each solution.
+        """
+
+        if type(self).penalize is ObjectiveFunc.penalize:
+            return np.zeros(len(solutions))
+
+        return np.array([self.penalize(solution) for solution in solutions])
+
 
 class ObjectiveVectorFunc(ObjectiveFunc):
     """
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import time
 from .ParamScheduler import ParamScheduler
 from abc import ABC, abstractmethod
 
@@ -31,6 +32,9 @@ class Operator(ABC):
 
         self.name = name
 
+        # Time spent in this operator, only measured when a Profiler asks for it
+        self.timer = None
+
         if params is None:
             self.params = {}
         elif params == "default":
@@ -81,7 +85,23 @@ class Operator(ABC):
         A shorthand for calling the 'evolve' method.
         """
 
-        return self.evolve(solution, population, objfunc, global_best, initializer)
+        if self.timer is None:
+            return self.evolve(solution, population, objfunc, global_best, initializer)
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        result = self.evolve(solution, population, objfunc, global_best, initializer)
+        self.timer.add(time.perf_counter() - wall_start, time.process_time() - cpu_start)
+
+        return result
+
+    @property
+    def supports_batch(self) -> bool:
+        """
+        Whether the operator can be applied to a whole population at once with the 'evolve_batch' method.
+        """
+
+        return False
 
     def step(self, progress: float):
         """
@@ -149,3 +169,75 @@ class Operator(ABC):
         new_individual: Individual
             The modified individual.
         """
+
+    def apply_batch(
+        self,
+        pop_matrix: ndarray,
+        fitness: ndarray,
+        global_best: ndarray,
+        speed: ndarray = None,
+        indiv_best: ndarray = None,
+        partner_matrix: ndarray = None,
+        partner_fitness: ndarray = None,
+        partner_idx: ndarray = None,
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Calls the 'evolve_batch' method, measuring the time spent in it if requested.
+        """
+
+        if self.timer is None:
+            return self.evolve_batch(pop_matrix, fitness, global_best, speed, indiv_best, partner_matrix, partner_fitness, partner_idx)
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        result = self.evolve_batch(pop_matrix, fitness, global_best, speed, indiv_best, partner_matrix, partner_fitness, partner_idx)
+        # Counted as one call per individual, to be comparable with the operators applied one by one
+        self.timer.add(time.perf_counter() - wall_start, time.process_time() - cpu_start, len(pop_matrix))
+
+        return result
+
+    def evolve_batch(
+        self,
+        pop_matrix: ndarray,
+        fitness: ndarray,
+        global_best: ndarray,
+        speed: ndarray = None,
+        indiv_best: ndarray = None,
+        partner_matrix: ndarray = None,
+        partner_fitness: ndarray = None,
+        partner_idx: ndarray = None,
+    ) -> Tuple[ndarray, ndarray]:
+        """
+        Evolves every individual of a population at once, where the population is represented
+        as a matrix with the genotype of an individual in each row.
+
+        Only available if 'supports_batch' is True.
+
+        Parameters
+        ----------
+        pop_matrix: ndarray
+            Matrix with the genotypes of the individuals to be operated on.
+        fitness: ndarray
+            Fitness of each individual.
+        global_best: ndarray
+            Genotype of the best individual found during the optimization of the algorithm.
+        speed: ndarray, optional
+            Matrix with the speed of each individual.
+        indiv_best: ndarray, optional
+            Matrix with the best genotype found by each individual.
+        partner_matrix: ndarray, optional
+            Matrix with the genotypes of the population the individuals take their partners from, used
+            when only part of a population is operated on. Defaults to the individuals themselves.
+        partner_fitness: ndarray, optional
+            Fitness of each individual of the partner matrix.
+        partner_idx: ndarray, optional
+            Position of each individual in the partner matrix, so that it isn't chosen as its own partner.
+            Required if a partner matrix is given.
+
+        Returns
+        -------
+        offspring: Tuple[ndarray, ndarray]
+            A pair of the matrix with the modified genotypes and the matrix with their speeds.
+        """
+
+        raise NotImplementedError(f'Operator "{self.name}" can\'t be applied to a whole population at once.')
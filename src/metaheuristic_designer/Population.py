@@ -0,0 +1,440 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from copy import copy
+import numpy as np
+from numpy import ndarray
+from .Individual import Individual
+from .encodings import DefaultEncoding
+from .utils import RAND_GEN
+
+
+class Population(Sequence):
+    """
+    Population of individuals represented with vectors, stored as contiguous arrays.
+
+    The genotypes, speeds and best vectors of the individuals are rows of a matrix, and their
+    fitness, ages and ids are stored as vectors. Indexing the population with an integer returns a
+    view of that row that behaves like an :py:class:`~metaheuristic_designer.Individual`, so that code
+    expecting a list of individuals keeps working.
+
+    Parameters
+    ----------
+    objfunc: ObjectiveFunc
+        Objective function used to evaluate the individuals.
+    genotype_matrix: ndarray
+        Matrix with the genotype of an individual in each row.
+    speed_matrix: ndarray, optional
+        Matrix with the speed of an individual in each row.
+    encoding: Encoding, optional
+        Encoding shared by all the individuals of the population.
+    ages: ndarray, optional
+        Age of each individual.
+    """
+
+    def __init__(
+        self,
+        objfunc: ObjectiveFunc,
+        genotype_matrix: ndarray,
+        speed_matrix: ndarray = None,
+        encoding: Encoding = None,
+        ages: ndarray = None,
+    ):
+        """
+        Constructor for the Population class.
+        """
+
+        self.objfunc = objfunc
+
+        self.genotype_matrix = np.array(genotype_matrix, ndmin=2)
+        pop_size = self.genotype_matrix.shape[0]
+
+        if speed_matrix is None:
+            speed_matrix = RAND_GEN.random(size=self.genotype_matrix.shape)
+        self.speed_matrix = np.array(speed_matrix, dtype=float, ndmin=2)
+
+        self.best_matrix = self.genotype_matrix.copy()
+
+        self.fitness = np.zeros(pop_size)
+        self.best_fitness = np.full(pop_size, np.nan)
+        self.fitness_calculated = np.zeros(pop_size, dtype=bool)
+
+        if ages is None:
+            ages = np.zeros(pop_size, dtype=int)
+        self.ages = np.array(ages, dtype=int)
+
+        self.ids = np.arange(Individual._last_id, Individual._last_id + pop_size)
+        Individual._last_id += pop_size
+
+        if encoding is None:
+            encoding = DefaultEncoding()
+        self.encoding = encoding
+
+    @classmethod
+    def from_individuals(cls, individuals: List[Individual]) -> Population:
+        """
+        Builds a population from a list of individuals, keeping their fitness, age and best vector.
+
+        Parameters
+        ----------
+        individuals: List[Individual]
+            Individuals that will be stored in the population. They must share the same encoding.
+
+        Returns
+        -------
+        population: Population
+            The population with the information of the individuals.
+        """
+
+        if isinstance(individuals, Population):
+            return individuals
+
+        first = individuals[0]
+        genotypes = np.vstack([indiv.genotype for indiv in individuals])
+        speeds = None
+        if all(indiv.speed is not None for indiv in individuals):
+            speeds = np.vstack([indiv.speed for indiv in individuals])
+        ages = np.array([indiv.age for indiv in individuals])
+
+        population = cls(first.objfunc, genotypes, speeds, first.encoding, ages)
+        population.best_matrix = np.vstack([indiv.best for indiv in individuals])
+        population.fitness = np.array([indiv._fitness for indiv in individuals], dtype=float)
+        population.fitness_calculated = np.array([indiv.fitness_calculated for indiv in individuals], dtype=bool)
+        population.best_fitness = np.array(
+            [np.nan if indiv.best_fitness is None else indiv.best_fitness for indiv in individuals], dtype=float
+        )
+        population.ids = np.array([indiv.id for indiv in individuals])
+
+        return population
+
+    @classmethod
+    def concatenate(cls, populations: List[Population]) -> Population:
+        """
+        Joins several populations in a single one, the individuals keep their ids.
+
+        Parameters
+        ----------
+        populations: List[Population]
+            Populations that will be joined.
+
+        Returns
+        -------
+        population: Population
+            A population with all the individuals of the given populations.
+        """
+
+        populations = [cls.from_individuals(pop) for pop in populations]
+
+        joined = copy(populations[0])
+        for attr in ["genotype_matrix", "speed_matrix", "best_matrix", "fitness", "best_fitness", "fitness_calculated", "ages", "ids"]:
+            setattr(joined, attr, np.concatenate([getattr(pop, attr) for pop in populations]))
+
+        return joined
+
+    def __len__(self) -> int:
+        return self.genotype_matrix.shape[0]
+
+    def __getitem__(self, idx: int | slice | ndarray) -> IndividualView | Population:
+        """
+        Returns a view of a single individual if an integer is given, or a new population with
+        a copy of the selected individuals if a slice, an array of indices or a boolean mask is given.
+        """
+
+        if isinstance(idx, (int, np.integer)):
+            if idx < -len(self) or idx >= len(self):
+                raise IndexError("Population index out of range.")
+            return IndividualView(self, idx % len(self))
+
+        return self.take(idx)
+
+    def take(self, indices: slice | ndarray) -> Population:
+        """
+        Creates a new population with a copy of the individuals in the given positions.
+
+        Parameters
+        ----------
+        indices: slice | ndarray
+            Positions of the selected individuals, as a slice, an array of indices or a boolean mask.
+
+        Returns
+        -------
+        population: Population
+            Population with the selected individuals.
+        """
+
+        if isinstance(indices, list):
+            indices = np.asarray(indices, dtype=int)
+
+        selected = copy(self)
+        for attr in ["genotype_matrix", "speed_matrix", "best_matrix", "fitness", "best_fitness", "fitness_calculated", "ages", "ids"]:
+            setattr(selected, attr, getattr(self, attr)[indices].copy())
+
+        return selected
+
+    def to_individuals(self) -> List[Individual]:
+        """
+        Creates an independent Individual object for each member of the population.
+
+        Returns
+        -------
+        individuals: List[Individual]
+            A list with a copy of each individual.
+        """
+
+        return [copy(IndividualView(self, idx)) for idx in range(len(self))]
+
+    @property
+    def decoded_matrix(self) -> ndarray:
+        """
+        Matrix with the decoded solution of each individual in each row.
+        """
+
+        return np.stack([self.encoding.decode(genotype) for genotype in self.genotype_matrix])
+
+    def set_fitness(self, indices: slice | ndarray, values: ndarray):
+        """
+        Manually sets the fitness of a group of individuals, updating their best vectors.
+
+        Parameters
+        ----------
+        indices: slice | ndarray
+            Positions of the individuals.
+        values: ndarray
+            Fitness of each individual.
+        """
+
+        idx = np.arange(len(self))[indices]
+        values = np.asarray(values, dtype=float)
+
+        improved = np.isnan(self.best_fitness[idx]) | (self.best_fitness[idx] < values)
+        self.best_fitness[idx[improved]] = values[improved]
+        self.best_matrix[idx[improved]] = self.genotype_matrix[idx[improved]]
+
+        self.fitness[idx] = values
+        self.fitness_calculated[idx] = True
+
+    def evaluate(self, objfunc: ObjectiveFunc = None) -> Population:
+        """
+        Calculates the fitness of the individuals whose fitness has not been calculated yet.
+
+        Parameters
+        ----------
+        objfunc: ObjectiveFunc, optional
+            Objective function used for the evaluation, by default the one associated with the population.
+
+        Returns
+        -------
+        population: Population
+            The population itself.
+        """
+
+        if objfunc is None:
+            objfunc = self.objfunc
+
+        def evaluate(views):
+            solutions = np.stack([self.encoding.decode(view.genotype) for view in views])
+
+            if objfunc.supports_batch:
+                return objfunc.solution_fitness_batch(solutions)
+
+            return [objfunc.solution_fitness(solution) for solution in solutions]
+
+        pending = np.flatnonzero(~self.fitness_calculated)
+        if pending.size > 0:
+            values = objfunc.fitness_cached([IndividualView(self, idx) for idx in pending], evaluate)
+            self.set_fitness(pending, values)
+
+        return self
+
+    def best_index(self) -> int:
+        """
+        Returns the position of the individual with the highest fitness.
+        """
+
+        return int(np.argmax(self.fitness))
+
+
+class IndividualView(Individual):
+    """
+    Individual that reads and writes its information directly from a row of a :py:class:`Population`.
+
+    Parameters
+    ----------
+    population: Population
+        Population that holds the information of the individual.
+    index: int
+        Position of the individual in the population.
+    """
+
+    # The raw objective value is not stored in the population
+    objective_value = None
+
+    def __init__(self, population: Population, index: int):
+        """
+        Constructor for the IndividualView class.
+        """
+
+        self._population = population
+        self._index = index
+
+    @property
+    def objfunc(self) -> ObjectiveFunc:
+        return self._population.objfunc
+
+    @objfunc.setter
+    def objfunc(self, new_objfunc: ObjectiveFunc):
+        self._population.objfunc = new_objfunc
+
+    @property
+    def encoding(self) -> Encoding:
+        return self._population.encoding
+
+    @encoding.setter
+    def encoding(self, new_encoding: Encoding):
+        self._population.encoding = new_encoding
+
+    @property
+    def _genotype(self) -> ndarray:
+        return self._population.genotype_matrix[self._index]
+
+    @_genotype.setter
+    def _genotype(self, vector: ndarray):
+        self._population.genotype_matrix[self._index] = vector
+
+    @property
+    def speed(self) -> ndarray:
+        return self._population.speed_matrix[self._index]
+
+    @speed.setter
+    def speed(self, vector: ndarray):
+        # Individuals represented with vectors always have a speed, a missing speed leaves it unchanged
+        if vector is not None:
+            self._population.speed_matrix[self._index] = vector
+
+    @property
+    def best(self) -> ndarray:
+        return self._population.best_matrix[self._index]
+
+    @best.setter
+    def best(self, vector: ndarray):
+        self._population.best_matrix[self._index] = vector
+
+    @property
+    def _fitness(self) -> float:
+        return self._population.fitness[self._index]
+
+    @_fitness.setter
+    def _fitness(self, fit: float):
+        self._population.fitness[self._index] = fit
+
+    @property
+    def best_fitness(self) -> float:
+        best_fitness = self._population.best_fitness[self._index]
+        return None if np.isnan(best_fitness) else best_fitness
+
+    @best_fitness.setter
+    def best_fitness(self, fit: float):
+        self._population.best_fitness[self._index] = np.nan if fit is None else fit
+
+    @property
+    def fitness_calculated(self) -> bool:
+        return bool(self._population.fitness_calculated[self._index])
+
+    @fitness_calculated.setter
+    def fitness_calculated(self, calculated: bool):
+        self._population.fitness_calculated[self._index] = calculated
+
+    @property
+    def age(self) -> int:
+        return int(self._population.ages[self._index])
+
+    @age.setter
+    def age(self, new_age: int):
+        self._population.ages[self._index] = new_age
+
+    @property
+    def id(self) -> int:
+        return int(self._population.ids[self._index])
+
+    @id.setter
+    def id(self, new_id: int):
+        self._population.ids[self._index] = new_id
+
+
+def stack_genotypes(population: List[Individual] | Population) -> ndarray:
+    """
+    Returns a matrix with the genotype of each individual in each row, without copying
+    the data if the individuals are stored in a :py:class:`Population`.
+
+    Parameters
+    ----------
+    population: List[Individual] | Population
+        The individuals of the population.
+
+    Returns
+    -------
+    genotype_matrix: ndarray
+        Matrix with the genotypes of the population.
+    """
+
+    if hasattr(population, "genotype_matrix"):
+        return population.genotype_matrix
+
+    return np.vstack([indiv.genotype for indiv in population])
+
+
+def genotype_mean_std(population: List[Individual] | Population) -> Tuple[ndarray, ndarray]:
+    """
+    Returns the mean and the standard deviation of each component of the genotypes of a population,
+    without building the genotype matrix if the population is able to calculate them on its own
+    (as the rest of a :py:class:`PopulationContext` does).
+
+    Parameters
+    ----------
+    population: List[Individual] | Population
+        The individuals of the population.
+
+    Returns
+    -------
+    mean: ndarray
+        Mean of each component of the genotypes.
+    std: ndarray
+        Standard deviation of each component of the genotypes.
+    """
+
+    if hasattr(population, "genotype_mean_std"):
+        return population.genotype_mean_std()
+
+    genotype_matrix = stack_genotypes(population)
+    return genotype_matrix.mean(axis=0), genotype_matrix.std(axis=0)
+
+
+def is_vector_population(population: List[Individual] | Population) -> bool:
+    """
+    Checks whether the individuals of a population can be represented as rows of a matrix,
+    that is, all of them have vector genotypes and speeds with the same size.
+
+    Parameters
+    ----------
+    population: List[Individual] | Population
+        The individuals of the population.
+
+    Returns
+    -------
+    is_vector: bool
+        Whether the population can be stored in a matrix.
+    """
+
+    if isinstance(population, Population):
+        return True
+
+    if len(population) == 0 or not isinstance(population[0].genotype, np.ndarray):
+        return False
+
+    shape = population[0].genotype.shape
+    return len(shape) == 1 and all(
+        isinstance(indiv.genotype, np.ndarray)
+        and indiv.genotype.shape == shape
+        and isinstance(indiv.speed, np.ndarray)
+        and indiv.speed.shape == shape
+        for indiv in population
+    )
@@ -0,0 +1,292 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from functools import cached_property
+import numpy as np
+from numpy import ndarray
+from .Population import Population, stack_genotypes
+
+
+class PopulationContext(Sequence):
+    """
+    Information about the population of a generation that is shared by all the operators applied on it.
+
+    It behaves like the list of individuals it wraps, but the fitness of the population, the ranking
+    of the individuals and the genotype matrix are computed only once (and only if some operator needs them).
+    It also gives access to the rest of the population from the point of view of one of its individuals
+    in constant time, avoiding a scan of the population each time an operator is applied.
+
+    Parameters
+    ----------
+    population: List[Individual]
+        The individuals of the population.
+    """
+
+    def __init__(self, population: List[Individual]):
+        """
+        Constructor for the PopulationContext class.
+        """
+
+        self.population = population
+
+    def __len__(self) -> int:
+        return len(self.population)
+
+    def __getitem__(self, idx: int | slice) -> Individual | List[Individual]:
+        return self.population[idx]
+
+    def __iter__(self):
+        return iter(self.population)
+
+    @cached_property
+    def fitness(self) -> ndarray:
+        """
+        Fitness of each individual.
+        """
+
+        return np.array([indiv.fitness for indiv in self.population])
+
+    @cached_property
+    def fitness_order(self) -> ndarray:
+        """
+        Positions of the individuals sorted from the highest to the lowest fitness.
+        """
+
+        return np.argsort(-self.fitness, kind="stable")
+
+    @cached_property
+    def genotype_matrix(self) -> ndarray:
+        """
+        Matrix with the genotype of each individual in each row.
+        """
+
+        return stack_genotypes(self.population)
+
+    @cached_property
+    def _genotype_moments(self) -> Tuple[ndarray, ndarray, ndarray]:
+        # Sums of the genotypes (and their squares) shifted by the mean of the population, which keeps the
+        # statistics accurate when an individual is subtracted from them
+        center = self.genotype_matrix.mean(axis=0)
+        shifted = self.genotype_matrix - center
+
+        return center, shifted.sum(axis=0), np.square(shifted).sum(axis=0)
+
+    def genotype_mean_std(self, excluded: int = None) -> Tuple[ndarray, ndarray]:
+        """
+        Returns the mean and the standard deviation of each component of the genotypes.
+
+        The sums needed are computed once for the entire population, so leaving an individual out
+        only takes time proportional to the size of a genotype.
+
+        Parameters
+        ----------
+        excluded: int, optional
+            Position of an individual that will not be considered.
+
+        Returns
+        -------
+        mean: ndarray
+            Mean of each component of the genotypes.
+        std: ndarray
+            Standard deviation of each component of the genotypes.
+        """
+
+        center, total, total_sq = self._genotype_moments
+        count = len(self)
+
+        if excluded is not None:
+            diff = self.genotype_matrix[excluded] - center
+            total = total - diff
+            total_sq = total_sq - np.square(diff)
+            count -= 1
+
+        mean_shift = total / count
+        variance = np.maximum(total_sq / count - np.square(mean_shift), 0)
+
+        return center + mean_shift, np.sqrt(variance)
+
+    @cached_property
+    def _positions(self) -> dict:
+        # Individuals are identified by their id, the individuals of a Population are views created on each access
+        if isinstance(self.population, Population):
+            ids = self.population.ids.tolist()
+        else:
+            ids = [indiv.id for indiv in self.population]
+
+        return {indiv_id: idx for idx, indiv_id in enumerate(ids)}
+
+    def position(self, indiv: Individual) -> int:
+        """
+        Returns the position of an individual in the population, or None if it is not part of it.
+        """
+
+        return self._positions.get(indiv.id)
+
+    def best(self, excluded: int = None) -> Individual:
+        """
+        Returns the individual with the highest fitness.
+
+        Parameters
+        ----------
+        excluded: int, optional
+            Position of an individual that will not be considered.
+
+        Returns
+        -------
+        best: Individual
+            The best individual of the population.
+        """
+
+        best_idx = self.fitness_order[0]
+        if best_idx == excluded:
+            best_idx = self.fitness_order[1]
+
+        return self.population[best_idx]
+
+    def top(self, n: int, excluded: int = None) -> List[Individual]:
+        """
+        Returns the 'n' individuals with the highest fitness, from best to worst.
+
+        Parameters
+        ----------
+        n: int
+            Number of individuals returned.
+        excluded: int, optional
+            Position of an individual that will not be considered.
+
+        Returns
+        -------
+        top_individuals: List[Individual]
+            The best individuals of the population.
+        """
+
+        top_idx = self.fitness_order[: n + 1]
+        top_idx = top_idx[top_idx != excluded][:n]
+
+        return [self.population[idx] for idx in top_idx]
+
+    def others(self, indiv: Individual) -> OtherIndividuals:
+        """
+        Returns the individuals of the population without the given one.
+
+        Parameters
+        ----------
+        indiv: Individual
+            The individual that will be excluded.
+
+        Returns
+        -------
+        others: OtherIndividuals
+            The rest of the population.
+        """
+
+        return OtherIndividuals(self, self.position(indiv))
+
+
+class OtherIndividuals(Sequence):
+    """
+    View of a population without one of its individuals.
+
+    Parameters
+    ----------
+    context: PopulationContext
+        The complete population.
+    excluded: int
+        Position of the individual left out, if None the view contains the entire population.
+    """
+
+    def __init__(self, context: PopulationContext, excluded: int = None):
+        """
+        Constructor for the OtherIndividuals class.
+        """
+
+        self.context = context
+        self.excluded = excluded
+
+    def __len__(self) -> int:
+        return len(self.context) - (self.excluded is not None)
+
+    def __getitem__(self, idx: int | slice) -> Individual | List[Individual]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+
+        if idx < 0:
+            idx += len(self)
+
+        if idx < 0 or idx >= len(self):
+            raise IndexError("Population index out of range.")
+
+        if self.excluded is not None and idx >= self.excluded:
+            idx += 1
+
+        return self.context.population[idx]
+
+    @cached_property
+    def rows(self) -> ndarray:
+        """
+        Positions of the individuals in the genotype matrix of the complete population.
+        """
+
+        rows = np.arange(len(self.context))
+        if self.excluded is not None:
+            rows = rows[rows != self.excluded]
+
+        return rows
+
+    @property
+    def genotype_matrix(self) -> ndarray:
+        """
+        Matrix with the genotype of each individual in each row.
+
+        Unless no individual is left out, the rows are copied from the genotype matrix of the complete
+        population, prefer :py:meth:`genotype_mean_std` or indexing that matrix with :py:attr:`rows`.
+        """
+
+        if self.excluded is None:
+            return self.context.genotype_matrix
+
+        return self.context.genotype_matrix[self.rows]
+
+    def genotype_mean_std(self) -> Tuple[ndarray, ndarray]:
+        """
+        Returns the mean and the standard deviation of each component of the genotypes, without copying them.
+        """
+
+        return self.context.genotype_mean_std(self.excluded)
+
+    def best(self) -> Individual:
+        """
+        Returns the individual with the highest fitness.
+        """
+
+        return self.context.best(self.excluded)
+
+    def top(self, n: int) -> List[Individual]:
+        """
+        Returns the 'n' individuals with the highest fitness, from best to worst.
+        """
+
+        return self.context.top(n, self.excluded)
+
+
+def other_individuals(population: List[Individual] | PopulationContext, indiv: Individual) -> Sequence:
+    """
+    Returns the individuals of the population different from the given one, in constant time if
+    the population is wrapped in a :py:class:`PopulationContext`.
+
+    Parameters
+    ----------
+    population: List[Individual] | PopulationContext
+        The population of the current generation.
+    indiv: Individual
+        The individual that will be excluded.
+
+    Returns
+    -------
+    others: Sequence
+        The rest of the population.
+    """
+
+    if isinstance(population, PopulationContext):
+        return population.others(indiv)
+
+    return [i for i in population if i != indiv]
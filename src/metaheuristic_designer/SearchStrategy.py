@@ -1,6 +1,9 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from copy import copy
+import numpy as np
 from .Individual import Individual
+from .Population import Population, stack_genotypes, is_vector_population
 from .ParamScheduler import ParamScheduler
 from .selectionMethods import (
     SurvivorSelection,
@@ -9,13 +12,7 @@ from .selectionMethods import (
     ParentSelectionNull,
 )
 from .Operator import Operator
-from multiprocessing import Pool
-
-
-def evaluate_indiv(indiv):
-    calculation_done = not indiv.fitness_calculated
-    indiv.calculate_fitness()
-    return indiv, calculation_done
+from .evaluators import SerialEvaluator, ProcessEvaluator
 
 
 class SearchStrategy(ABC):
@@ -30,6 +27,8 @@ class SearchStrategy(ABC):
         Population initializer that will generate the initial population of the search strategy.
     param: Union[ParamScheduler, dict]
         Dictionary of parameters to define the stopping condition and output of the search strategy.
+        If "columnar" is True, a population of vectors is stored as a
+        :py:class:`~metaheuristic_designer.Population` instead of a list of individuals.
     name: str, optional
         The name that will be displayed for this search strategy in the reports.
     """
@@ -149,26 +148,184 @@ class SearchStrategy(ABC):
         if self._initializer is None:
             raise Exception("Initializer not indicated.")
 
-        self.population = self._initializer.generate_population(objfunc)
+        population = self._initializer.generate_population(objfunc)
+
+        # Populations of vectors can be stored as contiguous arrays instead of a list of individuals
+        if self.params.get("columnar", False):
+            if not is_vector_population(population):
+                raise ValueError("Only populations of vectors with the same size can be stored as a Population.")
+            population = Population.from_individuals(population)
+
+        self.population = population
 
         return self.population
 
-    def evaluate_population(self, population, objfunc, parallel=False, threads=8):
-        if parallel:
-            with Pool(threads) as p:
-                result_pairs = p.map(evaluate_indiv, population)
-            population, calculated = map(list, zip(*result_pairs))
-            objfunc.counter += sum(calculated)
+    def evaluate_population(
+        self,
+        population: List[Individual] | Population,
+        objfunc: ObjectiveFunc,
+        parallel: bool = False,
+        threads: int = 8,
+        evaluator: Evaluator = None,
+    ) -> List[Individual]:
+        """
+        Calculates the fitness of the individuals in the population and keeps track of the best one found.
+
+        Parameters
+        ----------
+        population: List[Individual] | Population
+            The individuals that will be evaluated.
+        objfunc: ObjectiveFunc
+            Objective function to be optimized.
+        parallel: bool, optional
+            Whether to evaluate the population using multiple processes, only used if no evaluator is given.
+        threads: int, optional
+            Number of processes used in the parallel evaluation, only used if no evaluator is given.
+        evaluator: Evaluator, optional
+            Evaluator used to calculate the fitness of the population. If not given, a temporary one is created.
+
+        Returns
+        -------
+        population: List[Individual]
+            The evaluated population.
+        """
+
+        if evaluator is None:
+            evaluator = ProcessEvaluator(threads) if parallel else SerialEvaluator()
+            population = evaluator(population, objfunc)
+            evaluator.shutdown()
         else:
-            [indiv.calculate_fitness() for indiv in population]
+            population = evaluator(population, objfunc)
 
-        current_best = max(population, key=lambda x: x.fitness)
+        if isinstance(population, Population):
+            # Keep a detached copy, the rows of the population can be overwritten later
+            current_best = copy(population[population.best_index()])
+        else:
+            current_best = max(population, key=lambda x: x.fitness)
 
         if not self.best or self.best.fitness < current_best.fitness:
             self.best = current_best
 
         return population
 
+    def evaluate_neighbor(self, indiv: Individual, parent: Individual, objfunc: ObjectiveFunc) -> Individual:
+        """
+        Calculates the fitness of an individual obtained by modifying a few components of 'parent', using
+        the incremental evaluation of the objective function ('objective_delta') when it is implemented.
+        Otherwise, the individual is left to be evaluated with the rest of the population.
+
+        Parameters
+        ----------
+        indiv: Individual
+            The modified individual.
+        parent: Individual
+            The individual that was modified.
+        objfunc: ObjectiveFunc
+            Objective function to be optimized.
+
+        Returns
+        -------
+        indiv: Individual
+            The modified individual, evaluated if the objective function allows it.
+        """
+
+        if objfunc.supports_delta and not indiv.fitness_calculated:
+            indiv.fitness = objfunc.fitness_delta(indiv, parent)
+
+        return indiv
+
+    def evolve_batch(
+        self,
+        operator: Operator,
+        parent_list: List[Individual] | Population,
+        objfunc: ObjectiveFunc,
+        parent_idx: ndarray = None,
+        partner_pool: bool = False,
+    ) -> List[Individual] | Population:
+        """
+        Applies an operator to all the parents at once using its 'evolve_batch' method.
+
+        Parents whose genotype and speed are left unchanged by the operator are passed to
+        the offspring as they are, so that they are not evaluated again.
+
+        Parameters
+        ----------
+        operator: Operator
+            Operator that will be applied, it must support batch evolution.
+        parent_list: List[Individual] | Population
+            The parents that will be used to generate the offspring.
+        objfunc: ObjectiveFunc
+            Objective function to be optimized.
+        parent_idx: ndarray, optional
+            Position of the parent that generates each offspring, by default each parent generates one offspring.
+        partner_pool: bool, optional
+            Whether the operator takes partners (e.g. for a crossover) from the whole list of parents instead
+            of only from the ones given by 'parent_idx'. The operator is only applied to the latter either way.
+
+        Returns
+        -------
+        offspring: List[Individual] | Population
+            The individuals generated by the operator, as a Population if the parents are one.
+        """
+
+        if isinstance(parent_list, Population):
+            pop_matrix = parent_list.genotype_matrix
+            speed = parent_list.speed_matrix
+            indiv_best = parent_list.best_matrix
+            fitness = parent_list.fitness
+        else:
+            pop_matrix = stack_genotypes(parent_list)
+            speed = np.vstack([indiv.speed for indiv in parent_list])
+            indiv_best = np.vstack([indiv.best for indiv in parent_list])
+            fitness = np.array([indiv.fitness for indiv in parent_list])
+
+        partners = (pop_matrix, fitness, parent_idx) if partner_pool and parent_idx is not None else ()
+
+        if parent_idx is None:
+            parent_idx = np.arange(len(parent_list))
+        else:
+            pop_matrix, speed, indiv_best, fitness = pop_matrix[parent_idx], speed[parent_idx], indiv_best[parent_idx], fitness[parent_idx]
+
+        global_best = None if self.best is None else self.best.genotype
+
+        offspring_matrix, offspring_speed = operator.apply_batch(pop_matrix, fitness, global_best, speed, indiv_best, *partners)
+        if offspring_speed is None:
+            offspring_speed = speed
+
+        unchanged = np.all(offspring_matrix == pop_matrix, axis=1) & np.all(offspring_speed == speed, axis=1)
+
+        if isinstance(parent_list, Population):
+            offspring = parent_list.take(parent_idx)
+
+            changed = np.flatnonzero(~unchanged)
+            for idx in changed:
+                offspring.genotype_matrix[idx] = objfunc.repair_solution(offspring_matrix[idx])
+                offspring.speed_matrix[idx] = objfunc.repair_speed(offspring_speed[idx])
+
+            offspring.fitness_calculated[changed] = False
+            offspring.best_fitness[changed] = np.nan
+            offspring.ages[changed] = 0
+            offspring.ids[changed] = np.arange(Individual._last_id, Individual._last_id + changed.size)
+            Individual._last_id += changed.size
+
+            return offspring
+
+        offspring = []
+        for idx in range(len(parent_idx)):
+            parent = parent_list[parent_idx[idx]]
+
+            if unchanged[idx]:
+                new_indiv = parent
+            else:
+                new_indiv = Individual(parent.objfunc, offspring_matrix[idx], offspring_speed[idx], encoding=parent.encoding)
+                new_indiv.best = parent.best
+                new_indiv.genotype = objfunc.repair_solution(new_indiv.genotype)
+                new_indiv.speed = objfunc.repair_speed(new_indiv.speed)
+
+            offspring.append(new_indiv)
+
+        return offspring
+
     def select_parents(self, population: List[Individual], **kwargs) -> Tuple[List[Individual], List[int]]:
         """
         Selects the individuals that will be perturbed in this generation to generate the offspring.
@@ -273,6 +430,35 @@ class SearchStrategy(ABC):
 
         return data
 
+    def get_metrics(self, names: Container[str] = None) -> dict:
+        """
+        Computes metrics that describe the current state of the search strategy.
+
+        The base search strategy provides the "diversity" of the population, the mean standard deviation
+        of each component of the genotypes, when the genotypes are numeric vectors. Search strategies
+        add their own metrics by extending this method.
+
+        Parameters
+        ----------
+        names: Container[str], optional
+            Names of the metrics that will be computed, all of them if not given. Metrics that this search
+            strategy doesn't provide are ignored.
+
+        Returns
+        -------
+        metrics: dict
+            The value of each metric requested that this search strategy provides.
+        """
+
+        metrics = {}
+
+        if (names is None or "diversity" in names) and self.population and is_vector_population(self.population):
+            genotype_matrix = stack_genotypes(self.population)
+            if genotype_matrix.dtype.kind in "biuf":
+                metrics["diversity"] = float(genotype_matrix.std(axis=0).mean())
+
+        return metrics
+
     def extra_step_info(self):
         """
         Specific information to report relevant to this search strategy each iteration.
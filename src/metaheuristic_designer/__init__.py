@@ -1,4 +1,6 @@
 from .utils import RAND_GEN, reset_seed
+from .kernels import kernel_backends, set_kernel_backend
+from .profiling import Profiler
 
 from .ObjectiveFunc import ObjectiveFunc, ObjectiveVectorFunc, ObjectiveFromLambda
 
@@ -9,7 +11,18 @@ from .algorithms import GeneralAlgorithm, MemeticAlgorithm
 from .SearchStrategy import SearchStrategy
 from . import strategies
 
+from .Evaluator import Evaluator
+from . import evaluators
+
+from .History import History
+from . import histories
+
+from .MetricsSink import MetricsSink
+from . import sinks
+
 from .Individual import Individual
+from .Population import Population
+from .PopulationContext import PopulationContext
 
 from .Encoding import Encoding
 from . import encodings
@@ -1,10 +1,7 @@
 from __future__ import annotations
 import time
-import pandas as pd
-from matplotlib import pyplot as plt
 from ..Algorithm import Algorithm
 from collections import Counter
-import enlighten
 
 
 class AlgorithmSelection:
@@ -48,7 +45,11 @@ class AlgorithmSelection:
         Evaluates all the provided search strategies and returns the best overall solution
         """
 
+        import pandas as pd
+
         if self.verbose:
+            import enlighten
+
             print(f"Running {len(self.algorithm_list)} algorithms {self.repetitions} times each.")
 
         best_solution = None
@@ -1,6 +1,5 @@
 from __future__ import annotations
 import time
-from matplotlib import pyplot as plt
 from ..Algorithm import Algorithm
 
 
@@ -19,6 +18,10 @@ class GeneralAlgorithm(Algorithm):
         Search strategy that will iteratively optimize the function.
     params: ParamScheduler or dict, optional
         Dictionary of parameters to define the stopping condition and output of the algorithm.
+    name: str, optional
+        Name that is associated with the algorithm.
+    evaluator: Evaluator, optional
+        Evaluator used to calculate the fitness of the population.
     """
 
     def __init__(
@@ -27,35 +30,41 @@ class GeneralAlgorithm(Algorithm):
         search_strategy: SearchStrategy,
         params: Union[ParamScheduler, dict] = None,
         name: str = None,
+        evaluator: Evaluator = None,
     ):
         """
         Constructor of the Metaheuristic class
         """
 
-        super().__init__(objfunc, search_strategy, params, name)
+        super().__init__(objfunc, search_strategy, params, name, evaluator)
 
     def step(self, time_start=0, verbose=False):
         # Get the population of this generation
         population = self.search_strategy.population
 
         # Generate their parents
-        parents = self.search_strategy.select_parents(population, progress=self.progress, history=self.best_history)
+        with self.profiler.phase("select_parents"):
+            parents = self.search_strategy.select_parents(population, progress=self.progress, history=self.best_history)
 
         # Evolve the selected parents
-        offspring = self.search_strategy.perturb(parents, self.objfunc, progress=self.progress, history=self.best_history)
+        with self.profiler.phase("perturb"):
+            offspring = self.search_strategy.perturb(parents, self.objfunc, progress=self.progress, history=self.best_history)
 
         # Get the fitness of the individuals
-        offspring = self.search_strategy.evaluate_population(offspring, self.objfunc, self.parallel, self.threads)
+        with self.profiler.phase("evaluate"):
+            offspring = self.search_strategy.evaluate_population(offspring, self.objfunc, self.parallel, self.threads, self.evaluator)
 
         # Select the individuals that remain for the next generation
-        population = self.search_strategy.select_individuals(population, offspring, progress=self.progress, history=self.best_history)
+        with self.profiler.phase("select_individuals"):
+            population = self.search_strategy.select_individuals(population, offspring, progress=self.progress, history=self.best_history)
 
         # Assign the newly generate population
         self.search_strategy.population = population
 
         # Get information about the algorithm to track it's progress
-        best_individual, best_fitness = self.search_strategy.best_solution()
-        self.search_strategy.update_params(progress=self.progress)
+        with self.profiler.phase("update_params"):
+            best_individual, best_fitness = self.search_strategy.best_solution()
+            self.search_strategy.update_params(progress=self.progress)
 
         # Store information
         self.best_history.append(best_individual)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 import time
-from matplotlib import pyplot as plt
 from ..Algorithm import Algorithm
 
 
@@ -21,6 +20,10 @@ class MemeticAlgorithm(Algorithm):
         Method used to select the individuals that will be improved
     params: ParamScheduler or dict, optional
         Dictionary of parameters to define the stopping condition and output of the algorithm.
+    name: str, optional
+        Name that is associated with the algorithm.
+    evaluator: Evaluator, optional
+        Evaluator used to calculate the fitness of the population.
     """
 
     def __init__(
@@ -31,12 +34,13 @@ class MemeticAlgorithm(Algorithm):
         improve_choice,
         params=None,
         name=None,
+        evaluator=None,
     ):
         """
         Constructor of the Metaheuristic class
         """
 
-        super().__init__(objfunc, search_strategy, params, name)
+        super().__init__(objfunc, search_strategy, params, name, evaluator)
 
         self.local_search = local_search
         self.improve_choice = improve_choice
@@ -54,6 +58,16 @@ class MemeticAlgorithm(Algorithm):
         super().initialize()
         self.local_search.initialize(self.objfunc)
 
+    def _attach_profiler(self):
+        super()._attach_profiler()
+        self.profiler.attach(self.objfunc, self.local_search)
+
+    def _checkpoint_components(self):
+        components = super()._checkpoint_components()
+        components["local_search"] = self.local_search
+        components["improve_choice"] = self.improve_choice
+        return components
+
     def _do_local_search(self, offspring):
         offspring_ids = [indiv.id for indiv in offspring]
 
@@ -67,28 +81,34 @@ class MemeticAlgorithm(Algorithm):
         for idx, val in enumerate(off_idxs):
             offspring[val] = improved[idx]
 
-        offspring = self.search_strategy.evaluate_population(offspring, self.objfunc, self.parallel, self.threads)
+        offspring = self.search_strategy.evaluate_population(offspring, self.objfunc, self.parallel, self.threads, self.evaluator)
 
         return offspring
 
     def step(self, time_start=0, verbose=False):
         population = self.search_strategy.population
 
-        parents = self.search_strategy.select_parents(population, progress=self.progress, history=self.best_history)
+        with self.profiler.phase("select_parents"):
+            parents = self.search_strategy.select_parents(population, progress=self.progress, history=self.best_history)
 
-        offspring = self.search_strategy.perturb(parents, self.objfunc, progress=self.progress, history=self.best_history)
+        with self.profiler.phase("perturb"):
+            offspring = self.search_strategy.perturb(parents, self.objfunc, progress=self.progress, history=self.best_history)
 
         # Get the fitness of the individuals
-        offspring = self.search_strategy.evaluate_population(offspring, self.objfunc, self.parallel, self.threads)
+        with self.profiler.phase("evaluate"):
+            offspring = self.search_strategy.evaluate_population(offspring, self.objfunc, self.parallel, self.threads, self.evaluator)
 
-        offspring = self._do_local_search(offspring)
+        with self.profiler.phase("local_search"):
+            offspring = self._do_local_search(offspring)
 
-        population = self.search_strategy.select_individuals(population, offspring, progress=self.progress, history=self.best_history)
+        with self.profiler.phase("select_individuals"):
+            population = self.search_strategy.select_individuals(population, offspring, progress=self.progress, history=self.best_history)
 
         self.search_strategy.population = population
 
-        best_individual, best_fitness = self.search_strategy.best_solution()
-        self.search_strategy.update_params(progress=self.progress)
+        with self.profiler.phase("update_params"):
+            best_individual, best_fitness = self.search_strategy.best_solution()
+            self.search_strategy.update_params(progress=self.progress)
 
         # Store information
         self.best_history.append(best_individual)
@@ -1,7 +1,5 @@
 from __future__ import annotations
 import time
-import pandas as pd
-from matplotlib import pyplot as plt
 from ..SearchStrategy import SearchStrategy
 from .GeneralAlgorithm import GeneralAlgorithm
 from .AlgorithmSelection import AlgorithmSelection
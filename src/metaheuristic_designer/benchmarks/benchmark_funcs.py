@@ -3,6 +3,7 @@ import numpy as np
 # from numba import jit
 from ..ObjectiveFunc import ObjectiveVectorFunc
 from ..utils import RAND_GEN
+from ..kernels import kernel
 import time
 
 
@@ -14,6 +15,12 @@ class MaxOnes(ObjectiveVectorFunc):
     def objective(self, solution):
         return solution.sum()
 
+    def objective_batch(self, solutions):
+        return solutions.sum(axis=1)
+
+    def objective_delta(self, old_solution, old_value, changed_indices, new_solution):
+        return old_value + new_solution[changed_indices].sum() - old_solution[changed_indices].sum()
+
     def repair_solution(self, solution):
         return (solution >= 0.5).astype(np.int32)
 
@@ -28,6 +35,9 @@ class DiophantineEq(ObjectiveVectorFunc):
     def objective(self, solution):
         return abs((solution * self.coeff).sum() - self.target)
 
+    def objective_batch(self, solutions):
+        return np.abs((solutions * self.coeff).sum(axis=1) - self.target)
+
     def repair_solution(self, solution):
         return solution.astype(np.int32)
 
@@ -40,6 +50,9 @@ class MaxOnesReal(ObjectiveVectorFunc):
     def objective(self, solution):
         return solution.sum()
 
+    def objective_batch(self, solutions):
+        return solutions.sum(axis=1)
+
     def repair_solution(self, solution):
         return np.clip(solution.copy(), 0, 1)
 
@@ -65,6 +78,12 @@ class Sphere(ObjectiveVectorFunc):
     def objective(self, solution):
         return _sphere(solution)
 
+    def objective_batch(self, solutions):
+        return _sphere(solutions)
+
+    def objective_delta(self, old_solution, old_value, changed_indices, new_solution):
+        return old_value + _sphere(new_solution[changed_indices]) - _sphere(old_solution[changed_indices])
+
 
 class HighCondElliptic(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -74,6 +93,9 @@ class HighCondElliptic(ObjectiveVectorFunc):
     def objective(self, solution):
         return _high_cond_elipt_f(solution)
 
+    def objective_batch(self, solutions):
+        return _high_cond_elipt_f(solutions)
+
 
 class BentCigar(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -83,6 +105,9 @@ class BentCigar(ObjectiveVectorFunc):
     def objective(self, solution):
         return _bent_cigar(solution)
 
+    def objective_batch(self, solutions):
+        return _bent_cigar(solutions)
+
 
 class Discus(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -92,6 +117,9 @@ class Discus(ObjectiveVectorFunc):
     def objective(self, solution):
         return _discus(solution)
 
+    def objective_batch(self, solutions):
+        return _discus(solutions)
+
 
 class Rosenbrock(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -101,6 +129,9 @@ class Rosenbrock(ObjectiveVectorFunc):
     def objective(self, solution):
         return _rosenbrock(solution)
 
+    def objective_batch(self, solutions):
+        return _rosenbrock(solutions)
+
 
 class Ackley(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -110,6 +141,9 @@ class Ackley(ObjectiveVectorFunc):
     def objective(self, solution):
         return _ackley(solution)
 
+    def objective_batch(self, solutions):
+        return _ackley(solutions)
+
 
 class Weierstrass(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -119,6 +153,9 @@ class Weierstrass(ObjectiveVectorFunc):
     def objective(self, solution):
         return _weierstrass(solution)
 
+    def objective_batch(self, solutions):
+        return _weierstrass(solutions)
+
 
 class Griewank(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -128,6 +165,9 @@ class Griewank(ObjectiveVectorFunc):
     def objective(self, solution):
         return _griewank(solution)
 
+    def objective_batch(self, solutions):
+        return _griewank(solutions)
+
 
 class Rastrigin(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -137,6 +177,9 @@ class Rastrigin(ObjectiveVectorFunc):
     def objective(self, solution):
         return _rastrigin(solution)
 
+    def objective_batch(self, solutions):
+        return _rastrigin(solutions)
+
 
 class ModSchwefel(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -146,6 +189,9 @@ class ModSchwefel(ObjectiveVectorFunc):
     def objective(self, solution):
         return _mod_schwefel(solution)
 
+    def objective_batch(self, solutions):
+        return _mod_schwefel(solutions)
+
 
 class Katsuura(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -155,6 +201,9 @@ class Katsuura(ObjectiveVectorFunc):
     def objective(self, solution):
         return _katsuura(solution)
 
+    def objective_batch(self, solutions):
+        return _katsuura(solutions)
+
 
 class HappyCat(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -164,6 +213,9 @@ class HappyCat(ObjectiveVectorFunc):
     def objective(self, solution):
         return _happy_cat(solution)
 
+    def objective_batch(self, solutions):
+        return _happy_cat(solutions)
+
 
 class HGBat(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -173,6 +225,9 @@ class HGBat(ObjectiveVectorFunc):
     def objective(self, solution):
         return _hgbat(solution)
 
+    def objective_batch(self, solutions):
+        return _hgbat(solutions)
+
 
 class ExpandedGriewankPlusRosenbrock(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -182,6 +237,9 @@ class ExpandedGriewankPlusRosenbrock(ObjectiveVectorFunc):
     def objective(self, solution):
         return _exp_griewank_plus_rosenbrock(solution)
 
+    def objective_batch(self, solutions):
+        return _exp_griewank_plus_rosenbrock(solutions)
+
 
 class ExpandedShafferF6(ObjectiveVectorFunc):
     def __init__(self, size, opt="min"):
@@ -191,6 +249,9 @@ class ExpandedShafferF6(ObjectiveVectorFunc):
     def objective(self, solution):
         return _exp_shafferF6(solution)
 
+    def objective_batch(self, solutions):
+        return _exp_shafferF6(solutions)
+
 
 class SumPowell(ObjectiveVectorFunc):
     """
@@ -206,6 +267,9 @@ class SumPowell(ObjectiveVectorFunc):
     def objective(self, solution):
         return _sum_powell(solution)
 
+    def objective_batch(self, solutions):
+        return _sum_powell(solutions)
+
     def repair_solution(self, solution, parent=None):
         # bounce back method
         if parent:
@@ -234,6 +298,9 @@ class N4XinSheYang(ObjectiveVectorFunc):
     def objective(self, solution):
         return _n4xinshe_yang(solution)
 
+    def objective_batch(self, solutions):
+        return _n4xinshe_yang(solutions)
+
     def repair_solution(self, solution, parent=None):
         # bounce back method
         if parent:
@@ -250,146 +317,202 @@ class N4XinSheYang(ObjectiveVectorFunc):
 
 # @jit(nopython=True)
 def _sphere(solution):
-    return (solution**2).sum()
+    return (solution**2).sum(axis=-1)
 
 
 # @jit(nopython=True)
 def _high_cond_elipt_f(vect):
-    c = 1.0e6 ** ((np.arange(vect.shape[0]) / (vect.shape[0] - 1)))
-    return np.sum(c * vect * vect)
+    c = 1.0e6 ** ((np.arange(vect.shape[-1]) / (vect.shape[-1] - 1)))
+    return np.sum(c * vect * vect, axis=-1)
 
 
 # @jit(nopython=True)
 def _bent_cigar(solution):
-    return solution[0] ** 2 + 1e6 * (solution[1:] ** 2).sum()
+    return solution[..., 0] ** 2 + 1e6 * (solution[..., 1:] ** 2).sum(axis=-1)
 
 
 # @jit(nopython=True)
 def _discus(solution):
-    return 1e6 * solution[0] ** 2 + (solution[1:] ** 2).sum()
+    return 1e6 * solution[..., 0] ** 2 + (solution[..., 1:] ** 2).sum(axis=-1)
 
 
 # @jit(nopython=True)
 def _rosenbrock(solution):
-    term1 = solution[1:] - solution[:-1] ** 2
-    term2 = 1 - solution[:-1]
+    term1 = solution[..., 1:] - solution[..., :-1] ** 2
+    term2 = 1 - solution[..., :-1]
     result = 100 * term1**2 + term2**2
-    return result.sum()
+    return result.sum(axis=-1)
 
 
 # @jit(nopython=True)
 def _ackley(solution):
-    term1 = (solution**2).sum()
-    term1 = -0.2 * np.sqrt(term1 / solution.size)
-    term2 = (np.cos(2 * np.pi * solution)).sum() / solution.size
+    size = solution.shape[-1]
+    term1 = (solution**2).sum(axis=-1)
+    term1 = -0.2 * np.sqrt(term1 / size)
+    term2 = (np.cos(2 * np.pi * solution)).sum(axis=-1) / size
     return np.exp(1) - 20 * np.exp(term1) - np.exp(term2) + 20
 
 
-# @jit(nopython=False)
+# @jit(nopython=True)
 def _weierstrass(solution, iter=20):
-    return np.sum(np.array([0.5**k * np.cos(2 * np.pi * 3**k * (solution + 0.5)) for k in range(iter)]))
+    k = np.arange(iter)
+    terms = np.cos(2 * np.pi * 3.0**k * (solution[..., None] + 0.5))
+    return (terms @ 0.5**k).sum(axis=-1)
 
 
 # @jit(nopython=True)
 def _griewank(solution):
-    term1 = (solution**2).sum()
-    term2 = np.prod(np.cos(solution / np.sqrt(np.arange(1, solution.size + 1))))
+    term1 = (solution**2).sum(axis=-1)
+    term2 = np.prod(np.cos(solution / np.sqrt(np.arange(1, solution.shape[-1] + 1))), axis=-1)
     return 1 + term1 / 4000 - term2
 
 
 # @jit(nopython=True)
 def _rastrigin(solution, A=10):
-    return A * len(solution) + (solution**2 - A * np.cos(2 * np.pi * solution)).sum()
+    return A * solution.shape[-1] + (solution**2 - A * np.cos(2 * np.pi * solution)).sum(axis=-1)
 
 
-# @jit(nopython=True)
 def _mod_schwefel(solution):
-    fit = 0
-    for i in range(solution.size):
-        z = solution[i] + 4.209687462275036e2
-        if z > 500:
-            fit = fit - (500 - z % 500) * np.sin((500 - z % 500) ** 0.5)
-            tmp = (z - 500) / 100
-            fit = fit + tmp * tmp / solution.size
-        elif z < -500:
-            fit = fit - (-500 - abs(z) % 500) * np.sin((500 - abs(z) % 500) ** 0.5)
-            tmp = (z + 500) / 100
-            fit = fit + tmp * tmp / solution.size
-        else:
-            fit = fit - z * np.sin(abs(z) ** 0.5)
-    return fit + 4.189828872724338e2 * solution.size
+    return _trailing_axis_kernel(_mod_schwefel_kernel, solution)
+
+
+def _mod_schwefel_numpy(solution):
+    size = solution.shape[-1]
+    z = solution + 4.209687462275036e2
+    z_mod = np.abs(z) % 500
+
+    term_upper = -(500 - z_mod) * np.sin(np.sqrt(500 - z_mod)) + ((z - 500) / 100) ** 2 / size
+    term_lower = -(-500 - z_mod) * np.sin(np.sqrt(500 - z_mod)) + ((z + 500) / 100) ** 2 / size
+    term_inside = -z * np.sin(np.sqrt(np.abs(z)))
+
+    terms = np.where(z > 500, term_upper, np.where(z < -500, term_lower, term_inside))
+    return terms.sum(axis=-1) + 4.189828872724338e2 * size
+
+
+@kernel("mod_schwefel", fallback=_mod_schwefel_numpy)
+def _mod_schwefel_kernel(solutions):
+    n_solutions, size = solutions.shape
+    result = np.empty(n_solutions)
+
+    for row in range(n_solutions):
+        fit = 0.0
+        for i in range(size):
+            z = solutions[row, i] + 4.209687462275036e2
+            if z > 500:
+                z_mod = z % 500
+                fit -= (500 - z_mod) * np.sin(np.sqrt(500 - z_mod))
+                fit += ((z - 500) / 100) ** 2 / size
+            elif z < -500:
+                z_mod = abs(z) % 500
+                fit -= (-500 - z_mod) * np.sin(np.sqrt(500 - z_mod))
+                fit += ((z + 500) / 100) ** 2 / size
+            else:
+                fit -= z * np.sin(np.sqrt(abs(z)))
+        result[row] = fit + 4.189828872724338e2 * size
+
+    return result
 
 
-# @jit(nopython=True)
 def _katsuura(solution):
-    A = 10 / solution.size**2
-
-    temp_list = [
-        1
-        + (i + 1)
-        * np.sum(
-            (
-                np.abs(2 ** (np.arange(1, 32 + 1)) * solution[i] - np.round(2 ** (np.arange(1, 32 + 1)) * solution[i]))
-                * 2 ** (-np.arange(1, 32 + 1, dtype=float))
-            )
-            ** (10 / solution.size**1.2)
-        )
-        for i in range(solution.size)
-    ]
-    prod_val = np.prod(temp_list)
+    return _trailing_axis_kernel(_katsuura_kernel, solution)
+
+
+def _katsuura_numpy(solution):
+    size = solution.shape[-1]
+    A = 10 / size**2
+
+    powers = 2.0 ** np.arange(1, 32 + 1)
+    scaled = solution[..., None] * powers
+    terms = (np.abs(scaled - np.round(scaled)) / powers) ** (10 / size**1.2)
+    prod_val = np.prod(1 + np.arange(1, size + 1) * terms.sum(axis=-1), axis=-1)
     return A * prod_val - A
 
 
+@kernel("katsuura", fallback=_katsuura_numpy)
+def _katsuura_kernel(solutions):
+    n_solutions, size = solutions.shape
+    A = 10 / size**2
+    exponent = 10 / size**1.2
+    result = np.empty(n_solutions)
+
+    for row in range(n_solutions):
+        prod_val = 1.0
+        for i in range(size):
+            term_sum = 0.0
+            power = 1.0
+            for _ in range(32):
+                power *= 2.0
+                scaled = solutions[row, i] * power
+                term_sum += (abs(scaled - np.rint(scaled)) / power) ** exponent
+            prod_val *= 1 + (i + 1) * term_sum
+        result[row] = A * prod_val - A
+
+    return result
+
+
+def _trailing_axis_kernel(func, solution):
+    """
+    Applies a kernel that works on a matrix with a solution in each row to an array of any number of dimensions,
+    the solutions are placed in the last axis.
+    """
+
+    solution = np.asarray(solution, dtype=float)
+    result = func(np.ascontiguousarray(solution.reshape(-1, solution.shape[-1])))
+    return result.reshape(solution.shape[:-1])
+
+
 # @jit(nopython=True)
 def _happy_cat(solution):
+    size = solution.shape[-1]
     z = solution + 4.189828872724338e2
-    r2 = (z * solution).sum()
-    s = solution.sum()
-    return np.abs(r2 - solution.size) ** 0.25 + (0.5 * r2 + s) / solution.size + 0.5
+    r2 = (z * solution).sum(axis=-1)
+    s = solution.sum(axis=-1)
+    return np.abs(r2 - size) ** 0.25 + (0.5 * r2 + s) / size + 0.5
 
 
 # @jit(nopython=True)
 def _hgbat(solution):
+    size = solution.shape[-1]
     z = solution + 4.189828872724338e2
-    r2 = (z * solution).sum()
-    s = solution.sum()
-    return np.abs((r2**2 - s**2)) ** 0.5 + (0.5 * r2 + s) / solution.size + 0.5
+    r2 = (z * solution).sum(axis=-1)
+    s = solution.sum(axis=-1)
+    return np.abs((r2**2 - s**2)) ** 0.5 + (0.5 * r2 + s) / size + 0.5
 
 
 # @jit(nopython=True)
 def _exp_griewank_plus_rosenbrock(solution):
-    z = solution[:-1] + 4.189828872724338e2
-    tmp1 = solution[:-1] ** 2 - solution[1:]
+    z = solution[..., :-1] + 4.189828872724338e2
+    tmp1 = solution[..., :-1] ** 2 - solution[..., 1:]
     tmp2 = z - 1
     tmp = 100 * tmp1**2 + tmp2**2
-    grw = (tmp**2 / 4000 - np.cos(tmp) + 1).sum()
+    grw = (tmp**2 / 4000 - np.cos(tmp) + 1).sum(axis=-1)
 
-    term1 = solution[1:] - solution[:-1] ** 2
-    term2 = 1 - solution[:-1]
-    ros = (100 * term1**2 + term2**2).sum()
+    term1 = solution[..., 1:] - solution[..., :-1] ** 2
+    term2 = 1 - solution[..., :-1]
+    ros = (100 * term1**2 + term2**2).sum(axis=-1)
 
     return grw + ros**2 / 4000 - np.cos(ros) + 1
 
 
 # @jit(nopython=True)
 def _exp_shafferF6(solution):
-    term1 = np.sin(np.sqrt(np.sum(solution[:-1] ** 2 + solution[1:] ** 2))) ** 2 - 0.5
-    term2 = 1 + 0.001 * (solution[:-1] ** 2 + solution[1:] ** 2).sum()
+    term1 = np.sin(np.sqrt(np.sum(solution[..., :-1] ** 2 + solution[..., 1:] ** 2, axis=-1))) ** 2 - 0.5
+    term2 = 1 + 0.001 * (solution[..., :-1] ** 2 + solution[..., 1:] ** 2).sum(axis=-1)
     temp = 0.5 + term1 / term2
 
-    term1 = np.sin(np.sqrt(np.sum((solution.size - 1) ** 2 + solution[0] ** 2))) ** 2 - 0.5
-    term2 = 1 + 0.001 * ((solution.size - 1) ** 2 + solution[0] ** 2)
+    term1 = np.sin(np.sqrt((solution.shape[-1] - 1) ** 2 + solution[..., 0] ** 2)) ** 2 - 0.5
+    term2 = 1 + 0.001 * ((solution.shape[-1] - 1) ** 2 + solution[..., 0] ** 2)
 
     return temp + 0.5 + term1 / term2
 
 
 # @jit(nopython=True)
 def _sum_powell(solution):
-    return (np.abs(solution) ** np.arange(2, solution.shape[0] + 2)).sum()
+    return (np.abs(solution) ** np.arange(2, solution.shape[-1] + 2)).sum(axis=-1)
 
 
 # @jit(nopython=True)
 def _n4xinshe_yang(solution):
-    sum_1 = np.exp(-(solution**2).sum())
-    sum_2 = np.exp(-(np.sin(np.sqrt(np.abs(solution))) ** 2).sum())
-    return (np.sin(solution) ** 2 - sum_1).sum() * sum_2
+    sum_1 = np.exp(-(solution**2).sum(axis=-1, keepdims=True))
+    sum_2 = np.exp(-(np.sin(np.sqrt(np.abs(solution))) ** 2).sum(axis=-1))
+    return (np.sin(solution) ** 2 - sum_1).sum(axis=-1) * sum_2
@@ -1,6 +1,7 @@
 import numpy as np
 import warnings
 from ..ObjectiveFunc import ObjectiveVectorFunc
+from ..kernels import kernel
 
 
 class ThreeSAT(ObjectiveVectorFunc):
@@ -9,51 +10,105 @@ class ThreeSAT(ObjectiveVectorFunc):
     given in 3CNF (conjunctive normal form with 3 variables per clause) is satisfiable,
     in other words, if there is a combination of boolean variables that makes it true.
 
+    Expressions in CNF with clauses of any length are also accepted.
+
     Format based on https://www.cs.ubc.ca/%7Ehoos/SATLIB/benchm.html
 
     Parameters
     ----------
-    clauses: ndarray
+    clauses: ndarray | List[List[int]]
         A representation of the clauses that defines the logical expression, this will be a matrix
         of size (n,3), where each component is the index (starting at 1) of the variable in this clause,
-        negation is represented as negative numbers.
+        negation is represented as negative numbers. Clauses with different lengths can be given as a list of lists.
 
         For example, the expression (¬a ∨ b ∨ ¬c) ∧ (a ∨ ¬b ∨ d) is represented as [[-1, 2, -3], [1, -2, 4]]
     """
 
     def __init__(self, clauses):
-        if not isinstance(clauses, np.ndarray) or clauses.shape[1] != 3:
-            raise ValueError("The caluses must be represented as an array of size (n_clauses, 3).")
+        if isinstance(clauses, np.ndarray):
+            if clauses.ndim != 2 or clauses.shape[1] == 0:
+                raise ValueError("The caluses must be represented as an array of size (n_clauses, 3).")
+        else:
+            clauses = _pad_clauses([np.asarray(clause, dtype=int) for clause in clauses])
+
+        if clauses.shape[0] == 0 or np.any(clauses == 0):
+            raise ValueError("The clauses must be non-empty and the variable indices must start at 1.")
 
         self.clauses = clauses
         self.n_vars = np.abs(clauses).max()
 
+        # Compiled representation of the clauses, the variable of each literal and whether it is negated
+        self.clause_vars = np.abs(clauses) - 1
+        self.clause_negated = clauses < 0
+
+        # Clauses in which each variable appears, the ones of the i-th variable are
+        # var_clauses[var_clauses_start[i]:var_clauses_start[i+1]]
+        clause_vars = self.clause_vars.ravel()
+        order = np.argsort(clause_vars, kind="stable")
+        self.var_clauses = np.repeat(np.arange(clauses.shape[0]), clauses.shape[1])[order]
+        self.var_clauses_start = np.searchsorted(clause_vars[order], np.arange(self.n_vars + 1))
+
         super().__init__(self.n_vars, name="3-SAT")
 
     @staticmethod
     def from_cnf_file(path):
+        """
+        Reads a logical expression from a file in the DIMACS CNF format.
+
+        Comment lines (starting with 'c') and lines starting with '%' are ignored. The clauses
+        can have any length and span several lines, each one ends with a 0.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file.
+
+        Returns
+        -------
+        objfunc: ThreeSAT
+            The 3-SAT problem defined in the file.
+        """
+
         n_vars = 0
         n_clauses = 0
-        clauses = []
+        clause_lines = []
         with open(path, "r") as cnf_file:
             for line in cnf_file:
-                line_splitted = " ".join(line.split()).split()
-                if line[0] == "p":
+                first_char = line.lstrip()[:1]
+                if first_char == "p":
+                    line_splitted = line.split()
                     n_vars = int(line_splitted[2])
                     n_clauses = int(line_splitted[3])
+                elif first_char not in ("c", "%", ""):
+                    clause_lines.append(line)
+
+        literals = np.fromstring("".join(clause_lines), dtype=np.int64, sep=" ")
 
-                elif line[0] != "c" and "%" not in line and len(line_splitted) >= 3:
-                    clauses.append([int(i) for i in line_splitted[:3]])
+        # Each clause ends with a 0, a missing 0 at the end of the file is tolerated
+        ends = np.flatnonzero(literals == 0)
+        if literals.size > 0 and literals[-1] != 0:
+            ends = np.append(ends, literals.size)
+        starts = np.concatenate([[0], ends[:-1] + 1])
+        lengths = ends - starts
 
-        clauses_arr = np.asarray(clauses)
+        # Empty clauses come from trailing 0s, as in the SATLIB files
+        starts = starts[lengths > 0]
+        lengths = lengths[lengths > 0]
+
+        if lengths.size > 0 and np.all(lengths == lengths[0]):
+            clauses_arr = literals[starts[:, None] + np.arange(lengths[0])]
+        else:
+            clauses_arr = [literals[start : start + length] for start, length in zip(starts, lengths)]
 
-        if len(clauses) != n_clauses:
+        if len(clauses_arr) != n_clauses:
             warnings.warn("The number of clauses in the file was incorrect.", stacklevel=2)
 
-        if np.abs(clauses_arr).max() != n_vars:
+        objfunc = ThreeSAT(clauses_arr)
+
+        if objfunc.n_vars != n_vars:
             warnings.warn("The number of variables in the file was incorrect.", stacklevel=2)
 
-        return ThreeSAT(clauses_arr)
+        return objfunc
 
     def objective(self, solution):
         """
@@ -70,14 +125,92 @@ class ThreeSAT(ObjectiveVectorFunc):
             The percentage of clauses satisfied with this assignment of variables.
         """
 
-        n_satisfied = 0
-        for clause in self.clauses:
-            bool_vals = solution[np.abs(clause) - 1].astype(bool)
-            satisfied = np.logical_xor(bool_vals, clause < 0)  # Flip if negative
-            n_satisfied += np.any(satisfied).astype(int)
+        n_satisfied = np.count_nonzero(self.satisfied_clauses(solution))
 
         return n_satisfied / self.clauses.shape[0]
 
+    def objective_batch(self, solutions):
+        # The literals of the whole population are evaluated in blocks to limit the memory used
+        solutions = np.asarray(solutions).astype(bool)
+        block_size = max(1, _BATCH_LITERALS // self.clause_vars.size)
+
+        n_satisfied = np.empty(solutions.shape[0])
+        for start in range(0, solutions.shape[0], block_size):
+            block = solutions[start : start + block_size]
+            literal_vals = block[:, self.clause_vars] != self.clause_negated
+            n_satisfied[start : start + block_size] = np.count_nonzero(literal_vals.any(axis=2), axis=1)
+
+        return n_satisfied / self.clauses.shape[0]
+
+    def objective_delta(self, old_solution, old_value, changed_indices, new_solution):
+        """
+        Updates the percentage of clauses satisfied checking only the clauses that contain
+        one of the variables that changed.
+        """
+
+        n_clauses = self.clauses.shape[0]
+        if changed_indices.size == 0:
+            return old_value
+
+        affected = np.unique(
+            np.concatenate([self.var_clauses[self.var_clauses_start[var] : self.var_clauses_start[var + 1]] for var in changed_indices])
+        )
+
+        n_satisfied = round(old_value * n_clauses)
+        n_satisfied += np.count_nonzero(self.satisfied_clauses(new_solution, affected))
+        n_satisfied -= np.count_nonzero(self.satisfied_clauses(old_solution, affected))
+
+        return n_satisfied / n_clauses
+
+    def satisfied_clauses(self, solution, clause_idx=None):
+        """
+        Checks which clauses are satisfied with an assignment of variables.
+
+        Parameters
+        ----------
+        solution: ndarray
+            A binary vector representing the value of each binary variable.
+        clause_idx: ndarray, optional
+            Indices of the clauses to check, all of them by default.
+
+        Returns
+        -------
+        satisfied: ndarray
+            A boolean vector indicating whether each clause is satisfied.
+        """
+
+        clause_vars = self.clause_vars
+        clause_negated = self.clause_negated
+        if clause_idx is not None:
+            clause_vars = clause_vars[clause_idx]
+            clause_negated = clause_negated[clause_idx]
+
+        literal_vals = np.asarray(solution).astype(bool)[clause_vars] != clause_negated
+
+        return literal_vals.any(axis=1)
+
+
+# Maximum number of literals evaluated at once in ThreeSAT.objective_batch
+_BATCH_LITERALS = 2**24
+
+
+def _pad_clauses(clauses):
+    """
+    Stores clauses with different lengths in a matrix, filling the shorter ones with repetitions of
+    their first literal, which doesn't change the value of the clause.
+    """
+
+    if any(clause.size == 0 for clause in clauses):
+        raise ValueError("The clauses must be non-empty and the variable indices must start at 1.")
+
+    max_length = max((clause.size for clause in clauses), default=1)
+    padded = np.empty((len(clauses), max_length), dtype=int)
+    for idx, clause in enumerate(clauses):
+        padded[idx, : clause.size] = clause
+        padded[idx, clause.size :] = clause[0]
+
+    return padded
+
 
 class BinKnapsack(ObjectiveVectorFunc):
     """
@@ -130,6 +263,27 @@ class BinKnapsack(ObjectiveVectorFunc):
 
         return result
 
+    def objective_delta(self, old_solution, old_value, changed_indices, new_solution):
+        """
+        Updates the value of the selection of elements from the value of the previous selection.
+
+        The weight of a valid selection can't be recovered from its value, so it is calculated again,
+        the weight of an invalid selection is updated with the elements that changed.
+        """
+
+        changes = new_solution[changed_indices] - old_solution[changed_indices]
+
+        if old_value < 0:
+            weight = -old_value + np.inner(changes, self.cost[changed_indices])
+            valid = weight < self.max_weight
+            result = np.inner(new_solution, self.value) if valid else -weight
+        else:
+            weight = np.inner(new_solution, self.cost)
+            valid = weight < self.max_weight
+            result = old_value + np.inner(changes, self.value[changed_indices]) if valid else -weight
+
+        return result
+
     def repair_solution(self, solution):
         return (np.round(solution) != 0).astype(int)
 
@@ -165,32 +319,451 @@ class MaxClique(ObjectiveVectorFunc):
             The size of the clique generated with this sequence
         """
 
-        max_clique_size = 0
+        return self._clique_size(solution, 1)
+
+    def objective_delta(self, old_solution, old_value, changed_indices, new_solution):
+        """
+        Calculates the size of the clique continuing from the first node of the sequence
+        that changed, the nodes before it are known to form a clique.
+        """
 
-        n_cliques = 1
-        is_clique = True
-        while n_cliques < self.vecsize and is_clique:
-            for i in range(1, n_cliques):
-                idx_i = solution[i]
-                idx_j = solution[n_cliques]
-                is_clique = is_clique and self.adj_mat[idx_i, idx_j] != 0
+        changed_indices = changed_indices[changed_indices > 0]
+        first_changed = changed_indices.min() if changed_indices.size > 0 else None
 
-            if is_clique:
-                n_cliques += 1
+        # The nodes after the one that ended the clique are not read
+        if first_changed is None or first_changed > old_value:
+            return old_value
 
-        return n_cliques
+        return self._clique_size(new_solution, int(first_changed))
+
+    def _clique_size(self, solution, start):
+        """
+        Reads the sequence of nodes starting from the position 'start', assuming that the nodes
+        before it form a clique.
+        """
+
+        return _clique_size(self.adj_mat, np.asarray(solution).astype(np.int64), start)
+
+
+def _clique_size_numpy(adj_mat, solution, start):
+    n_cliques = start
+    while n_cliques < solution.size and np.all(adj_mat[solution[1:n_cliques], solution[n_cliques]] != 0):
+        n_cliques += 1
+
+    return n_cliques
+
+
+@kernel("max_clique", fallback=_clique_size_numpy)
+def _clique_size(adj_mat, solution, start):
+    """
+    Reads the sequence of nodes from the position 'start' until a node is not connected to
+    all of the previous ones (except the first), returns the position of that node.
+    """
+
+    n_cliques = start
+    is_clique = True
+    while n_cliques < solution.size and is_clique:
+        for i in range(1, n_cliques):
+            if adj_mat[solution[i], solution[n_cliques]] == 0:
+                is_clique = False
+                break
+
+        if is_clique:
+            n_cliques += 1
+
+    return n_cliques
 
 
 class TSP(ObjectiveVectorFunc):
-    def __init__(self):
-        super().__init__(1, name="TSP")
+    """
+    This is the Travelling Salesman Problem, which consists in finding the shortest route
+    that visits every city exactly once and returns to the starting city.
+
+    The solutions are permutations of the cities, the distances between cities are stored in a
+    precomputed matrix so that the length of a route is calculated with a single gather.
+
+    Parameters
+    ----------
+    distance_matrix: ndarray
+        Matrix with the distance from each city to every other city.
+    dtype: type, optional
+        Type used to store the distance matrix, 'np.float32' halves the memory used with large problems.
+    """
+
+    def __init__(self, distance_matrix, dtype=np.float64):
+        distance_matrix = np.asarray(distance_matrix, dtype=dtype)
+        if distance_matrix.ndim != 2 or distance_matrix.shape[0] != distance_matrix.shape[1]:
+            raise ValueError("The distance matrix must be a square matrix.")
+
+        self.distances = distance_matrix
+        self.n_cities = distance_matrix.shape[0]
+        self.symmetric = bool(np.array_equal(distance_matrix, distance_matrix.T))
+
+        super().__init__(self.n_cities, mode="min", low_lim=0, up_lim=self.n_cities - 1, name="TSP")
+
+    @staticmethod
+    def from_coordinates(coordinates, dtype=np.float64):
+        """
+        Creates a TSP instance using the euclidean distance between the cities.
+
+        Parameters
+        ----------
+        coordinates: ndarray
+            Matrix with the coordinates of a city in each row.
+        dtype: type, optional
+            Type used to store the distance matrix.
+
+        Returns
+        -------
+        objfunc: TSP
+            The TSP instance.
+        """
+
+        coordinates = np.asarray(coordinates, dtype=float)
+        return TSP(_pairwise_distances(coordinates, _euclidean, dtype), dtype)
+
+    @staticmethod
+    def from_edge_list_file(path, missing_weight=None, dtype=np.float64):
+        """
+        Reads a weighted undirected graph from a CSV file with a header and the columns 'Edge1,Edge2,Weight',
+        as the files in 'data/tsp_examples'.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file.
+        missing_weight: float, optional
+            Distance assigned to the pairs of cities that are not connected, by default it is
+            the number of cities times the largest weight, so that any route that uses these
+            connections is longer than every route that doesn't.
+        dtype: type, optional
+            Type used to store the distance matrix.
+
+        Returns
+        -------
+        objfunc: TSP
+            The TSP instance.
+        """
+
+        edges = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2)
+        node_from = edges[:, 0].astype(int)
+        node_to = edges[:, 1].astype(int)
+        weights = edges[:, 2]
+
+        n_cities = max(node_from.max(), node_to.max()) + 1
+        if missing_weight is None:
+            missing_weight = n_cities * weights.max()
+
+        distance_matrix = np.full((n_cities, n_cities), missing_weight, dtype=dtype)
+        distance_matrix[node_from, node_to] = weights
+        distance_matrix[node_to, node_from] = weights
+        np.fill_diagonal(distance_matrix, 0)
+
+        return TSP(distance_matrix, dtype)
+
+    @staticmethod
+    def from_tsplib_file(path, dtype=np.float64):
+        """
+        Reads a symmetric TSP instance in the TSPLIB format.
+
+        The edge weight types EXPLICIT (in any of the matrix formats), EUC_2D, EUC_3D, CEIL_2D, MAN_2D,
+        MAN_3D, MAX_2D, MAX_3D, ATT and GEO are supported, with the rounding defined in the TSPLIB specification.
+
+        Parameters
+        ----------
+        path: str
+            Path of the file.
+        dtype: type, optional
+            Type used to store the distance matrix.
+
+        Returns
+        -------
+        objfunc: TSP
+            The TSP instance.
+        """
+
+        specification = {}
+        sections = {}
+        current_section = None
+        with open(path, "r") as tsp_file:
+            for line in tsp_file:
+                stripped = line.strip()
+                if stripped == "EOF":
+                    break
+
+                if ":" in stripped:
+                    key, value = stripped.split(":", 1)
+                    specification[key.strip().upper()] = value.strip()
+                    current_section = None
+                elif stripped.upper().endswith("_SECTION"):
+                    current_section = stripped.upper()
+                    sections[current_section] = []
+                elif current_section is not None and stripped:
+                    sections[current_section].append(stripped)
+
+        n_cities = int(specification["DIMENSION"])
+        weight_type = specification.get("EDGE_WEIGHT_TYPE", "EUC_2D").upper()
+
+        if weight_type == "EXPLICIT":
+            values = np.fromstring(" ".join(sections["EDGE_WEIGHT_SECTION"]), dtype=float, sep=" ")
+            weight_format = specification.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX").upper()
+            distance_matrix = _explicit_matrix(values, n_cities, weight_format)
+        elif weight_type == "GEO":
+            distance_matrix = _geo_distances(_node_coordinates(sections, n_cities))
+        elif weight_type in _TSPLIB_DISTANCES:
+            distance_matrix = _pairwise_distances(_node_coordinates(sections, n_cities), _TSPLIB_DISTANCES[weight_type], dtype)
+        else:
+            raise ValueError(f"Edge weight type {weight_type} not supported.")
+
+        return TSP(distance_matrix, dtype)
 
     def objective(self, solution):
         """
-        Not implemented.
+        Calculates the length of the route.
+
+        Parameters
+        ----------
+        solution: ndarray
+            A permutation of the cities indicating the order in which they are visited.
+
+        Returns
+        -------
+        route_length: float
+            The total distance travelled, including the return to the first city.
+        """
+
+        return self.distances[solution, np.roll(solution, -1)].sum(dtype=np.float64)
+
+    def objective_batch(self, solutions):
+        return self.distances[solutions, np.roll(solutions, -1, axis=1)].sum(axis=1, dtype=np.float64)
+
+    def objective_delta(self, old_solution, old_value, changed_indices, new_solution):
+        """
+        Updates the length of the route with the connections of the cities whose position changed.
+        """
+
+        edges = np.unique(np.concatenate([changed_indices - 1, changed_indices]) % self.n_cities)
+        return old_value + self._edges_length(new_solution, edges) - self._edges_length(old_solution, edges)
+
+    def swap_delta(self, solution, i, j):
         """
+        Calculates the change in the length of the route after swapping the cities in the positions 'i' and 'j'
+        in constant time.
+
+        Parameters
+        ----------
+        solution: ndarray
+            The route before the move.
+        i: int
+            Position of the first city.
+        j: int
+            Position of the second city.
+
+        Returns
+        -------
+        delta: float
+            Length of the new route minus the length of the original route.
+        """
+
+        i %= self.n_cities
+        j %= self.n_cities
+        edges = np.unique(np.array([i - 1, i, j - 1, j]) % self.n_cities)
+        edge_ends = np.stack([edges, (edges + 1) % self.n_cities])
+
+        old_cities = solution[edge_ends]
+        new_cities = old_cities.copy()
+        new_cities[edge_ends == i] = solution[j]
+        new_cities[edge_ends == j] = solution[i]
+
+        old_length = self.distances[old_cities[0], old_cities[1]].sum(dtype=np.float64)
+        new_length = self.distances[new_cities[0], new_cities[1]].sum(dtype=np.float64)
+
+        return new_length - old_length
+
+    def insert_delta(self, solution, start, end):
+        """
+        Calculates the change in the length of the route after moving the city in the position 'end-1'
+        to the position 'start' in constant time, which is the move made by the 'Insert' permutation operator
+        (rolling 'solution[start:end]' one position).
+
+        Parameters
+        ----------
+        solution: ndarray
+            The route before the move.
+        start: int
+            Start of the segment that is rolled.
+        end: int
+            End of the segment that is rolled (not included).
+
+        Returns
+        -------
+        delta: float
+            Length of the new route minus the length of the original route.
+        """
+
+        if end - start < 2 or end - start >= self.n_cities:
+            return 0.0
+
+        dist = self.distances
+        prev_city = solution[start - 1]
+        first = solution[start]
+        before_last = solution[end - 2]
+        last = solution[end - 1]
+        next_city = solution[end % self.n_cities]
+
+        old_length = float(dist[prev_city, first]) + float(dist[before_last, last]) + float(dist[last, next_city])
+        new_length = float(dist[prev_city, last]) + float(dist[last, first]) + float(dist[before_last, next_city])
+
+        return new_length - old_length
+
+    def invert_delta(self, solution, start, end):
+        """
+        Calculates the change in the length of the route after reversing 'solution[start:end]', the 2-opt move made by
+        the 'Invert' permutation operator. It takes constant time if the distance matrix is symmetric, otherwise the
+        connections inside the segment are also taken into account.
+
+        Parameters
+        ----------
+        solution: ndarray
+            The route before the move.
+        start: int
+            Start of the segment that is reversed.
+        end: int
+            End of the segment that is reversed (not included).
+
+        Returns
+        -------
+        delta: float
+            Length of the new route minus the length of the original route.
+        """
+
+        if end - start < 2:
+            return 0.0
+
+        if not self.symmetric or end - start >= self.n_cities - 1:
+            new_solution = solution.copy()
+            new_solution[start:end] = np.flip(solution[start:end])
+            return self.objective_delta(solution, 0.0, np.arange(start, end), new_solution)
+
+        dist = self.distances
+        prev_city = solution[start - 1]
+        first = solution[start]
+        last = solution[end - 1]
+        next_city = solution[end % self.n_cities]
+
+        old_length = float(dist[prev_city, first]) + float(dist[last, next_city])
+        new_length = float(dist[prev_city, last]) + float(dist[first, next_city])
+
+        return new_length - old_length
+
+    def _edges_length(self, solution, edges):
+        return self.distances[solution[edges], solution[(edges + 1) % self.n_cities]].sum(dtype=np.float64)
 
     def repair_solution(self, solution):
         """
-        Not implemented.
+        Turns the solution into a valid permutation, keeping the relative order of its components.
         """
+
+        return np.argsort(np.argsort(solution, kind="stable"), kind="stable")
+
+
+def _nint(distances):
+    return np.floor(distances + 0.5)
+
+
+def _euclidean(diff):
+    return np.sqrt(np.sum(diff**2, axis=-1))
+
+
+def _att(diff):
+    pseudo_euclidean = np.sqrt(np.sum(diff**2, axis=-1) / 10)
+    rounded = _nint(pseudo_euclidean)
+    return rounded + (rounded < pseudo_euclidean)
+
+
+_TSPLIB_DISTANCES = {
+    "EUC_2D": lambda diff: _nint(_euclidean(diff)),
+    "EUC_3D": lambda diff: _nint(_euclidean(diff)),
+    "CEIL_2D": lambda diff: np.ceil(_euclidean(diff)),
+    "MAN_2D": lambda diff: _nint(np.abs(diff).sum(axis=-1)),
+    "MAN_3D": lambda diff: _nint(np.abs(diff).sum(axis=-1)),
+    "MAX_2D": lambda diff: _nint(np.abs(diff).max(axis=-1)),
+    "MAX_3D": lambda diff: _nint(np.abs(diff).max(axis=-1)),
+    "ATT": _att,
+}
+
+# Maximum number of city pairs whose distance is calculated at once
+_DISTANCE_BLOCK = 2**20
+
+
+def _pairwise_distances(coordinates, metric, dtype):
+    """
+    Calculates the distance matrix between the rows of 'coordinates', in blocks of rows
+    to limit the memory used with a large number of cities.
+    """
+
+    n_cities = coordinates.shape[0]
+    distance_matrix = np.empty((n_cities, n_cities), dtype=dtype)
+    block_size = max(1, _DISTANCE_BLOCK // max(1, n_cities))
+    for start in range(0, n_cities, block_size):
+        diff = coordinates[start : start + block_size, None, :] - coordinates[None, :, :]
+        distance_matrix[start : start + block_size] = metric(diff)
+
+    return distance_matrix
+
+
+def _node_coordinates(sections, n_cities):
+    values = np.fromstring(" ".join(sections["NODE_COORD_SECTION"]), dtype=float, sep=" ")
+    return values.reshape(n_cities, -1)[:, 1:]
+
+
+def _geo_distances(coordinates):
+    """
+    Geographical distance as defined in the TSPLIB specification, coordinates are given as DDD.MM (degrees and minutes).
+    """
+
+    degrees = np.trunc(coordinates)
+    radians = np.pi * (degrees + 5 * (coordinates - degrees) / 3) / 180
+    latitude = radians[:, 0]
+    longitude = radians[:, 1]
+
+    earth_radius = 6378.388
+    q1 = np.cos(longitude[:, None] - longitude[None, :])
+    q2 = np.cos(latitude[:, None] - latitude[None, :])
+    q3 = np.cos(latitude[:, None] + latitude[None, :])
+    distances = np.floor(earth_radius * np.arccos(np.clip(0.5 * ((1 + q1) * q2 - (1 - q1) * q3), -1, 1)) + 1)
+    np.fill_diagonal(distances, 0)
+
+    return distances
+
+
+def _explicit_matrix(values, n_cities, weight_format):
+    """
+    Builds a symmetric distance matrix from the weights listed in a TSPLIB file.
+    """
+
+    if weight_format == "FULL_MATRIX":
+        return values[: n_cities * n_cities].reshape(n_cities, n_cities)
+
+    # A triangle stored by columns has the same order as the opposite triangle stored by rows
+    row_formats = {
+        "UPPER_ROW": (np.triu_indices, 1),
+        "LOWER_ROW": (np.tril_indices, -1),
+        "UPPER_DIAG_ROW": (np.triu_indices, 0),
+        "LOWER_DIAG_ROW": (np.tril_indices, 0),
+        "UPPER_COL": (np.tril_indices, -1),
+        "LOWER_COL": (np.triu_indices, 1),
+        "UPPER_DIAG_COL": (np.tril_indices, 0),
+        "LOWER_DIAG_COL": (np.triu_indices, 0),
+    }
+    if weight_format not in row_formats:
+        raise ValueError(f"Edge weight format {weight_format} not supported.")
+
+    triangle_indices, offset = row_formats[weight_format]
+    rows, cols = triangle_indices(n_cities, offset)
+
+    distance_matrix = np.zeros((n_cities, n_cities))
+    distance_matrix[rows, cols] = values[: rows.size]
+    distance_matrix[cols, rows] = values[: rows.size]
+
+    return distance_matrix
@@ -3,7 +3,6 @@ from ..encodings import ImageEncoding
 import numpy as np
 
 # from numba import jit
-from skimage import metrics
 
 
 class ImgApprox(ObjectiveVectorFunc):
@@ -31,6 +30,8 @@ class ImgApprox(ObjectiveVectorFunc):
         if self.diff_func == "mse":
             error = imgdistance_mse(solution, self.reference)
         elif self.diff_func == "sts":
+            from skimage import metrics
+
             error = 0
             for i in range(3):
                 error += metrics.structural_similarity(solution[:, :, i], self.reference[:, :, i])
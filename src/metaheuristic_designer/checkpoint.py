@@ -0,0 +1,298 @@
+from __future__ import annotations
+import functools
+import os
+import pickle
+import random
+import types
+import numpy as np
+from .utils import RAND_GEN
+
+# Version of the format of the checkpoint files
+CHECKPOINT_VERSION = 1
+
+_FUNCTION_TYPES = (types.FunctionType, types.BuiltinFunctionType, types.MethodType, functools.partial)
+
+
+class ComponentState(dict):
+    """
+    State of an object of the algorithm (search strategy, operator, selection method, ...) that is restored
+    into the equivalent object of the algorithm that resumes the execution.
+    """
+
+
+class PartialDict(dict):
+    """
+    Dictionary stored without some of its values (functions, references to the objective function, ...),
+    it is restored updating the dictionary of the algorithm that resumes the execution.
+    """
+
+
+class _Skip:
+    pass
+
+
+_SKIP = _Skip()
+
+
+def _component_types() -> tuple:
+    from .Operator import Operator
+    from .SelectionMethod import SelectionMethod
+    from .ParamScheduler import ParamScheduler
+    from .Initializer import Initializer
+    from .SearchStrategy import SearchStrategy
+
+    return (Operator, SelectionMethod, ParamScheduler, Initializer, SearchStrategy)
+
+
+def _reference_types() -> tuple:
+    from .ObjectiveFunc import ObjectiveFunc
+    from .Evaluator import Evaluator
+    from .Encoding import Encoding
+    from .profiling import Profiler
+
+    return (ObjectiveFunc, Evaluator, Encoding, Profiler, np.random.Generator)
+
+
+def _capture_value(value: Any, components: tuple, references: tuple) -> Any:
+    if isinstance(value, components):
+        return get_component_state(value)
+
+    # References to objects that are not part of the state, the algorithm that resumes the execution already has them
+    if isinstance(value, references) or isinstance(value, _FUNCTION_TYPES):
+        return _SKIP
+
+    if isinstance(value, dict):
+        captured = {key: _capture_value(item, components, references) for key, item in value.items()}
+        complete = all(item is not _SKIP and not isinstance(item, (ComponentState, PartialDict)) for item in captured.values())
+        if complete:
+            return value
+        return PartialDict({key: item for key, item in captured.items() if item is not _SKIP})
+
+    if isinstance(value, (list, tuple)) and not isinstance(value, str):
+        captured = [_capture_value(item, components, references) for item in value]
+        if any(item is _SKIP for item in captured):
+            return _SKIP
+        if all(item is original for item, original in zip(captured, value)):
+            return value
+        return type(value)(captured) if isinstance(value, list) else tuple(captured)
+
+    return value
+
+
+def get_component_state(component: Any, skip: Iterable[str] = ()) -> ComponentState:
+    """
+    Gets the attributes of an object that change during the execution of an algorithm.
+
+    Attributes that hold other components of the algorithm (operators, selection methods, parameter schedulers,
+    initializers and search strategies) are stored recursively. References to the objective function, evaluators,
+    encodings, random generators and functions are left out, the algorithm that resumes the execution must have
+    been created with the same ones.
+
+    Parameters
+    ----------
+    component: Any
+        Object whose state will be stored.
+    skip: Iterable[str], optional
+        Names of attributes that won't be stored.
+
+    Returns
+    -------
+    state: ComponentState
+        The values of the attributes of the object.
+    """
+
+    components = _component_types()
+    references = _reference_types()
+
+    state = ComponentState()
+    for name, value in vars(component).items():
+        if name in skip:
+            continue
+
+        captured = _capture_value(value, components, references)
+        if captured is not _SKIP:
+            state[name] = captured
+
+    return state
+
+
+def _restore_value(current: Any, saved: Any) -> Any:
+    if isinstance(saved, ComponentState):
+        if current is None:
+            raise ValueError("The checkpoint doesn't match the structure of the algorithm.")
+        set_component_state(current, saved)
+        return current
+
+    if isinstance(saved, PartialDict):
+        if not isinstance(current, dict):
+            current = {}
+        for key, item in saved.items():
+            current[key] = _restore_value(current.get(key), item)
+        return current
+
+    if isinstance(saved, (list, tuple)) and any(isinstance(item, (ComponentState, PartialDict)) for item in saved):
+        if current is None or len(current) != len(saved):
+            raise ValueError("The checkpoint doesn't match the structure of the algorithm.")
+        restored = [_restore_value(current_item, item) for current_item, item in zip(current, saved)]
+        return restored if isinstance(saved, list) else tuple(restored)
+
+    return saved
+
+
+def set_component_state(component: Any, state: ComponentState):
+    """
+    Restores the attributes of an object stored with :py:func:`get_component_state`.
+
+    Parameters
+    ----------
+    component: Any
+        Object whose state will be restored.
+    state: ComponentState
+        The values of the attributes of the object.
+    """
+
+    for name, saved in state.items():
+        setattr(component, name, _restore_value(vars(component).get(name), saved))
+
+
+def get_random_state() -> dict:
+    """
+    Gets the state of the random number generators used by the package.
+
+    Returns
+    -------
+    state: dict
+        State of RAND_GEN, of the 'random' module and of the global generator of numpy.
+    """
+
+    return {
+        "rand_gen": RAND_GEN.bit_generator.state,
+        "random": random.getstate(),
+        "numpy": np.random.get_state(),
+    }
+
+
+def set_random_state(state: dict):
+    """
+    Restores the state of the random number generators stored with :py:func:`get_random_state`.
+
+    Parameters
+    ----------
+    state: dict
+        State of RAND_GEN, of the 'random' module and of the global generator of numpy.
+    """
+
+    RAND_GEN.bit_generator.state = state["rand_gen"]
+    random.setstate(state["random"])
+    np.random.set_state(state["numpy"])
+
+
+class _CheckpointPickler(pickle.Pickler):
+    """
+    Pickler that stores references to some objects (the objective function, encodings, ...)
+    instead of the objects themselves.
+    """
+
+    def __init__(self, file, external: dict):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._external_keys = {id(obj): key for key, obj in external.items()}
+
+    def persistent_id(self, obj):
+        return self._external_keys.get(id(obj))
+
+
+class _CheckpointUnpickler(pickle.Unpickler):
+    def __init__(self, file, external: dict):
+        super().__init__(file)
+        self._external = external
+
+    def persistent_load(self, key):
+        if key not in self._external:
+            raise pickle.UnpicklingError(f'The checkpoint refers to "{key}", which is not part of the algorithm.')
+
+        return self._external[key]
+
+
+def find_encodings(*objects: Any) -> list:
+    """
+    Finds the encodings used by the components of an algorithm, in a deterministic order.
+
+    Parameters
+    ----------
+    objects: Any
+        Objects where the encodings are searched.
+
+    Returns
+    -------
+    encodings: list
+        The encodings found, without repetitions.
+    """
+
+    from .Encoding import Encoding
+
+    components = _component_types()
+
+    found = {}
+    visited = set()
+    pending = list(reversed(objects))
+    while pending:
+        item = pending.pop()
+        if isinstance(item, Encoding):
+            found.setdefault(id(item), item)
+        elif isinstance(item, (list, tuple)):
+            pending.extend(reversed(item))
+        elif isinstance(item, components) and id(item) not in visited:
+            visited.add(id(item))
+            pending.extend(reversed(list(vars(item).values())))
+
+    return list(found.values())
+
+
+def write_checkpoint(file_name: str, state: dict, external: dict):
+    """
+    Writes a checkpoint to disk, the file is replaced atomically so that a failure while writing
+    doesn't corrupt the previous checkpoint.
+
+    Parameters
+    ----------
+    file_name: str
+        Path of the checkpoint file.
+    state: dict
+        State that will be stored.
+    external: dict
+        Objects that are stored as references, by name.
+    """
+
+    tmp_name = f"{file_name}.tmp"
+    with open(tmp_name, "wb") as file:
+        pickle.dump(CHECKPOINT_VERSION, file, protocol=pickle.HIGHEST_PROTOCOL)
+        _CheckpointPickler(file, external).dump(state)
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(tmp_name, file_name)
+
+
+def read_checkpoint(file_name: str, external: dict) -> dict:
+    """
+    Reads a checkpoint written with :py:func:`write_checkpoint`.
+
+    Parameters
+    ----------
+    file_name: str
+        Path of the checkpoint file.
+    external: dict
+        Objects that were stored as references, by name.
+
+    Returns
+    -------
+    state: dict
+        The state stored.
+    """
+
+    with open(file_name, "rb") as file:
+        version = pickle.load(file)
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"Checkpoint version {version} is not supported, expected version {CHECKPOINT_VERSION}.")
+
+        return _CheckpointUnpickler(file, external).load()
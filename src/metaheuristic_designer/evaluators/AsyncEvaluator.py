@@ -0,0 +1,110 @@
+from __future__ import annotations
+import asyncio
+import threading
+from ..Evaluator import Evaluator
+
+
+class AsyncEvaluator(Evaluator):
+    """
+    Evaluator that calculates the fitness of the whole population concurrently in an event loop,
+    using the 'objective_async' coroutine of the objective function.
+
+    This is meant for objective functions that spend most of their time waiting for I/O, like the ones that
+    send the solutions to an external simulation service. The event loop runs in a separate thread that is created
+    once when the evaluator is started and reused until it is shut down, so resources bound to the loop (connections,
+    sessions, ...) can be kept between generations. Each generation, the algorithm waits until all the individuals
+    have been evaluated.
+
+    Parameters
+    ----------
+    max_concurrency: int, optional
+        Maximum number of evaluations in progress at the same time.
+    name: str, optional
+        Name that is associated with the evaluator.
+    """
+
+    def __init__(self, max_concurrency: int = 100, name: str = None):
+        """
+        Constructor for the AsyncEvaluator class.
+        """
+
+        if name is None:
+            name = "Async"
+
+        super().__init__(name)
+
+        if max_concurrency <= 0:
+            raise ValueError("The maximum number of concurrent evaluations must be a positive integer.")
+
+        self.max_concurrency = max_concurrency
+        self._loop = None
+        self._thread = None
+
+    def start(self, objfunc):
+        if self.running:
+            self.shutdown()
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="AsyncEvaluator", daemon=True)
+        self._thread.start()
+        super().start(objfunc)
+
+    def shutdown(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+        super().shutdown()
+
+    def evaluate(self, population, objfunc):
+        if not self.running:
+            self.start(objfunc)
+
+        future = asyncio.run_coroutine_threadsafe(self.evaluate_async(population, objfunc), self._loop)
+        return future.result()
+
+    async def evaluate_async(self, population: List[Individual], objfunc: ObjectiveFunc) -> List[Individual]:
+        """
+        Coroutine that calculates the fitness of each individual in the population that has not been evaluated yet,
+        with at most 'max_concurrency' evaluations in progress at the same time.
+
+        It can be awaited directly from an event loop managed by the user.
+
+        Parameters
+        ----------
+        population: List[Individual]
+            Individuals to be evaluated.
+        objfunc: ObjectiveFunc
+            Objective function being optimized.
+
+        Returns
+        -------
+        evaluated_population: List[Individual]
+            The population with the fitness of each individual calculated.
+        """
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def evaluate_indiv(indiv):
+            async with semaphore:
+                return await objfunc.solution_fitness_async(indiv.encoding.decode(indiv.genotype))
+
+        async def evaluate(individuals):
+            return await asyncio.gather(*[evaluate_indiv(indiv) for indiv in individuals])
+
+        pending = [indiv for indiv in population if not indiv.fitness_calculated]
+        if pending:
+            # Individuals with the same genotype are evaluated once, even if they are evaluated concurrently
+            for indiv, fit in zip(pending, await objfunc.fitness_cached_async(pending, evaluate)):
+                indiv.fitness = fit
+
+        return population
+
+    def get_state(self):
+        data = super().get_state()
+        data["max_concurrency"] = self.max_concurrency
+
+        return data
@@ -0,0 +1,119 @@
+from __future__ import annotations
+import math
+from itertools import chain
+from multiprocessing import Pool
+import numpy as np
+from ..Evaluator import Evaluator
+
+# Objective function installed in each worker process when the pool is created.
+_worker_objfunc = None
+
+
+def _init_worker(objfunc):
+    global _worker_objfunc
+    _worker_objfunc = objfunc
+
+
+def _evaluate_genotypes(objfunc, encoding, genotypes):
+    solutions = [encoding.decode(genotype) for genotype in genotypes]
+
+    if objfunc.supports_batch:
+        return objfunc.solution_fitness_batch(np.stack(solutions)).tolist()
+
+    return [objfunc.solution_fitness(solution) for solution in solutions]
+
+
+def _evaluate_chunk(task):
+    encoding, genotypes = task
+    return _evaluate_genotypes(_worker_objfunc, encoding, genotypes)
+
+
+def _make_tasks(individuals, n_chunks):
+    """
+    Splits the genotypes of a list of individuals into at most 'n_chunks' groups (more if
+    the individuals use different encodings), each one paired with the encoding of its individuals.
+    """
+
+    chunk_size = max(1, math.ceil(len(individuals) / n_chunks))
+
+    tasks = []
+    current_encoding = None
+    current_chunk = []
+    for indiv in individuals:
+        if indiv.encoding is not current_encoding or len(current_chunk) >= chunk_size:
+            current_encoding = indiv.encoding
+            current_chunk = []
+            tasks.append((current_encoding, current_chunk))
+        current_chunk.append(indiv.genotype)
+
+    return tasks
+
+
+class ProcessEvaluator(Evaluator):
+    """
+    Evaluator that distributes the calculation of the fitness among a pool of worker processes.
+
+    The pool is created once when the evaluator is started and reused until it is shut down.
+    The objective function is sent to each worker only when the pool is created, after that
+    only the genotypes are sent to the workers and only the fitness values are sent back.
+    Changes made to the objective function after starting the evaluator will not be seen by the workers.
+
+    Parameters
+    ----------
+    threads: int, optional
+        Number of worker processes.
+    chunks_per_worker: int, optional
+        Number of pieces in which the work assigned to each worker is divided to balance the load.
+    name: str, optional
+        Name that is associated with the evaluator.
+    """
+
+    def __init__(self, threads: int = 8, chunks_per_worker: int = 4, name: str = None):
+        """
+        Constructor for the ProcessEvaluator class.
+        """
+
+        if name is None:
+            name = "Process pool"
+
+        super().__init__(name)
+
+        self.threads = threads
+        self.chunks_per_worker = chunks_per_worker
+        self._pool = None
+        self._objfunc = None
+
+    def start(self, objfunc):
+        if self.running:
+            self.shutdown()
+
+        self._pool = Pool(self.threads, initializer=_init_worker, initargs=(objfunc,))
+        self._objfunc = objfunc
+        super().start(objfunc)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._objfunc = None
+
+        super().shutdown()
+
+    def evaluate(self, population, objfunc):
+        # Workers hold a copy of the objective function, restart them if it has been replaced
+        if not self.running or objfunc is not self._objfunc:
+            self.start(objfunc)
+
+        def evaluate(to_evaluate):
+            tasks = _make_tasks(to_evaluate, self.threads * self.chunks_per_worker)
+            return list(chain.from_iterable(self._pool.map(_evaluate_chunk, tasks)))
+
+        # Only the individuals not found in the fitness cache are sent to the workers
+        return self._evaluate_pending(population, objfunc, evaluate)
+
+    def get_state(self):
+        data = super().get_state()
+        data["threads"] = self.threads
+
+        return data
@@ -0,0 +1,42 @@
+from __future__ import annotations
+from ..Evaluator import Evaluator
+from ..Population import Population
+
+
+class SerialEvaluator(Evaluator):
+    """
+    Evaluator that calculates the fitness of the population in the main process.
+
+    If the objective function implements 'objective_batch' the whole population is evaluated
+    with a single call, otherwise each individual is evaluated one after the other.
+
+    Parameters
+    ----------
+    name: str, optional
+        Name that is associated with the evaluator.
+    """
+
+    def __init__(self, name: str = None):
+        """
+        Constructor for the SerialEvaluator class.
+        """
+
+        if name is None:
+            name = "Serial"
+
+        super().__init__(name)
+
+    def evaluate(self, population, objfunc):
+        if isinstance(population, Population):
+            population.evaluate(objfunc)
+        elif objfunc.supports_batch:
+            # Evaluate all the pending individuals with a single call to the objective function
+            pending = [indiv for indiv in population if not indiv.fitness_calculated]
+            if pending:
+                for indiv, fit in zip(pending, objfunc.fitness_batch(pending)):
+                    indiv.fitness = fit
+        else:
+            for indiv in population:
+                indiv.calculate_fitness()
+
+        return population
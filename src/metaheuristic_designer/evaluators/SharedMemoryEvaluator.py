@@ -0,0 +1,190 @@
+from __future__ import annotations
+import math
+from itertools import chain
+from multiprocessing import Pool, resource_tracker, shared_memory
+import numpy as np
+from ..Evaluator import Evaluator
+from ..ObjectiveFunc import _encoding_fingerprint
+from .ProcessEvaluator import ProcessEvaluator, _init_worker, _make_tasks, _evaluate_chunk, _evaluate_genotypes
+
+# Objective function and shared buffers mapped in each worker process.
+_worker_objfunc = None
+_worker_buffers = {}
+
+
+def _init_shared_worker(objfunc):
+    global _worker_objfunc
+    _worker_objfunc = objfunc
+    _init_worker(objfunc)
+
+
+def _shared_array(name, shape, dtype):
+    """
+    Returns an array backed by the shared memory block with the given name, the block is mapped
+    only the first time it is used and the blocks that are no longer used are released.
+    """
+
+    if name not in _worker_buffers:
+        shm = shared_memory.SharedMemory(name=name)
+        _worker_buffers[name] = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+    return _worker_buffers[name][1]
+
+
+def _release_unused(names):
+    for name in list(_worker_buffers):
+        if name not in names:
+            shm, array = _worker_buffers.pop(name)
+            del array
+            shm.close()
+
+
+def _evaluate_shared(task):
+    genotype_name, fitness_name, shape, dtype, encoding, start, stop = task
+    _release_unused((genotype_name, fitness_name))
+
+    genotypes = _shared_array(genotype_name, shape, dtype)
+    fitness = _shared_array(fitness_name, shape[:1], np.float64)
+    fitness[start:stop] = _evaluate_genotypes(_worker_objfunc, encoding, genotypes[start:stop])
+
+
+class SharedMemoryEvaluator(ProcessEvaluator):
+    """
+    Evaluator that distributes the calculation of the fitness among a pool of worker processes,
+    sharing the genotypes with the workers through shared memory.
+
+    The genotypes of the individuals that need to be evaluated are copied into a matrix in a block of
+    shared memory that the workers map only once, and each worker writes the fitness values in another shared
+    array. Only the range of rows to evaluate (and the encoding of the individuals) is sent to the workers, which
+    avoids serializing large genotypes like images. The shared blocks grow when needed and are released when the
+    evaluator is shut down.
+
+    Only populations whose genotypes are arrays with the same shape and type and that share the same
+    encoding can be shared, other populations are sent to the workers like in :py:class:`ProcessEvaluator`.
+
+    Parameters
+    ----------
+    threads: int, optional
+        Number of worker processes.
+    chunks_per_worker: int, optional
+        Number of pieces in which the work assigned to each worker is divided to balance the load.
+    name: str, optional
+        Name that is associated with the evaluator.
+    """
+
+    def __init__(self, threads: int = 8, chunks_per_worker: int = 4, name: str = None):
+        """
+        Constructor for the SharedMemoryEvaluator class.
+        """
+
+        if name is None:
+            name = "Shared memory process pool"
+
+        super().__init__(threads, chunks_per_worker, name)
+
+        self._genotype_shm = None
+        self._fitness_shm = None
+        self._genotype_buffer = None
+        self._fitness_buffer = None
+
+    def start(self, objfunc):
+        if self.running:
+            self.shutdown()
+
+        # The workers must use the resource tracker of this process so that they don't destroy the shared blocks on exit
+        resource_tracker.ensure_running()
+        self._pool = Pool(self.threads, initializer=_init_shared_worker, initargs=(objfunc,))
+        self._objfunc = objfunc
+        Evaluator.start(self, objfunc)
+
+    def shutdown(self):
+        super().shutdown()
+        self._release_buffers()
+
+    def _release_buffers(self):
+        self._genotype_buffer = None
+        self._fitness_buffer = None
+
+        for shm in (self._genotype_shm, self._fitness_shm):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+        self._genotype_shm = None
+        self._fitness_shm = None
+
+    def _reserve_buffers(self, n_rows: int, row_shape: tuple, dtype: np.dtype):
+        """
+        Makes sure the shared blocks can hold 'n_rows' genotypes with the given shape and type.
+        """
+
+        buffer = self._genotype_buffer
+        if buffer is not None and buffer.shape[1:] == row_shape and buffer.dtype == dtype and buffer.shape[0] >= n_rows:
+            return
+
+        capacity = n_rows
+        if buffer is not None and buffer.shape[1:] == row_shape and buffer.dtype == dtype:
+            capacity = max(n_rows, 2 * buffer.shape[0])
+
+        self._release_buffers()
+
+        row_bytes = max(1, math.prod(row_shape) * dtype.itemsize)
+        self._genotype_shm = shared_memory.SharedMemory(create=True, size=capacity * row_bytes)
+        self._fitness_shm = shared_memory.SharedMemory(create=True, size=capacity * np.dtype(np.float64).itemsize)
+        self._genotype_buffer = np.ndarray((capacity,) + row_shape, dtype=dtype, buffer=self._genotype_shm.buf)
+        self._fitness_buffer = np.ndarray((capacity,), dtype=np.float64, buffer=self._fitness_shm.buf)
+
+    def evaluate(self, population, objfunc):
+        # Workers hold a copy of the objective function, restart them if it has been replaced
+        if not self.running or objfunc is not self._objfunc:
+            self.start(objfunc)
+
+        def evaluate(to_evaluate):
+            if _can_share(to_evaluate):
+                return self._evaluate_shared(to_evaluate)
+
+            tasks = _make_tasks(to_evaluate, self.threads * self.chunks_per_worker)
+            return list(chain.from_iterable(self._pool.map(_evaluate_chunk, tasks)))
+
+        # Only the individuals not found in the fitness cache are sent to the workers
+        return self._evaluate_pending(population, objfunc, evaluate)
+
+    def _evaluate_shared(self, individuals: List[Individual]) -> List[float]:
+        first_genotype = individuals[0].genotype
+        n_rows = len(individuals)
+        self._reserve_buffers(n_rows, first_genotype.shape, first_genotype.dtype)
+
+        for idx, indiv in enumerate(individuals):
+            self._genotype_buffer[idx] = indiv.genotype
+
+        chunk_size = max(1, math.ceil(n_rows / (self.threads * self.chunks_per_worker)))
+        task_info = (
+            self._genotype_shm.name,
+            self._fitness_shm.name,
+            self._genotype_buffer.shape,
+            self._genotype_buffer.dtype.str,
+            individuals[0].encoding,
+        )
+        tasks = [task_info + (start, min(start + chunk_size, n_rows)) for start in range(0, n_rows, chunk_size)]
+        self._pool.map(_evaluate_shared, tasks)
+
+        return self._fitness_buffer[:n_rows].tolist()
+
+
+def _can_share(individuals: List[Individual]) -> bool:
+    """
+    Checks whether the genotypes of the individuals can be stored as rows of a single matrix.
+    """
+
+    first = individuals[0]
+    if not isinstance(first.genotype, np.ndarray) or first.genotype.dtype.hasobject:
+        return False
+
+    encoding = _encoding_fingerprint(first.encoding)
+    return all(
+        (indiv.encoding is first.encoding or _encoding_fingerprint(indiv.encoding) == encoding)
+        and isinstance(indiv.genotype, np.ndarray)
+        and indiv.genotype.shape == first.genotype.shape
+        and indiv.genotype.dtype == first.genotype.dtype
+        for indiv in individuals
+    )
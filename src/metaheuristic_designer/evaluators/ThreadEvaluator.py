@@ -0,0 +1,72 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from ..Evaluator import Evaluator
+from .ProcessEvaluator import _make_tasks, _evaluate_genotypes
+
+
+class ThreadEvaluator(Evaluator):
+    """
+    Evaluator that distributes the calculation of the fitness among a pool of threads.
+
+    The threads share the memory of the main process, so neither the objective function nor the
+    individuals need to be serialized. Only objective functions that release the GIL during most of their
+    execution (for example, the ones that rely on NumPy, SciPy or scikit-image operations on large arrays)
+    will benefit from this evaluator. The pool is created once when the evaluator is started and reused
+    until it is shut down.
+
+    Parameters
+    ----------
+    threads: int, optional
+        Number of threads in the pool.
+    chunks_per_worker: int, optional
+        Number of pieces in which the work assigned to each thread is divided to balance the load.
+    name: str, optional
+        Name that is associated with the evaluator.
+    """
+
+    def __init__(self, threads: int = 8, chunks_per_worker: int = 4, name: str = None):
+        """
+        Constructor for the ThreadEvaluator class.
+        """
+
+        if name is None:
+            name = "Thread pool"
+
+        super().__init__(name)
+
+        self.threads = threads
+        self.chunks_per_worker = chunks_per_worker
+        self._executor = None
+
+    def start(self, objfunc):
+        if self.running:
+            self.shutdown()
+
+        self._executor = ThreadPoolExecutor(self.threads, thread_name_prefix="ThreadEvaluator")
+        super().start(objfunc)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        super().shutdown()
+
+    def evaluate(self, population, objfunc):
+        if not self.running:
+            self.start(objfunc)
+
+        def evaluate(to_evaluate):
+            tasks = _make_tasks(to_evaluate, self.threads * self.chunks_per_worker)
+            results = self._executor.map(lambda task: _evaluate_genotypes(objfunc, *task), tasks)
+            return list(chain.from_iterable(results))
+
+        # Only the individuals not found in the fitness cache are sent to the threads
+        return self._evaluate_pending(population, objfunc, evaluate)
+
+    def get_state(self):
+        data = super().get_state()
+        data["threads"] = self.threads
+
+        return data
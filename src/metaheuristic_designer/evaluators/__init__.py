@@ -0,0 +1,5 @@
+from .SerialEvaluator import SerialEvaluator
+from .ProcessEvaluator import ProcessEvaluator
+from .ThreadEvaluator import ThreadEvaluator
+from .SharedMemoryEvaluator import SharedMemoryEvaluator
+from .AsyncEvaluator import AsyncEvaluator
@@ -0,0 +1,48 @@
+from __future__ import annotations
+import numpy as np
+from ..History import History
+
+
+class DecimatedHistory(History):
+    """
+    History that keeps in memory the value of one generation out of every 'step' generations.
+
+    Parameters
+    ----------
+    step: int
+        Number of generations between two values kept.
+    name: str, optional
+        Name that is associated with the history.
+    """
+
+    def __init__(self, step: int, name: str = None):
+        """
+        Constructor for the DecimatedHistory class.
+        """
+
+        if step <= 0:
+            raise ValueError("The step of the history must be a positive integer.")
+
+        super().__init__(name)
+        self.step = step
+        self.values = []
+
+    @property
+    def generations(self):
+        return np.arange(len(self.values)) * self.step
+
+    def record(self, value, generation):
+        if generation % self.step == 0:
+            self.values.append(value)
+
+    def discard(self):
+        self.values = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, idx):
+        return self.values[idx]
+
+    def __iter__(self):
+        return iter(self.values)
@@ -0,0 +1,185 @@
+from __future__ import annotations
+import io
+import os
+import numpy as np
+from ..History import History
+
+
+class DiskHistory(History):
+    """
+    History that streams the value of every generation to a ".npy" file, keeping nothing in memory.
+
+    The values must be arrays (or numbers) of the same shape. They are appended to the file as they are
+    recorded and the header of the file is updated when the history is read or the file is closed, so the
+    file can be opened with ``np.load(file_name, mmap_mode="r")``. Reading the history maps the file into
+    memory instead of loading it.
+
+    Parameters
+    ----------
+    file_name: str
+        Path of the file where the values are stored, an existing file is opened to read its values.
+    dtype: np.dtype, optional
+        Type of the values stored, by default the type of the first value recorded.
+    name: str, optional
+        Name that is associated with the history.
+    """
+
+    def __init__(self, file_name: str, dtype: np.dtype = None, name: str = None):
+        """
+        Constructor for the DiskHistory class.
+        """
+
+        super().__init__(name)
+        self.file_name = file_name
+        self.fixed_dtype = dtype
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        self.shape = None
+        self.count = 0
+        self.header_size = None
+        self._file = None
+        self._header_count = None
+        self._mapped = None
+
+        if os.path.exists(file_name):
+            self._read_header()
+
+    def _header(self, count: int) -> bytes:
+        header = io.BytesIO()
+        header_data = {"descr": np.lib.format.dtype_to_descr(self.dtype), "fortran_order": False, "shape": (count,) + self.shape}
+        np.lib.format.write_array_header_1_0(header, header_data)
+        return header.getvalue()
+
+    def _read_header(self):
+        with open(self.file_name, "rb") as file:
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, _, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, _, dtype = np.lib.format.read_array_header_2_0(file)
+            self.header_size = file.tell()
+
+        self.dtype = dtype
+        self.shape = tuple(shape[1:])
+        self.count = shape[0]
+        self._header_count = self.count
+        self.n_appended = self.count
+
+    def _open(self):
+        self._file = open(self.file_name, "r+b")
+        self._file.seek(self.header_size + self.count * self.record_size)
+
+    @property
+    def record_size(self) -> int:
+        """
+        Number of bytes used by each value in the file.
+        """
+
+        return self.dtype.itemsize * int(np.prod(self.shape, dtype=int))
+
+    @property
+    def generations(self):
+        return np.arange(self.count)
+
+    def record(self, value, generation):
+        value = np.asarray(value, dtype=self.dtype)
+        if value.dtype == object:
+            raise ValueError("Only numeric values can be stored in a DiskHistory.")
+
+        if self.shape is None:
+            self.dtype = value.dtype
+            self.shape = value.shape
+            header = self._header(0)
+            self.header_size = len(header)
+            with open(self.file_name, "wb") as file:
+                file.write(header)
+            self._header_count = 0
+        elif value.shape != self.shape:
+            raise ValueError(f"Values of shape {value.shape} can't be stored in a history of values of shape {self.shape}.")
+
+        if self._file is None:
+            self._open()
+
+        self._file.write(np.ascontiguousarray(value).tobytes())
+        self.count += 1
+
+    def flush(self):
+        """
+        Writes the pending values and updates the header of the file.
+        """
+
+        if self._file is not None:
+            self._file.flush()
+
+        if self.shape is not None and self._header_count != self.count:
+            header = self._header(self.count)
+            if len(header) != self.header_size:
+                raise RuntimeError(f'The header of "{self.file_name}" can\'t be updated in place.')
+
+            with open(self.file_name, "r+b") as file:
+                file.write(header)
+            self._header_count = self.count
+
+    def close(self):
+        """
+        Updates the file and closes it, the history can still be read or extended after closing it.
+        """
+
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._mapped = None
+
+    def discard(self):
+        self.close()
+        if os.path.exists(self.file_name):
+            os.remove(self.file_name)
+
+        self.dtype = None if self.fixed_dtype is None else np.dtype(self.fixed_dtype)
+        self.shape = None
+        self.count = 0
+        self.header_size = None
+        self._header_count = None
+
+    def to_array(self):
+        if self.count == 0:
+            return np.zeros((0,) + (self.shape or ()), dtype=self.dtype or float)
+
+        if self._mapped is None or len(self._mapped) != self.count:
+            self.flush()
+            self._mapped = np.memmap(self.file_name, dtype=self.dtype, mode="r", offset=self.header_size, shape=(self.count,) + self.shape)
+
+        return self._mapped
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, idx):
+        if isinstance(idx, (int, np.integer)) and not -self.count <= idx < self.count:
+            raise IndexError("history index out of range")
+
+        return self.to_array()[idx]
+
+    def __getstate__(self):
+        # The file is updated so that it contains exactly the values recorded when the state was taken
+        self.flush()
+        state = self.__dict__.copy()
+        state["_file"] = None
+        state["_mapped"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+        # Values recorded after the state was taken are discarded
+        if self.shape is not None and os.path.exists(self.file_name):
+            with open(self.file_name, "r+b") as file:
+                file.truncate(self.header_size + self.count * self.record_size)
+            self._header_count = None
+            self.flush()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -0,0 +1,41 @@
+from __future__ import annotations
+import numpy as np
+from ..History import History
+
+
+class ListHistory(History):
+    """
+    History that keeps the value of every generation in memory.
+
+    Parameters
+    ----------
+    name: str, optional
+        Name that is associated with the history.
+    """
+
+    def __init__(self, name: str = None):
+        """
+        Constructor for the ListHistory class.
+        """
+
+        super().__init__(name)
+        self.values = []
+
+    @property
+    def generations(self):
+        return np.arange(len(self.values))
+
+    def record(self, value, generation):
+        self.values.append(value)
+
+    def discard(self):
+        self.values = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, idx):
+        return self.values[idx]
+
+    def __iter__(self):
+        return iter(self.values)
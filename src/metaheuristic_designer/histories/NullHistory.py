@@ -0,0 +1,37 @@
+from __future__ import annotations
+import numpy as np
+from ..History import History
+
+
+class NullHistory(History):
+    """
+    History that doesn't keep any value, only the last one is available in the 'last' attribute.
+
+    Parameters
+    ----------
+    name: str, optional
+        Name that is associated with the history.
+    """
+
+    def __init__(self, name: str = None):
+        """
+        Constructor for the NullHistory class.
+        """
+
+        super().__init__(name)
+
+    @property
+    def generations(self):
+        return np.zeros(0, dtype=int)
+
+    def record(self, value, generation):
+        pass
+
+    def discard(self):
+        pass
+
+    def __len__(self):
+        return 0
+
+    def __getitem__(self, idx):
+        return [][idx]
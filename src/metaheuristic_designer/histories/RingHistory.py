@@ -0,0 +1,55 @@
+from __future__ import annotations
+from collections import deque
+from itertools import islice
+import numpy as np
+from ..History import History
+
+
+class RingHistory(History):
+    """
+    History that keeps the values of the last generations in memory.
+
+    Parameters
+    ----------
+    size: int
+        Maximum number of values kept.
+    name: str, optional
+        Name that is associated with the history.
+    """
+
+    def __init__(self, size: int, name: str = None):
+        """
+        Constructor for the RingHistory class.
+        """
+
+        if size <= 0:
+            raise ValueError("The size of the history must be a positive integer.")
+
+        super().__init__(name)
+        self.size = size
+        self.values = deque(maxlen=size)
+
+    @property
+    def generations(self):
+        return np.arange(self.n_appended - len(self.values), self.n_appended)
+
+    def record(self, value, generation):
+        self.values.append(value)
+
+    def discard(self):
+        self.values.clear()
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self.values))
+            if step == 1:
+                return list(islice(self.values, start, stop))
+            return list(self.values)[idx]
+
+        return self.values[idx]
+
+    def __iter__(self):
+        return iter(self.values)
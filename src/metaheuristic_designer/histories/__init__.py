@@ -0,0 +1,5 @@
+from .ListHistory import ListHistory
+from .NullHistory import NullHistory
+from .RingHistory import RingHistory
+from .DecimatedHistory import DecimatedHistory
+from .DiskHistory import DiskHistory
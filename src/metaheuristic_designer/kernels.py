@@ -0,0 +1,178 @@
+from __future__ import annotations
+from typing import Callable
+import os
+import warnings
+
+# Backend requested by the user, can be set with the MHD_KERNEL_BACKEND environment variable
+_requested_backend = os.environ.get("MHD_KERNEL_BACKEND", "auto").lower()
+
+# The numba module once it has been imported, False if it is not available
+_numba = None
+
+# Every kernel defined in the package, by name
+_kernels = {}
+
+
+def _load_numba():
+    """
+    Imports numba the first time a kernel is used, so that importing the package doesn't pay its cost.
+    """
+
+    global _numba
+
+    if _numba is None:
+        try:
+            import numba
+
+            _numba = numba
+        except ImportError:
+            _numba = False
+
+    return _numba
+
+
+class Kernel:
+    """
+    Computational kernel with an implementation compiled with numba and a NumPy implementation
+    that is used when numba is not installed.
+
+    The function given is written with explicit loops so that it can be compiled with numba, it is
+    only compiled the first time the kernel is called. If numba is not available or the compilation fails,
+    the fallback implementation is used, which by default is the same function run by the interpreter.
+
+    Parameters
+    ----------
+    func: Callable
+        Implementation of the kernel that will be compiled with numba.
+    fallback: Callable, optional
+        Implementation used without numba, usually a vectorized version of the kernel.
+    name: str, optional
+        Name of the kernel.
+    """
+
+    def __init__(self, func: Callable, fallback: Callable = None, name: str = None):
+        """
+        Constructor for the Kernel class.
+        """
+
+        self.func = func
+        self.fallback = func if fallback is None else fallback
+        self.name = func.__name__ if name is None else name
+        self.__doc__ = func.__doc__
+
+        self._impl = None
+        self._backend = None
+        self._compiled = False
+
+    @property
+    def backend(self) -> str:
+        """
+        Name of the implementation used, either "numba" or "numpy".
+        """
+
+        if self._impl is None:
+            self._resolve()
+
+        return self._backend
+
+    def reset(self):
+        """
+        Forgets the implementation chosen so that it is chosen again the next time the kernel is used.
+        """
+
+        self._impl = None
+        self._backend = None
+        self._compiled = False
+
+    def _resolve(self):
+        numba = _load_numba() if _requested_backend != "numpy" else False
+
+        if numba:
+            self._impl = numba.njit(cache=True)(self.func)
+            self._backend = "numba"
+        else:
+            self._impl = self.fallback
+            self._backend = "numpy"
+
+    def __call__(self, *args):
+        if self._impl is None:
+            self._resolve()
+
+        if self._backend == "numba" and not self._compiled:
+            # Numba compiles the function on the first call, if it fails the NumPy implementation is used
+            try:
+                result = self._impl(*args)
+                self._compiled = True
+                return result
+            except _numba.core.errors.NumbaError as err:
+                warnings.warn(f"The kernel {self.name} could not be compiled with numba, using NumPy instead: {err}", stacklevel=2)
+                self._impl = self.fallback
+                self._backend = "numpy"
+
+        return self._impl(*args)
+
+
+def kernel(name: str = None, fallback: Callable = None) -> Callable[[Callable], Kernel]:
+    """
+    Decorator that registers a function as a :py:class:`Kernel`.
+
+    Parameters
+    ----------
+    name: str, optional
+        Name of the kernel, by default the name of the function.
+    fallback: Callable, optional
+        Implementation used without numba, by default the decorated function.
+
+    Returns
+    -------
+    decorator: Callable
+        Function that creates the kernel.
+    """
+
+    def decorator(func):
+        new_kernel = Kernel(func, fallback, name)
+        _kernels[new_kernel.name] = new_kernel
+        return new_kernel
+
+    return decorator
+
+
+def kernel_backends() -> dict:
+    """
+    Reports the implementation used by each of the accelerated kernels.
+
+    Returns
+    -------
+    backends: dict
+        Dictionary with the name of each kernel and its backend, "numba" or "numpy".
+    """
+
+    # Kernels are defined in the modules that use them
+    from . import operators, selectionMethods, benchmarks
+
+    return {name: kern.backend for name, kern in sorted(_kernels.items())}
+
+
+def set_kernel_backend(backend: str = "auto"):
+    """
+    Chooses the implementation of the accelerated kernels.
+
+    Parameters
+    ----------
+    backend: str, optional
+        "numba" to use the compiled kernels, "numpy" to use the NumPy implementations and "auto"
+        to use numba only when it is installed.
+    """
+
+    global _requested_backend
+
+    backend = backend.lower()
+    if backend not in ("auto", "numba", "numpy"):
+        raise ValueError(f'The kernel backend must be "auto", "numba" or "numpy", got "{backend}".')
+
+    if backend == "numba" and not _load_numba():
+        raise ImportError("The numba backend was requested but numba is not installed.")
+
+    _requested_backend = backend
+    for kern in _kernels.values():
+        kern.reset()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from ..Operator import Operator
+from ..PopulationContext import other_individuals
 from .vector_operator_functions import *
 from copy import copy
 import enum
@@ -86,7 +87,7 @@ class OperatorBinary(Operator):
 
     def evolve(self, indiv, population, objfunc, global_best, initializer):
         new_indiv = copy(indiv)
-        others = [i for i in population if i != indiv]
+        others = other_individuals(population, indiv)
         if len(others) == 0:
             indiv2 = indiv
             others = [indiv]
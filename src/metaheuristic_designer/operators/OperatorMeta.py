@@ -5,6 +5,7 @@ from copy import copy
 import numpy as np
 import enum
 from enum import Enum
+from ..utils import RAND_GEN
 
 
 class MetaOpMethods(Enum):
@@ -127,6 +128,57 @@ class OperatorMeta(Operator):
 
         return result
 
+    @property
+    def supports_batch(self):
+        return self.method in [MetaOpMethods.BRANCH, MetaOpMethods.SEQUENCE] and all(
+            isinstance(op, Operator) and op.supports_batch for op in self.op_list
+        )
+
+    def evolve_batch(
+        self, pop_matrix, fitness, global_best, speed=None, indiv_best=None, partner_matrix=None, partner_fitness=None, partner_idx=None
+    ):
+        if not self.supports_batch:
+            return super().evolve_batch(pop_matrix, fitness, global_best, speed, indiv_best, partner_matrix, partner_fitness, partner_idx)
+
+        if self.method == MetaOpMethods.BRANCH:
+            weights = np.asarray(self.params["weights"], dtype=float)
+            chosen = RAND_GEN.choice(len(self.op_list), size=pop_matrix.shape[0], p=weights / weights.sum())
+
+            # Each operator only evolves the rows it was chosen for, the whole population is kept as the pool of partners
+            if partner_matrix is None:
+                partner_matrix, partner_fitness, partner_idx = pop_matrix, fitness, np.arange(pop_matrix.shape[0])
+            partner_idx = np.asarray(partner_idx)
+
+            result = pop_matrix.copy()
+            result_speed = None if speed is None else speed.copy()
+            for idx_op, op in enumerate(self.op_list):
+                rows = np.flatnonzero(chosen == idx_op)
+                if rows.size > 0:
+                    op_result, op_speed = op.apply_batch(
+                        pop_matrix[rows],
+                        None if fitness is None else fitness[rows],
+                        global_best,
+                        None if speed is None else speed[rows],
+                        None if indiv_best is None else indiv_best[rows],
+                        partner_matrix,
+                        partner_fitness,
+                        partner_idx[rows],
+                    )
+                    result[rows] = op_result
+                    if op_speed is not None:
+                        if result_speed is None:
+                            result_speed = np.zeros(pop_matrix.shape)
+                        result_speed[rows] = op_speed
+
+        elif self.method == MetaOpMethods.SEQUENCE:
+            result, result_speed = pop_matrix, speed
+            for op in self.op_list:
+                result, result_speed = op.apply_batch(
+                    result, fitness, global_best, result_speed, indiv_best, partner_matrix, partner_fitness, partner_idx
+                )
+
+        return result, result_speed
+
     def step(self, progress: float):
         super().step(progress)
 
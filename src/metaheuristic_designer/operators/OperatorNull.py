@@ -36,3 +36,12 @@ class OperatorNull(Operator):
 
     def evolve(self, indiv, *args):
         return indiv
+
+    @property
+    def supports_batch(self):
+        return True
+
+    def evolve_batch(
+        self, pop_matrix, fitness, global_best, speed=None, indiv_best=None, partner_matrix=None, partner_fitness=None, partner_idx=None
+    ):
+        return pop_matrix, speed
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import numpy as np
 from ..Operator import Operator
+from ..PopulationContext import other_individuals
 from .vector_operator_functions import *
 from ..ParamScheduler import ParamScheduler
 from copy import copy
@@ -96,6 +97,29 @@ real_ops_map = {
 }
 
 
+# Methods that can be applied to a whole population at once
+real_batch_methods = {
+    RealOpMethods.ONE_POINT,
+    RealOpMethods.TWO_POINT,
+    RealOpMethods.MULTIPOINT,
+    RealOpMethods.BLXALPHA,
+    RealOpMethods.SBX,
+    RealOpMethods.GAUSS,
+    RealOpMethods.LAPLACE,
+    RealOpMethods.CAUCHY,
+    RealOpMethods.UNIFORM,
+    RealOpMethods.DE_RAND_1,
+    RealOpMethods.DE_BEST_1,
+    RealOpMethods.DE_RAND_2,
+    RealOpMethods.DE_BEST_2,
+    RealOpMethods.DE_CTRAND_1,
+    RealOpMethods.DE_CTBEST_1,
+    RealOpMethods.DE_CTPBEST_1,
+    RealOpMethods.PSO,
+    RealOpMethods.NOTHING,
+}
+
+
 class OperatorReal(Operator):
     """
     Operator class that has mutation and cross methods for real coded vectors
@@ -132,7 +156,7 @@ class OperatorReal(Operator):
 
     def evolve(self, indiv, population, objfunc, global_best, initializer):
         new_indiv = copy(indiv)
-        others = [i for i in population if i != indiv]
+        others = other_individuals(population, indiv)
         if len(others) == 0:
             indiv2 = indiv
             others = [indiv]
@@ -276,3 +300,92 @@ class OperatorReal(Operator):
             new_indiv = indiv
 
         return new_indiv
+
+    @property
+    def supports_batch(self):
+        return self.method in real_batch_methods
+
+    def evolve_batch(
+        self, pop_matrix, fitness, global_best, speed=None, indiv_best=None, partner_matrix=None, partner_fitness=None, partner_idx=None
+    ):
+        if not self.supports_batch:
+            return super().evolve_batch(pop_matrix, fitness, global_best, speed, indiv_best, partner_matrix, partner_fitness, partner_idx)
+
+        params = self.params
+        partners = (partner_matrix, partner_fitness, partner_idx)
+
+        if speed is None:
+            speed = np.zeros(pop_matrix.shape)
+
+        pool = pop_matrix
+        if partner_matrix is not None:
+            if partner_idx is None:
+                raise ValueError("The position of each individual in the partner matrix must be given.")
+            pool = partner_matrix
+
+        # Each individual is crossed with a different one, unless there are not enough individuals
+        cross_matrix = pop_matrix
+        if pool.shape[0] > 2:
+            cross_matrix = pool[sample_other_indices(pool.shape[0], 1, partner_idx)[:, 0]]
+
+        new_speed = speed
+
+        if self.method == RealOpMethods.ONE_POINT:
+            offspring = cross_1p_batch(pop_matrix, cross_matrix)
+
+        elif self.method == RealOpMethods.TWO_POINT:
+            offspring = cross_2p_batch(pop_matrix, cross_matrix)
+
+        elif self.method == RealOpMethods.MULTIPOINT:
+            offspring = cross_mp_batch(pop_matrix, cross_matrix)
+
+        elif self.method == RealOpMethods.BLXALPHA:
+            offspring = blxalpha_batch(pop_matrix, cross_matrix, params["Cr"])
+
+        elif self.method == RealOpMethods.SBX:
+            offspring = sbx_batch(pop_matrix, cross_matrix, params["Cr"])
+
+        elif self.method == RealOpMethods.GAUSS:
+            offspring = gaussian(pop_matrix, params["F"])
+
+        elif self.method == RealOpMethods.LAPLACE:
+            offspring = laplace(pop_matrix, params["F"])
+
+        elif self.method == RealOpMethods.CAUCHY:
+            offspring = cauchy(pop_matrix, params["F"])
+
+        elif self.method == RealOpMethods.UNIFORM:
+            offspring = uniform(pop_matrix, params["Low"], params["Up"])
+
+        elif self.method == RealOpMethods.DE_RAND_1:
+            offspring = DE_rand1_batch(pop_matrix, params["F"], params["Cr"], partner_matrix, partner_idx)
+
+        elif self.method == RealOpMethods.DE_BEST_1:
+            offspring = DE_best1_batch(pop_matrix, fitness, params["F"], params["Cr"], *partners)
+
+        elif self.method == RealOpMethods.DE_RAND_2:
+            offspring = DE_rand2_batch(pop_matrix, params["F"], params["Cr"], partner_matrix, partner_idx)
+
+        elif self.method == RealOpMethods.DE_BEST_2:
+            offspring = DE_best2_batch(pop_matrix, fitness, params["F"], params["Cr"], *partners)
+
+        elif self.method == RealOpMethods.DE_CTRAND_1:
+            offspring = DE_current_to_rand1_batch(pop_matrix, params["F"], params["Cr"], partner_matrix, partner_idx)
+
+        elif self.method == RealOpMethods.DE_CTBEST_1:
+            offspring = DE_current_to_best1_batch(pop_matrix, fitness, params["F"], params["Cr"], *partners)
+
+        elif self.method == RealOpMethods.DE_CTPBEST_1:
+            offspring = DE_current_to_pbest1_batch(pop_matrix, fitness, params["F"], params["Cr"], params["P"], *partners)
+
+        elif self.method == RealOpMethods.PSO:
+            if global_best is None:
+                global_best = pop_matrix
+            if indiv_best is None:
+                indiv_best = pop_matrix
+            offspring, new_speed = pso_operator_batch(pop_matrix, speed, indiv_best, global_best, params["w"], params["c1"], params["c2"])
+
+        elif self.method == RealOpMethods.NOTHING:
+            offspring = pop_matrix
+
+        return offspring, new_speed
@@ -1,11 +1,11 @@
 import math
 import random
 import numpy as np
-import scipy as sp
-import scipy.stats
 import enum
 from enum import Enum
 from ..utils import RAND_GEN
+from ..Population import stack_genotypes, genotype_mean_std
+from ..kernels import kernel
 
 
 class ProbDist(Enum):
@@ -90,11 +90,14 @@ def mutate_sample(vector, population, params):
     mask_pos = np.hstack([np.ones(n), np.zeros(vector.size - n)]).astype(bool)
     RAND_GEN.shuffle(mask_pos)
 
-    popul_matrix = np.vstack([i.genotype for i in population])
-    if loc is None or (type(loc) is str and loc == "calculated"):
-        loc = popul_matrix.mean(axis=0)[mask_pos]
-    if scale is None or (type(scale) is str and scale == "calculated"):
-        scale = popul_matrix.std(axis=0)[mask_pos]
+    calc_loc = loc is None or (type(loc) is str and loc == "calculated")
+    calc_scale = scale is None or (type(scale) is str and scale == "calculated")
+    if calc_loc or calc_scale:
+        popul_mean, popul_std = genotype_mean_std(population)
+        if calc_loc:
+            loc = popul_mean[mask_pos]
+        if calc_scale:
+            scale = popul_std[mask_pos]
 
     rand_vec = sample_distribution(distrib, n, loc, scale, params)
 
@@ -143,11 +146,14 @@ def rand_sample(vector, population, params):
         loc = minim
         scale = maxim - minim
 
-    popul_matrix = np.vstack([i.genotype for i in population])
-    if loc is None or (type(loc) is str and loc == "calculated"):
-        loc = popul_matrix.mean(axis=0)
-    if scale is None or (type(scale) is str and scale == "calculated"):
-        scale = popul_matrix.std(axis=0)
+    calc_loc = loc is None or (type(loc) is str and loc == "calculated")
+    calc_scale = scale is None or (type(scale) is str and scale == "calculated")
+    if calc_loc or calc_scale:
+        popul_mean, popul_std = genotype_mean_std(population)
+        if calc_loc:
+            loc = popul_mean
+        if calc_scale:
+            scale = popul_std
 
     rand_vec = sample_distribution(distrib, vector.shape, loc, scale, params)
 
@@ -180,6 +186,9 @@ def sample_distribution(distrib, n, loc=None, scale=None, params={}):
     Takes 'n' samples from a given probablility distribution and returns them as a vector.
     """
 
+    import scipy as sp
+    import scipy.stats
+
     loc = 0 if loc is None else loc
     scale = 1 if scale is None else scale
 
@@ -269,18 +278,17 @@ def poisson(vector, mu):
 def generate_statistic(vector, population, params):
     stat_name = params.get("statistic", "mean")
 
-    popul_matrix = np.vstack([i.genotype for i in population])
-
     new_vector = None
     if stat_name == "mean":
-        new_vector = np.mean(popul_matrix, axis=0)
+        new_vector = genotype_mean_std(population)[0]
     elif stat_name == "average":
+        popul_matrix = stack_genotypes(population)
         weights = params.get("weights", np.ones(popul_matrix.shape[1]))
         new_vector = np.average(popul_matrix, weights=weights, axis=0)
     elif stat_name == "median":
-        new_vector = np.median(popul_matrix, axis=0)
+        new_vector = np.median(stack_genotypes(population), axis=0)
     elif stat_name == "std":
-        new_vector = np.std(popul_matrix, axis=0)
+        new_vector = genotype_mean_std(population)[1]
 
     return new_vector
 
@@ -449,6 +457,13 @@ def pmx(vector1, vector2):
     cross_point1 = random.randrange(0, vector1.size - 2)
     cross_point2 = random.randrange(cross_point1, vector1.size)
 
+    if not _is_index_permutation(vector1):
+        return _pmx_numpy(vector1, vector2, cross_point1, cross_point2)
+
+    return _pmx_kernel(vector1, vector2, cross_point1, cross_point2)
+
+
+def _pmx_numpy(vector1, vector2, cross_point1, cross_point2):
     # Segmentamos
     child = np.full_like(vector1, -1)
     range_vec = np.arange(vector1.size)
@@ -478,10 +493,63 @@ def pmx(vector1, vector2):
     return child
 
 
+@kernel("pmx", fallback=_pmx_numpy)
+def _pmx_kernel(vector1, vector2, cross_point1, cross_point2):
+    """
+    Partially mapped crossover of two permutations of the integers from 0 to n-1, with the same result as '_pmx_numpy'.
+    """
+
+    size = vector1.size
+    seg_end = min(cross_point2, size - 1)
+
+    child = np.full(size, -1, dtype=vector1.dtype)
+    position_in_2 = np.empty(size, dtype=np.int64)
+    in_segment_2 = np.zeros(size, dtype=np.bool_)
+    for i in range(size):
+        position_in_2[vector2[i]] = i
+    for i in range(cross_point1, seg_end + 1):
+        child[i] = vector1[i]
+        in_segment_2[vector2[i]] = True
+
+    # The elements without conflicts are placed in increasing order in the positions they have in the second vector
+    no_conflict = np.zeros(size, dtype=np.bool_)
+    for i in range(size):
+        if (i < cross_point1 or i > seg_end) and not in_segment_2[vector1[i]]:
+            no_conflict[vector1[i]] = True
+
+    next_value = 0
+    for i in range(size):
+        if no_conflict[vector2[i]]:
+            while not no_conflict[next_value]:
+                next_value += 1
+            child[i] = next_value
+            next_value += 1
+
+    # The conflicting elements follow the mapping defined by the segment
+    for i in range(size):
+        if (i < cross_point1 or i > seg_end) and in_segment_2[vector1[i]]:
+            elem = vector1[i]
+            genotype_in_pos = elem
+            pos = child[position_in_2[elem]]
+            while pos != -1:
+                genotype_in_pos = pos
+                pos = child[position_in_2[pos]]
+            child[position_in_2[genotype_in_pos]] = elem
+
+    return child
+
+
 def order_cross(vector1, vector2):
     cross_point1 = random.randrange(0, vector1.size - 2)
     cross_point2 = random.randrange(cross_point1, vector1.size)
 
+    if not _is_index_permutation(vector1):
+        return _order_cross_numpy(vector1, vector2, cross_point1, cross_point2)
+
+    return _order_cross_kernel(vector1, vector2, cross_point1, cross_point2)
+
+
+def _order_cross_numpy(vector1, vector2, cross_point1, cross_point2):
     child = np.full_like(vector1, -1)
     range_vec = np.arange(vector1.size)
     seg_mask = (range_vec >= cross_point1) & (range_vec <= cross_point2)
@@ -495,6 +563,48 @@ def order_cross(vector1, vector2):
     return child
 
 
+@kernel("order_cross", fallback=_order_cross_numpy)
+def _order_cross_kernel(vector1, vector2, cross_point1, cross_point2):
+    """
+    Order crossover of two permutations of the integers from 0 to n-1, with the same result as '_order_cross_numpy'.
+    """
+
+    size = vector1.size
+    seg_end = min(cross_point2, size - 1)
+
+    child = np.full(size, -1, dtype=vector1.dtype)
+    used = np.zeros(size, dtype=np.bool_)
+    for i in range(cross_point1, seg_end + 1):
+        child[i] = vector1[i]
+        used[vector1[i]] = True
+
+    # Elements not in the segment in increasing order, rolled 'cross_point1' positions
+    n_remaining = size - (seg_end - cross_point1 + 1)
+    remaining = np.empty(n_remaining, dtype=vector1.dtype)
+    idx = 0
+    for value in range(size):
+        if not used[value]:
+            remaining[(idx + cross_point1) % n_remaining] = value
+            idx += 1
+
+    idx = 0
+    for i in range(size):
+        if i < cross_point1 or i > seg_end:
+            child[i] = remaining[idx]
+            idx += 1
+
+    return child
+
+
+def _is_index_permutation(vector):
+    """
+    Checks whether the components of the vector are integers between 0 and its size, which is required
+    by the compiled permutation kernels.
+    """
+
+    return vector.dtype.kind in "iu" and vector.size > 0 and vector.min() >= 0 and vector.max() < vector.size
+
+
 def cross_inter_avg(vector, population, n_ind):
     """
     Performs an intermediate average crossover between the vector and 'n-1' individuals the population
@@ -530,18 +640,58 @@ def sbx(vector1, vector2, strength):
     Performs the SBX crossing operator between two vectors.
     """
 
-    beta = np.zeros(vector1.shape)
     u = RAND_GEN.random(vector1.shape)
-    for idx, val in enumerate(u):
-        if val <= 0.5:
-            beta[idx] = (2 * val) ** (1 / (strength + 1))
-        else:
-            beta[idx] = (0.5 * (1 - val)) ** (1 / (strength + 1))
+    beta = _sbx_beta(u.ravel(), float(strength)).reshape(u.shape)
 
     sign = random.choice([-1, 1])
     return 0.5 * (vector1 + vector2) + sign * 0.5 * beta * (vector1 - vector2)
 
 
+def _sbx_beta_numpy(u, strength):
+    return np.where(u <= 0.5, 2 * u, 0.5 * (1 - u)) ** (1 / (strength + 1))
+
+
+@kernel("sbx", fallback=_sbx_beta_numpy)
+def _sbx_beta(u, strength):
+    """
+    Spread factor of the SBX operator for each uniform random number.
+    """
+
+    beta = np.empty(u.size)
+    for idx in range(u.size):
+        if u[idx] <= 0.5:
+            beta[idx] = (2 * u[idx]) ** (1 / (strength + 1))
+        else:
+            beta[idx] = (0.5 * (1 - u[idx])) ** (1 / (strength + 1))
+
+    return beta
+
+
+def _best_of(population):
+    """
+    Returns the individual with the highest fitness, using the ranking of the population if it is already known.
+    """
+
+    if hasattr(population, "best"):
+        return population.best()
+
+    fitness = [i.fitness for i in population]
+    return population[fitness.index(max(fitness))]
+
+
+def _pbest_of(population, P):
+    """
+    Returns a random individual among the best 100·P% of the population.
+    """
+
+    upper_idx = max(1, math.ceil(len(population) * P))
+    if hasattr(population, "top"):
+        return random.choice(population.top(upper_idx))
+
+    fitness = [i.fitness for i in population]
+    return population[random.choice(np.argsort(fitness)[::-1][:upper_idx])]
+
+
 def DE_rand1(vector, population, F, CR):
     """
     Performs the differential evolution operator DE/rand/1
@@ -562,8 +712,7 @@ def DE_best1(vector, population, F, CR):
     """
 
     if len(population) > 3:
-        fitness = [i.fitness for i in population]
-        best = population[fitness.index(max(fitness))]
+        best = _best_of(population)
         r1, r2 = random.sample(population, 2)
 
         v = best.genotype + F * (r1.genotype - r2.genotype)
@@ -592,8 +741,7 @@ def DE_best2(vector, population, F, CR):
     """
 
     if len(population) > 5:
-        fitness = [i.fitness for i in population]
-        best = population[fitness.index(max(fitness))]
+        best = _best_of(population)
         r1, r2, r3, r4 = random.sample(population, 4)
 
         v = best.genotype + F * (r1.genotype - r2.genotype) + F * (r3.genotype - r4.genotype)
@@ -622,8 +770,7 @@ def DE_current_to_best1(vector, population, F, CR):
     """
 
     if len(population) > 3:
-        fitness = [i.fitness for i in population]
-        best = population[fitness.index(max(fitness))]
+        best = _best_of(population)
         r1, r2 = random.sample(population, 2)
 
         v = vector + F * (best.genotype - vector) + F * (r1.genotype - r2.genotype)
@@ -638,10 +785,7 @@ def DE_current_to_pbest1(vector, population, F, CR, P):
     """
 
     if len(population) > 3:
-        fitness = [i.fitness for i in population]
-        upper_idx = max(1, math.ceil(len(population) * P))
-        pbest_idx = random.choice(np.argsort(fitness)[:upper_idx])
-        pbest = population[pbest_idx]
+        pbest = _pbest_of(population, P)
         r1, r2 = random.sample(population, 2)
 
         v = vector + F * (pbest.genotype - vector) + F * (r1.genotype - r2.genotype)
@@ -689,3 +833,255 @@ def dummy_op(vector, scale=1000):
     """
 
     return np.full(vector.shape, scale)
+
+
+def sample_other_indices(pop_size, n_samples, own_idx=None):
+    """
+    For each member of a population, samples 'n_samples' distinct positions of other members
+    of a population of size 'pop_size'. The position of each member in that population is given
+    by 'own_idx', which defaults to all of its members. Returns a matrix with one row per member.
+    """
+
+    if own_idx is None:
+        own_idx = np.arange(pop_size)
+    own_idx = np.asarray(own_idx)[:, None]
+
+    sampled = RAND_GEN.integers(0, pop_size - 1, size=(own_idx.shape[0], n_samples))
+    sampled += sampled >= own_idx
+
+    # Resample the rows that picked the same member more than once
+    sorted_sampled = np.sort(sampled, axis=1)
+    repeated = np.any(sorted_sampled[:, 1:] == sorted_sampled[:, :-1], axis=1)
+    while np.any(repeated):
+        new_samples = RAND_GEN.integers(0, pop_size - 1, size=(np.count_nonzero(repeated), n_samples))
+        new_samples += new_samples >= own_idx[repeated]
+        sampled[repeated] = new_samples
+
+        sorted_sampled = np.sort(sampled, axis=1)
+        repeated = np.any(sorted_sampled[:, 1:] == sorted_sampled[:, :-1], axis=1)
+
+    return sampled
+
+
+def best_other_indices(fitness, own_idx=None):
+    """
+    For each member of a population, returns the position of the best member of the rest of the population.
+    The position of each member in the population is given by 'own_idx', which defaults to all of its members.
+    """
+
+    if own_idx is None:
+        own_idx = np.arange(fitness.size)
+    own_idx = np.asarray(own_idx)
+
+    if fitness.size == 1:
+        return np.zeros(own_idx.size, dtype=int)
+
+    top_2 = np.argpartition(fitness, -2)[-2:]
+    first, second = top_2[np.argsort(fitness[top_2])[::-1]]
+
+    best_idx = np.full(own_idx.size, first)
+    best_idx[own_idx == first] = second
+
+    return best_idx
+
+
+def _partner_pool(pop_matrix, fitness, partner_matrix, partner_fitness, partner_idx):
+    """
+    Returns the population the partners of each row are drawn from, its fitness and the position of each row in it.
+    """
+
+    if partner_matrix is None:
+        return pop_matrix, fitness, None
+
+    if partner_idx is None:
+        raise ValueError("The position of each individual in the partner matrix must be given.")
+
+    return partner_matrix, partner_fitness, partner_idx
+
+
+def cross_1p_batch(pop_matrix, partner_matrix):
+    """
+    Performs a 1 point cross between each row of the two matrices.
+    """
+
+    cross_points = RAND_GEN.integers(0, pop_matrix.shape[1], size=(pop_matrix.shape[0], 1))
+    mask_pos = np.arange(pop_matrix.shape[1]) >= cross_points
+    return np.where(mask_pos, partner_matrix, pop_matrix)
+
+
+def cross_2p_batch(pop_matrix, partner_matrix):
+    """
+    Performs a 2 point cross between each row of the two matrices.
+    """
+
+    pop_size, vecsize = pop_matrix.shape
+    cross_points1 = RAND_GEN.integers(0, vecsize - 2, size=(pop_size, 1))
+    cross_points2 = cross_points1 + np.floor(RAND_GEN.random((pop_size, 1)) * (vecsize - cross_points1)).astype(int)
+
+    range_vec = np.arange(vecsize)
+    mask_pos = (range_vec >= cross_points1) & (range_vec < cross_points2)
+    return np.where(mask_pos, partner_matrix, pop_matrix)
+
+
+def cross_mp_batch(pop_matrix, partner_matrix):
+    """
+    Performs a multipoint cross between each row of the two matrices.
+    """
+
+    mask_pos = RAND_GEN.random(pop_matrix.shape) > 0.5
+    return np.where(mask_pos, partner_matrix, pop_matrix)
+
+
+def blxalpha_batch(pop_matrix, partner_matrix, alpha):
+    """
+    Performs the BLX alpha crossing operator between each row of the two matrices.
+    """
+
+    alpha = alpha * RAND_GEN.random((pop_matrix.shape[0], 1))
+    return alpha * pop_matrix + (1 - alpha) * partner_matrix
+
+
+def sbx_batch(pop_matrix, partner_matrix, strength):
+    """
+    Performs the SBX crossing operator between each row of the two matrices.
+    """
+
+    u = RAND_GEN.random(pop_matrix.shape)
+    beta = np.where(u <= 0.5, 2 * u, 0.5 * (1 - u)) ** (1 / (strength + 1))
+
+    sign = RAND_GEN.choice([-1, 1], size=(pop_matrix.shape[0], 1))
+    return 0.5 * (pop_matrix + partner_matrix) + sign * 0.5 * beta * (pop_matrix - partner_matrix)
+
+
+def _DE_cross_batch(pop_matrix, v, CR):
+    mask_pos = RAND_GEN.random(pop_matrix.shape) <= CR
+    return np.where(mask_pos, v, pop_matrix)
+
+
+def DE_rand1_batch(pop_matrix, F, CR, partner_matrix=None, partner_idx=None):
+    """
+    Performs the differential evolution operator DE/rand/1 on each row of the matrix.
+
+    The donors are drawn from 'partner_matrix' if it's given, in which case 'partner_idx' has the position
+    of each row in it, and from 'pop_matrix' otherwise. The same holds for the rest of the DE operators.
+    """
+
+    pool, _, own_idx = _partner_pool(pop_matrix, None, partner_matrix, None, partner_idx)
+    if pool.shape[0] <= 4:
+        return pop_matrix.copy()
+
+    r1, r2, r3 = sample_other_indices(pool.shape[0], 3, own_idx).T
+
+    v = pool[r1] + F * (pool[r2] - pool[r3])
+    return _DE_cross_batch(pop_matrix, v, CR)
+
+
+def DE_best1_batch(pop_matrix, fitness, F, CR, partner_matrix=None, partner_fitness=None, partner_idx=None):
+    """
+    Performs the differential evolution operator DE/best/1 on each row of the matrix.
+    """
+
+    pool, pool_fitness, own_idx = _partner_pool(pop_matrix, fitness, partner_matrix, partner_fitness, partner_idx)
+    if pool.shape[0] <= 4:
+        return pop_matrix.copy()
+
+    best = pool[best_other_indices(pool_fitness, own_idx)]
+    r1, r2 = sample_other_indices(pool.shape[0], 2, own_idx).T
+
+    v = best + F * (pool[r1] - pool[r2])
+    return _DE_cross_batch(pop_matrix, v, CR)
+
+
+def DE_rand2_batch(pop_matrix, F, CR, partner_matrix=None, partner_idx=None):
+    """
+    Performs the differential evolution operator DE/rand/2 on each row of the matrix.
+    """
+
+    pool, _, own_idx = _partner_pool(pop_matrix, None, partner_matrix, None, partner_idx)
+    if pool.shape[0] <= 6:
+        return pop_matrix.copy()
+
+    r1, r2, r3, r4, r5 = sample_other_indices(pool.shape[0], 5, own_idx).T
+
+    v = pool[r1] + F * (pool[r2] - pool[r3]) + F * (pool[r4] - pool[r5])
+    return _DE_cross_batch(pop_matrix, v, CR)
+
+
+def DE_best2_batch(pop_matrix, fitness, F, CR, partner_matrix=None, partner_fitness=None, partner_idx=None):
+    """
+    Performs the differential evolution operator DE/best/2 on each row of the matrix.
+    """
+
+    pool, pool_fitness, own_idx = _partner_pool(pop_matrix, fitness, partner_matrix, partner_fitness, partner_idx)
+    if pool.shape[0] <= 6:
+        return pop_matrix.copy()
+
+    best = pool[best_other_indices(pool_fitness, own_idx)]
+    r1, r2, r3, r4 = sample_other_indices(pool.shape[0], 4, own_idx).T
+
+    v = best + F * (pool[r1] - pool[r2]) + F * (pool[r3] - pool[r4])
+    return _DE_cross_batch(pop_matrix, v, CR)
+
+
+def DE_current_to_rand1_batch(pop_matrix, F, CR, partner_matrix=None, partner_idx=None):
+    """
+    Performs the differential evolution operator DE/current-to-rand/1 on each row of the matrix.
+    """
+
+    pool, _, own_idx = _partner_pool(pop_matrix, None, partner_matrix, None, partner_idx)
+    if pool.shape[0] <= 4:
+        return pop_matrix.copy()
+
+    r1, r2, r3 = sample_other_indices(pool.shape[0], 3, own_idx).T
+
+    weight = RAND_GEN.random((pop_matrix.shape[0], 1))
+    v = pop_matrix + weight * (pool[r1] - pop_matrix) + F * (pool[r2] - pool[r3])
+    return _DE_cross_batch(pop_matrix, v, CR)
+
+
+def DE_current_to_best1_batch(pop_matrix, fitness, F, CR, partner_matrix=None, partner_fitness=None, partner_idx=None):
+    """
+    Performs the differential evolution operator DE/current-to-best/1 on each row of the matrix.
+    """
+
+    pool, pool_fitness, own_idx = _partner_pool(pop_matrix, fitness, partner_matrix, partner_fitness, partner_idx)
+    if pool.shape[0] <= 4:
+        return pop_matrix.copy()
+
+    best = pool[best_other_indices(pool_fitness, own_idx)]
+    r1, r2 = sample_other_indices(pool.shape[0], 2, own_idx).T
+
+    v = pop_matrix + F * (best - pop_matrix) + F * (pool[r1] - pool[r2])
+    return _DE_cross_batch(pop_matrix, v, CR)
+
+
+def DE_current_to_pbest1_batch(pop_matrix, fitness, F, CR, P, partner_matrix=None, partner_fitness=None, partner_idx=None):
+    """
+    Performs the differential evolution operator DE/current-to-pbest/1 on each row of the matrix.
+    """
+
+    pool, pool_fitness, own_idx = _partner_pool(pop_matrix, fitness, partner_matrix, partner_fitness, partner_idx)
+    pool_size = pool.shape[0]
+    if pool_size <= 4:
+        return pop_matrix.copy()
+
+    upper_idx = max(1, math.ceil((pool_size - 1) * P))
+    top_idx = np.argpartition(pool_fitness, -upper_idx)[-upper_idx:]
+    pbest = pool[top_idx[RAND_GEN.integers(0, upper_idx, size=pop_matrix.shape[0])]]
+    r1, r2 = sample_other_indices(pool_size, 2, own_idx).T
+
+    v = pop_matrix + F * (pbest - pop_matrix) + F * (pool[r1] - pool[r2])
+    return _DE_cross_batch(pop_matrix, v, CR)
+
+
+def pso_operator_batch(pop_matrix, speed, indiv_best, global_best, w, c1, c2):
+    """
+    Performs a step of the Particle Swarm algorithm on each row of the matrix,
+    returns the new positions and the new speeds.
+    """
+
+    c1 = c1 * RAND_GEN.random(pop_matrix.shape)
+    c2 = c2 * RAND_GEN.random(pop_matrix.shape)
+
+    new_speed = w * speed + c1 * (indiv_best - pop_matrix) + c2 * (global_best - pop_matrix)
+    return pop_matrix + new_speed, new_speed
@@ -0,0 +1,587 @@
+from __future__ import annotations
+import io
+import math
+import threading
+import time
+import numpy as np
+from numpy import ndarray
+
+
+class TimeStats:
+    """
+    Accumulated wall-clock and CPU time spent in a section of code.
+    """
+
+    __slots__ = ("calls", "wall_time", "cpu_time")
+
+    def __init__(self):
+        """
+        Constructor for the TimeStats class.
+        """
+
+        self.reset()
+
+    def reset(self):
+        """
+        Discards the time accumulated.
+        """
+
+        self.calls = 0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+
+    def add(self, wall_time: float, cpu_time: float, calls: int = 1):
+        """
+        Registers the time spent in some calls to the section of code.
+
+        Parameters
+        ----------
+        wall_time: float
+            Wall-clock time in seconds.
+        cpu_time: float
+            CPU time of the process in seconds.
+        calls: int, optional
+            Number of calls in which the time was spent.
+        """
+
+        self.calls += calls
+        self.wall_time += wall_time
+        self.cpu_time += cpu_time
+
+    def get_state(self) -> dict:
+        """
+        Gets the accumulated times as a dictionary.
+
+        Returns
+        -------
+        state: dict
+            Number of calls, total wall-clock and CPU time and mean wall-clock time per call.
+        """
+
+        return {
+            "calls": self.calls,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "mean_wall_time": self.wall_time / self.calls if self.calls > 0 else 0.0,
+        }
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies with logarithmically spaced bins, recording a value has constant cost
+    and memory usage doesn't grow with the number of values recorded.
+
+    Values below 'min_latency' and above 'max_latency' are accumulated in the first and last bins.
+    Values can be recorded from several threads at once, as done by the threaded evaluators.
+
+    Parameters
+    ----------
+    min_latency: float, optional
+        Lower edge of the first bin, in seconds.
+    max_latency: float, optional
+        Upper edge of the last bin, in seconds.
+    bins_per_decade: int, optional
+        Number of bins for each power of 10.
+    """
+
+    def __init__(self, min_latency: float = 1e-7, max_latency: float = 1e3, bins_per_decade: int = 5):
+        """
+        Constructor for the LatencyHistogram class.
+        """
+
+        self.bins_per_decade = bins_per_decade
+        self._log_min = math.log10(min_latency)
+        n_bins = math.ceil((math.log10(max_latency) - self._log_min) * bins_per_decade)
+        self.bin_edges = 10 ** (self._log_min + np.arange(n_bins + 1) / bins_per_decade)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __getstate__(self):
+        # Locks can't be pickled, a new one is created when the state is restored
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """
+        Discards the values recorded.
+        """
+
+        self.counts = [0] * (len(self.bin_edges) - 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, latency: float, count: int = 1):
+        """
+        Records a latency, optionally as the mean latency of several operations.
+
+        Parameters
+        ----------
+        latency: float
+            Latency in seconds.
+        count: int, optional
+            Number of operations with this latency.
+        """
+
+        if latency > 0:
+            idx = min(max(int((math.log10(latency) - self._log_min) * self.bins_per_decade), 0), len(self.counts) - 1)
+        else:
+            idx = 0
+
+        with self._lock:
+            self.counts[idx] += count
+            self.count += count
+            self.total += latency * count
+            if latency < self.min:
+                self.min = latency
+            if latency > self.max:
+                self.max = latency
+
+    @property
+    def mean(self) -> float:
+        """
+        Mean of the latencies recorded.
+        """
+
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def quantile(self, q: float | ndarray) -> float | ndarray:
+        """
+        Estimates a quantile of the latencies recorded as the geometric center of the bin in which it is found.
+
+        Parameters
+        ----------
+        q: float or ndarray
+            Quantiles to estimate, between 0 and 1.
+
+        Returns
+        -------
+        values: float or ndarray
+            Estimated latency for each quantile.
+        """
+
+        if self.count == 0:
+            return np.zeros_like(q, dtype=float) if np.ndim(q) > 0 else 0.0
+
+        cumulative = np.cumsum(self.counts)
+        idx = np.searchsorted(cumulative, np.asarray(q) * self.count, side="left")
+        idx = np.minimum(idx, len(self.counts) - 1)
+        centers = np.sqrt(self.bin_edges[:-1] * self.bin_edges[1:])
+        values = np.clip(centers[idx], self.min, self.max)
+
+        return values if np.ndim(q) > 0 else float(values)
+
+    def get_state(self) -> dict:
+        """
+        Gets a summary of the latencies recorded as a dictionary.
+
+        Returns
+        -------
+        state: dict
+            Count, total, mean, extreme values and some quantiles of the latencies, along with
+            the non-empty bins of the histogram.
+        """
+
+        nonzero = [idx for idx, count in enumerate(self.counts) if count > 0]
+        p50, p90, p99 = self.quantile([0.5, 0.9, 0.99])
+
+        return {
+            "count": self.count,
+            "total_time": self.total,
+            "mean": self.mean,
+            "min": self.min if self.count > 0 else 0.0,
+            "max": self.max,
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+            "histogram": {
+                "lower_edges": self.bin_edges[nonzero],
+                "upper_edges": self.bin_edges[np.array(nonzero, dtype=int) + 1],
+                "counts": [self.counts[idx] for idx in nonzero],
+            },
+        }
+
+
+class _PhaseTimer:
+    """
+    Context manager that adds the time spent inside it to a TimeStats object.
+    """
+
+    __slots__ = ("stats", "wall_start", "cpu_start")
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def __enter__(self):
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stats.add(time.perf_counter() - self.wall_start, time.process_time() - self.cpu_start)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def _memory_filters():
+    # Ignore the memory used by the profilers themselves
+    import cProfile
+    import tracemalloc
+
+    return [tracemalloc.Filter(False, cProfile.__file__), tracemalloc.Filter(False, tracemalloc.__file__)]
+
+
+def find_operators(objects: Iterable) -> List[Operator]:
+    """
+    Finds every operator in a collection of objects, including the ones inside of lists and
+    operators that combine other operators (like OperatorMeta).
+
+    Parameters
+    ----------
+    objects: Iterable
+        The objects to inspect.
+
+    Returns
+    -------
+    operators: List[Operator]
+        The operators found, without repetitions.
+    """
+
+    from .Operator import Operator
+
+    found = {}
+    pending = list(objects)
+    while pending:
+        item = pending.pop()
+        if isinstance(item, (list, tuple)):
+            pending.extend(item)
+        elif isinstance(item, Operator) and id(item) not in found:
+            found[id(item)] = item
+            pending.extend(vars(item).values())
+
+    return sorted(found.values(), key=lambda op: op.id)
+
+
+class Profiler:
+    """
+    Instrumentation of the execution of an algorithm.
+
+    It records the wall-clock and CPU time spent in each phase of the algorithm, the latency
+    of the evaluations of the objective function and, optionally, the time spent in each operator.
+    A window of generations can also be analyzed with cProfile and tracemalloc.
+
+    Parameters
+    ----------
+    enabled: bool, optional
+        Whether to record the time of each phase and of the objective function.
+    operator_timing: bool, optional
+        Whether to record the time spent in each operator, which adds a small cost to each call.
+    profile_gens: Tuple[int, int], optional
+        First generation and generation after the last one analyzed with cProfile.
+    profile_memory: bool, optional
+        Whether to trace the memory allocations with tracemalloc during the profiled generations.
+    profile_top: int, optional
+        Number of functions and lines of code shown in the profiling reports.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        operator_timing: bool = False,
+        profile_gens: Tuple[int, int] = None,
+        profile_memory: bool = False,
+        profile_top: int = 20,
+    ):
+        """
+        Constructor for the Profiler class.
+        """
+
+        self.enabled = enabled
+        self.operator_timing = operator_timing
+        self.profile_gens = profile_gens
+        self.profile_memory = profile_memory
+        self.profile_top = profile_top
+
+        self.phases = {}
+        self.operators = {}
+        self.objective_latency = LatencyHistogram()
+
+        self.profile_stats = None
+        self.memory_stats = None
+        self._cprofile = None
+        self._memory_start = None
+        self._stop_tracemalloc = False
+
+        self._objfunc = None
+
+    def reset(self):
+        """
+        Discards the measurements taken.
+        """
+
+        self.phases = {}
+        self.objective_latency.reset()
+        for _, stats in self.operators.values():
+            stats.reset()
+
+        self.profile_stats = None
+        self.memory_stats = None
+
+    def phase(self, name: str) -> ContextManager:
+        """
+        Returns a context manager that measures the time spent in a phase of the algorithm.
+
+        Parameters
+        ----------
+        name: str
+            Name of the phase.
+
+        Returns
+        -------
+        timer: ContextManager
+            Context manager that records the time spent inside of it.
+        """
+
+        if not self.enabled:
+            return _NULL_TIMER
+
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = TimeStats()
+
+        return _PhaseTimer(stats)
+
+    def attach(self, objfunc: ObjectiveFunc, search_strategy: SearchStrategy):
+        """
+        Starts recording the evaluations of an objective function and the calls to the operators of a search strategy.
+
+        Parameters
+        ----------
+        objfunc: ObjectiveFunc
+            Objective function being optimized.
+        search_strategy: SearchStrategy
+            Search strategy whose operators will be measured.
+        """
+
+        if not self.enabled:
+            return
+
+        self._objfunc = objfunc
+        objfunc.latency = self.objective_latency
+
+        if self.operator_timing:
+            for op in find_operators(vars(search_strategy).values()):
+                if op.timer is None:
+                    op.timer = TimeStats()
+                self.operators[op.id] = (op, op.timer)
+
+    def detach(self):
+        """
+        Stops recording the evaluations of the objective function and the calls to the operators.
+        """
+
+        if self._objfunc is not None and self._objfunc.latency is self.objective_latency:
+            self._objfunc.latency = None
+        self._objfunc = None
+
+        for op, stats in self.operators.values():
+            if op.timer is stats:
+                op.timer = None
+
+        self.stop_capture()
+
+    def check_window(self, generation: int):
+        """
+        Starts or stops the analysis with cProfile and tracemalloc when the generation
+        about to be executed is the first one or the one after the last one of the window.
+
+        Parameters
+        ----------
+        generation: int
+            Number of generations executed so far.
+        """
+
+        if self.profile_gens is None:
+            return
+
+        start, end = self.profile_gens
+        if generation == start and self._cprofile is None:
+            self.start_capture()
+        elif generation >= end and self._cprofile is not None:
+            self.stop_capture()
+
+    def start_capture(self):
+        """
+        Starts analyzing the execution with cProfile and, if requested, tracemalloc.
+        """
+
+        import cProfile
+
+        if self.profile_memory:
+            import tracemalloc
+
+            self._stop_tracemalloc = not tracemalloc.is_tracing()
+            if self._stop_tracemalloc:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.take_snapshot().filter_traces(_memory_filters())
+
+        self._cprofile = cProfile.Profile()
+        self._cprofile.enable()
+
+    def stop_capture(self):
+        """
+        Stops the analysis started with :py:meth:`start_capture` and stores its results.
+        """
+
+        if self._cprofile is None:
+            return
+
+        import pstats
+
+        self._cprofile.disable()
+        self.profile_stats = pstats.Stats(self._cprofile)
+        self._cprofile = None
+
+        if self._memory_start is not None:
+            import tracemalloc
+
+            snapshot = tracemalloc.take_snapshot().filter_traces(_memory_filters())
+            _, peak = tracemalloc.get_traced_memory()
+            if self._stop_tracemalloc:
+                tracemalloc.stop()
+
+            differences = snapshot.compare_to(self._memory_start, "lineno")
+            self.memory_stats = {
+                "peak": peak,
+                "allocated": sum(stat.size_diff for stat in differences),
+                "top": [str(stat) for stat in differences[: self.profile_top]],
+            }
+            self._memory_start = None
+
+    def profile_report(self, sort_by: str = "cumulative") -> str:
+        """
+        Returns the functions that took the most time in the profiled generations as text.
+
+        Parameters
+        ----------
+        sort_by: str, optional
+            Criterion used by pstats to sort the functions.
+
+        Returns
+        -------
+        report: str
+            Report generated by pstats, or None if no generations were profiled.
+        """
+
+        if self.profile_stats is None:
+            return None
+
+        stream = io.StringIO()
+        self.profile_stats.stream = stream
+        self.profile_stats.sort_stats(sort_by).print_stats(self.profile_top)
+        return stream.getvalue()
+
+    def get_state(self, total_time: float = None) -> dict:
+        """
+        Gets the measurements taken as a dictionary.
+
+        The time spent in the framework (overhead) is the time spent in the phases of the algorithm
+        minus the time spent in the objective function. If the objective function was evaluated in other
+        processes, the time of the evaluations can't be measured and the whole evaluation phase is counted
+        as objective time.
+
+        Parameters
+        ----------
+        total_time: float, optional
+            Total time of the execution, by default the sum of the time spent in each phase.
+
+        Returns
+        -------
+        state: dict
+            The measurements of the profiler.
+        """
+
+        if total_time is None:
+            total_time = sum(stats.wall_time for stats in self.phases.values())
+
+        objective_time = self.objective_latency.total
+        if self.objective_latency.count == 0 and "evaluate" in self.phases:
+            objective_time = self.phases["evaluate"].wall_time
+        overhead_time = max(total_time - objective_time, 0.0)
+
+        data = {
+            "phases": {name: stats.get_state() for name, stats in self.phases.items()},
+            "objective_latency": self.objective_latency.get_state(),
+            "objective_time": objective_time,
+            "overhead_time": overhead_time,
+            "overhead_fraction": overhead_time / total_time if total_time > 0 else 0.0,
+        }
+
+        if self.operators:
+            data["operators"] = [dict(id=op.id, name=op.name, **stats.get_state()) for op, stats in self.operators.values()]
+
+        if self.profile_stats is not None:
+            data["profile"] = self.profile_report()
+
+        if self.memory_stats is not None:
+            data["memory"] = self.memory_stats
+
+        return data
+
+    def report(self, total_time: float = None):
+        """
+        Prints a summary of the measurements taken.
+
+        Parameters
+        ----------
+        total_time: float, optional
+            Total time of the execution, by default the sum of the time spent in each phase.
+        """
+
+        state = self.get_state(total_time)
+
+        print("Time spent in each phase (wall / CPU):")
+        for name, phase_state in state["phases"].items():
+            print(f"\t{name}: {phase_state['wall_time']:.5f}s / {phase_state['cpu_time']:.5f}s")
+
+        latency = state["objective_latency"]
+        print(f"Objective function: {latency['count']} evaluations, {state['objective_time']:.5f}s")
+        if latency["count"] > 0:
+            print(
+                f"\tLatency mean: {latency['mean']:.3e}s, p50: {latency['p50']:.3e}s, p99: {latency['p99']:.3e}s, max: {latency['max']:.3e}s"
+            )
+        print(f"Framework overhead: {state['overhead_time']:.5f}s ({state['overhead_fraction']:.1%})")
+
+        if "operators" in state:
+            print("Time spent in each operator (wall / CPU):")
+            for op_state in state["operators"]:
+                print(
+                    f"\t{op_state['name']} ({op_state['id']}): {op_state['wall_time']:.5f}s / {op_state['cpu_time']:.5f}s, {op_state['calls']} calls"
+                )
+
+        if "profile" in state:
+            print(state["profile"])
+
+        if "memory" in state:
+            print(f"Memory allocated while profiling: {state['memory']['allocated']} B, peak: {state['memory']['peak']} B")
+            for line in state["memory"]["top"]:
+                print(f"\t{line}")
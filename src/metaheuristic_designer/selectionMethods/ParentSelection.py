@@ -1,6 +1,9 @@
 from __future__ import annotations
+from copy import copy
 import enum
 from enum import Enum
+import numpy as np
+from ..Population import Population
 from ..ParamScheduler import ParamScheduler
 from ..SelectionMethod import SelectionMethod
 from .parent_selection_functions import *
@@ -75,36 +78,52 @@ class ParentSelection(SelectionMethod):
             if "F" not in self.params:
                 self.params["F"] = None
 
-    def select(self, population: List[Individual], offsping: List[Individual] = None) -> List[Individual]:
-        population = population.copy()
-        parents = []
+    def select_indices(self, population: List[Individual] | Population) -> ndarray:
+        """
+        Chooses the parents of a population, returning their positions instead of the individuals.
+
+        Parameters
+        ----------
+        population: List[Individual] | Population
+            Population of individuals from which the parents will be chosen.
+
+        Returns
+        -------
+        indices: ndarray
+            Position of each parent in the population.
+        """
+
+        if self.method == ParentSelMethod.NOTHING:
+            return np.arange(len(population))
+
+        if self.method == ParentSelMethod.RANDOM:
+            return uniform_indices(len(population), self.params["amount"])
+
+        fitness = population_fitness(population)
 
         if self.method == ParentSelMethod.TOURNAMENT:
-            parents = prob_tournament(population, self.params["amount"], self.params["p"])
+            indices = tournament_indices(fitness, len(population), self.params["amount"], self.params["p"])
 
         elif self.method == ParentSelMethod.BEST:
-            parents = select_best(population, self.params["amount"])
-
-        elif self.method == ParentSelMethod.RANDOM:
-            parents = uniform_selection(population, self.params["amount"])
+            indices = best_indices(fitness, self.params["amount"])
 
         elif self.method == ParentSelMethod.ROULETTE:
-            parents = roulette(
-                population,
-                self.params["amount"],
-                self.params["method"],
-                self.params["F"],
-            )
+            weights = selection_weights(fitness, self.params["method"], 2 if self.params["F"] is None else self.params["F"])
+            indices = roulette_indices(weights, self.params["amount"])
 
         elif self.method == ParentSelMethod.SUS:
-            parents = sus(
-                population,
-                self.params["amount"],
-                self.params["method"],
-                self.params["F"],
-            )
+            weights = selection_weights(fitness, self.params["method"], 2 if self.params["F"] is None else self.params["F"])
+            indices = sus_indices(weights, self.params["amount"])
+
+        return indices
+
+    def select(self, population: List[Individual], offsping: List[Individual] = None) -> List[Individual]:
+        if self.method == ParentSelMethod.NOTHING:
+            return copy(population)
+
+        indices = self.select_indices(population)
 
-        elif self.method == ParentSelMethod.NOTHING:
-            parents = population
+        if isinstance(population, Population):
+            return population.take(indices)
 
-        return parents
+        return [population[i] for i in indices]
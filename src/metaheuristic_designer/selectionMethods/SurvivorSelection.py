@@ -1,8 +1,10 @@
 from __future__ import annotations
 import enum
 from enum import Enum
+import numpy as np
 from ..ParamScheduler import ParamScheduler
 from ..SelectionMethod import SelectionMethod
+from ..Population import Population
 from .survivor_selection_functions import *
 
 
@@ -79,37 +81,64 @@ class SurvivorSelection(SelectionMethod):
 
         self.method = SurvSelMethod.from_str(method)
 
-    def select(self, popul: List[Individual], offspring: List[Individual]) -> List[Individual]:
-        result = []
+    def select_indices(self, popul: List[Individual] | Population, offspring: List[Individual] | Population) -> ndarray:
+        """
+        Chooses the individuals that survive to the next generation, returning their positions instead of the individuals.
+
+        Parameters
+        ----------
+        popul: List[Individual] | Population
+            Original population of individuals before being operated on.
+        offspring: List[Individual] | Population
+            Individuals resulting from an iteration of the algorithm.
+
+        Returns
+        -------
+        indices: ndarray
+            Position of each survivor, the offspring are numbered after the individuals of the original population.
+        """
+
+        if self.method == SurvSelMethod.GENERATIONAL:
+            return len(popul) + np.arange(len(offspring))
+
+        fitness = population_fitness(popul)
+        offspring_fitness = population_fitness(offspring)
+
         if self.method == SurvSelMethod.ELITISM:
-            result = elitism(popul, offspring, self.params["amount"])
+            indices = elitism_indices(fitness, offspring_fitness, self.params["amount"])
 
         elif self.method == SurvSelMethod.COND_ELITISM:
-            result = cond_elitism(popul, offspring, self.params["amount"])
-
-        elif self.method == SurvSelMethod.GENERATIONAL:
-            result = offspring
+            indices = cond_elitism_indices(fitness, offspring_fitness, self.params["amount"])
 
         elif self.method == SurvSelMethod.ONE_TO_ONE:
-            result = one_to_one(popul, offspring)
+            indices = one_to_one_indices(fitness, offspring_fitness)
 
         elif self.method == SurvSelMethod.PROB_ONE_TO_ONE:
-            result = prob_one_to_one(popul, offspring, self.params["p"])
+            indices = one_to_one_indices(fitness, offspring_fitness, self.params["p"])
 
         elif self.method == SurvSelMethod.MU_PLUS_LAMBDA:
-            result = lamb_plus_mu(popul, offspring)
+            indices = lamb_plus_mu_indices(fitness, offspring_fitness)
 
         elif self.method == SurvSelMethod.MU_COMMA_LAMBDA:
-            result = lamb_comma_mu(popul, offspring)
+            indices = lamb_comma_mu_indices(fitness, offspring_fitness)
 
         elif self.method == SurvSelMethod.CRO:
-            result = cro_selection(
-                popul,
-                offspring,
+            indices = cro_indices(
+                fitness,
+                offspring_fitness,
                 self.params["Fd"],
                 self.params["Pd"],
                 self.params["attempts"],
                 self.params["maxPopSize"],
             )
 
-        return result
+        return indices
+
+    def select(self, popul: List[Individual], offspring: List[Individual]) -> List[Individual]:
+        if self.method == SurvSelMethod.GENERATIONAL:
+            # The offspring keep the representation of the population
+            if isinstance(popul, Population) and not isinstance(offspring, Population):
+                return Population.from_individuals(offspring)
+            return offspring
+
+        return gather_survivors(popul, offspring, self.select_indices(popul, offspring))
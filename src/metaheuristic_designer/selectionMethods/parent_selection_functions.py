@@ -3,6 +3,7 @@ import random
 import warnings
 import enum
 from enum import Enum
+from ..utils import RAND_GEN
 
 
 class SelectionDist(Enum):
@@ -29,6 +30,221 @@ select_dist_map = {
 }
 
 
+def population_fitness(population):
+    """
+    Gets the fitness of each individual of a population as a vector.
+
+    Parameters
+    ----------
+    population: List[Individual] | Population
+        Individuals whose fitness will be collected.
+
+    Returns
+    -------
+    fitness: ndarray
+        Fitness of each individual.
+    """
+
+    # Populations stored as arrays already have a fitness vector
+    fitness_calculated = getattr(population, "fitness_calculated", None)
+    if isinstance(fitness_calculated, np.ndarray) and fitness_calculated.all():
+        return population.fitness
+
+    return np.fromiter((indiv.fitness for indiv in population), dtype=float, count=len(population))
+
+
+def best_indices(fitness, amount):
+    """
+    Gets the position of the individuals with the highest fitness, sorted from best to worst.
+
+    Only the 'amount' best individuals are sorted, the rest of the population is partitioned.
+    Individuals with the same fitness keep their original order, as in a stable sort.
+
+    Parameters
+    ----------
+    fitness: ndarray
+        Fitness of each individual.
+    amount: int
+        Amount of individuals to be chosen.
+
+    Returns
+    -------
+    indices: ndarray
+        Position of the chosen individuals.
+    """
+
+    amount = min(amount, fitness.size)
+    if amount <= 0:
+        return np.zeros(0, dtype=int)
+
+    if amount < fitness.size:
+        # The individuals tied with the worst one chosen are taken in order of position
+        threshold = -np.partition(-fitness, amount - 1)[amount - 1]
+        better = np.flatnonzero(fitness > threshold)
+        tied = np.flatnonzero(fitness == threshold)[: amount - better.size]
+        candidates = np.sort(np.concatenate([better, tied]))
+    else:
+        candidates = np.arange(fitness.size)
+
+    return candidates[np.argsort(-fitness[candidates], kind="stable")]
+
+
+def tournament_indices(fitness, n_tournaments, tourn_size, prob):
+    """
+    Performs all the tournaments at once, drawing the contestants as a matrix with a tournament in each row.
+
+    The contestants of a tournament are drawn with replacement.
+
+    Parameters
+    ----------
+    fitness: ndarray
+        Fitness of each individual.
+    n_tournaments: int
+        Amount of tournaments, one individual is chosen in each one.
+    tourn_size: int
+        Amount of individuals that will be chosen for each tournament.
+    prob: float
+        Probability that a parent with low fitness will win the tournament.
+
+    Returns
+    -------
+    indices: ndarray
+        Position of the winner of each tournament.
+    """
+
+    contestants = RAND_GEN.integers(0, fitness.size, size=(n_tournaments, tourn_size))
+    winners = np.argmax(fitness[contestants], axis=1)
+
+    # Some tournaments are won by a random contestant
+    random_win = RAND_GEN.random(n_tournaments) < prob
+    winners[random_win] = RAND_GEN.integers(0, tourn_size, size=np.count_nonzero(random_win))
+
+    return contestants[np.arange(n_tournaments), winners]
+
+
+def uniform_indices(pop_size, amount):
+    """
+    Chooses the positions of a number of individuals at random, with replacement.
+
+    Parameters
+    ----------
+    pop_size: int
+        Amount of individuals in the population.
+    amount: int
+        Amount of individuals to be chosen.
+
+    Returns
+    -------
+    indices: ndarray
+        Position of the chosen individuals.
+    """
+
+    return RAND_GEN.integers(0, pop_size, size=amount)
+
+
+def _cumulative_weights(weights):
+    if np.any(weights < 0):
+        warnings.warn(
+            "Some values of fitness resulted in negative selection probabilities in the parent selection step.",
+            stacklevel=3,
+        )
+        weights = np.maximum(weights, 0)
+
+    cum_weights = np.cumsum(weights)
+    if cum_weights[-1] <= 0:
+        cum_weights = np.arange(1, weights.size + 1, dtype=float)
+
+    return cum_weights
+
+
+def roulette_indices(weights, amount):
+    """
+    Chooses individuals with a probability proportional to their weight, using the cumulative sum of
+    the weights and a binary search for each random number.
+
+    Parameters
+    ----------
+    weights: ndarray
+        Weight of each individual, negative weights are treated as 0.
+    amount: int
+        Amount of individuals to be chosen.
+
+    Returns
+    -------
+    indices: ndarray
+        Position of the chosen individuals.
+    """
+
+    cum_weights = _cumulative_weights(weights)
+    pointers = RAND_GEN.random(amount) * cum_weights[-1]
+
+    return np.minimum(np.searchsorted(cum_weights, pointers, side="right"), weights.size - 1)
+
+
+def sus_indices(weights, amount):
+    """
+    Chooses individuals with stochastic universal sampling, using 'amount' equally spaced pointers
+    over the cumulative sum of the weights.
+
+    Parameters
+    ----------
+    weights: ndarray
+        Weight of each individual, negative weights are treated as 0.
+    amount: int
+        Amount of individuals to be chosen.
+
+    Returns
+    -------
+    indices: ndarray
+        Position of the chosen individuals.
+    """
+
+    cum_weights = _cumulative_weights(weights)
+    step = cum_weights[-1] / amount
+    pointers = (RAND_GEN.random() + np.arange(amount)) * step
+
+    return np.minimum(np.searchsorted(cum_weights, pointers, side="right"), weights.size - 1)
+
+
+def selection_weights(fitness, method, f=2):
+    """
+    Gives the weights that will be applied to each individual in the selection process from their fitness.
+
+    Parameters
+    ----------
+    fitness: ndarray
+        Fitness of each individual.
+    method: SelectionDist
+        Indicates how the roulette will be generated.
+    f: float, optional
+        Parameter passed to some of the roulette generating methods.
+
+    Returns
+    -------
+    weights: ndarray
+        Weight assinged to each of the individuals
+    """
+
+    if method == SelectionDist.FIT_PROP:
+        weights = fitness.astype(float)
+    elif method == SelectionDist.SIGMA_SCALE:
+        weights = np.maximum(fitness - (fitness.mean() - f * fitness.std()), 0)
+    elif method == SelectionDist.LIN_RANK:
+        fit_order = np.argsort(fitness)
+        n_parents = fitness.size
+        weights = (2 - f) + (2 * fit_order * (f - 1)) / (n_parents - 1)
+    elif method == SelectionDist.EXP_RANK:
+        fit_order = np.argsort(fitness)
+        weights = 1 - np.exp(-fit_order)
+
+    weight_norm = weights.sum()
+    if weight_norm == 0:
+        weights += 1
+        weight_norm = weights.sum()
+
+    return weights / weight_norm
+
+
 def select_best(population, amount):
     """
     Selects the best parent of the population as parents.
@@ -46,16 +262,9 @@ def select_best(population, amount):
         List of individuals chosen as parents.
     """
 
-    # Get the fitness of all the individuals
-    fitness_list = np.fromiter(map(lambda x: x.fitness, population), dtype=float)
-
-    # Get the index of the individuals sorted by fitness
-    order = np.argsort(fitness_list)[::-1][:amount]
-
-    # Select the 'amount' best individuals
+    order = best_indices(population_fitness(population), amount)
     parents = [population[i] for i in order]
 
-    # return parents, order
     return parents
 
 
@@ -78,28 +287,10 @@ def prob_tournament(population, tourn_size, prob):
         List of individuals chosen as parents.
     """
 
-    parent_pool = []
-    order = []
-
-    for _ in population:
-        # Choose 'tourn_size' individuals for the torunament
-        parent_idxs = random.sample(range(len(population)), tourn_size)
-        parents = [population[i] for i in parent_idxs]
-        fits = [i.fitness for i in parents]
-
-        # Choose one of the individuals
-        if random.random() < prob:
-            idx = random.randint(0, tourn_size - 1)
-        else:
-            idx = fits.index(max(fits))
-
-        # Add the individuals to the list
-        order.append(parent_idxs[idx])
-        parent = parents[idx]
-        parent_pool.append(parent)
+    order = tournament_indices(population_fitness(population), len(population), tourn_size, prob)
+    parents = [population[i] for i in order]
 
-    # return parent_pool, order
-    return parent_pool
+    return parents
 
 
 def uniform_selection(population, amount):
@@ -119,10 +310,9 @@ def uniform_selection(population, amount):
         List of individuals chosen as parents.
     """
 
-    order = random.choices(range(len(population)), k=amount)
+    order = uniform_indices(len(population), amount)
     parents = [population[i] for i in order]
 
-    # return parents, order
     return parents
 
 
@@ -145,26 +335,8 @@ def selection_distribution(population, method, f=2):
     weights: ndarray
         Weight assinged to each of the individuals
     """
-    fit_list = np.fromiter((i.fitness for i in population), float)
-
-    if method == SelectionDist.FIT_PROP:
-        weights = fit_list
-    elif method == SelectionDist.SIGMA_SCALE:
-        weights = np.maximum(fit_list - (fit_list.mean() - f * fit_list.std()), 0)
-    elif method == SelectionDist.LIN_RANK:
-        fit_order = np.argsort(fit_list)
-        n_parents = len(population)
-        weights = (2 - f) + (2 * fit_order * (f - 1)) / (n_parents - 1)
-    elif method == SelectionDist.EXP_RANK:
-        fit_order = np.argsort(fit_list)
-        weights = 1 - np.exp(-fit_order)
-
-    weight_norm = weights.sum()
-    if weight_norm == 0:
-        weights += 1
-        weight_norm = weights.sum()
 
-    return weights / weight_norm
+    return selection_weights(population_fitness(population), method, f)
 
 
 def roulette(population, amount, method=None, f=None):
@@ -194,18 +366,9 @@ def roulette(population, amount, method=None, f=None):
     if f is None:
         f = 2
 
-    weights = selection_distribution(population, method, f)
-
-    if np.any(weights < 0):
-        warnings.warn(
-            "Some values of fitness resulted in negative selection probabilities in the parent selection step.",
-            stacklevel=2,
-        )
-
-    order = random.choices(range(len(population)), k=amount, weights=weights)
+    order = roulette_indices(selection_distribution(population, method, f), amount)
     parents = [population[i] for i in order]
 
-    # return parents, order
     return parents
 
 
@@ -236,21 +399,7 @@ def sus(population, amount, method=None, f=None):
     if f is None:
         f = 2
 
-    weights = selection_distribution(population, method, f)
-
-    cum_weights = np.cumsum(weights)
-
-    order = []
-    current_member = i = 1
-    while current_member < amount:
-        r = random.random() / amount
-        while r <= cum_weights[i] and current_member < amount:
-            order.append(i)
-            r = r + 1 / amount
-            current_member += 1
-        i += 1
-
-    parents = [population[idx] for idx in order]
+    order = sus_indices(selection_distribution(population, method, f), amount)
+    parents = [population[i] for i in order]
 
-    # return parents, order
     return parents
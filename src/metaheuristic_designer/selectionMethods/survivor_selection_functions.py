@@ -1,24 +1,164 @@
-from copy import copy
-import random
+import numpy as np
+from ..utils import RAND_GEN
+from ..kernels import kernel
+from ..Population import Population
+from .parent_selection_functions import population_fitness, best_indices
 
 
-def argsort(seq):
+def gather_survivors(popul, offspring, indices):
     """
-    Implementation of argsort for python-style lists.
-    Source: https://stackoverflow.com/questions/3382352/equivalent-of-numpy-argsort-in-basic-python
+    Collects the individuals in the given positions of the parents followed by the offspring.
 
     Parameters
     ----------
-    seq: Iterable
-        Iterable for which we want to obtain the order of.
+    popul: List[Individual] | Population
+        Original population of individuals before being operated on.
+    offspring: List[Individual] | Population
+        Individuals resulting from an iteration of the algorithm.
+    indices: ndarray
+        Positions of the survivors, the offspring are numbered after the parents.
+
+    Returns
+    -------
+    survivors: List[Individual] | Population
+        The individuals in the given positions, as a Population if any of the inputs is one.
+    """
+
+    if isinstance(popul, Population) or isinstance(offspring, Population):
+        return Population.concatenate([popul, offspring]).take(indices)
+
+    candidates = list(popul) + list(offspring)
+    return [candidates[idx] for idx in indices]
+
+
+def one_to_one_indices(parent_fitness, offspring_fitness, p=0):
+    """
+    Compares each new individual with its parent, replacing it if it has a better fitness
+    or with a probability of p. Parents without a child are kept.
+
+    Parameters
+    ----------
+    parent_fitness: ndarray
+        Fitness of each individual of the original population.
+    offspring_fitness: ndarray
+        Fitness of each new individual.
+    p: float, optional
+        Probability that an individual will be replaced by its child even if it has a worse fitness.
+
+    Returns
+    -------
+    indices: ndarray
+        Positions of the survivors, the offspring are numbered after the parents.
+    """
+
+    pop_size = parent_fitness.size
+    n_pairs = min(pop_size, offspring_fitness.size)
+
+    replaced = offspring_fitness[:n_pairs] > parent_fitness[:n_pairs]
+    if p > 0:
+        replaced |= RAND_GEN.random(n_pairs) < p
+
+    indices = np.arange(pop_size)
+    indices[:n_pairs] = np.where(replaced, pop_size + indices[:n_pairs], indices[:n_pairs])
+
+    return indices
+
+
+def elitism_indices(parent_fitness, offspring_fitness, amount):
+    """
+    The best offspring are passed to the next generation along with the 'amount' best parents.
+
+    Parameters
+    ----------
+    parent_fitness: ndarray
+        Fitness of each individual of the original population.
+    offspring_fitness: ndarray
+        Fitness of each new individual.
+    amount: int
+        Amount of parents from the original population that will be kept.
+
+    Returns
+    -------
+    indices: ndarray
+        Positions of the survivors, the offspring are numbered after the parents.
+    """
+
+    pop_size = parent_fitness.size
+    best_parents = best_indices(parent_fitness, amount)
+    best_offspring = best_indices(offspring_fitness, pop_size - amount)
+
+    return np.concatenate([best_parents, pop_size + best_offspring])
+
+
+def cond_elitism_indices(parent_fitness, offspring_fitness, amount):
+    """
+    The best offspring are passed to the next generation, the best parents replace the worst of them
+    only if they are better than every individual in the offspring.
+
+    Parameters
+    ----------
+    parent_fitness: ndarray
+        Fitness of each individual of the original population.
+    offspring_fitness: ndarray
+        Fitness of each new individual.
+    amount: int
+        Maximum amount of parents from the original population that will be kept.
 
     Returns
     -------
-    order: List
-        The positions of the original elements of the list in order.
+    indices: ndarray
+        Positions of the survivors, the offspring are numbered after the parents.
     """
 
-    return sorted(range(len(seq)), key=seq.__getitem__)
+    pop_size = parent_fitness.size
+    best_parents = best_indices(parent_fitness, amount)
+    best_offspring = best_indices(offspring_fitness, pop_size)
+
+    if best_offspring.size > 0:
+        best_parents = best_parents[parent_fitness[best_parents] > offspring_fitness[best_offspring[0]]]
+
+    n_offspring = max(best_offspring.size - best_parents.size, 0)
+    return np.concatenate([best_parents, pop_size + best_offspring[:n_offspring]])
+
+
+def lamb_plus_mu_indices(parent_fitness, offspring_fitness):
+    """
+    Both the parents and the offspring are considered and the best of them will pass to the next generation.
+
+    Parameters
+    ----------
+    parent_fitness: ndarray
+        Fitness of each individual of the original population.
+    offspring_fitness: ndarray
+        Fitness of each new individual.
+
+    Returns
+    -------
+    indices: ndarray
+        Positions of the survivors, the offspring are numbered after the parents.
+    """
+
+    return best_indices(np.concatenate([parent_fitness, offspring_fitness]), parent_fitness.size)
+
+
+def lamb_comma_mu_indices(parent_fitness, offspring_fitness):
+    """
+    Only the best individuals in the offsping are selected.
+
+    Parameters
+    ----------
+    parent_fitness: ndarray
+        Fitness of each individual of the original population.
+    offspring_fitness: ndarray
+        Fitness of each new individual.
+
+    Returns
+    -------
+    indices: ndarray
+        Positions of the survivors, the offspring are numbered after the parents.
+    """
+
+    return parent_fitness.size + best_indices(offspring_fitness, parent_fitness.size)
 
 
 def one_to_one(popul, offspring):
@@ -39,18 +179,8 @@ def one_to_one(popul, offspring):
         The individuals selected for the next generation.
     """
 
-    new_population = []
-    for parent, child in zip(popul, offspring):
-        if child.fitness > parent.fitness:
-            new_population.append(child)
-        else:
-            new_population.append(parent)
-
-    if len(offspring) < len(popul):
-        n_leftover = len(popul) - len(offspring)
-        new_population += popul[n_leftover:]
-
-    return new_population
+    indices = one_to_one_indices(population_fitness(popul), population_fitness(offspring))
+    return gather_survivors(popul, offspring, indices)
 
 
 def prob_one_to_one(popul, offspring, p):
@@ -73,18 +203,8 @@ def prob_one_to_one(popul, offspring, p):
         The individuals selected for the next generation.
     """
 
-    new_population = []
-    for parent, child in zip(popul, offspring):
-        if random.random() < p or child.fitness > parent.fitness:
-            new_population.append(child)
-        else:
-            new_population.append(parent)
-
-    if len(offspring) < len(popul):
-        n_leftover = len(popul) - len(offspring)
-        new_population += popul[n_leftover:]
-
-    return new_population
+    indices = one_to_one_indices(population_fitness(popul), population_fitness(offspring), p)
+    return gather_survivors(popul, offspring, indices)
 
 
 def elitism(popul, offspring, amount):
@@ -106,10 +226,9 @@ def elitism(popul, offspring, amount):
     survivors: List[Individual]
         The individuals selected for the next generation.
     """
-    selected_offspring = sorted(offspring, reverse=True, key=lambda x: x.fitness)[: len(popul) - amount]
-    best_parents = sorted(popul, reverse=True, key=lambda x: x.fitness)[:amount]
 
-    return best_parents + selected_offspring
+    indices = elitism_indices(population_fitness(popul), population_fitness(offspring), amount)
+    return gather_survivors(popul, offspring, indices)
 
 
 def cond_elitism(popul, offspring, amount):
@@ -129,16 +248,8 @@ def cond_elitism(popul, offspring, amount):
         The individuals selected for the next generation.
     """
 
-    best_parents = sorted(popul, reverse=True, key=lambda x: x.fitness)[:amount]
-    new_offspring = sorted(offspring, reverse=True, key=lambda x: x.fitness)[: len(popul)]
-    best_offspring = new_offspring[:amount]
-
-    for idx, val in enumerate(best_parents):
-        if val.fitness > best_offspring[0].fitness:
-            new_offspring.pop()
-            new_offspring = [val] + new_offspring
-
-    return new_offspring
+    indices = cond_elitism_indices(population_fitness(popul), population_fitness(offspring), amount)
+    return gather_survivors(popul, offspring, indices)
 
 
 def lamb_plus_mu(popul, offspring):
@@ -159,8 +270,8 @@ def lamb_plus_mu(popul, offspring):
         The individuals selected for the next generation.
     """
 
-    population = popul + offspring
-    return sorted(population, reverse=True, key=lambda x: x.fitness)[: len(popul)]
+    indices = lamb_plus_mu_indices(population_fitness(popul), population_fitness(offspring))
+    return gather_survivors(popul, offspring, indices)
 
 
 def lamb_comma_mu(popul, offspring):
@@ -180,65 +291,211 @@ def lamb_comma_mu(popul, offspring):
         The individuals selected for the next generation.
     """
 
-    return sorted(offspring, reverse=True, key=lambda x: x.fitness)[: len(popul)]
+    indices = lamb_comma_mu_indices(population_fitness(popul), population_fitness(offspring))
+    return gather_survivors(popul, offspring, indices)
 
 
-def _cro_set_larvae(population, offspring, attempts, maxpopsize):
+def _settle_larvae_numpy(reef_fitness, occupied, larva_fitness, positions):
     """
-    First step of the CRO selection function.
+    Vectorized implementation of the settlement of the larvae, each attempt is resolved for all the larvae at once.
+    """
+
+    n_larvae, attempts = positions.shape
+
+    fitness = reef_fitness.copy()
+    filled = occupied.copy()
+    slot_larva = np.full(reef_fitness.size, -1, dtype=np.int64)
+    settled = np.zeros(n_larvae, dtype=bool)
 
-    Each individual in the offsring tries to settle down into the reef,
-    if the spot they find is empty they are accepted, if there is already
-    an individual in that spot, the one with the best fitness is kept.
+    pending = np.arange(n_larvae)
+    for attempt in range(attempts):
+        if pending.size == 0:
+            break
+
+        # The best larva aiming at each slot competes for it, ties are won by the first larva
+        targets = positions[pending, attempt]
+        order = np.lexsort((pending, -larva_fitness[pending], targets))
+        first = np.ones(order.size, dtype=bool)
+        first[1:] = targets[order[1:]] != targets[order[:-1]]
+        contenders = pending[order[first]]
+        slots = targets[order[first]]
+
+        wins = ~filled[slots] | (larva_fitness[contenders] > fitness[slots])
+        winners = contenders[wins]
+        slots = slots[wins]
+
+        slot_larva[slots] = winners
+        fitness[slots] = larva_fitness[winners]
+        filled[slots] = True
+        settled[winners] = True
+
+        pending = pending[~settled[pending]]
+
+    return slot_larva
+
+
+@kernel("cro_set_larvae", fallback=_settle_larvae_numpy)
+def _settle_larvae(reef_fitness, occupied, larva_fitness, positions):
     """
+    Settles the larvae in the reef trying the slots given for each of them in order.
 
-    new_population = copy(population)
-    for larva in offspring:
-        attempts_left = attempts
-        setted = False
+    In each attempt, the best larva aiming at each slot competes for it (ties are won by the first larva)
+    and settles if the slot is empty or if it is better than the coral in it. The larvae that lose try
+    their next slot.
 
-        while attempts_left > 0 and not setted:
-            idx = random.randrange(0, maxpopsize)
+    Returns the larva that settled in each slot of the reef, or -1 for the slots that didn't change.
+    """
 
-            if setted := (idx >= len(new_population)):
-                new_population.append(larva)
-            elif setted := (larva.fitness > new_population[idx].fitness):
-                new_population[idx] = larva
+    n_slots = reef_fitness.size
+    n_larvae, attempts = positions.shape
+
+    fitness = reef_fitness.copy()
+    filled = occupied.copy()
+    slot_larva = np.full(n_slots, -1, dtype=np.int64)
+    settled = np.zeros(n_larvae, dtype=np.bool_)
+    contender = np.full(n_slots, -1, dtype=np.int64)
+
+    for attempt in range(attempts):
+        for larva in range(n_larvae):
+            if not settled[larva]:
+                slot = positions[larva, attempt]
+                if contender[slot] == -1 or larva_fitness[larva] > larva_fitness[contender[slot]]:
+                    contender[slot] = larva
+
+        for larva in range(n_larvae):
+            slot = positions[larva, attempt]
+            if settled[larva] or contender[slot] != larva:
+                continue
+
+            contender[slot] = -1
+            if not filled[slot] or larva_fitness[larva] > fitness[slot]:
+                slot_larva[slot] = larva
+                fitness[slot] = larva_fitness[larva]
+                filled[slot] = True
+                settled[larva] = True
+
+    return slot_larva
+
+
+def settle_larvae(reef_fitness, occupied, larva_fitness, attempts):
+    """
+    First step of the CRO selection function.
+
+    Each larva tries to settle down into the reef in a random slot, if the slot is empty it is accepted,
+    if there is already a coral in it, the one with the best fitness is kept. Larvae that fail try
+    again in another slot up to 'attempts' times.
+
+    Parameters
+    ----------
+    reef_fitness: ndarray
+        Fitness of the coral in each slot of the reef.
+    occupied: ndarray
+        Mask of the slots of the reef that have a coral.
+    larva_fitness: ndarray
+        Fitness of each larva.
+    attempts: int
+        Maximum number of times a larva can attempt to settle in the reef.
+
+    Returns
+    -------
+    slot_larva: ndarray
+        The larva that settled in each slot of the reef, or -1 for the slots that didn't change.
+    """
 
-            attempts_left -= 1
+    if larva_fitness.size == 0 or attempts <= 0:
+        return np.full(reef_fitness.size, -1, dtype=np.int64)
 
-    return new_population
+    positions = RAND_GEN.integers(0, reef_fitness.size, size=(larva_fitness.size, attempts))
+    return _settle_larvae(reef_fitness, occupied, larva_fitness, positions)
 
 
-def _cro_depredation(population, Fd, Pd):
+def depredation_mask(reef_fitness, occupied, Fd, Pd):
     """
     Second step of the CRO selection function.
 
-    A fraction Fd of the worse individuals in the population will be removed
-    from the population with a probability of Pd.
+    A fraction Fd of the worse corals in the reef will be removed with a probability of Pd.
+
+    To ensure the integrity of the algorithm at least 2 corals will always be kept.
 
-    To ensure the integrity of the algorithm at least 2 individuals will always be
-    kept.
+    Parameters
+    ----------
+    reef_fitness: ndarray
+        Fitness of the coral in each slot of the reef.
+    occupied: ndarray
+        Mask of the slots of the reef that have a coral.
+    Fd: float
+        Proportion of corals with the worse fintess that will go through the depredation step.
+    Pd: float
+        Probability that a coral will be eliminated from the reef in the depredation step.
+
+    Returns
+    -------
+    dead: ndarray
+        Mask of the slots of the reef whose coral is removed.
     """
 
-    amount = int(len(population) * Fd)
+    occupied_slots = np.flatnonzero(occupied)
+    amount = int(occupied_slots.size * Fd)
 
-    fitness_values = [coral.fitness for coral in population]
-    affected_corals = argsort(fitness_values)[:amount]
+    worst_slots = occupied_slots[best_indices(-reef_fitness[occupied_slots], amount)]
+    dies = RAND_GEN.random(worst_slots.size) < Pd
+    dies &= np.cumsum(dies) <= max(occupied_slots.size - 2, 0)
 
-    alive_count = len(population)
-    dead_list = [False] * len(population)
+    dead = np.zeros(reef_fitness.size, dtype=bool)
+    dead[worst_slots[dies]] = True
 
-    for idx, val in enumerate(affected_corals):
-        if alive_count <= 2:
-            break
+    return dead
+
+
+def cro_indices(parent_fitness, offspring_fitness, Fd, Pd, attempts, maxpopsize):
+    """
+    Selection method of the Coral Reef Optimization algorithm for a population that occupies the first
+    slots of a reef.
+
+    Parameters
+    ----------
+    parent_fitness: ndarray
+        Fitness of each individual of the original population.
+    offspring_fitness: ndarray
+        Fitness of each new individual.
+    Fd: float
+        Proportion of individuals with the worse fintess that will go through
+        a depredation step.
+    Pd: float
+        Probability that an individual will be eliminated from the population
+        in the depredation step.
+    attempts: int
+        Maximum number of times a solution can attempt to be inserted into a
+        position with an individual with a better fitness value.
+    maxpopsize: int
+        Maximum size of the population.
+
+    Returns
+    -------
+    indices: ndarray
+        Positions of the survivors, the offspring are numbered after the parents.
+    """
+
+    pop_size = parent_fitness.size
+    reef_size = max(maxpopsize, pop_size)
+
+    occupied = np.zeros(reef_size, dtype=bool)
+    occupied[:pop_size] = True
+    reef_fitness = np.full(reef_size, -np.inf)
+    reef_fitness[:pop_size] = parent_fitness
+
+    sources = np.full(reef_size, -1, dtype=np.int64)
+    sources[:pop_size] = np.arange(pop_size)
+
+    slot_larva = settle_larvae(reef_fitness, occupied, offspring_fitness, attempts)
+    new_corals = slot_larva >= 0
+    sources[new_corals] = pop_size + slot_larva[new_corals]
+    reef_fitness[new_corals] = offspring_fitness[slot_larva[new_corals]]
+    occupied |= new_corals
 
-        dies = random.random() <= Pd
-        dead_list[idx] = dies
-        if dies:
-            alive_count -= 1
+    occupied &= ~depredation_mask(reef_fitness, occupied, Fd, Pd)
 
-    return [c for idx, c in enumerate(population) if not dead_list[idx]]
+    return sources[occupied]
 
 
 def cro_selection(popul, offspring, Fd, Pd, attempts, maxpopsize):
@@ -272,6 +529,5 @@ def cro_selection(popul, offspring, Fd, Pd, attempts, maxpopsize):
         The individuals selected for the next generation.
     """
 
-    setted_corals = _cro_set_larvae(popul, offspring, attempts, maxpopsize)
-    reduced_population = _cro_depredation(setted_corals, Fd, Pd)
-    return reduced_population
+    indices = cro_indices(population_fitness(popul), population_fitness(offspring), Fd, Pd, attempts, maxpopsize)
+    return gather_survivors(popul, offspring, indices)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+import csv
+import os
+from ..MetricsSink import MetricsSink, flatten_record
+
+
+class CSVSink(MetricsSink):
+    """
+    Sink that writes each record as a row of a CSV file.
+
+    Nested metrics (like the probability of each operator) are stored in a column for each of their entries,
+    named "metric.entry". When a record includes metrics that previous records didn't have (like the time
+    of a phase that is first run later), the file is rewritten with the new columns.
+
+    Parameters
+    ----------
+    file_name: str
+        Path of the file where the records are written.
+    every: int, optional
+        Number of generations between two records.
+    metrics: Iterable[str], optional
+        Names of the metrics stored in each record, every metric available is stored if not given.
+    flush: bool, optional
+        Whether to flush the file after each record, so that other processes can read it during the execution.
+    name: str, optional
+        Name that is associated with the sink.
+    """
+
+    def __init__(self, file_name: str, every: int = 1, metrics: Iterable[str] = None, flush: bool = True, name: str = None):
+        """
+        Constructor for the CSVSink class.
+        """
+
+        super().__init__(every, metrics, name)
+        self.file_name = file_name
+        self.flush = flush
+        self.columns = None
+        self._file = None
+        self._writer = None
+
+    def open(self, resume=False):
+        self.close()
+
+        # The columns of an existing file are kept when resuming
+        self.columns = None
+        if resume and os.path.exists(self.file_name):
+            with open(self.file_name, newline="") as file:
+                self.columns = next(csv.reader(file), None)
+
+        self._file = open(self.file_name, "a" if self.columns else "w", newline="")
+        self._writer = None
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    def _add_columns(self, new_columns: List[str]):
+        """
+        Rewrites the file adding new columns, which are left empty in the previous rows.
+        """
+
+        self._file.close()
+        with open(self.file_name, newline="") as file:
+            rows = list(csv.DictReader(file))
+
+        self.columns = self.columns + new_columns
+        self._file = open(self.file_name, "w", newline="")
+        self._writer = csv.DictWriter(self._file, self.columns)
+        self._writer.writeheader()
+        self._writer.writerows(rows)
+
+    def write(self, record):
+        if self._file is None:
+            self.open(resume=True)
+
+        record = flatten_record(record)
+        if self.columns is None:
+            self.columns = list(record)
+            self._writer = csv.DictWriter(self._file, self.columns)
+            self._writer.writeheader()
+        elif any(column not in self.columns for column in record):
+            self._add_columns([column for column in record if column not in self.columns])
+        elif self._writer is None:
+            self._writer = csv.DictWriter(self._file, self.columns)
+
+        self._writer.writerow(record)
+        if self.flush:
+            self._file.flush()
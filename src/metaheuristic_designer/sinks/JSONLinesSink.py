@@ -0,0 +1,50 @@
+from __future__ import annotations
+import json
+from ..MetricsSink import MetricsSink
+from ..utils import NumpyEncoder
+
+
+class JSONLinesSink(MetricsSink):
+    """
+    Sink that writes each record as a line of JSON in a file.
+
+    Parameters
+    ----------
+    file_name: str
+        Path of the file where the records are written.
+    every: int, optional
+        Number of generations between two records.
+    metrics: Iterable[str], optional
+        Names of the metrics stored in each record, every metric available is stored if not given.
+    flush: bool, optional
+        Whether to flush the file after each record, so that other processes can read it during the execution.
+    name: str, optional
+        Name that is associated with the sink.
+    """
+
+    def __init__(self, file_name: str, every: int = 1, metrics: Iterable[str] = None, flush: bool = True, name: str = None):
+        """
+        Constructor for the JSONLinesSink class.
+        """
+
+        super().__init__(every, metrics, name)
+        self.file_name = file_name
+        self.flush = flush
+        self._file = None
+
+    def open(self, resume=False):
+        self.close()
+        self._file = open(self.file_name, "a" if resume else "w")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def write(self, record):
+        if self._file is None:
+            self.open(resume=True)
+
+        self._file.write(json.dumps(record, cls=NumpyEncoder) + "\n")
+        if self.flush:
+            self._file.flush()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+from collections import deque
+import numpy as np
+from ..MetricsSink import MetricsSink
+
+
+class MemorySink(MetricsSink):
+    """
+    Sink that keeps the last records in memory.
+
+    Parameters
+    ----------
+    size: int, optional
+        Maximum number of records kept.
+    every: int, optional
+        Number of generations between two records.
+    metrics: Iterable[str], optional
+        Names of the metrics stored in each record, every metric available is stored if not given.
+    name: str, optional
+        Name that is associated with the sink.
+    """
+
+    def __init__(self, size: int = 1000, every: int = 1, metrics: Iterable[str] = None, name: str = None):
+        """
+        Constructor for the MemorySink class.
+        """
+
+        super().__init__(every, metrics, name)
+        self.size = size
+        self.records = deque(maxlen=size)
+
+    def open(self, resume=False):
+        if not resume:
+            self.records.clear()
+
+    def write(self, record):
+        self.records.append(record)
+
+    def get_metric(self, name: str) -> ndarray:
+        """
+        Returns the values of a metric in the records kept.
+
+        Parameters
+        ----------
+        name: str
+            Name of the metric.
+
+        Returns
+        -------
+        values: ndarray
+            Value of the metric in each record that includes it.
+        """
+
+        return np.array([record[name] for record in self.records if name in record])
+
+    def __len__(self):
+        return len(self.records)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+import math
+import numbers
+import os
+import re
+from ..MetricsSink import MetricsSink
+
+
+class PrometheusSink(MetricsSink):
+    """
+    Sink that writes the last record to a file in the text format of Prometheus, to be collected
+    by the textfile collector of the node exporter.
+
+    Each numeric metric is written as a gauge called "{prefix}_{metric}", nested metrics (like the
+    probability of each operator) are written as a gauge with a label "key" for each of their entries.
+    Metrics that aren't numbers are ignored. The file is replaced atomically after each record.
+
+    Parameters
+    ----------
+    file_name: str
+        Path of the file where the metrics are written, it should have the ".prom" extension.
+    every: int, optional
+        Number of generations between two records.
+    metrics: Iterable[str], optional
+        Names of the metrics stored in each record, every metric available is stored if not given.
+    prefix: str, optional
+        Prefix added to the name of each metric.
+    labels: dict, optional
+        Labels added to every metric, to tell apart the executions that write to the same collector.
+    name: str, optional
+        Name that is associated with the sink.
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        every: int = 1,
+        metrics: Iterable[str] = None,
+        prefix: str = "metaheuristic",
+        labels: dict = None,
+        name: str = None,
+    ):
+        """
+        Constructor for the PrometheusSink class.
+        """
+
+        super().__init__(every, metrics, name)
+        self.file_name = file_name
+        self.prefix = prefix
+        self.labels = {} if labels is None else dict(labels)
+
+    def _format_labels(self, labels: dict) -> str:
+        if not labels:
+            return ""
+
+        escaped = [f'{_metric_name(key)}="{_escape(value)}"' for key, value in labels.items()]
+        return "{" + ",".join(escaped) + "}"
+
+    def format_record(self, record: dict) -> str:
+        """
+        Converts a record into the text format of Prometheus.
+
+        Parameters
+        ----------
+        record: dict
+            Metrics of the algorithm in the current generation.
+
+        Returns
+        -------
+        text: str
+            The metrics of the record in the text format.
+        """
+
+        lines = []
+        for name, value in record.items():
+            metric_name = _metric_name(f"{self.prefix}_{name}")
+            if isinstance(value, dict):
+                samples = [(dict(self.labels, key=key), item) for key, item in value.items() if _is_number(item)]
+            elif _is_number(value):
+                samples = [(self.labels, value)]
+            else:
+                continue
+
+            if samples:
+                lines.append(f"# TYPE {metric_name} gauge")
+                for labels, item in samples:
+                    lines.append(f"{metric_name}{self._format_labels(labels)} {_format_value(item)}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, record):
+        tmp_name = f"{self.file_name}.tmp"
+        with open(tmp_name, "w") as file:
+            file.write(self.format_record(record))
+
+        os.replace(tmp_name, self.file_name)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Real)
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _metric_name(name: str) -> str:
+    name = re.sub(r"[^a-zA-Z0-9_:]", "_", str(name))
+    return name if not name[:1].isdigit() else f"_{name}"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
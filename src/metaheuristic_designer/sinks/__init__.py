@@ -0,0 +1,4 @@
+from .JSONLinesSink import JSONLinesSink
+from .CSVSink import CSVSink
+from .MemorySink import MemorySink
+from .PrometheusSink import PrometheusSink
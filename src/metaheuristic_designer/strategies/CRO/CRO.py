@@ -5,6 +5,7 @@ from ...operators import OperatorMeta
 from ...selectionMethods import SurvivorSelection
 from ..StaticPopulation import StaticPopulation
 from ...ParamScheduler import ParamScheduler
+from .Reef import Reef
 
 
 class CRO(StaticPopulation):
@@ -36,3 +37,14 @@ class CRO(StaticPopulation):
         pop_init.pop_size = round(pop_init.pop_size * params["rho"])
 
         super().__init__(pop_init, evolve_op, params=params, survivor_sel=survivor_sel, name=name)
+
+        self.reef = Reef(initializer.pop_size)
+
+    def initialize(self, objfunc):
+        population = super().initialize(objfunc)
+        self.reef.place(len(population))
+        return population
+
+    def select_individuals(self, population, offspring, **kwargs):
+        params = self.survivor_sel.params
+        return self.reef.select(population, offspring, params["attempts"], params["Fd"], params["Pd"])
@@ -1,10 +1,14 @@
 from __future__ import annotations
 from typing import Union, List
 from copy import deepcopy
-from ...selectionMethods import SurvivorSelection
+import numpy as np
+from ...selectionMethods import SurvivorSelection, population_fitness
 from ...ParamScheduler import ParamScheduler
 from ...SearchStrategy import SearchStrategy
 from ...Operator import Operator
+from ...Population import Population, is_vector_population
+from ...PopulationContext import PopulationContext
+from .Reef import Reef
 
 
 class CRO_SL(SearchStrategy):
@@ -19,15 +23,21 @@ class CRO_SL(SearchStrategy):
         params: ParamScheduler | dict = None,
         name: str = "CRO-SL",
     ):
+        maxpopsize = initializer.pop_size
         initializer = deepcopy(initializer)
         initializer.pop_size = round(initializer.pop_size * params["rho"])
 
         super().__init__(initializer, params=params, name=name)
 
         # Hyperparameters of the algorithm
-        self.maxpopsize = initializer.pop_size
+        self.maxpopsize = maxpopsize
         self.operator_list = operator_list
-        self.operator_idx = [i % len(operator_list) for i in range(initializer.pop_size)]
+        self.operator_idx = [i % len(operator_list) for i in range(maxpopsize)]
+        self.reef = Reef(maxpopsize)
+
+        # Substrate of the coral that produced each larva and summary of the larvae of each substrate
+        self.larva_substrates = np.zeros(0, dtype=int)
+        self.offspring_stats = None
 
         self.survivor_sel = SurvivorSelection(
             "CRO",
@@ -35,35 +45,133 @@ class CRO_SL(SearchStrategy):
                 "Fd": params["Fd"],
                 "Pd": params["Pd"],
                 "attempts": params["attempts"],
-                "maxPopSize": initializer.pop_size,
+                "maxPopSize": maxpopsize,
             },
         )
 
+    def initialize(self, objfunc):
+        population = super().initialize(objfunc)
+        self.reef.place(len(population))
+        return population
+
+    def coral_substrates(self, n_corals: int) -> ndarray:
+        """
+        Gets the substrate of the slot occupied by each coral of the reef.
+
+        Parameters
+        ----------
+        n_corals: int
+            Amount of individuals in the population.
+
+        Returns
+        -------
+        substrates: ndarray
+            Index of the operator assigned to each coral of the population.
+        """
+
+        self.reef.sync(n_corals)
+        return np.asarray(self.operator_idx)[self.reef.occupied_slots]
+
+    def evolve_substrates(self, parent_list, objfunc, substrates, grouped=False):
+        """
+        Applies the operator of each substrate to the corals that live in it.
+
+        The corals are grouped by substrate and each operator is applied to its whole group at once
+        if it supports batch evolution, otherwise it is applied to each coral of the group.
+
+        Parameters
+        ----------
+        parent_list: List[Individual] | Population
+            Corals of the reef.
+        objfunc: ObjectiveFunc
+            Objective function to be optimized.
+        substrates: ndarray
+            Index of the operator assigned to each coral.
+        grouped: bool, optional
+            Whether the operators only see the corals of their own substrate (e.g. when choosing partners
+            for a crossover) instead of the whole reef.
+
+        Returns
+        -------
+        offspring: List[Individual]
+            The larva generated by each coral, in the same order as the corals.
+        """
+
+        order = np.argsort(substrates, kind="stable")
+        group_ends = np.cumsum(np.bincount(substrates, minlength=len(self.operator_list)))
+        groups = np.split(order, group_ends[:-1])
+
+        batch = is_vector_population(parent_list)
+        population = None if grouped else PopulationContext(parent_list)
+
+        offspring = [None] * len(parent_list)
+        for op, group in zip(self.operator_list, groups):
+            if group.size == 0:
+                continue
+
+            if batch and isinstance(op, Operator) and op.supports_batch:
+                # The operator only evolves the corals of its group, taking partners from the whole reef if not grouped
+                larvae = self.evolve_batch(op, parent_list, objfunc, parent_idx=group, partner_pool=not grouped)
+            else:
+                if grouped:
+                    group_parents = parent_list.take(group) if isinstance(parent_list, Population) else [parent_list[idx] for idx in group]
+                context = PopulationContext(group_parents) if grouped else population
+                larvae = []
+                for idx in group:
+                    new_indiv = op(parent_list[idx], context, objfunc, self.best, self.initializer)
+                    new_indiv.genotype = objfunc.repair_solution(new_indiv.genotype)
+                    new_indiv.speed = objfunc.repair_speed(new_indiv.speed)
+                    larvae.append(new_indiv)
+
+            for idx, larva in zip(group, larvae):
+                offspring[idx] = larva
+
+        return offspring
+
     def perturb(self, parent_list, objfunc, **kwargs):
-        offspring = []
-        for idx, indiv in enumerate(parent_list):
-            # Select operator
-            op_idx = self.operator_idx[idx]
+        self.larva_substrates = self.coral_substrates(len(parent_list))
+        return self.evolve_substrates(parent_list, objfunc, self.larva_substrates)
 
-            op = self.operator_list[op_idx]
+    def substrate_statistics(self, offspring) -> dict:
+        """
+        Summarizes the fitness of the larvae produced by each substrate in the last generation.
 
-            # Apply operator
-            new_indiv = op(indiv, parent_list, objfunc, self.best, self.initializer)
-            new_indiv.genotype = objfunc.repair_solution(new_indiv.genotype)
-            new_indiv.speed = objfunc.repair_speed(new_indiv.speed)
+        Parameters
+        ----------
+        offspring: List[Individual] | Population
+            The evaluated larvae, in the same order as the corals that produced them.
 
-            # Add to offspring list
-            offspring.append(new_indiv)
+        Returns
+        -------
+        statistics: dict
+            Arrays with the amount of larvae of each substrate ("count") and the mean ("mean"), highest ("best")
+            and lowest ("worst") fitness among them. Substrates without larvae have a NaN fitness.
+        """
 
-        # Update best solution
-        current_best = max(offspring, key=lambda x: x.fitness)
-        if self.best.fitness < current_best.fitness:
-            self.best = current_best
+        n_substrates = len(self.operator_list)
+        substrates = self.larva_substrates
+        fitness = population_fitness(offspring)
 
-        return offspring
+        count = np.bincount(substrates, minlength=n_substrates)
+        best = np.full(n_substrates, -np.inf)
+        worst = np.full(n_substrates, np.inf)
+        np.maximum.at(best, substrates, fitness)
+        np.minimum.at(worst, substrates, fitness)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.bincount(substrates, weights=fitness, minlength=n_substrates) / count
+
+        empty = count == 0
+        best[empty] = np.nan
+        worst[empty] = np.nan
+
+        return {"count": count, "mean": mean, "best": best, "worst": worst}
 
     def select_individuals(self, population, offspring, **kwargs):
-        return self.survivor_sel(population, offspring)
+        self.offspring_stats = self.substrate_statistics(offspring)
+
+        params = self.survivor_sel.params
+        return self.reef.select(population, offspring, params["attempts"], params["Fd"], params["Pd"])
 
     def update_params(self, **kwargs):
         super().update_params(**kwargs)
@@ -1,9 +1,12 @@
 from __future__ import annotations
-import random
 from typing import Union, List
 import numpy as np
 from ...ParamScheduler import ParamScheduler
+from ...selectionMethods import population_fitness
+from ...histories import RingHistory
+from ...utils import RAND_GEN
 from .CRO_SL import CRO_SL
+from .SubstrateStatistics import SubstrateStatistics
 
 
 class DPCRO_SL(CRO_SL):
@@ -31,42 +34,21 @@ class DPCRO_SL(CRO_SL):
         self.dyn_steps = params["dyn_steps"]
         self.prob_amp = params["prob_amp"]
 
-        self.operator_idx = random.choices(range(len(self.operator_list)), k=self.maxpopsize)
-        self.operator_weight = [1 / len(operator_list)] * len(operator_list)
+        n_operators = len(operator_list)
+        self.operator_idx = RAND_GEN.integers(0, n_operators, size=self.maxpopsize)
+        self.operator_weight = np.full(n_operators, 1 / n_operators)
+        self.prob_amp_warned = False
 
-        if self.dyn_method == "success":
-            self.operator_data = [[0] for i in operator_list]
-        else:
-            self.operator_data = [[] for i in operator_list]
-
-        self.operator_metric_prev = [0 for i in operator_list]
+        # Statistics of the larvae of each operator gathered since the last evaluation of the operators
+        self.operator_stats = SubstrateStatistics(n_operators)
 
-        self.larva_count = [0 for i in operator_list]
+        self.operator_metric_prev = np.zeros(n_operators)
 
-        self.operator_w_history = []
+        history_size = params.get("weight_history_size", 1000)
+        self.operator_w_history = RingHistory(history_size)
         self.op_steps = 0
-        self.operator_metric = [0] * len(operator_list)
-        self.operator_history = []
-
-    def _operator_metric(self, data):
-        result = 0
-
-        # Choose what information to extract from the data gathered
-        if len(data) > 0:
-            if self.dyn_metric == "best":
-                result = max(data)
-            elif self.dyn_metric == "avg":
-                result = sum(data) / len(data)
-            elif self.dyn_metric == "med":
-                data = sorted(data)
-                if len(data) % 2 == 0:
-                    result = (data[len(data) // 2 - 1] + data[len(data) // 2]) / 2
-                else:
-                    result = data[len(data) // 2]
-            elif self.dyn_metric == "worse":
-                result = min(data)
-
-        return result
+        self.operator_metric = np.zeros(n_operators)
+        self.operator_history = RingHistory(history_size)
 
     def _operator_probability(self, values):
         # Normalization to avoid passing big values to softmax
@@ -98,38 +80,24 @@ class DPCRO_SL(CRO_SL):
         return prob
 
     def _evaluate_operators(self):
-        metric = 0
-
-        # take reference data for the calculation of the difference of the next evaluation
-        if self.dyn_method == "diff":
-            full_data = [data_point for op_data in self.operator_data for data_point in op_data]
-            metric = self._operator_metric(full_data)
-
-        # calculate the value of each operator with the data gathered
-        for idx, s_data in enumerate(self.operator_data):
-            if self.dyn_method == "success":
-                # obtain the rate of success of the larvae
-                if self.larva_count[idx] > 0:
-                    self.operator_metric[idx] = s_data[0] / self.larva_count[idx]
-                else:
-                    self.operator_metric[idx] = 0
-
-                # Reset data for nex iteration
-                self.operator_data[idx] = [0]
-                self.larva_count[idx] = 0
-
-            elif self.dyn_method == "fitness" or self.dyn_method == "diff":
-                # obtain the value used in the evaluation of the operator
-                self.operator_metric[idx] = self._operator_metric(s_data)
-
-                # Calculate the difference of the fitness in this generation to the previous one and
-                # store the current value for the next evaluation
-                if self.dyn_method == "diff":
-                    self.operator_metric[idx] = self.operator_metric[idx] - self.operator_metric_prev[idx]
-                    self.operator_metric_prev[idx] = metric
-
-                # Reset data for next iteration
-                self.operator_data[idx] = []
+        stats = self.operator_stats
+
+        if self.dyn_method == "success":
+            # obtain the rate of success of the larvae
+            self.operator_metric = np.where(stats.count > 0, stats.success_rate, 0)
+
+        elif self.dyn_method == "fitness" or self.dyn_method == "diff":
+            # obtain the value used in the evaluation of the operator
+            self.operator_metric = stats.metric(self.dyn_metric)
+
+            # Calculate the difference of the fitness in this generation to the previous one and
+            # store the current value for the next evaluation
+            if self.dyn_method == "diff":
+                self.operator_metric = self.operator_metric - self.operator_metric_prev
+                self.operator_metric_prev = np.full(len(self.operator_list), stats.total_metric(self.dyn_metric))
+
+        # Reset data for next iteration
+        stats.reset()
 
     def _generate_substrates(self, progress=0):
         n_operators = len(self.operator_list)
@@ -143,58 +111,20 @@ class DPCRO_SL(CRO_SL):
         self.operator_w_history.append(self.operator_weight)
 
         # Choose each operator with the weights chosen
-        self.operator_idx = random.choices(range(n_operators), weights=self.operator_weight, k=self.maxpopsize)
+        self.operator_idx = RAND_GEN.choice(n_operators, size=self.maxpopsize, p=self.operator_weight)
 
         # save the evaluation of each operator
         self.operator_history.append(np.array(self.operator_metric))
 
     def perturb(self, parent_list, objfunc, **kwargs):
-        offspring = []
-
-        divided_population = [[] for i in self.operator_list]
-        for idx, indiv in enumerate(parent_list):
-            op_idx = self.operator_idx[idx]
-            divided_population[op_idx].append(indiv)
-
-        for idx, indiv in enumerate(parent_list):
-            # Select operator
-            op_idx = self.operator_idx[idx]
-
-            op = self.operator_list[op_idx]
-
-            new_parent_list = divided_population[op_idx] if self.group_subs else parent_list
-
-            # Apply operator
-            new_indiv = op(indiv, new_parent_list, objfunc, self.best, self.initializer)
-            new_indiv.genotype = objfunc.repair_solution(new_indiv.genotype)
-            new_indiv.speed = objfunc.repair_speed(new_indiv.speed)
-
-            # Collect data about each operator
-            if self.dyn_method == "fitness" or self.dyn_method == "diff":
-                self.operator_data[op_idx].append(new_indiv.fitness)
-
-            # Add to offspring list
-            offspring.append(new_indiv)
-
-        # Update best solution
-        current_best = max(offspring, key=lambda x: x.fitness)
-        if self.best.fitness < current_best.fitness:
-            self.best = current_best
-
-        return offspring
+        self.larva_substrates = self.coral_substrates(len(parent_list))
+        return self.evolve_substrates(parent_list, objfunc, self.larva_substrates, grouped=self.group_subs)
 
     def select_individuals(self, population, offspring, **kwargs):
-        offspring_ids = [i.id for i in offspring]
-        new_population = self.survivor_sel(population, offspring)
-        new_ids = [i.id for i in new_population]
+        new_population = super().select_individuals(population, offspring, **kwargs)
 
-        for idx, off_id in enumerate(offspring_ids):
-            op_idx = self.operator_idx[idx]
-
-            self.larva_count[op_idx] += 1
-
-            if off_id in new_ids:
-                self.operator_data[op_idx][0] += 1
+        # Collect data about each operator
+        self.operator_stats.add(self.larva_substrates, population_fitness(offspring), self.reef.larva_survived)
 
         return new_population
 
@@ -206,10 +136,20 @@ class DPCRO_SL(CRO_SL):
         self._generate_substrates(progress)
         super().update_params(progress=progress)
 
+    def get_metrics(self, names=None):
+        metrics = super().get_metrics(names)
+
+        if names is None or "operator_probabilities" in names:
+            # Operators with the same name are told apart by their position
+            op_names = [op.name for op in self.operator_list]
+            keys = [name if op_names.count(name) == 1 else f"{name}_{idx}" for idx, name in enumerate(op_names)]
+            metrics["operator_probabilities"] = {key: float(weight) for key, weight in zip(keys, self.operator_weight)}
+
+        return metrics
+
     def extra_step_info(self):
         print("\n\tSubstrate probability:")
-        op_names = [i.name for i in self.operator_list]
-        weights = [round(i, 6) for i in self.operator_weight]
-        adjust = max([len(i) for i in op_names])
-        for idx, val in enumerate(op_names):
-            print(f"\t\t{val}:".ljust(adjust + 3, " ") + f"{weights[idx]}")
+        probabilities = self.get_metrics(["operator_probabilities"])["operator_probabilities"]
+        adjust = max([len(i) for i in probabilities])
+        for name, weight in probabilities.items():
+            print(f"\t\t{name}:".ljust(adjust + 3, " ") + f"{round(weight, 6)}")
@@ -0,0 +1,130 @@
+from __future__ import annotations
+import numpy as np
+from ...utils import RAND_GEN
+from ...selectionMethods import population_fitness, gather_survivors, settle_larvae, depredation_mask
+
+
+class Reef:
+    """
+    Reef of the Coral Reef Optimization algorithms, made of a fixed amount of slots where the corals settle.
+
+    The reef keeps a mask with the slots that are occupied and the fitness of the coral in each of them.
+    The corals themselves are kept by the search strategy as a population ordered by slot, so that
+    the i-th individual of the population lives in the i-th occupied slot. After each selection, the reef
+    also keeps a mask with the larvae that are still in it.
+
+    Parameters
+    ----------
+    size: int
+        Number of slots of the reef.
+    """
+
+    def __init__(self, size: int):
+        """
+        Constructor of the Reef class.
+        """
+
+        if size <= 0:
+            raise ValueError(f"The size of the reef must be positive, got {size}.")
+
+        self.size = size
+        self.occupied = np.zeros(size, dtype=bool)
+        self.fitness = np.full(size, -np.inf)
+        self.larva_survived = np.zeros(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.occupied))
+
+    @property
+    def occupied_slots(self) -> ndarray:
+        """
+        Slots of the reef that have a coral, in the order of the population.
+        """
+
+        return np.flatnonzero(self.occupied)
+
+    def place(self, n_corals: int):
+        """
+        Empties the reef and assigns random slots to a new population of corals.
+
+        Parameters
+        ----------
+        n_corals: int
+            Amount of individuals in the population.
+        """
+
+        if n_corals > self.size:
+            raise ValueError(f"A population of {n_corals} individuals doesn't fit in a reef of size {self.size}.")
+
+        self.occupied[:] = False
+        self.occupied[RAND_GEN.choice(self.size, n_corals, replace=False)] = True
+        self.fitness[:] = -np.inf
+
+    def sync(self, n_corals: int):
+        """
+        Places the population again if it was replaced by one with a different amount of corals.
+
+        Parameters
+        ----------
+        n_corals: int
+            Amount of individuals in the population.
+        """
+
+        if n_corals != len(self):
+            self.place(n_corals)
+
+    def select(
+        self,
+        population: List[Individual] | Population,
+        larvae: List[Individual] | Population,
+        attempts: int,
+        Fd: float,
+        Pd: float,
+    ) -> List[Individual] | Population:
+        """
+        Settles the larvae in the reef and then removes some of the worse corals in a depredation step.
+
+        Parameters
+        ----------
+        population: List[Individual] | Population
+            Corals in the reef, ordered by slot.
+        larvae: List[Individual] | Population
+            Individuals that try to settle in the reef.
+        attempts: int
+            Maximum number of times a larva can attempt to settle in the reef.
+        Fd: float
+            Proportion of corals with the worse fintess that will go through a depredation step.
+        Pd: float
+            Probability that a coral will be eliminated from the reef in the depredation step.
+
+        Returns
+        -------
+        population: List[Individual] | Population
+            The corals in the reef after the selection, ordered by slot.
+        """
+
+        n_corals = len(population)
+        self.sync(n_corals)
+
+        # The corals are evaluated after being placed, so their fitness is refreshed here
+        self.fitness[self.occupied] = population_fitness(population)
+        larva_fitness = population_fitness(larvae)
+
+        sources = np.full(self.size, -1, dtype=np.int64)
+        sources[self.occupied] = np.arange(n_corals)
+
+        slot_larva = settle_larvae(self.fitness, self.occupied, larva_fitness, attempts)
+        new_corals = slot_larva >= 0
+        sources[new_corals] = n_corals + slot_larva[new_corals]
+        self.fitness[new_corals] = larva_fitness[slot_larva[new_corals]]
+        self.occupied |= new_corals
+
+        dead = depredation_mask(self.fitness, self.occupied, Fd, Pd)
+        self.occupied &= ~dead
+        self.fitness[dead] = -np.inf
+
+        survivors = sources[self.occupied]
+        self.larva_survived = np.zeros(len(larvae), dtype=bool)
+        self.larva_survived[survivors[survivors >= n_corals] - n_corals] = True
+
+        return gather_survivors(population, larvae, survivors)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+import numpy as np
+from ...utils import RAND_GEN
+
+
+class SubstrateStatistics:
+    """
+    Statistics of the larvae produced by each substrate of a CRO-SL reef, accumulated over several generations.
+
+    Every statistic is kept in a preallocated array, so the cost of adding larvae doesn't depend on how many
+    were added before. The median is estimated from a reservoir sample of fixed size for each substrate,
+    which is exact while the substrate has produced fewer larvae than the size of the sample.
+
+    Parameters
+    ----------
+    n_substrates: int
+        Number of substrates of the reef.
+    sample_size: int, optional
+        Number of fitness values kept for each substrate to estimate its median.
+    """
+
+    def __init__(self, n_substrates: int, sample_size: int = 1024):
+        """
+        Constructor of the SubstrateStatistics class.
+        """
+
+        if sample_size <= 0:
+            raise ValueError(f"The size of the sample must be positive, got {sample_size}.")
+
+        self.n_substrates = n_substrates
+        self.sample_size = sample_size
+
+        self.count = np.zeros(n_substrates, dtype=np.int64)
+        self.success = np.zeros(n_substrates, dtype=np.int64)
+        self.fitness_sum = np.zeros(n_substrates)
+        self.best = np.full(n_substrates, -np.inf)
+        self.worst = np.full(n_substrates, np.inf)
+
+        # The last row samples the larvae of all the substrates together
+        self._samples = np.zeros((n_substrates + 1, sample_size))
+        self._seen = np.zeros(n_substrates + 1, dtype=np.int64)
+
+    def reset(self):
+        """
+        Forgets the larvae added so far.
+        """
+
+        self.count[:] = 0
+        self.success[:] = 0
+        self.fitness_sum[:] = 0
+        self.best[:] = -np.inf
+        self.worst[:] = np.inf
+        self._seen[:] = 0
+
+    def add(self, substrates: ndarray, fitness: ndarray, survived: ndarray = None):
+        """
+        Adds the larvae of a generation to the statistics.
+
+        Parameters
+        ----------
+        substrates: ndarray
+            Substrate that produced each larva.
+        fitness: ndarray
+            Fitness of each larva.
+        survived: ndarray, optional
+            Mask of the larvae that settled in the reef and survived the depredation.
+        """
+
+        self.count += np.bincount(substrates, minlength=self.n_substrates)
+        self.fitness_sum += np.bincount(substrates, weights=fitness, minlength=self.n_substrates)
+        np.maximum.at(self.best, substrates, fitness)
+        np.minimum.at(self.worst, substrates, fitness)
+
+        if survived is not None:
+            self.success += np.bincount(substrates[survived], minlength=self.n_substrates)
+
+        order = np.argsort(substrates, kind="stable")
+        group_ends = np.cumsum(np.bincount(substrates, minlength=self.n_substrates))
+        for substrate, group in enumerate(np.split(order, group_ends[:-1])):
+            self._sample(substrate, fitness[group])
+        self._sample(self.n_substrates, fitness)
+
+    def _sample(self, row: int, values: ndarray):
+        """
+        Adds values to one of the reservoir samples, each value seen so far has the same probability of being kept.
+        """
+
+        seen = self._seen[row]
+        n_free = min(max(self.sample_size - seen, 0), values.size)
+        self._samples[row, seen : seen + n_free] = values[:n_free]
+
+        remaining = values[n_free:]
+        if remaining.size > 0:
+            # The i-th value of the stream replaces a random element of the sample with probability sample_size/i
+            stream_pos = seen + n_free + 1 + np.arange(remaining.size)
+            replaced = (RAND_GEN.random(remaining.size) * stream_pos).astype(np.int64)
+            kept = replaced < self.sample_size
+            self._samples[row, replaced[kept]] = remaining[kept]
+
+        self._seen[row] += values.size
+
+    def _sample_median(self, row: int) -> float:
+        n_values = min(self._seen[row], self.sample_size)
+        if n_values == 0:
+            return np.nan
+
+        return float(np.median(self._samples[row, :n_values]))
+
+    @property
+    def mean(self) -> ndarray:
+        """
+        Average fitness of the larvae of each substrate, NaN for substrates without larvae.
+        """
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.fitness_sum / self.count
+
+    @property
+    def median(self) -> ndarray:
+        """
+        Estimated median of the fitness of the larvae of each substrate, NaN for substrates without larvae.
+        """
+
+        return np.array([self._sample_median(substrate) for substrate in range(self.n_substrates)])
+
+    @property
+    def success_rate(self) -> ndarray:
+        """
+        Proportion of the larvae of each substrate that survived, NaN for substrates without larvae.
+        """
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.success / self.count
+
+    def metric(self, name: str) -> ndarray:
+        """
+        Summarizes the fitness of the larvae of each substrate.
+
+        Parameters
+        ----------
+        name: str
+            Statistic used, "best", "avg", "med" or "worse".
+
+        Returns
+        -------
+        values: ndarray
+            The value of the statistic for each substrate, 0 for substrates without larvae.
+        """
+
+        if name == "best":
+            values = self.best
+        elif name == "avg":
+            values = self.mean
+        elif name == "med":
+            values = self.median
+        elif name == "worse":
+            values = self.worst
+        else:
+            raise ValueError(f'Metric "{name}" not defined.')
+
+        return np.where(self.count > 0, values, 0)
+
+    def total_metric(self, name: str) -> float:
+        """
+        Summarizes the fitness of the larvae of all the substrates together.
+
+        Parameters
+        ----------
+        name: str
+            Statistic used, "best", "avg", "med" or "worse".
+
+        Returns
+        -------
+        value: float
+            The value of the statistic, 0 if there are no larvae.
+        """
+
+        total_count = self.count.sum()
+        if total_count == 0:
+            return 0
+
+        if name == "best":
+            value = self.best.max()
+        elif name == "avg":
+            value = self.fitness_sum.sum() / total_count
+        elif name == "med":
+            value = self._sample_median(self.n_substrates)
+        elif name == "worse":
+            value = self.worst.min()
+        else:
+            raise ValueError(f'Metric "{name}" not defined.')
+
+        return float(value)
@@ -1,3 +1,5 @@
+from .Reef import Reef
+from .SubstrateStatistics import SubstrateStatistics
 from .CRO import CRO
 from .CRO_SL import CRO_SL
 from .PCRO_SL import PCRO_SL
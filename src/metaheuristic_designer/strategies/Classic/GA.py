@@ -40,6 +40,6 @@ class GA(VariablePopulation):
         )
 
     def extra_step_info(self):
-        popul_matrix = np.array(list(map(lambda x: x.genotype, self.population)))
-        divesity = popul_matrix.std(axis=1).mean()
-        print(f"\tdiversity: {divesity:0.3}")
+        metrics = self.get_metrics(["diversity"])
+        if "diversity" in metrics:
+            print(f"\tdiversity: {metrics['diversity']:0.3}")
@@ -5,6 +5,7 @@ from ...operators import OperatorReal
 from ...selectionMethods import SurvivorSelection
 from ..StaticPopulation import StaticPopulation
 from ...ParamScheduler import ParamScheduler
+from ...Population import Population
 
 
 class PSO(StaticPopulation):
@@ -34,10 +35,20 @@ class PSO(StaticPopulation):
 
         super().__init__(initializer, pso_op, params=params, name=name)
 
+    def get_metrics(self, names=None):
+        metrics = super().get_metrics(names)
+
+        if (names is None or "mean_speed" in names) and self.population:
+            if isinstance(self.population, Population):
+                speed_matrix = self.population.speed_matrix
+            else:
+                speed_matrix = np.array([indiv.speed for indiv in self.population])
+            metrics["mean_speed"] = float(speed_matrix.mean())
+
+        return metrics
+
     def extra_step_info(self):
-        popul_matrix = np.array(list(map(lambda x: x.genotype, self.population)))
-        speed_matrix = np.array(list(map(lambda x: x.speed, self.population)))
-        divesity = popul_matrix.std(axis=1).mean()
-        mean_speed = speed_matrix.mean()
-        print(f"\tdiversity: {divesity:0.3}")
-        print(f"\tmean speed: {mean_speed:0.3}")
+        metrics = self.get_metrics(["diversity", "mean_speed"])
+        if "diversity" in metrics:
+            print(f"\tdiversity: {metrics['diversity']:0.3}")
+        print(f"\tmean speed: {metrics['mean_speed']:0.3}")
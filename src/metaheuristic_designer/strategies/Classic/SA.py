@@ -51,8 +51,19 @@ class SA(HillClimb):
             self.survivor_sel.params["p"] = np.exp(-1 / self.temp)
             self.iter_count = 0
 
+    def get_metrics(self, names=None):
+        metrics = super().get_metrics(names)
+
+        if names is None or "temperature" in names:
+            metrics["temperature"] = float(self.temp)
+        if names is None or "accept_prob" in names:
+            metrics["accept_prob"] = float(np.exp(-1 / self.temp))
+
+        return metrics
+
     def extra_step_info(self):
+        metrics = self.get_metrics(["temperature", "accept_prob"])
         print()
         print(f"\tTemp iters: {self.iter_count}/{self.iter}")
-        print(f"\tTemperature: {float(self.temp):0.3}")
-        print(f"\tAccept prob: {np.exp(-1 / self.temp):0.3}")
+        print(f"\tTemperature: {metrics['temperature']:0.3}")
+        print(f"\tAccept prob: {metrics['accept_prob']:0.3}")
@@ -1,12 +1,12 @@
 from __future__ import annotations
 import numpy as np
-import scipy as sp
 from ...Individual import Individual
 from ...operators import OperatorBinary
 from ...selectionMethods import ParentSelection, SurvivorSelection
 from ...Initializer import Initializer
 from ...ParamScheduler import ParamScheduler
 from ..VariablePopulation import VariablePopulation
+from ...Population import stack_genotypes
 from ...utils import RAND_GEN
 
 
@@ -45,7 +45,7 @@ class BernoulliPBIL(VariablePopulation):
         )
 
     def _batch_fit(self, parent_list):
-        population_matrix = np.asarray([i.genotype for i in parent_list])
+        population_matrix = stack_genotypes(parent_list)
         p_hat = population_matrix.mean(axis=0)
 
         return p_hat
@@ -1,11 +1,11 @@
 from __future__ import annotations
 import numpy as np
-import scipy as sp
 from ...operators import OperatorReal, OperatorBinary, OperatorInt
 from ...selectionMethods import ParentSelection, SurvivorSelection
 from ...Initializer import Initializer
 from ...ParamScheduler import ParamScheduler
 from ..VariablePopulation import VariablePopulation
+from ...Population import stack_genotypes
 from ...utils import RAND_GEN
 
 
@@ -47,7 +47,7 @@ class BinomialUMDA(VariablePopulation):
         )
 
     def _batch_fit(self, parent_list):
-        population_matrix = np.asarray([i.genotype for i in parent_list])
+        population_matrix = stack_genotypes(parent_list)
         p_hat = population_matrix.sum(axis=0) / (self.n * population_matrix.shape[0])
 
         return p_hat
@@ -37,6 +37,7 @@ class HillClimb(SearchStrategy):
             new_indiv = self.operator(indiv, indiv_list, objfunc, self.best, self.initializer)
             new_indiv.genotype = objfunc.repair_solution(new_indiv.genotype)
             new_indiv.speed = objfunc.repair_speed(new_indiv.speed)
+            self.evaluate_neighbor(new_indiv, indiv, objfunc)
 
             offspring.append(new_indiv)
 
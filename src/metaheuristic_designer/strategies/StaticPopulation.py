@@ -8,6 +8,8 @@ from ..selectionMethods import (
 )
 from ..SearchStrategy import SearchStrategy
 from ..Operator import Operator
+from ..Population import is_vector_population
+from ..PopulationContext import PopulationContext
 
 
 class StaticPopulation(SearchStrategy):
@@ -35,10 +37,15 @@ class StaticPopulation(SearchStrategy):
         )
 
     def perturb(self, parent_list, objfunc, **kwargs):
+        if self.operator.supports_batch and is_vector_population(parent_list):
+            return self.evolve_batch(self.operator, parent_list, objfunc)
+
+        population = PopulationContext(parent_list)
+
         offspring = []
         for indiv in parent_list:
             # Apply operator
-            new_indiv = self.operator(indiv, parent_list, objfunc, self.best, self.initializer)
+            new_indiv = self.operator(indiv, population, objfunc, self.best, self.initializer)
             new_indiv.genotype = objfunc.repair_solution(new_indiv.genotype)
             new_indiv.speed = objfunc.repair_speed(new_indiv.speed)
 
@@ -55,6 +55,7 @@ class VNS(SearchStrategy):
             # Perturb individual
             new_indiv = self.perturb_op(indiv, indiv_list, objfunc, self.best, self.initializer)
             new_indiv.genotype = objfunc.repair_solution(new_indiv.genotype)
+            self.evaluate_neighbor(new_indiv, indiv, objfunc)
 
             # Local search
             population = [new_indiv]
@@ -9,6 +9,9 @@ from ..selectionMethods import (
 )
 from ..SearchStrategy import SearchStrategy
 from ..Operator import Operator
+from ..Population import is_vector_population
+from ..PopulationContext import PopulationContext
+from ..utils import RAND_GEN
 
 
 class VariablePopulation(SearchStrategy):
@@ -53,12 +56,18 @@ class VariablePopulation(SearchStrategy):
         self._initializer = new_initializer
 
     def perturb(self, parent_list, objfunc, **kwargs):
+        if self.operator.supports_batch and is_vector_population(parent_list):
+            parent_idx = RAND_GEN.integers(0, len(parent_list), size=self.n_offspring)
+            return self.evolve_batch(self.operator, parent_list, objfunc, parent_idx)
+
+        population = PopulationContext(parent_list)
+
         offspring = []
 
         while len(offspring) < self.n_offspring:
             # Apply operator
             indiv = random.choice(parent_list)
-            new_indiv = self.operator(indiv, parent_list, objfunc, self.best, self.initializer)
+            new_indiv = self.operator(indiv, population, objfunc, self.best, self.initializer)
             new_indiv.genotype = objfunc.repair_solution(new_indiv.genotype)
             new_indiv.speed = objfunc.repair_speed(new_indiv.speed)
 
@@ -0,0 +1,89 @@
+import pytest
+
+from metaheuristic_designer import ParamScheduler
+from metaheuristic_designer.algorithms import GeneralAlgorithm, MemeticAlgorithm
+from metaheuristic_designer.benchmarks import Sphere
+from metaheuristic_designer.initializers import UniformVectorInitializer, PermInitializer
+from metaheuristic_designer.operators import OperatorReal, OperatorBinary, OperatorPerm
+from metaheuristic_designer.selectionMethods import ParentSelection, SurvivorSelection
+from metaheuristic_designer.strategies import GA, DE, PSO, SA, HS, CRO_SL, DPCRO_SL, GaussianUMDA, CrossEntropyMethod, HillClimb
+
+CRO_PARAMS = {"rho": 0.6, "Fb": 0.95, "Fd": 0.1, "Pd": 0.9, "attempts": 3}
+DPCRO_PARAMS = dict(CRO_PARAMS, group_subs=True, dyn_method="fitness", dyn_metric="avg", dyn_steps=3, prob_amp=0.1)
+
+
+def build_strategy(name, vecsize=10, pop_size=20, params=None):
+    """
+    Builds one of the search strategies used across the tests, optimizing a vector of 'vecsize' components.
+    The parameters given are added to the default parameters of the strategy (e.g. {"columnar": True}).
+    """
+
+    params = {} if params is None else params
+    initializer = UniformVectorInitializer(vecsize, -100, 100, pop_size=pop_size)
+    parent_sel = ParentSelection("Best", {"amount": pop_size // 2})
+    survivor_sel = SurvivorSelection("(m+n)")
+    ga_params = dict({"pcross": 0.8, "pmut": 0.2}, **params)
+
+    # Repeated operator names and operators that are applied to each individual separately
+    cro_operators = [
+        OperatorReal("DE/rand/1", {"F": 0.7, "Cr": 0.8}),
+        OperatorReal("Gauss", {"F": 0.1}),
+        OperatorReal("Gauss", {"F": 1}),
+        OperatorReal("CrossInterAvg", {"N": 3}),
+    ]
+
+    if name == "GA":
+        mutation = OperatorReal("Gauss", ParamScheduler("Linear", {"F": [0.5, 0.01]}))
+        return GA(initializer, mutation, OperatorReal("Multipoint"), parent_sel, survivor_sel, ga_params)
+    elif name == "GA_binary":
+        initializer = UniformVectorInitializer(vecsize, 0, 1, pop_size=pop_size, dtype=int)
+        parent_sel = ParentSelection("Tournament", {"amount": pop_size // 2, "p": 0.1})
+        return GA(initializer, OperatorBinary("Flip", {"N": 1}), OperatorBinary("Multipoint"), parent_sel, survivor_sel, ga_params)
+    elif name == "GA_perm":
+        initializer = PermInitializer(vecsize, pop_size=pop_size)
+        return GA(initializer, OperatorPerm("Swap"), OperatorPerm("PMX"), parent_sel, survivor_sel, ga_params)
+    elif name == "DE":
+        return DE(initializer, OperatorReal("DE/best/1", {"F": 0.7, "Cr": 0.8}), params)
+    elif name == "PSO":
+        return PSO(initializer, dict({"w": 0.7, "c1": 1.5, "c2": 1.5}, **params))
+    elif name == "SA":
+        initializer.pop_size = 1
+        return SA(initializer, OperatorReal("Gauss", {"F": 0.1}), dict({"iter": 3, "temp_init": 1, "alpha": 0.9}, **params))
+    elif name == "HS":
+        return HS(initializer, dict({"HMCR": 0.9, "BW": 0.5, "PAR": 0.3}, **params))
+    elif name == "CRO_SL":
+        return CRO_SL(initializer, cro_operators, dict(CRO_PARAMS, **params))
+    elif name == "DPCRO_SL":
+        return DPCRO_SL(initializer, cro_operators, dict(DPCRO_PARAMS, **params))
+    elif name == "GaussianUMDA":
+        return GaussianUMDA(initializer, parent_sel, survivor_sel, params=dict({"scale": 0.1, "noise": 1e-3}, **params))
+    elif name == "CrossEntropyMethod":
+        return CrossEntropyMethod(initializer, params=params)
+
+    raise ValueError(f"Unknown test strategy {name}.")
+
+
+def build_algorithm(name, params, memetic=False, vecsize=10, pop_size=20, strategy_params=None):
+    """
+    Builds an algorithm that optimizes the Sphere function with one of the search strategies of :py:func:`build_strategy`,
+    combined with a local search if 'memetic' is True.
+    """
+
+    strategy = build_strategy(name, vecsize, pop_size, strategy_params)
+    if memetic:
+        local_search = HillClimb(
+            UniformVectorInitializer(vecsize, -100, 100, pop_size=1), OperatorReal("Gauss", {"F": 0.1}), params={"iters": 3}
+        )
+        return MemeticAlgorithm(Sphere(vecsize), strategy, local_search, ParentSelection("Best", {"amount": 2}), params)
+
+    return GeneralAlgorithm(Sphere(vecsize), strategy, params)
+
+
+@pytest.fixture
+def make_strategy():
+    return build_strategy
+
+
+@pytest.fixture
+def make_algorithm():
+    return build_algorithm
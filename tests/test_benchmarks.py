@@ -1,5 +1,7 @@
 import pytest
 
+import numpy as np
+
 from metaheuristic_designer.initializers import UniformVectorInitializer
 from metaheuristic_designer.benchmarks import *
 import metaheuristic_designer as mhd
@@ -50,3 +52,197 @@ def test_real_benchmarks(bench_class):
     population = pop_init.generate_population(objfunc)
     for indiv in population:
         objfunc.repair_solution(indiv.genotype)
+
+
+@pytest.mark.parametrize("vecsize", [2, 10, 30])
+@pytest.mark.parametrize("bench_class", benchmark_functions)
+def test_benchmarks_batch(vecsize, bench_class):
+    objfunc = bench_class(vecsize)
+    pop_init = UniformVectorInitializer(vecsize, objfunc.low_lim, objfunc.up_lim, pop_size=100)
+
+    population = pop_init.generate_population(objfunc)
+    fitness_single = np.array([objfunc.fitness(indiv) for indiv in population])
+    fitness_batch = objfunc.fitness_batch(population)
+
+    assert fitness_batch.shape == (100,)
+    assert objfunc.counter == 200
+    np.testing.assert_allclose(fitness_batch, fitness_single, rtol=1e-10)
+
+
+def sat_reference(clauses, solution):
+    n_satisfied = 0
+    for clause in clauses:
+        n_satisfied += any(bool(solution[abs(lit) - 1]) != (lit < 0) for lit in clause)
+    return n_satisfied / len(clauses)
+
+
+@pytest.mark.parametrize("cnf_file", ["uf50-03.cnf", "uf100-01.cnf"])
+def test_sat_file(cnf_file):
+    objfunc = ThreeSAT.from_cnf_file(f"./data/sat_examples/{cnf_file}")
+    assert objfunc.clauses.shape[1] == 3
+
+    solutions = np.random.randint(0, 2, (50, objfunc.vecsize))
+    expected = [sat_reference(objfunc.clauses, solution) for solution in solutions]
+
+    np.testing.assert_allclose([objfunc.objective(solution) for solution in solutions], expected)
+    np.testing.assert_allclose(objfunc.objective_batch(solutions), expected)
+
+
+def test_sat_variable_length(tmp_path):
+    cnf_file = tmp_path / "test.cnf"
+    cnf_file.write_text("c comment\np cnf 5 4\n1 -2 0\n-3 4\n 5 -1 0\n2 0 -5 0\n%\n0\n")
+
+    objfunc = ThreeSAT.from_cnf_file(str(cnf_file))
+    clauses = [[1, -2], [-3, 4, 5, -1], [2], [-5]]
+    assert objfunc.vecsize == 5
+    assert objfunc.clauses.shape == (4, 4)
+
+    solutions = np.random.randint(0, 2, (40, 5))
+    expected = [sat_reference(clauses, solution) for solution in solutions]
+    np.testing.assert_allclose([objfunc.objective(solution) for solution in solutions], expected)
+    np.testing.assert_allclose(objfunc.objective_batch(solutions), expected)
+    np.testing.assert_allclose(ThreeSAT(clauses).objective_batch(solutions), expected)
+
+
+def test_sat_invalid():
+    with pytest.raises(ValueError):
+        ThreeSAT(np.array([[1, 0, 2]]))
+
+    with pytest.raises(ValueError):
+        ThreeSAT([[1, 2], []])
+
+
+burma14 = """NAME: burma14
+TYPE: TSP
+DIMENSION: 14
+EDGE_WEIGHT_TYPE: GEO
+NODE_COORD_SECTION
+1 16.47 96.10
+2 16.47 94.44
+3 20.09 92.54
+4 22.39 93.37
+5 25.23 97.24
+6 22.00 96.05
+7 20.47 97.02
+8 17.20 96.29
+9 16.30 97.38
+10 14.05 98.12
+11 16.53 97.38
+12 21.52 95.59
+13 19.41 97.13
+14 20.09 94.55
+EOF
+"""
+
+
+def tsp_reference(distances, solution):
+    return sum(distances[solution[i], solution[(i + 1) % solution.size]] for i in range(solution.size))
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("tsp_file", ["r20_01.csv", "r100_05.csv"])
+def test_tsp_edge_list(tsp_file, dtype):
+    objfunc = TSP.from_edge_list_file(f"./data/tsp_examples/{tsp_file}", dtype=dtype)
+    assert objfunc.distances.dtype == dtype
+    assert objfunc.symmetric
+
+    solutions = np.array([np.random.permutation(objfunc.vecsize) for _ in range(30)])
+    expected = [tsp_reference(objfunc.distances, solution) for solution in solutions]
+
+    np.testing.assert_allclose([objfunc.objective(solution) for solution in solutions], expected, rtol=1e-5)
+    np.testing.assert_allclose(objfunc.objective_batch(solutions), expected, rtol=1e-5)
+
+
+def test_tsp_tsplib(tmp_path):
+    tsp_file = tmp_path / "burma14.tsp"
+    tsp_file.write_text(burma14)
+
+    objfunc = TSP.from_tsplib_file(str(tsp_file))
+    optimal_tour = np.array([1, 2, 14, 3, 4, 5, 6, 12, 7, 13, 8, 11, 9, 10]) - 1
+    assert objfunc.objective(optimal_tour) == 3323
+
+
+@pytest.mark.parametrize("weight_format", ["FULL_MATRIX", "UPPER_ROW", "LOWER_DIAG_ROW", "UPPER_DIAG_COL"])
+def test_tsp_tsplib_explicit(tmp_path, weight_format):
+    coords = np.random.uniform(0, 100, (8, 2))
+    distances = np.round(np.linalg.norm(coords[:, None] - coords[None, :], axis=2))
+
+    if weight_format == "FULL_MATRIX":
+        weights = distances.ravel()
+    elif weight_format == "UPPER_ROW":
+        weights = distances[np.triu_indices(8, 1)]
+    else:
+        weights = distances[np.tril_indices(8, 0)]
+
+    tsp_file = tmp_path / "test.tsp"
+    weight_lines = " ".join(str(w) for w in weights)
+    tsp_file.write_text(
+        f"NAME: test\nDIMENSION: 8\nEDGE_WEIGHT_TYPE: EXPLICIT\nEDGE_WEIGHT_FORMAT: {weight_format}\nEDGE_WEIGHT_SECTION\n{weight_lines}\nEOF\n"
+    )
+
+    objfunc = TSP.from_tsplib_file(str(tsp_file))
+    np.testing.assert_array_equal(objfunc.distances, distances)
+
+
+@pytest.mark.parametrize("symmetric", [True, False])
+def test_tsp_deltas(symmetric):
+    if symmetric:
+        objfunc = TSP.from_coordinates(np.random.uniform(0, 100, (30, 2)))
+    else:
+        objfunc = TSP(np.random.uniform(1, 100, (30, 30)))
+    assert objfunc.symmetric == symmetric
+
+    for _ in range(300):
+        solution = np.random.permutation(30)
+        length = objfunc.objective(solution)
+        i, j = sorted(np.random.choice(31, 2, replace=False))
+
+        swapped = solution.copy()
+        swapped[[i % 30, j % 30]] = swapped[[j % 30, i % 30]]
+        np.testing.assert_allclose(length + objfunc.swap_delta(solution, i % 30, j % 30), objfunc.objective(swapped))
+
+        inserted = solution.copy()
+        inserted[i:j] = np.roll(inserted[i:j], 1)
+        np.testing.assert_allclose(length + objfunc.insert_delta(solution, i, j), objfunc.objective(inserted))
+
+        inverted = solution.copy()
+        inverted[i:j] = np.flip(inverted[i:j])
+        np.testing.assert_allclose(length + objfunc.invert_delta(solution, i, j), objfunc.objective(inverted))
+
+        changed = np.flatnonzero(inverted != solution)
+        np.testing.assert_allclose(objfunc.objective_delta(solution, length, changed, inverted), objfunc.objective(inverted))
+
+
+def test_tsp_repair():
+    objfunc = TSP.from_coordinates(np.random.uniform(0, 100, (10, 2)))
+    permutation = np.random.permutation(10)
+
+    np.testing.assert_array_equal(objfunc.repair_solution(permutation), permutation)
+    np.testing.assert_array_equal(np.sort(objfunc.repair_solution(np.random.uniform(0, 1, 10))), np.arange(10))
+
+
+def mod_schwefel_reference(solution):
+    fit = 0
+    for i in range(solution.size):
+        z = solution[i] + 4.209687462275036e2
+        if z > 500:
+            fit = fit - (500 - z % 500) * np.sin((500 - z % 500) ** 0.5)
+            tmp = (z - 500) / 100
+            fit = fit + tmp * tmp / solution.size
+        elif z < -500:
+            fit = fit - (-500 - abs(z) % 500) * np.sin((500 - abs(z) % 500) ** 0.5)
+            tmp = (z + 500) / 100
+            fit = fit + tmp * tmp / solution.size
+        else:
+            fit = fit - z * np.sin(abs(z) ** 0.5)
+    return fit + 4.189828872724338e2 * solution.size
+
+
+@pytest.mark.parametrize("vecsize", [2, 10, 100])
+def test_mod_schwefel_branches(vecsize):
+    objfunc = ModSchwefel(vecsize)
+    solutions = np.random.uniform(-2000, 2000, (50, vecsize))
+
+    expected = [mod_schwefel_reference(solution) for solution in solutions]
+    np.testing.assert_allclose([objfunc.objective(solution) for solution in solutions], expected)
+    np.testing.assert_allclose(objfunc.objective_batch(solutions), expected)
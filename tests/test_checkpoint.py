@@ -0,0 +1,225 @@
+import pytest
+
+import pickle
+import random
+import numpy as np
+from metaheuristic_designer import Individual
+from metaheuristic_designer.checkpoint import get_component_state, set_component_state, PartialDict, ComponentState
+from metaheuristic_designer.operators import OperatorReal, OperatorMeta
+from metaheuristic_designer.utils import RAND_GEN
+import metaheuristic_designer as mhd
+
+mhd.reset_seed(0)
+
+
+def _seed(seed):
+    mhd.reset_seed(seed)
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+class Interruption(Exception):
+    pass
+
+
+def _interrupt_at(algorithm, generation):
+    step = algorithm.step
+
+    def interrupted_step(*args):
+        if algorithm.steps == generation:
+            raise Interruption()
+        return step(*args)
+
+    algorithm.step = interrupted_step
+
+
+@pytest.mark.parametrize(
+    "name, memetic",
+    [
+        ("GA", False),
+        ("DE", False),
+        ("PSO", False),
+        ("SA", False),
+        ("HS", False),
+        ("CRO_SL", False),
+        ("DPCRO_SL", False),
+        ("GaussianUMDA", False),
+        ("CrossEntropyMethod", False),
+        ("GA", True),
+    ],
+)
+def test_resume_is_exact(tmp_path, name, memetic, make_algorithm):
+    params = {"stop_cond": "ngen", "ngen": 20, "verbose": False}
+    checkpoint_file = str(tmp_path / "checkpoint.pkl")
+
+    _seed(1)
+    reference = make_algorithm(name, params, memetic)
+    reference.optimize()
+
+    # The execution is interrupted after the checkpoint of generation 8
+    _seed(1)
+    interrupted = make_algorithm(name, dict(params, checkpoint_file=checkpoint_file, checkpoint_gens=4), memetic)
+    _interrupt_at(interrupted, 10)
+    with pytest.raises(Interruption):
+        interrupted.optimize()
+
+    # The execution is resumed in a new algorithm with a different random state
+    _seed(1234)
+    resumed = make_algorithm(name, params, memetic)
+    resumed.resume(checkpoint_file)
+
+    assert resumed.steps == reference.steps
+    np.testing.assert_array_equal(resumed.fit_history, reference.fit_history)
+    np.testing.assert_array_equal(resumed.best_history, reference.best_history)
+    np.testing.assert_array_equal(resumed.best_solution()[0], reference.best_solution()[0])
+    assert resumed.objfunc.counter == reference.objfunc.counter
+    assert RAND_GEN.bit_generator.state == reference_state(make_algorithm, name, params, memetic)
+
+
+def reference_state(make_algorithm, name, params, memetic):
+    _seed(1)
+    make_algorithm(name, params, memetic).optimize()
+    return RAND_GEN.bit_generator.state
+
+
+def test_load_checkpoint(tmp_path, make_algorithm):
+    checkpoint_file = str(tmp_path / "checkpoint.pkl")
+    params = {"stop_cond": "ngen", "ngen": 12, "verbose": False, "checkpoint_file": checkpoint_file, "checkpoint_gens": 5}
+
+    _seed(0)
+    algorithm = make_algorithm("DPCRO_SL", params)
+    algorithm.objfunc.enable_cache(100)
+    algorithm.optimize()
+    last_id = Individual._last_id
+
+    loaded = make_algorithm("DPCRO_SL", params)
+    loaded.objfunc.enable_cache(100)
+    loaded.load_checkpoint()
+
+    # A final checkpoint is written when the algorithm ends
+    assert loaded.ended
+    assert loaded.steps == 12
+    assert list(loaded.fit_history) == list(algorithm.fit_history)
+    assert loaded.objfunc.counter == algorithm.objfunc.counter
+    assert loaded.objfunc.cache == algorithm.objfunc.cache
+    np.testing.assert_array_equal(loaded.search_strategy.operator_weight, algorithm.search_strategy.operator_weight)
+    np.testing.assert_array_equal(loaded.search_strategy.operator_stats.count, algorithm.search_strategy.operator_stats.count)
+    np.testing.assert_array_equal(loaded.search_strategy.operator_stats.median, algorithm.search_strategy.operator_stats.median)
+    np.testing.assert_array_equal(
+        loaded.search_strategy.operator_w_history.to_array(), algorithm.search_strategy.operator_w_history.to_array()
+    )
+    assert len(loaded.search_strategy.population) == len(algorithm.search_strategy.population)
+    assert Individual._last_id == last_id
+
+    # The individuals refer to the objective function of the new algorithm
+    assert all(indiv.objfunc is loaded.objfunc for indiv in loaded.search_strategy.population)
+    assert loaded.search_strategy.best.fitness == algorithm.search_strategy.best.fitness
+
+
+def test_sa_temperature(tmp_path, make_algorithm):
+    checkpoint_file = str(tmp_path / "checkpoint.pkl")
+
+    algorithm = make_algorithm("SA", {"stop_cond": "ngen", "ngen": 10, "verbose": False})
+    algorithm.optimize()
+    algorithm.save_checkpoint(checkpoint_file)
+
+    loaded = make_algorithm("SA", {"stop_cond": "ngen", "ngen": 10, "verbose": False})
+    loaded.load_checkpoint(checkpoint_file)
+
+    assert loaded.search_strategy.temp == algorithm.search_strategy.temp < 1
+    assert loaded.search_strategy.iter_count == algorithm.search_strategy.iter_count
+
+
+def test_resume_extended(tmp_path, make_algorithm):
+    checkpoint_file = str(tmp_path / "checkpoint.pkl")
+
+    algorithm = make_algorithm("GA", {"stop_cond": "ngen", "ngen": 10, "verbose": False, "checkpoint_file": checkpoint_file})
+    algorithm.optimize()
+
+    # The stopping condition of the new algorithm is used when resuming
+    extended = make_algorithm("GA", {"stop_cond": "ngen", "ngen": 15, "verbose": False})
+    extended.resume(checkpoint_file)
+
+    assert extended.steps == 15
+    assert extended.fit_history[:10] == list(algorithm.fit_history)
+
+
+def test_checkpoint_time_interval(tmp_path, make_algorithm):
+    checkpoint_file = tmp_path / "checkpoint.pkl"
+    params = {"stop_cond": "ngen", "ngen": 5, "verbose": False, "checkpoint_file": str(checkpoint_file)}
+
+    algorithm = make_algorithm("DE", params)
+    assert algorithm.checkpoint_time == 60
+
+    algorithm = make_algorithm("DE", dict(params, checkpoint_time=0))
+    _interrupt_at(algorithm, 3)
+    with pytest.raises(Interruption):
+        algorithm.optimize()
+
+    loaded = make_algorithm("DE", params)
+    loaded.load_checkpoint()
+    assert loaded.steps == 3
+
+
+def test_checkpoint_errors(tmp_path, make_algorithm):
+    algorithm = make_algorithm("DE", {"stop_cond": "ngen", "ngen": 2, "verbose": False})
+    algorithm.optimize()
+
+    with pytest.raises(ValueError):
+        algorithm.save_checkpoint()
+    with pytest.raises(ValueError):
+        algorithm.load_checkpoint()
+
+    checkpoint_file = tmp_path / "checkpoint.pkl"
+    with open(checkpoint_file, "wb") as file:
+        pickle.dump(-1, file)
+    with pytest.raises(ValueError):
+        algorithm.load_checkpoint(str(checkpoint_file))
+
+
+def test_component_state():
+    op = OperatorReal("Gauss", "default")
+    meta = OperatorMeta("Branch", [op, OperatorReal("Multipoint")], {"p": 0.5})
+    meta.chosen_idx = 1
+
+    state = get_component_state(meta)
+
+    # Functions are left out of the state
+    assert isinstance(state["op_list"][0], ComponentState)
+    assert isinstance(state["op_list"][0]["params"], PartialDict)
+    assert "function" not in state["op_list"][0]["params"]
+
+    state = pickle.loads(pickle.dumps(state))
+
+    new_op = OperatorReal("Gauss", "default")
+    new_meta = OperatorMeta("Branch", [new_op, OperatorReal("Multipoint")], {"p": 0.5})
+    new_op.params["F"] = 100
+    set_component_state(new_meta, state)
+
+    assert new_meta.chosen_idx == 1
+    assert new_op.params["F"] == op.params["F"]
+    assert callable(new_op.params["function"])
+
+
+@pytest.mark.parametrize("history", ["ring", "decimate", "disk"])
+def test_resume_history(tmp_path, history, make_algorithm):
+    params = {"stop_cond": "ngen", "ngen": 20, "verbose": False, "history": history, "history_size": 5, "history_step": 3}
+    checkpoint_file = str(tmp_path / "checkpoint.pkl")
+
+    _seed(1)
+    reference = make_algorithm("DE", dict(params, history_file=str(tmp_path / "reference")))
+    reference.optimize()
+
+    _seed(1)
+    interrupted = make_algorithm("DE", dict(params, history_file=str(tmp_path / "run"), checkpoint_file=checkpoint_file, checkpoint_gens=4))
+    _interrupt_at(interrupted, 10)
+    with pytest.raises(Interruption):
+        interrupted.optimize()
+
+    resumed = make_algorithm("DE", dict(params, history_file=str(tmp_path / "run")))
+    resumed.resume(checkpoint_file)
+
+    assert resumed.fit_history.n_appended == 20
+    np.testing.assert_array_equal(resumed.fit_history.generations, reference.fit_history.generations)
+    np.testing.assert_array_equal(resumed.fit_history.to_array(), reference.fit_history.to_array())
+    np.testing.assert_array_equal(resumed.best_history.to_array(), reference.best_history.to_array())
@@ -0,0 +1,153 @@
+import pytest
+
+import numpy as np
+from metaheuristic_designer import Individual, ObjectiveVectorFunc
+from metaheuristic_designer.benchmarks import MaxOnes, Sphere, ThreeSAT, BinKnapsack, MaxClique, Rastrigin
+from metaheuristic_designer.initializers import UniformVectorInitializer, PermInitializer
+from metaheuristic_designer.operators import OperatorBinary, OperatorReal
+from metaheuristic_designer.strategies import HillClimb, LocalSearch, SA
+from metaheuristic_designer.strategies.VNS import VND
+import metaheuristic_designer as mhd
+
+mhd.reset_seed(0)
+
+
+def random_graph(n_nodes, density):
+    adj_mat = (np.random.random((n_nodes, n_nodes)) < density).astype(int)
+    adj_mat = np.triu(adj_mat, 1)
+    return adj_mat + adj_mat.T
+
+
+problems = [
+    (MaxOnes(50), lambda n: np.random.randint(0, 2, n)),
+    (Sphere(50), lambda n: np.random.uniform(-100, 100, n)),
+    (ThreeSAT(np.random.choice([-1, 1], (200, 3)) * np.random.randint(1, 51, (200, 3))), lambda n: np.random.randint(0, 2, n)),
+    (BinKnapsack(np.random.uniform(1, 10, 50), np.random.uniform(1, 10, 50), 100), lambda n: np.random.randint(0, 2, n)),
+    (MaxClique(random_graph(30, 0.9)), lambda n: np.random.permutation(n)),
+]
+
+
+def random_move(solution):
+    new_solution = solution.copy()
+    n_changes = np.random.randint(0, 4)
+    positions = np.random.choice(solution.size, n_changes, replace=False)
+
+    if solution.dtype.kind == "f":
+        new_solution[positions] = np.random.uniform(-100, 100, n_changes)
+    elif len(np.unique(solution)) == solution.size:
+        new_solution[positions] = new_solution[positions[::-1]]
+    else:
+        new_solution[positions] = 1 - new_solution[positions]
+
+    return new_solution
+
+
+@pytest.mark.parametrize("objfunc, sampler", problems)
+def test_delta_matches_objective(objfunc, sampler):
+    assert objfunc.supports_delta
+
+    for _ in range(200):
+        old_solution = sampler(objfunc.vecsize)
+        old_value = objfunc.objective(old_solution)
+        for _ in range(5):
+            new_solution = random_move(old_solution)
+            changed = np.flatnonzero(new_solution != old_solution)
+
+            delta_value = objfunc.objective_delta(old_solution, old_value, changed, new_solution)
+            np.testing.assert_allclose(delta_value, objfunc.objective(new_solution))
+
+            old_solution, old_value = new_solution, delta_value
+
+
+@pytest.mark.parametrize("objfunc, sampler", problems)
+def test_fitness_delta(objfunc, sampler):
+    parent = Individual(objfunc, sampler(objfunc.vecsize))
+    parent.calculate_fitness()
+
+    for _ in range(50):
+        indiv = Individual(objfunc, random_move(parent.genotype))
+        fitness = objfunc.fitness_delta(indiv, parent)
+
+        assert indiv.objective_value is not None
+        np.testing.assert_allclose(fitness, objfunc.fitness(Individual(objfunc, indiv.genotype)))
+
+
+def test_fitness_delta_fallback():
+    objfunc = Rastrigin(10)
+    assert not objfunc.supports_delta
+
+    parent = Individual(objfunc, np.random.uniform(-5, 5, 10))
+    indiv = Individual(objfunc, random_move(parent.genotype))
+    assert objfunc.fitness_delta(indiv, parent) == objfunc.fitness(indiv)
+    assert objfunc.counter == 2
+
+    # Without the value of the parent the individual is evaluated completely
+    objfunc = Sphere(10)
+    parent = Individual(objfunc, np.random.uniform(-100, 100, 10))
+    indiv = Individual(objfunc, random_move(parent.genotype))
+    assert objfunc.fitness_delta(indiv, parent) == objfunc.fitness(indiv)
+
+
+def test_fitness_delta_penalty():
+    class PenalizedSphere(Sphere):
+        def penalize(self, solution):
+            return np.sum(np.maximum(np.abs(solution) - 50, 0))
+
+    objfunc = PenalizedSphere(10)
+    parent = Individual(objfunc, np.random.uniform(-100, 100, 10))
+    parent.calculate_fitness()
+    assert parent.objective_value == objfunc.objective(parent.genotype)
+
+    indiv = Individual(objfunc, random_move(parent.genotype))
+    np.testing.assert_allclose(objfunc.fitness_delta(indiv, parent), objfunc.fitness(Individual(objfunc, indiv.genotype)))
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        HillClimb(UniformVectorInitializer(50, 0, 1, pop_size=1, dtype=int), OperatorBinary("Flip", {"N": 2})),
+        LocalSearch(UniformVectorInitializer(50, 0, 1, pop_size=1, dtype=int), OperatorBinary("Flip", {"N": 2}), params={"iters": 10}),
+        SA(
+            UniformVectorInitializer(50, 0, 1, pop_size=1, dtype=int),
+            OperatorBinary("Flip", {"N": 2}),
+            {"iter": 10, "temp_init": 1, "alpha": 0.997},
+        ),
+        VND(
+            UniformVectorInitializer(50, 0, 1, pop_size=1, dtype=int),
+            [OperatorBinary("Flip", {"N": 1}), OperatorBinary("Flip", {"N": 3})],
+        ),
+    ],
+)
+def test_strategies_use_delta(strategy):
+    class CountingMaxOnes(MaxOnes):
+        full_evaluations = 0
+
+        def objective(self, solution):
+            self.full_evaluations += 1
+            return super().objective(solution)
+
+    objfunc = CountingMaxOnes(50)
+    population = strategy.initialize(objfunc)
+    population = strategy.evaluate_population(population, objfunc)
+    initial_evaluations = objfunc.full_evaluations
+
+    for _ in range(5):
+        parents = strategy.select_parents(population)
+        offspring = strategy.perturb(parents, objfunc)
+        offspring = strategy.evaluate_population(offspring, objfunc)
+        population = strategy.select_individuals(population, offspring)
+
+        for indiv in offspring:
+            assert indiv.fitness == indiv.genotype.sum()
+
+    assert objfunc.full_evaluations == initial_evaluations
+    assert objfunc.counter > initial_evaluations
+
+
+def test_delta_real_operator():
+    objfunc = Sphere(20)
+    strategy = HillClimb(UniformVectorInitializer(20, -100, 100, pop_size=1), OperatorReal("RandNoise", {"distrib": "Gauss", "F": 1e-3}))
+    population = strategy.evaluate_population(strategy.initialize(objfunc), objfunc)
+
+    offspring = strategy.evaluate_population(strategy.perturb(population, objfunc), objfunc)
+    np.testing.assert_allclose(offspring[0].fitness, -np.sum(offspring[0].genotype ** 2))
@@ -0,0 +1,414 @@
+import pytest
+
+import asyncio
+import time
+import numpy as np
+from metaheuristic_designer import Individual
+from metaheuristic_designer.evaluators import *
+from metaheuristic_designer.benchmarks import Sphere
+from metaheuristic_designer.encodings import TypeCastEncoding
+from metaheuristic_designer.initializers import UniformVectorInitializer
+from metaheuristic_designer.operators import OperatorReal
+from metaheuristic_designer.strategies import HillClimb, LocalSearch, GA
+from metaheuristic_designer.selectionMethods import ParentSelection, SurvivorSelection
+from metaheuristic_designer.algorithms import GeneralAlgorithm, MemeticAlgorithm
+import metaheuristic_designer as mhd
+
+mhd.reset_seed(0)
+
+
+def make_population(objfunc, pop_size, encoding=None):
+    return [Individual(objfunc, np.random.uniform(-100, 100, 10), encoding=encoding) for _ in range(pop_size)]
+
+
+@pytest.mark.parametrize("pop_size", [1, 7, 100])
+def test_serial_evaluator(pop_size):
+    objfunc = Sphere(10)
+    population = make_population(objfunc, pop_size)
+
+    evaluator = SerialEvaluator()
+    population = evaluator(population, objfunc)
+
+    assert objfunc.counter == pop_size
+    for indiv in population:
+        assert indiv.fitness_calculated
+        assert indiv.fitness == -np.sum(indiv.genotype**2)
+
+
+def test_serial_evaluator_batch():
+    objfunc = Sphere(10)
+    population = make_population(objfunc, 20)
+    population[0].calculate_fitness()
+
+    calls = []
+    objective_batch = objfunc.objective_batch
+
+    def counted_batch(solutions):
+        calls.append(solutions.shape)
+        return objective_batch(solutions)
+
+    objfunc.objective_batch = counted_batch
+    population = SerialEvaluator()(population, objfunc)
+
+    assert calls == [(19, 10)]
+    assert objfunc.counter == 20
+    for indiv in population:
+        assert indiv.fitness == pytest.approx(-np.sum(indiv.genotype**2))
+
+
+def test_serial_evaluator_no_batch():
+    objfunc = mhd.ObjectiveFromLambda(lambda x: np.sum(x**2), 10, "min")
+    assert not objfunc.supports_batch
+
+    population = make_population(objfunc, 20)
+    population = SerialEvaluator()(population, objfunc)
+
+    assert objfunc.counter == 20
+    for indiv in population:
+        assert indiv.fitness == pytest.approx(-np.sum(indiv.genotype**2))
+
+
+@pytest.mark.parametrize("pop_size", [1, 7, 100])
+@pytest.mark.parametrize("threads", [1, 3])
+def test_process_evaluator(pop_size, threads):
+    objfunc = Sphere(10)
+    population = make_population(objfunc, pop_size)
+
+    evaluator = ProcessEvaluator(threads)
+    evaluator.start(objfunc)
+    try:
+        population = evaluator(population, objfunc)
+    finally:
+        evaluator.shutdown()
+
+    assert not evaluator.running
+    assert objfunc.counter == pop_size
+    for indiv in population:
+        assert indiv.fitness_calculated
+        assert indiv.fitness == pytest.approx(-np.sum(indiv.genotype**2))
+
+
+def test_process_evaluator_reuses_pool():
+    objfunc = Sphere(10)
+
+    evaluator = ProcessEvaluator(2)
+    evaluator.start(objfunc)
+    try:
+        pool = evaluator._pool
+        for _ in range(5):
+            evaluator(make_population(objfunc, 20), objfunc)
+            assert evaluator._pool is pool
+    finally:
+        evaluator.shutdown()
+
+    assert objfunc.counter == 100
+
+
+def test_process_evaluator_skips_evaluated():
+    objfunc = Sphere(10)
+    population = make_population(objfunc, 20)
+    for indiv in population[:10]:
+        indiv.calculate_fitness()
+
+    evaluator = ProcessEvaluator(2)
+    try:
+        population = evaluator(population, objfunc)
+    finally:
+        evaluator.shutdown()
+
+    assert objfunc.counter == 20
+    assert all(indiv.fitness_calculated for indiv in population)
+
+
+def test_process_evaluator_mixed_encodings():
+    objfunc = Sphere(10)
+    encoding = TypeCastEncoding(float, int)
+    population = make_population(objfunc, 10) + make_population(objfunc, 10, encoding)
+
+    evaluator = ProcessEvaluator(2)
+    try:
+        population = evaluator(population, objfunc)
+    finally:
+        evaluator.shutdown()
+
+    for indiv in population:
+        assert indiv.fitness == pytest.approx(-np.sum(indiv.encoding.decode(indiv.genotype) ** 2))
+
+
+def test_algorithm_evaluator_lifecycle():
+    objfunc = Sphere(10)
+    initializer = UniformVectorInitializer(10, objfunc.low_lim, objfunc.up_lim, pop_size=20)
+    search_strat = HillClimb(initializer, OperatorReal("Gauss", {"F": 1}))
+
+    evaluator = ProcessEvaluator(2)
+    algorithm = GeneralAlgorithm(objfunc, search_strat, {"stop_cond": "ngen", "ngen": 5, "verbose": False}, evaluator=evaluator)
+    algorithm.optimize()
+
+    assert not evaluator.running
+    assert objfunc.counter == 20 * 6
+
+
+@pytest.mark.parametrize("pop_size", [1, 7, 100])
+@pytest.mark.parametrize("threads", [1, 3])
+def test_shared_memory_evaluator(pop_size, threads):
+    objfunc = Sphere(10)
+
+    evaluator = SharedMemoryEvaluator(threads)
+    evaluator.start(objfunc)
+    try:
+        population = evaluator(make_population(objfunc, pop_size), objfunc)
+        genotype_block = evaluator._genotype_shm.name
+
+        # The shared blocks are reused while they are big enough and grow otherwise
+        evaluator(make_population(objfunc, pop_size), objfunc)
+        assert evaluator._genotype_shm.name == genotype_block
+        evaluator(make_population(objfunc, 2 * pop_size), objfunc)
+        assert evaluator._genotype_buffer.shape[0] >= 2 * pop_size
+    finally:
+        evaluator.shutdown()
+
+    assert not evaluator.running
+    assert evaluator._genotype_shm is None
+    assert objfunc.counter == 4 * pop_size
+    for indiv in population:
+        assert indiv.fitness_calculated
+        assert indiv.fitness == pytest.approx(-np.sum(indiv.genotype**2))
+
+
+def test_shared_memory_evaluator_images():
+    objfunc = mhd.ObjectiveFromLambda(lambda x: np.mean(x), 3 * 32 * 32)
+    population = [Individual(objfunc, np.random.randint(0, 256, (32, 32, 3), dtype=np.uint8)) for _ in range(20)]
+    population[0].calculate_fitness()
+
+    evaluator = SharedMemoryEvaluator(2)
+    try:
+        population = evaluator(population, objfunc)
+    finally:
+        evaluator.shutdown()
+
+    assert objfunc.counter == 20
+    for indiv in population:
+        assert indiv.fitness == pytest.approx(np.mean(indiv.genotype))
+
+
+def test_shared_memory_evaluator_mixed_encodings():
+    objfunc = Sphere(10)
+    encoding = TypeCastEncoding(float, int)
+    population = make_population(objfunc, 10) + make_population(objfunc, 10, encoding)
+
+    evaluator = SharedMemoryEvaluator(2)
+    try:
+        population = evaluator(population, objfunc)
+    finally:
+        evaluator.shutdown()
+
+    assert evaluator._genotype_shm is None
+    for indiv in population:
+        assert indiv.fitness == pytest.approx(-np.sum(indiv.encoding.decode(indiv.genotype) ** 2))
+
+
+@pytest.mark.parametrize("pop_size", [1, 7, 100])
+@pytest.mark.parametrize("threads", [1, 3])
+def test_thread_evaluator(pop_size, threads):
+    objfunc = Sphere(10)
+    population = make_population(objfunc, pop_size)
+
+    evaluator = ThreadEvaluator(threads)
+    evaluator.start(objfunc)
+    try:
+        pool = evaluator._executor
+        population = evaluator(population, objfunc)
+        evaluator(make_population(objfunc, pop_size), objfunc)
+        assert evaluator._executor is pool
+    finally:
+        evaluator.shutdown()
+
+    assert not evaluator.running
+    assert objfunc.counter == 2 * pop_size
+    for indiv in population:
+        assert indiv.fitness_calculated
+        assert indiv.fitness == pytest.approx(-np.sum(indiv.genotype**2))
+
+
+def test_thread_evaluator_mixed_encodings():
+    objfunc = mhd.ObjectiveFromLambda(lambda x: np.sum(x**2), 10, "min")
+    encoding = TypeCastEncoding(float, int)
+    population = make_population(objfunc, 10) + make_population(objfunc, 10, encoding)
+    population[0].calculate_fitness()
+
+    evaluator = ThreadEvaluator(2)
+    try:
+        population = evaluator(population, objfunc)
+    finally:
+        evaluator.shutdown()
+
+    assert objfunc.counter == 20
+    for indiv in population:
+        assert indiv.fitness == pytest.approx(-np.sum(indiv.encoding.decode(indiv.genotype) ** 2))
+
+
+@pytest.mark.parametrize(
+    "backend, evaluator_class",
+    [
+        ("serial", SerialEvaluator),
+        ("process", ProcessEvaluator),
+        ("shared_memory", SharedMemoryEvaluator),
+        ("thread", ThreadEvaluator),
+        ("async", AsyncEvaluator),
+    ],
+)
+def test_algorithm_parallel_backend(backend, evaluator_class):
+    objfunc = Sphere(10)
+    initializer = UniformVectorInitializer(10, objfunc.low_lim, objfunc.up_lim, pop_size=20)
+    search_strat = HillClimb(initializer, OperatorReal("Gauss", {"F": 1}))
+    params = {"stop_cond": "ngen", "ngen": 3, "verbose": False, "threads": 2, "parallel_backend": backend}
+
+    algorithm = GeneralAlgorithm(objfunc, search_strat, params)
+    assert isinstance(algorithm.evaluator, evaluator_class)
+    assert algorithm.parallel == (backend != "serial")
+    algorithm.optimize()
+    assert not algorithm.evaluator.running
+
+    search_strat = GA(
+        initializer,
+        OperatorReal("Gauss", {"F": 1}),
+        OperatorReal("Multipoint"),
+        ParentSelection("Best", {"amount": 10}),
+        SurvivorSelection("(m+n)"),
+    )
+    local_search = LocalSearch(initializer, OperatorReal("Gauss", {"F": 1}), params={"iters": 10})
+    algorithm = MemeticAlgorithm(objfunc, search_strat, local_search, ParentSelection("Best", {"amount": 5}), params)
+    assert isinstance(algorithm.evaluator, evaluator_class)
+    algorithm.optimize()
+    assert not algorithm.evaluator.running
+
+    with pytest.raises(ValueError):
+        GeneralAlgorithm(objfunc, search_strat, {"parallel_backend": "gpu"})
+
+
+def test_algorithm_default_evaluator():
+    objfunc = Sphere(10)
+    initializer = UniformVectorInitializer(10, objfunc.low_lim, objfunc.up_lim, pop_size=20)
+    search_strat = HillClimb(initializer, OperatorReal("Gauss", {"F": 1}))
+
+    algorithm = GeneralAlgorithm(objfunc, search_strat, {"parallel": True, "threads": 2})
+    assert isinstance(algorithm.evaluator, ProcessEvaluator)
+
+    algorithm = GeneralAlgorithm(objfunc, search_strat, {})
+    assert isinstance(algorithm.evaluator, SerialEvaluator)
+
+
+class SlowSphere(Sphere):
+    def __init__(self, vecsize, delay):
+        super().__init__(vecsize)
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def objective_async(self, solution):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return self.objective(solution)
+
+
+@pytest.mark.parametrize("pop_size", [1, 7, 100])
+@pytest.mark.parametrize("max_concurrency", [1, 10, 1000])
+def test_async_evaluator(pop_size, max_concurrency):
+    objfunc = SlowSphere(10, 0.001)
+    assert objfunc.supports_async
+    population = make_population(objfunc, pop_size)
+
+    evaluator = AsyncEvaluator(max_concurrency)
+    evaluator.start(objfunc)
+    try:
+        population = evaluator(population, objfunc)
+    finally:
+        evaluator.shutdown()
+
+    assert not evaluator.running
+    assert objfunc.counter == pop_size
+    assert objfunc.max_in_flight <= max_concurrency
+    for indiv in population:
+        assert indiv.fitness_calculated
+        assert indiv.fitness == pytest.approx(-np.sum(indiv.genotype**2))
+
+
+def test_algorithm_async_backend():
+    objfunc = SlowSphere(10, 0.001)
+    initializer = UniformVectorInitializer(10, objfunc.low_lim, objfunc.up_lim, pop_size=20)
+    search_strat = HillClimb(initializer, OperatorReal("Gauss", {"F": 1}))
+    params = {"stop_cond": "ngen", "ngen": 3, "verbose": False, "parallel_backend": "async", "max_concurrency": 5}
+
+    algorithm = GeneralAlgorithm(objfunc, search_strat, params)
+    assert isinstance(algorithm.evaluator, AsyncEvaluator)
+    assert algorithm.evaluator.max_concurrency == 5
+    algorithm.optimize()
+
+    assert not algorithm.evaluator.running
+    assert 1 < objfunc.max_in_flight <= 5
+
+
+def test_async_evaluator_overlaps():
+    objfunc = SlowSphere(10, 0.05)
+    population = make_population(objfunc, 100)
+
+    evaluator = AsyncEvaluator(100)
+    try:
+        start = time.time()
+        evaluator(population, objfunc)
+        elapsed = time.time() - start
+    finally:
+        evaluator.shutdown()
+
+    assert objfunc.max_in_flight == 100
+    assert elapsed < 100 * 0.05 / 4
+
+
+def test_async_evaluator_sync_objective():
+    objfunc = Sphere(10)
+    assert not objfunc.supports_async
+    population = make_population(objfunc, 20)
+    population[0].calculate_fitness()
+
+    evaluator = AsyncEvaluator()
+    try:
+        population = evaluator(population, objfunc)
+    finally:
+        evaluator.shutdown()
+
+    assert objfunc.counter == 20
+    for indiv in population:
+        assert indiv.fitness == pytest.approx(-np.sum(indiv.genotype**2))
+
+
+def test_async_evaluator_errors():
+    class FailingSphere(Sphere):
+        async def objective_async(self, solution):
+            raise RuntimeError("Simulation failed")
+
+    with pytest.raises(ValueError):
+        AsyncEvaluator(0)
+
+    objfunc = FailingSphere(10)
+    evaluator = AsyncEvaluator()
+    try:
+        with pytest.raises(RuntimeError):
+            evaluator(make_population(objfunc, 5), objfunc)
+    finally:
+        evaluator.shutdown()
+
+
+def test_algorithm_async_evaluator():
+    objfunc = SlowSphere(10, 0.001)
+    initializer = UniformVectorInitializer(10, objfunc.low_lim, objfunc.up_lim, pop_size=20)
+    search_strat = HillClimb(initializer, OperatorReal("Gauss", {"F": 1}))
+
+    evaluator = AsyncEvaluator(20)
+    algorithm = GeneralAlgorithm(objfunc, search_strat, {"stop_cond": "ngen", "ngen": 5, "verbose": False}, evaluator=evaluator)
+    algorithm.optimize()
+
+    assert not evaluator.running
+    assert objfunc.counter == 20 * 6
+    assert objfunc.max_in_flight == 20
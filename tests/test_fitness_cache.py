@@ -0,0 +1,177 @@
+import pytest
+
+import numpy as np
+from metaheuristic_designer import Individual, Population
+from metaheuristic_designer.benchmarks import MaxOnes, Sphere
+from metaheuristic_designer.encodings import TypeCastEncoding
+from metaheuristic_designer.evaluators import SerialEvaluator, ThreadEvaluator, ProcessEvaluator, SharedMemoryEvaluator, AsyncEvaluator
+from metaheuristic_designer.initializers import UniformVectorInitializer
+from metaheuristic_designer.operators import OperatorBinary
+from metaheuristic_designer.selectionMethods import ParentSelection, SurvivorSelection
+from metaheuristic_designer.strategies import GA
+from metaheuristic_designer.algorithms import GeneralAlgorithm
+import metaheuristic_designer as mhd
+
+mhd.reset_seed(0)
+
+
+def make_population(objfunc, n_unique, n_repeats):
+    genotypes = np.random.randint(0, 2, (n_unique, objfunc.vecsize))
+    return [Individual(objfunc, genotypes[idx % n_unique].copy()) for idx in range(n_unique * n_repeats)]
+
+
+def test_cache_disabled():
+    objfunc = MaxOnes(20)
+    population = make_population(objfunc, 5, 2)
+    for indiv in population:
+        indiv.calculate_fitness()
+
+    assert objfunc.counter == 10
+    assert objfunc.true_evaluations == 10
+    assert objfunc.cache_hits == 0
+    assert objfunc.cache_misses == 0
+
+
+def test_cache_single():
+    objfunc = MaxOnes(20)
+    objfunc.enable_cache()
+    population = make_population(objfunc, 5, 3)
+    for indiv in population:
+        indiv.calculate_fitness()
+
+    assert objfunc.counter == 15
+    assert objfunc.true_evaluations == 5
+    assert objfunc.cache_hits == 10
+    assert objfunc.cache_misses == 5
+    for indiv in population:
+        assert indiv.fitness == indiv.genotype.sum()
+
+
+@pytest.mark.parametrize("evaluator", [SerialEvaluator(), ThreadEvaluator(2), ProcessEvaluator(2), SharedMemoryEvaluator(2)])
+def test_cache_evaluators(evaluator):
+    objfunc = MaxOnes(20)
+    objfunc.enable_cache()
+    population = make_population(objfunc, 10, 4)
+
+    try:
+        evaluator(population[:10], objfunc)
+        assert objfunc.true_evaluations == 10
+
+        evaluator(population, objfunc)
+    finally:
+        evaluator.shutdown()
+
+    assert objfunc.counter == 40
+    assert objfunc.cache_hits == 30
+    assert objfunc.true_evaluations == objfunc.counter - objfunc.cache_hits
+    for indiv in population:
+        assert indiv.fitness == indiv.genotype.sum()
+
+
+@pytest.mark.parametrize(
+    "evaluator", [SerialEvaluator(), ThreadEvaluator(2), ProcessEvaluator(2), SharedMemoryEvaluator(2), AsyncEvaluator(10)]
+)
+def test_cache_repeated_in_batch(evaluator):
+    objfunc = MaxOnes(20)
+    objfunc.enable_cache()
+    population = make_population(objfunc, 5, 4)
+
+    try:
+        evaluator(population, objfunc)
+    finally:
+        evaluator.shutdown()
+
+    # Each distinct genotype is evaluated once, the copies take its value
+    assert objfunc.counter == 20
+    assert objfunc.true_evaluations == 5
+    assert objfunc.cache_hits == 15
+    assert objfunc.cache_misses == 5
+    for indiv in population:
+        assert indiv.fitness == indiv.genotype.sum()
+
+
+def test_cache_disabled_repeated_in_batch():
+    objfunc = MaxOnes(20)
+    population = make_population(objfunc, 5, 4)
+
+    np.testing.assert_array_equal(objfunc.fitness_batch(population), [indiv.genotype.sum() for indiv in population])
+    assert objfunc.true_evaluations == 20
+
+
+def test_cache_population():
+    objfunc = Sphere(5)
+    objfunc.enable_cache()
+    genotypes = np.random.uniform(-100, 100, (10, 5))
+    population = Population(objfunc, np.vstack([genotypes, genotypes]))
+
+    population.evaluate()
+
+    # The repeated genotypes are evaluated once
+    assert objfunc.counter == 20
+    assert objfunc.true_evaluations == 10
+    assert objfunc.cache_hits == 10
+    np.testing.assert_allclose(population.fitness, -np.sum(population.genotype_matrix**2, axis=1))
+
+    Population(objfunc, genotypes).evaluate()
+    assert objfunc.counter == 30
+    assert objfunc.cache_hits == 20
+
+
+def test_cache_eviction():
+    objfunc = MaxOnes(20)
+    objfunc.enable_cache(max_size=3)
+    population = make_population(objfunc, 5, 1)
+
+    for indiv in population:
+        objfunc.fitness(indiv)
+    assert len(objfunc.cache) == 3
+
+    # The first individuals were discarded, the most recent ones are kept
+    objfunc.fitness(population[0])
+    objfunc.fitness(population[4])
+    assert objfunc.cache_hits == 1
+    assert objfunc.true_evaluations == 6
+
+    objfunc.enable_cache(max_size=1)
+    assert len(objfunc.cache) == 1
+
+    with pytest.raises(ValueError):
+        objfunc.enable_cache(0)
+
+    objfunc.disable_cache()
+    assert objfunc.cache is None
+
+
+def test_cache_key_encoding():
+    objfunc = Sphere(5)
+    objfunc.enable_cache()
+    genotype = np.random.uniform(-100, 100, 5)
+
+    objfunc.fitness(Individual(objfunc, genotype))
+    objfunc.fitness(Individual(objfunc, genotype, encoding=TypeCastEncoding(float, int)))
+    objfunc.fitness(Individual(objfunc, genotype), adjusted=False)
+
+    assert objfunc.true_evaluations == 3
+    assert objfunc.cache_hits == 0
+
+
+def test_cache_algorithm():
+    objfunc = MaxOnes(20)
+    objfunc.enable_cache()
+
+    pop_init = UniformVectorInitializer(20, 0, 1, pop_size=30, dtype=int)
+    search_strat = GA(
+        pop_init,
+        OperatorBinary("Flip", {"N": 1}),
+        OperatorBinary("Multipoint"),
+        ParentSelection("Best", {"amount": 10}),
+        SurvivorSelection("(m+n)"),
+        {"pcross": 0.8, "pmut": 0.2},
+    )
+    alg = GeneralAlgorithm(objfunc, search_strat, {"stop_cond": "ngen", "ngen": 20, "verbose": False})
+    alg.optimize()
+
+    state = alg.get_state()
+    assert objfunc.cache_hits > 0
+    assert state["evaluations"] == objfunc.true_evaluations + objfunc.cache_hits
+    assert state["fitness_cache"]["hits"] == objfunc.cache_hits
@@ -0,0 +1,234 @@
+import pytest
+
+import json
+import pickle
+import numpy as np
+from metaheuristic_designer import History
+from metaheuristic_designer.algorithms import GeneralAlgorithm
+from metaheuristic_designer.benchmarks import Sphere
+from metaheuristic_designer.histories import ListHistory, NullHistory, RingHistory, DecimatedHistory, DiskHistory
+from metaheuristic_designer.initializers import UniformVectorInitializer
+from metaheuristic_designer.operators import OperatorReal
+from metaheuristic_designer.strategies import DE
+from metaheuristic_designer.utils import NumpyEncoder
+import metaheuristic_designer as mhd
+
+mhd.reset_seed(0)
+
+
+def _values(n, shape=(3,)):
+    return [np.full(shape, idx, dtype=float) for idx in range(n)]
+
+
+def _algorithm(params):
+    strategy = DE(UniformVectorInitializer(5, -100, 100, pop_size=10), OperatorReal("DE/best/1", {"F": 0.7, "Cr": 0.8}))
+    return GeneralAlgorithm(Sphere(5), strategy, dict({"stop_cond": "ngen", "ngen": 25, "verbose": False}, **params))
+
+
+def test_list_history():
+    history = ListHistory()
+    for value in _values(5):
+        history.append(value)
+
+    assert isinstance(history, History)
+    assert len(history) == history.n_appended == 5
+    np.testing.assert_array_equal(history.generations, np.arange(5))
+    np.testing.assert_array_equal(history[-1], history.last)
+    assert history.to_array().shape == (5, 3)
+
+    history.clear()
+    assert len(history) == history.n_appended == 0
+    assert history.last is None
+
+
+def test_list_history_ragged():
+    history = ListHistory()
+    history.append(np.zeros(2))
+    history.append(np.zeros(3))
+
+    array = history.to_array()
+    assert array.dtype == object
+    assert len(array) == 2
+
+
+def test_null_history():
+    history = NullHistory()
+    for value in _values(5):
+        history.append(value)
+
+    assert len(history) == 0
+    assert history.n_appended == 5
+    assert list(history) == []
+    assert len(history.generations) == 0
+    np.testing.assert_array_equal(history.last, np.full(3, 4))
+    with pytest.raises(IndexError):
+        history[0]
+
+
+@pytest.mark.parametrize("size", [1, 4, 10, 20])
+def test_ring_history(size):
+    history = RingHistory(size)
+    for value in _values(10):
+        history.append(value)
+
+    kept = min(size, 10)
+    assert len(history) == kept
+    assert history.n_appended == 10
+    np.testing.assert_array_equal(history.generations, np.arange(10 - kept, 10))
+    np.testing.assert_array_equal(history.to_array()[:, 0], history.generations)
+    np.testing.assert_array_equal(history[-1], np.full(3, 9))
+    assert len(history[1:]) == kept - 1
+
+
+@pytest.mark.parametrize("step", [1, 3, 10, 20])
+def test_decimated_history(step):
+    history = DecimatedHistory(step)
+    for value in _values(10):
+        history.append(value)
+
+    np.testing.assert_array_equal(history.generations, np.arange(0, 10, step))
+    np.testing.assert_array_equal(history.to_array()[:, 0], history.generations)
+    assert history.n_appended == 10
+
+
+@pytest.mark.parametrize("history_class", [RingHistory, DecimatedHistory])
+def test_invalid_size(history_class):
+    with pytest.raises(ValueError):
+        history_class(0)
+
+
+@pytest.mark.parametrize("shape", [(), (3,), (2, 4, 4)])
+def test_disk_history(tmp_path, shape):
+    file_name = str(tmp_path / "history.npy")
+    history = DiskHistory(file_name)
+    for value in _values(6, shape):
+        history.append(value)
+
+    array = history.to_array()
+    assert isinstance(array, np.memmap)
+    assert array.shape == (6,) + shape
+    np.testing.assert_array_equal(history[2], np.full(shape, 2))
+    np.testing.assert_array_equal(history[-1], np.full(shape, 5))
+    with pytest.raises(IndexError):
+        history[6]
+
+    # The file can be read with numpy while the history is being written
+    history.append(np.full(shape, 6.0))
+    history.flush()
+    loaded = np.load(file_name, mmap_mode="r")
+    assert loaded.shape == (7,) + shape
+    np.testing.assert_array_equal(loaded[:, ...].reshape(7, -1)[:, 0], np.arange(7))
+
+    # An existing file is opened to read its values
+    history.close()
+    reopened = DiskHistory(file_name)
+    assert len(reopened) == 7
+    np.testing.assert_array_equal(reopened.to_array(), loaded)
+
+
+def test_disk_history_shape_mismatch(tmp_path):
+    history = DiskHistory(str(tmp_path / "history.npy"))
+    history.append(np.zeros(3))
+    with pytest.raises(ValueError):
+        history.append(np.zeros(4))
+
+
+def test_disk_history_clear(tmp_path):
+    file_name = tmp_path / "history.npy"
+    history = DiskHistory(str(file_name), dtype=np.float32)
+    for value in _values(3):
+        history.append(value)
+    assert history.to_array().dtype == np.float32
+
+    history.clear()
+    assert not file_name.exists()
+    assert len(history) == 0
+
+    history.append(np.zeros(5))
+    assert history.to_array().shape == (1, 5)
+
+
+def test_disk_history_pickle(tmp_path):
+    history = DiskHistory(str(tmp_path / "history.npy"))
+    for value in _values(4):
+        history.append(value)
+    dumped = pickle.dumps(history)
+
+    # Values recorded after the history was stored are discarded when it is restored
+    history.append(np.full(3, 4.0))
+    history.close()
+    restored = pickle.loads(dumped)
+    assert len(restored) == 4
+    restored.append(np.full(3, 10.0))
+    np.testing.assert_array_equal(restored.to_array()[:, 0], [0, 1, 2, 3, 10])
+
+
+@pytest.mark.parametrize(
+    "params, history_class",
+    [
+        ({}, ListHistory),
+        ({"history": "full"}, ListHistory),
+        ({"history": "none"}, NullHistory),
+        ({"history": "ring", "history_size": 5}, RingHistory),
+        ({"history": "decimate", "history_step": 5}, DecimatedHistory),
+        ({"history": "disk"}, DiskHistory),
+    ],
+)
+def test_algorithm_history(tmp_path, params, history_class):
+    algorithm = _algorithm(dict(params, history_file=str(tmp_path / "run")))
+    algorithm.optimize()
+
+    assert isinstance(algorithm.fit_history, history_class)
+    assert isinstance(algorithm.best_history, history_class)
+    assert algorithm.fit_history.n_appended == algorithm.steps == 25
+    assert len(algorithm.best_history) == len(algorithm.fit_history)
+
+    assert algorithm.fit_history.last == algorithm.best_solution()[1]
+    np.testing.assert_array_equal(algorithm.best_history.last, algorithm.best_solution()[0])
+    if history_class in [ListHistory, RingHistory, DiskHistory]:
+        assert algorithm.fit_history[-1] == algorithm.best_solution()[1]
+
+    state = algorithm.get_state(show_fit_history=True, show_gen_history=True)
+    assert len(state["fit_history"]) == len(algorithm.fit_history)
+    assert len(state["best_history"]) == len(algorithm.best_history)
+    if len(algorithm.fit_history) < 25:
+        np.testing.assert_array_equal(state["fit_history_generations"], algorithm.fit_history.generations)
+    else:
+        assert "fit_history_generations" not in state
+    json.dumps(state, cls=NumpyEncoder)
+
+    algorithm.display_report(show_plots=False)
+
+
+def test_algorithm_disk_history_files(tmp_path):
+    algorithm = _algorithm({"history": "disk", "history_file": str(tmp_path / "run")})
+    algorithm.optimize()
+    algorithm.best_history.flush()
+    algorithm.fit_history.flush()
+
+    best = np.load(tmp_path / "run_best.npy", mmap_mode="r")
+    fitness = np.load(tmp_path / "run_fitness.npy", mmap_mode="r")
+    assert best.shape == (25, 5)
+    assert fitness.shape == (25,)
+    np.testing.assert_array_equal(fitness, algorithm.fit_history.to_array())
+
+
+def test_algorithm_separate_fitness_history():
+    algorithm = _algorithm({"history": "none", "fit_history": "full"})
+    algorithm.optimize()
+
+    assert isinstance(algorithm.best_history, NullHistory)
+    assert len(algorithm.fit_history) == 25
+
+
+def test_algorithm_history_restart():
+    algorithm = _algorithm({"history": "ring", "history_size": 5})
+    algorithm.optimize()
+    algorithm.restart()
+
+    assert len(algorithm.fit_history) == algorithm.fit_history.n_appended == 0
+
+
+def test_invalid_history_mode():
+    with pytest.raises(ValueError):
+        _algorithm({"history": "unknown"})
@@ -0,0 +1,66 @@
+import pytest
+
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ["matplotlib", "pandas", "enlighten", "pyparsing", "scipy", "skimage"]
+
+
+def _loaded_modules(code):
+    """
+    Runs some code in a new interpreter and returns the heavy modules that were imported.
+    """
+
+    script = f"""
+import json
+import sys
+{code}
+print(json.dumps(sorted(name for name in {HEAVY_MODULES!r} if name in sys.modules)))
+"""
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_package_import():
+    assert _loaded_modules("import metaheuristic_designer") == []
+
+
+def test_subpackages_import():
+    code = """
+from metaheuristic_designer import algorithms, strategies, operators, selectionMethods, initializers, encodings
+from metaheuristic_designer import benchmarks, simple, evaluators, histories, sinks
+"""
+    assert _loaded_modules(code) == []
+
+
+def test_optimization_without_heavy_imports():
+    code = """
+from metaheuristic_designer.algorithms import GeneralAlgorithm
+from metaheuristic_designer.benchmarks import Sphere
+from metaheuristic_designer.initializers import UniformVectorInitializer
+from metaheuristic_designer.operators import OperatorReal
+from metaheuristic_designer.strategies import DE
+
+strategy = DE(UniformVectorInitializer(5, -100, 100, pop_size=10), OperatorReal("DE/best/1", {"F": 0.7, "Cr": 0.8}))
+algorithm = GeneralAlgorithm(Sphere(5), strategy, {"stop_cond": "ngen", "ngen": 5, "verbose": False})
+algorithm.optimize()
+algorithm.display_report(show_plots=False)
+"""
+    assert _loaded_modules(code) == []
+
+
+@pytest.mark.parametrize(
+    "code, module",
+    [
+        ("from metaheuristic_designer.Algorithm import parse_stopping_cond; parse_stopping_cond('ngen or neval')", "pyparsing"),
+        (
+            "from metaheuristic_designer.operators.vector_operator_functions import sample_distribution, ProbDist; "
+            "sample_distribution(ProbDist.GAUSS, 3)",
+            "scipy",
+        ),
+    ],
+)
+def test_lazy_import_on_use(code, module):
+    assert module in _loaded_modules(code)
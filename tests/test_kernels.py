@@ -0,0 +1,179 @@
+import pytest
+
+import types
+import random
+import numpy as np
+from metaheuristic_designer import kernels, kernel_backends, set_kernel_backend
+from metaheuristic_designer.kernels import Kernel
+import metaheuristic_designer.operators.vector_operator_functions as vec_ops
+import metaheuristic_designer.selectionMethods.survivor_selection_functions as surv_ops
+import metaheuristic_designer.benchmarks.benchmark_funcs as bench_funcs
+import metaheuristic_designer.benchmarks.classic_problems as classic_problems
+import metaheuristic_designer as mhd
+
+mhd.reset_seed(0)
+
+
+class FakeNumbaError(Exception):
+    pass
+
+
+def fake_numba(compiles=True):
+    """
+    Stand-in for the numba module whose 'njit' returns the function unchanged, or a function that fails to compile.
+    """
+
+    def njit(**kwargs):
+        def decorator(func):
+            if compiles:
+                return func
+
+            def failing(*args):
+                raise FakeNumbaError("Compilation failed")
+
+            return failing
+
+        return decorator
+
+    return types.SimpleNamespace(njit=njit, core=types.SimpleNamespace(errors=types.SimpleNamespace(NumbaError=FakeNumbaError)))
+
+
+@pytest.fixture
+def restore_backend():
+    yield
+    set_kernel_backend("auto")
+
+
+def test_kernel_backends():
+    backends = kernel_backends()
+
+    assert set(backends) == {"pmx", "order_cross", "sbx", "cro_set_larvae", "max_clique", "mod_schwefel", "katsuura"}
+    assert all(backend in ("numba", "numpy") for backend in backends.values())
+
+
+def test_set_backend(restore_backend):
+    set_kernel_backend("numpy")
+    assert all(backend == "numpy" for backend in kernel_backends().values())
+
+    with pytest.raises(ValueError):
+        set_kernel_backend("cuda")
+
+
+def test_kernels_numpy_fallback(restore_backend):
+    kernel_backends()
+
+    # Without numba no kernel falls back to running its loops in the interpreter
+    assert all(kern.fallback is not kern.func for kern in kernels._kernels.values())
+
+    set_kernel_backend("numpy")
+    surv_ops._settle_larvae(np.zeros(3), np.zeros(3, dtype=bool), np.ones(2), np.array([[0], [1]]))
+    assert surv_ops._settle_larvae._impl is surv_ops._settle_larvae_numpy
+
+
+def test_numba_missing(monkeypatch, restore_backend):
+    monkeypatch.setattr(kernels, "_numba", False)
+
+    with pytest.raises(ImportError):
+        set_kernel_backend("numba")
+
+    set_kernel_backend("auto")
+    assert all(backend == "numpy" for backend in kernel_backends().values())
+
+
+def test_numba_backend(monkeypatch, restore_backend):
+    monkeypatch.setattr(kernels, "_numba", fake_numba())
+    set_kernel_backend("numba")
+    assert all(backend == "numba" for backend in kernel_backends().values())
+
+    vector1 = np.random.permutation(20)
+    vector2 = np.random.permutation(20)
+    child = vec_ops.pmx(vector1, vector2)
+    assert np.array_equal(np.sort(child), np.arange(20))
+    assert vec_ops._pmx_kernel._compiled
+
+
+def test_compilation_failure(monkeypatch, restore_backend):
+    monkeypatch.setattr(kernels, "_numba", fake_numba(compiles=False))
+    set_kernel_backend("auto")
+
+    solution = np.random.uniform(-100, 100, 10)
+    with pytest.warns(UserWarning):
+        value = bench_funcs._mod_schwefel(solution)
+
+    assert bench_funcs._mod_schwefel_kernel.backend == "numpy"
+    np.testing.assert_allclose(value, bench_funcs._mod_schwefel_numpy(solution))
+
+
+def test_kernel_decorator():
+    test_kernel = Kernel(lambda x: x + 1, fallback=lambda x: x + 1.0, name="test")
+    assert test_kernel.name == "test"
+    assert test_kernel(1) == 2
+
+
+@pytest.mark.parametrize("size", [3, 4, 10, 50])
+def test_permutation_kernels(size):
+    for _ in range(200):
+        vector1 = np.random.permutation(size)
+        vector2 = np.random.permutation(size)
+        cross_point1 = random.randrange(0, size - 2)
+        cross_point2 = random.randrange(cross_point1, size)
+
+        expected = vec_ops._pmx_numpy(vector1, vector2, cross_point1, cross_point2)
+        np.testing.assert_array_equal(vec_ops._pmx_kernel.func(vector1, vector2, cross_point1, cross_point2), expected)
+
+        expected = vec_ops._order_cross_numpy(vector1, vector2, cross_point1, cross_point2)
+        np.testing.assert_array_equal(vec_ops._order_cross_kernel.func(vector1, vector2, cross_point1, cross_point2), expected)
+
+
+def test_sbx_kernel():
+    u = np.random.random(100)
+    np.testing.assert_allclose(vec_ops._sbx_beta.func(u, 2.0), vec_ops._sbx_beta_numpy(u, 2.0))
+
+
+@pytest.mark.parametrize("vecsize", [1, 2, 10, 100])
+def test_benchmark_kernels(vecsize):
+    solutions = np.random.uniform(-1000, 1000, (20, vecsize))
+
+    np.testing.assert_allclose(bench_funcs._mod_schwefel_kernel.func(solutions), bench_funcs._mod_schwefel_numpy(solutions))
+    np.testing.assert_allclose(bench_funcs._katsuura_kernel.func(solutions / 10), bench_funcs._katsuura_numpy(solutions / 10))
+    assert bench_funcs._mod_schwefel(solutions[0]).shape == ()
+
+
+def test_clique_kernel():
+    adj_mat = (np.random.random((30, 30)) < 0.9).astype(int)
+    adj_mat = np.triu(adj_mat, 1)
+    adj_mat = adj_mat + adj_mat.T
+
+    for _ in range(200):
+        solution = np.random.permutation(30)
+        start = random.randrange(1, 10)
+        assert classic_problems._clique_size.func(adj_mat, solution, start) == classic_problems._clique_size_numpy(adj_mat, solution, start)
+
+
+@pytest.mark.parametrize("implementation", ["func", "fallback"])
+def test_settle_larvae(implementation):
+    settle = getattr(surv_ops._settle_larvae, implementation)
+
+    reef_fitness = np.array([1.0, 5.0, 3.0, -np.inf, -np.inf])
+    occupied = np.array([True, True, True, False, False])
+    larva_fitness = np.array([4.0, 0.0, 10.0, 6.0])
+    positions = np.array([[1, 0], [0, 2], [4, 1], [4, 3]])
+
+    # The first larva replaces the first coral after failing with the second one, the second larva
+    # can't settle, the third one wins the empty slot 4 and the last one settles in slot 3 after losing it
+    slot_larva = settle(reef_fitness, occupied, larva_fitness, positions)
+    np.testing.assert_array_equal(slot_larva, [0, -1, -1, 3, 2])
+    np.testing.assert_array_equal(occupied, [True, True, True, False, False])
+
+
+def test_settle_larvae_implementations():
+    for _ in range(50):
+        reef_fitness = np.random.random(40).round(1)
+        occupied = np.random.random(40) < 0.6
+        larva_fitness = np.random.random(30).round(1)
+        positions = np.random.randint(0, 40, size=(30, 3))
+
+        np.testing.assert_array_equal(
+            surv_ops._settle_larvae.func(reef_fitness, occupied, larva_fitness, positions),
+            surv_ops._settle_larvae.fallback(reef_fitness, occupied, larva_fitness, positions),
+        )
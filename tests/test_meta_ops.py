@@ -2,7 +2,7 @@ import pytest
 
 import numpy as np
 from metaheuristic_designer import Individual
-from metaheuristic_designer.operators import OperatorMeta, meta_ops_map, OperatorReal
+from metaheuristic_designer.operators import OperatorMeta, meta_ops_map, OperatorReal, OperatorNull
 from metaheuristic_designer.benchmarks.benchmark_funcs import Sphere
 from metaheuristic_designer.initializers import UniformVectorInitializer
 import metaheuristic_designer as mhd
@@ -127,3 +127,73 @@ def test_split_op(indiv, op_list, values, mask):
     for idx, val in enumerate(values):
         if np.any(mask == idx):
             assert np.all(new_indiv.genotype[mask == idx] == val)
+
+
+@pytest.mark.parametrize(
+    "op_list, args",
+    [
+        ([OperatorReal("dummy", {"F": 1}), OperatorReal("dummy", {"F": 2})], {"weights": [0.2, 0.8]}),
+        ([OperatorReal("gauss", {"F": 1}), OperatorReal("nothing")], {"weights": [0.5, 0.5]}),
+    ],
+)
+def test_branch_op_batch(op_list, args):
+    operator = OperatorMeta("Branch", op_list, args)
+    assert operator.supports_batch == all(op.supports_batch for op in op_list)
+
+
+def test_branch_op_batch_rows():
+    op_list = [OperatorReal("gauss", {"F": 1}), OperatorNull()]
+    operator = OperatorMeta("Branch", op_list, {"weights": [0.5, 0.5]})
+    assert operator.supports_batch
+
+    pop_matrix = np.zeros((1000, 10))
+    offspring, speed = operator.evolve_batch(pop_matrix, np.zeros(1000), None, np.zeros((1000, 10)))
+
+    unchanged = np.all(offspring == 0, axis=1)
+    assert offspring.shape == pop_matrix.shape
+    assert 300 < np.count_nonzero(unchanged) < 700
+
+
+class RowCountOperator(OperatorNull):
+    def __init__(self):
+        super().__init__()
+        self.batch_rows = []
+
+    def evolve_batch(self, pop_matrix, fitness, global_best, speed=None, indiv_best=None, *partners):
+        self.batch_rows.append(pop_matrix.shape[0])
+        return pop_matrix + 1, speed
+
+
+def test_branch_op_batch_only_chosen_rows():
+    op_list = [RowCountOperator(), RowCountOperator()]
+    operator = OperatorMeta("Branch", op_list, {"weights": [0.5, 0.5]})
+
+    pop_matrix = np.zeros((1000, 10))
+    offspring, _ = operator.evolve_batch(pop_matrix, np.zeros(1000), None)
+
+    # Each row is evolved by exactly one operator
+    assert sum(op.batch_rows[0] for op in op_list) == 1000
+    assert np.all(offspring == 1)
+
+
+def test_branch_op_batch_partners():
+    # With a single row per operator, the donors of DE can only come from the whole population
+    operator = OperatorMeta("Branch", [OperatorReal("de/rand/1", {"F": 0.5, "Cr": 1}), OperatorNull()], {"weights": [0.01, 0.99]})
+
+    pop_matrix = np.random.uniform(-100, 100, (1000, 10))
+    offspring, _ = operator.evolve_batch(pop_matrix, np.zeros(1000), None)
+
+    changed = np.any(offspring != pop_matrix, axis=1)
+    assert 0 < np.count_nonzero(changed) < 100
+
+
+def test_sequence_op_batch():
+    op_list = [OperatorReal("gauss", {"F": 1}), OperatorNull(), OperatorReal("1point")]
+    operator = OperatorMeta("Sequence", op_list)
+    assert operator.supports_batch
+
+    offspring, speed = operator.evolve_batch(np.zeros((20, 10)), np.zeros(20), None)
+    assert offspring.shape == (20, 10)
+
+    operator = OperatorMeta("Split", op_list)
+    assert not operator.supports_batch
@@ -0,0 +1,176 @@
+import pytest
+
+import csv
+import json
+import numpy as np
+from metaheuristic_designer import MetricsSink
+from metaheuristic_designer.MetricsSink import flatten_record
+from metaheuristic_designer.sinks import JSONLinesSink, CSVSink, MemorySink, PrometheusSink
+import metaheuristic_designer as mhd
+
+mhd.reset_seed(0)
+
+
+def _params(sinks, ngen=10, **params):
+    return dict({"stop_cond": "ngen", "ngen": ngen, "verbose": False, "metrics_sinks": sinks}, **params)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("GA", ["diversity"]),
+        ("PSO", ["diversity", "mean_speed"]),
+        ("SA", ["diversity", "temperature", "accept_prob"]),
+        ("DPCRO_SL", ["diversity", "operator_probabilities"]),
+    ],
+)
+def test_memory_sink(name, expected, make_algorithm):
+    sink = MemorySink()
+    algorithm = make_algorithm(name, _params([sink]))
+    algorithm.optimize()
+
+    # A record for the initial population and one for each generation
+    assert len(sink) == 11
+    np.testing.assert_array_equal(sink.get_metric("generation"), np.arange(11))
+    np.testing.assert_array_equal(sink.get_metric("evaluations"), np.sort(sink.get_metric("evaluations")))
+
+    record = sink.records[-1]
+    assert record["evaluations"] == algorithm.objfunc.counter
+    assert record["best_fitness"] == algorithm.best_solution()[1]
+    assert record["evals_per_sec"] > 0
+    assert "perturb" in record["phase_timings"]
+    for metric in expected:
+        assert metric in record
+
+    if name == "DPCRO_SL":
+        # Operators with repeated names are told apart
+        assert len(record["operator_probabilities"]) == 4
+        assert sum(record["operator_probabilities"].values()) == pytest.approx(1)
+
+
+def test_memory_sink_size(make_algorithm):
+    sink = MemorySink(size=4)
+    make_algorithm("GA", _params([sink])).optimize()
+
+    np.testing.assert_array_equal(sink.get_metric("generation"), [7, 8, 9, 10])
+
+
+@pytest.mark.parametrize("every", [1, 3, 4, 20])
+def test_sink_rate(every, make_algorithm):
+    sink = MemorySink(every=every)
+    make_algorithm("GA", _params([sink])).optimize()
+
+    # The last generation is always recorded
+    expected = sorted(set(range(0, 11, every)) | {10})
+    np.testing.assert_array_equal(sink.get_metric("generation"), expected)
+
+
+def test_requested_metrics(monkeypatch, make_algorithm):
+    cheap_sink = MemorySink(metrics=["best_fitness", "evaluations"])
+    diversity_sink = MemorySink(every=5, metrics=["diversity"])
+    algorithm = make_algorithm("GA", _params([cheap_sink, diversity_sink]))
+
+    diversity_computed = []
+    get_metrics = algorithm.search_strategy.get_metrics
+
+    def counted_get_metrics(names=None):
+        metrics = get_metrics(names)
+        if "diversity" in metrics:
+            diversity_computed.append(algorithm.steps)
+        return metrics
+
+    monkeypatch.setattr(algorithm.search_strategy, "get_metrics", counted_get_metrics)
+    algorithm.optimize()
+
+    assert all(set(record) == {"generation", "best_fitness", "evaluations"} for record in cheap_sink.records)
+    assert all(set(record) == {"generation", "diversity"} for record in diversity_sink.records)
+
+    # The diversity is only computed in the generations where a sink requests it
+    assert diversity_computed == [0, 5, 10]
+
+
+def test_jsonl_sink(tmp_path, make_algorithm):
+    file_name = tmp_path / "metrics.jsonl"
+    algorithm = make_algorithm("DPCRO_SL", _params([JSONLinesSink(str(file_name), every=2)]))
+    algorithm.optimize()
+
+    records = [json.loads(line) for line in file_name.read_text().splitlines()]
+    assert [record["generation"] for record in records] == [0, 2, 4, 6, 8, 10]
+    assert isinstance(records[-1]["operator_probabilities"], dict)
+    assert records[-1]["evaluations"] == algorithm.objfunc.counter
+
+    # Running the algorithm again replaces the file
+    algorithm.optimize()
+    assert len(file_name.read_text().splitlines()) == 6
+
+
+def test_csv_sink(tmp_path, make_algorithm):
+    file_name = tmp_path / "metrics.csv"
+    make_algorithm("DPCRO_SL", _params([CSVSink(str(file_name))])).optimize()
+
+    with open(file_name, newline="") as file:
+        rows = list(csv.DictReader(file))
+
+    assert len(rows) == 11
+    assert [int(row["generation"]) for row in rows] == list(range(11))
+    assert "operator_probabilities.DE/rand/1" in rows[0]
+    assert "phase_timings.perturb" in rows[-1]
+    assert float(rows[-1]["best_fitness"]) >= 0
+
+
+def test_prometheus_sink(tmp_path, make_algorithm):
+    file_name = tmp_path / "metrics.prom"
+    sink = PrometheusSink(str(file_name), prefix="mhd", labels={"run": "test-1"})
+    make_algorithm("DPCRO_SL", _params([sink])).optimize()
+
+    text = file_name.read_text()
+    assert "# TYPE mhd_generation gauge" in text
+    assert 'mhd_generation{run="test-1"} 10.0' in text
+    assert 'mhd_operator_probabilities{run="test-1",key="DE/rand/1"}' in text
+    assert 'mhd_phase_timings{run="test-1",key="perturb"}' in text
+    assert not (tmp_path / "metrics.prom.tmp").exists()
+
+
+def test_prometheus_format():
+    sink = PrometheusSink("unused.prom")
+    text = sink.format_record({"generation": 3, "best_fitness": np.inf, "mean": np.nan, "method": "text", "ratio 1": 0.5})
+
+    assert "metaheuristic_generation 3.0" in text
+    assert "metaheuristic_best_fitness +Inf" in text
+    assert "metaheuristic_mean NaN" in text
+    assert "metaheuristic_ratio_1 0.5" in text
+    assert "method" not in text
+
+
+def test_flatten_record():
+    record = {"generation": np.int64(2), "timings": {"a": 1.0, "b": {"c": 2}}, "vector": np.arange(2)}
+
+    assert flatten_record(record) == {"generation": 2, "timings.a": 1.0, "timings.b.c": 2, "vector": [0, 1]}
+
+
+def test_sink_resume(tmp_path, make_algorithm):
+    metrics_file = tmp_path / "metrics.jsonl"
+    checkpoint_file = str(tmp_path / "checkpoint.pkl")
+
+    algorithm = make_algorithm("GA", _params([JSONLinesSink(str(metrics_file))], checkpoint_file=checkpoint_file))
+    algorithm.optimize()
+
+    # The records of the resumed execution are appended to the existing file
+    extended = make_algorithm("GA", _params([JSONLinesSink(str(metrics_file))], ngen=15))
+    extended.resume(checkpoint_file)
+
+    generations = [json.loads(line)["generation"] for line in metrics_file.read_text().splitlines()]
+    assert generations == list(range(16))
+
+
+def test_single_sink(make_algorithm):
+    sink = MemorySink()
+    algorithm = make_algorithm("GA", _params(sink))
+
+    assert algorithm.metrics_sinks == [sink]
+    assert isinstance(sink, MetricsSink)
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        MemorySink(every=0)
@@ -1,7 +1,11 @@
 import pytest
 
-from metaheuristic_designer import Individual
+import numpy as np
+from metaheuristic_designer import Individual, Population
+from metaheuristic_designer.benchmarks import Sphere
 from metaheuristic_designer.selectionMethods import ParentSelection
+from metaheuristic_designer.selectionMethods import best_indices, tournament_indices, roulette_indices, sus_indices
+from metaheuristic_designer.utils import RAND_GEN
 import metaheuristic_designer as mhd
 
 mhd.reset_seed(0)
@@ -98,3 +102,104 @@ def test_sus(population, amount, method, f, dummy_var):
 
     for indiv in parents:
         assert indiv.id in id_list
+
+
+@pytest.mark.parametrize("amount", [1, 5, 20, 100, 150])
+def test_best_indices(amount):
+    fitness = RAND_GEN.random(100)
+    indices = best_indices(fitness, amount)
+
+    np.testing.assert_array_equal(indices, np.argsort(-fitness)[:amount])
+
+
+@pytest.mark.parametrize("tourn_size", [1, 2, 5])
+@pytest.mark.parametrize("prob", [0, 0.1, 1])
+def test_tournament_indices(tourn_size, prob):
+    fitness = np.arange(100, dtype=float)
+    indices = tournament_indices(fitness, 500, tourn_size, prob)
+
+    assert indices.shape == (500,)
+    assert np.all((indices >= 0) & (indices < 100))
+
+    # Without random winners, larger tournaments select better individuals
+    if prob == 0 and tourn_size > 1:
+        assert fitness[indices].mean() > fitness.mean()
+
+
+def test_tournament_single_winner():
+    fitness = np.zeros(50)
+    fitness[7] = 1
+
+    indices = tournament_indices(fitness, 20, 50 * 20, 0)
+    assert np.all(indices == 7)
+
+
+@pytest.mark.parametrize("selection_function", [roulette_indices, sus_indices])
+def test_weighted_indices(selection_function):
+    weights = np.array([0, 1, 3, 0], dtype=float)
+    indices = selection_function(weights, 4000)
+
+    counts = np.bincount(indices, minlength=4)
+    assert counts[0] == counts[3] == 0
+    assert counts[2] / counts[1] == pytest.approx(3, rel=0.15)
+
+
+def test_sus_exact_counts():
+    weights = np.array([0.1, 0.2, 0.3, 0.4])
+    counts = np.bincount(sus_indices(weights, 10), minlength=4)
+
+    assert counts.sum() == 10
+    assert np.all(np.abs(counts - 10 * weights) < 1)
+
+
+def test_weighted_indices_negative():
+    with pytest.warns(UserWarning):
+        indices = roulette_indices(np.array([-1, 0, 2], dtype=float), 100)
+    assert np.all(indices == 2)
+
+    # The individuals are chosen uniformly if no weight is positive
+    with pytest.warns(UserWarning):
+        indices = roulette_indices(np.array([-1, -2, -3], dtype=float), 300)
+    assert set(indices) == {0, 1, 2}
+
+
+@pytest.mark.parametrize(
+    "method, params",
+    [
+        ("Tournament", {"amount": 3, "p": 0.1}),
+        ("Best", {"amount": 10}),
+        ("Random", {"amount": 10}),
+        ("Roulette", {"amount": 10, "method": "LinRank"}),
+        ("Sus", {"amount": 10, "method": "FitnessProp"}),
+        ("Nothing", {}),
+    ],
+)
+def test_select_indices(method, params):
+    parent_sel = ParentSelection(method, params)
+    indices = parent_sel.select_indices(example_populaton1)
+
+    assert indices.dtype.kind == "i"
+    assert np.all((indices >= 0) & (indices < pop_size))
+
+
+@pytest.mark.parametrize(
+    "method, params",
+    [
+        ("Tournament", {"amount": 3, "p": 0.1}),
+        ("Best", {"amount": 10}),
+        ("Roulette", {"amount": 10, "method": "SigmaScaling"}),
+        ("Sus", {"amount": 10, "method": "ExpRank"}),
+    ],
+)
+def test_select_population(method, params):
+    objfunc = Sphere(5)
+    population = Population(objfunc, RAND_GEN.uniform(-10, 10, size=(30, 5))).evaluate()
+
+    parent_sel = ParentSelection(method, params)
+    parents = parent_sel.select(population)
+
+    assert isinstance(parents, Population)
+    assert np.all(np.isin(parents.ids, population.ids))
+
+    if method == "Best":
+        np.testing.assert_array_equal(parents.fitness, np.sort(population.fitness)[::-1][:10])
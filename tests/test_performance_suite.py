@@ -0,0 +1,42 @@
+import pytest
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "performance"))
+perf = pytest.importorskip("perf")
+
+
+def _results(values):
+    return {"metadata": {}, "results": {name: {perf.suite.compared_metric(name): value} for name, value in values.items()}}
+
+
+def test_compare_results():
+    baseline = _results({"algorithm/GA/pop=20/dim=10": 1.0, "operator/real/Gauss/dim=10": 10.0, "parent_selection/best/pop=20": 5.0})
+    new = _results({"algorithm/GA/pop=20/dim=10": 1.5, "operator/real/Gauss/dim=10": 10.5, "parent_selection/best/pop=20": 2.0})
+
+    comparison = {name: status for name, _, _, _, _, status in perf.compare_results(baseline, new, threshold=0.1)}
+
+    assert comparison["algorithm/GA/pop=20/dim=10"] == "regression"
+    assert comparison["operator/real/Gauss/dim=10"] == "ok"
+    assert comparison["parent_selection/best/pop=20"] == "improvement"
+
+    comparison = {name: status for name, _, _, _, _, status in perf.compare_results(baseline, new, threshold=0.1, min_difference=1)}
+    assert comparison["algorithm/GA/pop=20/dim=10"] == "ok"
+
+
+@pytest.mark.parametrize("case_filter", ["algorithm/(GA|DPCRO_SL)/", "operator/perm/", "selection/.*/pop=20"])
+def test_run_and_compare(tmp_path, case_filter):
+    output = str(tmp_path / "results.json")
+
+    assert perf.main(["run", "--quick", "--silent", "-k", case_filter, "-o", output]) == 0
+
+    with open(output) as results_file:
+        results = json.load(results_file)
+
+    assert results["results"]
+    for name, measurements in results["results"].items():
+        assert "error" not in measurements, name
+        assert measurements[perf.suite.compared_metric(name)] > 0
+
+    assert perf.main(["compare", output, output]) == 0
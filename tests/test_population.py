@@ -0,0 +1,205 @@
+import pytest
+
+import numpy as np
+from copy import copy
+from metaheuristic_designer import Individual, Population, PopulationContext
+from metaheuristic_designer.Population import IndividualView, stack_genotypes
+from metaheuristic_designer.benchmarks import Sphere
+from metaheuristic_designer.evaluators import SerialEvaluator
+from metaheuristic_designer.algorithms import GeneralAlgorithm
+from metaheuristic_designer.operators import OperatorReal
+from metaheuristic_designer.strategies import HillClimb, DE
+from metaheuristic_designer.initializers import UniformVectorInitializer
+import metaheuristic_designer as mhd
+
+mhd.reset_seed(0)
+
+
+@pytest.mark.parametrize("pop_size", [1, 10, 100])
+@pytest.mark.parametrize("vecsize", [1, 5, 20])
+def test_population_views(pop_size, vecsize):
+    objfunc = Sphere(vecsize)
+    genotypes = np.random.uniform(-100, 100, (pop_size, vecsize))
+    population = Population(objfunc, genotypes)
+
+    assert len(population) == pop_size
+    assert population.speed_matrix.shape == (pop_size, vecsize)
+    assert len(np.unique(population.ids)) == pop_size
+
+    for idx, indiv in enumerate(population):
+        assert isinstance(indiv, IndividualView)
+        assert isinstance(indiv, Individual)
+        assert np.all(indiv.genotype == genotypes[idx])
+        assert indiv.id == population.ids[idx]
+        assert not indiv.fitness_calculated
+        assert indiv.best_fitness is None
+
+    view = population[-1]
+    view.genotype = np.zeros(vecsize)
+    view.age += 3
+    assert np.all(population.genotype_matrix[-1] == 0)
+    assert population.ages[-1] == 3
+
+    view.fitness = 2.5
+    assert population.fitness[-1] == 2.5
+    assert population.fitness_calculated[-1]
+    assert population.best_fitness[-1] == 2.5
+
+
+def test_population_evaluate():
+    objfunc = Sphere(10)
+    population = Population(objfunc, np.random.uniform(-100, 100, (50, 10)))
+    population[0].calculate_fitness()
+    assert objfunc.counter == 1
+
+    population.evaluate()
+    assert objfunc.counter == 50
+    assert np.all(population.fitness_calculated)
+    np.testing.assert_allclose(population.fitness, -np.sum(population.genotype_matrix**2, axis=1))
+    np.testing.assert_allclose(population.best_fitness, population.fitness)
+
+    best_idx = population.best_index()
+    assert population.fitness[best_idx] == population.fitness.max()
+
+
+def test_population_set_fitness_keeps_best():
+    objfunc = Sphere(3)
+    population = Population(objfunc, np.ones((4, 3)))
+    population.set_fitness(np.arange(4), np.array([1.0, 2.0, 3.0, 4.0]))
+
+    population.genotype_matrix[:] = 5
+    population.set_fitness(np.arange(4), np.array([0.0, 3.0, 0.0, 5.0]))
+
+    np.testing.assert_array_equal(population.best_fitness, [1.0, 3.0, 3.0, 5.0])
+    np.testing.assert_array_equal(population.best_matrix[:, 0], [1, 5, 1, 5])
+
+
+def test_population_from_individuals():
+    objfunc = Sphere(5)
+    individuals = [Individual(objfunc, np.random.uniform(-100, 100, 5)) for _ in range(20)]
+    for indiv in individuals[:10]:
+        indiv.calculate_fitness()
+
+    population = Population.from_individuals(individuals)
+
+    assert Population.from_individuals(population) is population
+    for indiv, view in zip(individuals, population):
+        assert indiv.id == view.id
+        assert np.all(indiv.genotype == view.genotype)
+        assert indiv.fitness_calculated == view.fitness_calculated
+        if indiv.fitness_calculated:
+            assert indiv.fitness == view.fitness
+
+    detached = population.to_individuals()
+    assert all(type(indiv) is Individual for indiv in detached)
+    detached[0].genotype = np.zeros(5)
+    assert not np.all(population.genotype_matrix[0] == 0)
+
+
+def test_population_take_and_concatenate():
+    objfunc = Sphere(5)
+    pop1 = Population(objfunc, np.random.uniform(-100, 100, (10, 5)))
+    pop2 = Population(objfunc, np.random.uniform(-100, 100, (6, 5)))
+
+    joined = Population.concatenate([pop1, pop2])
+    assert len(joined) == 16
+    np.testing.assert_array_equal(joined.ids, np.concatenate([pop1.ids, pop2.ids]))
+
+    selected = joined[[0, 12, 3]]
+    assert isinstance(selected, Population)
+    np.testing.assert_array_equal(selected.ids, joined.ids[[0, 12, 3]])
+
+    selected.genotype_matrix[:] = 0
+    assert not np.all(joined.genotype_matrix[0] == 0)
+
+    assert len(joined[:4]) == 4
+    assert len(joined[joined.ids % 2 == 0]) == np.count_nonzero(joined.ids % 2 == 0)
+
+    with pytest.raises(IndexError):
+        joined[16]
+
+
+def test_population_copy_view():
+    objfunc = Sphere(5)
+    population = Population(objfunc, np.random.uniform(-100, 100, (10, 5)))
+    population.evaluate()
+
+    copied = copy(population[2])
+    assert type(copied) is Individual
+    assert copied.fitness == population.fitness[2]
+
+    population.genotype_matrix[2] = 0
+    assert not np.all(copied.genotype == 0)
+
+
+def test_stack_genotypes():
+    objfunc = Sphere(5)
+    population = Population(objfunc, np.random.uniform(-100, 100, (10, 5)))
+
+    assert stack_genotypes(population) is population.genotype_matrix
+    np.testing.assert_array_equal(stack_genotypes(list(population)), population.genotype_matrix)
+
+
+def test_population_operators_and_evaluation():
+    objfunc = Sphere(5)
+    population = Population(objfunc, np.random.uniform(-100, 100, (10, 5)))
+
+    op = OperatorReal("RandSample", {"distrib": "Gauss", "loc": "calculated", "scale": "calculated"})
+    new_indiv = op(population[0], population, objfunc, None, None)
+    assert new_indiv.genotype.shape == (5,)
+
+    pop_init = UniformVectorInitializer(5, -100, 100, pop_size=10)
+    search_strat = HillClimb(pop_init)
+    population = search_strat.evaluate_population(population, objfunc, evaluator=SerialEvaluator())
+
+    assert objfunc.counter == 10
+    assert type(search_strat.best) is Individual
+    assert search_strat.best.fitness == population.fitness.max()
+
+
+@pytest.mark.parametrize("name", ["GA", "DE", "PSO", "GA_binary", "GA_perm", "CRO_SL"])
+@pytest.mark.parametrize("columnar", [True, False])
+def test_columnar_population_optimization(name, columnar, monkeypatch, make_strategy):
+    # The operators applied to each individual must leave it out of its partners
+    context_others = PopulationContext.others
+    partner_checks = []
+
+    def checked_others(context, indiv):
+        others = context_others(context, indiv)
+        # Individuals built by a previous operator of a sequence are not part of the population
+        if indiv.id in [member.id for member in context]:
+            partner_checks.append(others.excluded is not None and context[others.excluded].id == indiv.id)
+        return others
+
+    monkeypatch.setattr(PopulationContext, "others", checked_others)
+
+    # GA_binary, GA_perm and CRO_SL use operators that are applied to each individual separately
+    strategy = make_strategy(name, vecsize=5, params={"columnar": columnar})
+    algorithm = GeneralAlgorithm(Sphere(5), strategy, {"stop_cond": "ngen", "ngen": 10, "verbose": False})
+
+    populations = []
+    select_individuals = strategy.select_individuals
+    strategy.select_individuals = lambda *args, **kwargs: populations.append(select_individuals(*args, **kwargs)) or populations[-1]
+
+    algorithm.optimize()
+
+    # The representation of the population is kept through the whole optimization
+    assert len(populations) == 10
+    assert all(isinstance(population, Population) == columnar for population in populations)
+    assert isinstance(strategy.population, Population) == columnar
+    # The reef of CRO_SL can have empty slots
+    assert 0 < len(strategy.population) <= 20
+    assert max(indiv.fitness for indiv in strategy.population) <= strategy.best.fitness
+    assert all(partner_checks)
+    if name in ["GA_binary", "GA_perm", "CRO_SL"]:
+        assert len(partner_checks) > 0
+
+
+def test_columnar_population_not_vectors():
+    pop_init = UniformVectorInitializer(5, -100, 100, pop_size=10)
+    strategy = DE(pop_init, OperatorReal("DE/best/1", {"F": 0.7, "Cr": 0.8}), {"columnar": True})
+    assert isinstance(strategy.initialize(Sphere(5)), Population)
+
+    pop_init.generate_population = lambda objfunc, n_indiv=None: [Individual(objfunc, [1, 2, 3])]
+    with pytest.raises(ValueError):
+        strategy.initialize(Sphere(5))
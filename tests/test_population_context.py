@@ -0,0 +1,199 @@
+import pytest
+
+import numpy as np
+from metaheuristic_designer import Individual, Population, PopulationContext
+from metaheuristic_designer.PopulationContext import other_individuals
+from metaheuristic_designer.Population import stack_genotypes, genotype_mean_std
+from metaheuristic_designer.benchmarks import Sphere
+from metaheuristic_designer.operators import OperatorReal, OperatorInt, OperatorPerm
+from metaheuristic_designer.strategies import StaticPopulation, CRO_SL, DPCRO_SL
+from metaheuristic_designer.initializers import UniformVectorInitializer
+import metaheuristic_designer.operators.vector_operator_functions as vec_ops
+import metaheuristic_designer as mhd
+
+mhd.reset_seed(0)
+
+
+def make_population(objfunc, pop_size):
+    population = [Individual(objfunc, np.random.uniform(-100, 100, objfunc.vecsize)) for _ in range(pop_size)]
+    for indiv in population:
+        indiv.calculate_fitness()
+    return population
+
+
+@pytest.mark.parametrize("pop_size", [2, 5, 30])
+def test_context_others(pop_size):
+    objfunc = Sphere(5)
+    population = make_population(objfunc, pop_size)
+    context = PopulationContext(population)
+
+    assert len(context) == pop_size
+    assert list(context) == population
+    np.testing.assert_array_equal(stack_genotypes(context), stack_genotypes(population))
+
+    for indiv in population:
+        others = context.others(indiv)
+        expected = [i for i in population if i is not indiv]
+
+        assert len(others) == pop_size - 1
+        assert list(others) == expected
+        assert others[-1] is expected[-1]
+        assert others[1:3] == expected[1:3]
+        np.testing.assert_array_equal(others.genotype_matrix, stack_genotypes(expected))
+        np.testing.assert_array_equal(context.genotype_matrix[others.rows], stack_genotypes(expected))
+        with pytest.raises(IndexError):
+            others[pop_size - 1]
+
+        best_expected = max(expected, key=lambda x: x.fitness)
+        assert others.best() is best_expected
+        assert others.top(3) == sorted(expected, key=lambda x: x.fitness, reverse=True)[:3]
+
+
+@pytest.mark.parametrize("pop_size", [2, 10, 30])
+def test_context_others_columnar(pop_size):
+    objfunc = Sphere(5)
+    population = Population.from_individuals(make_population(objfunc, pop_size))
+    context = PopulationContext(population)
+
+    # The views of the individuals are created on each access, the individual is found by its id
+    for idx, indiv in enumerate(population):
+        others = context.others(indiv)
+
+        assert context.position(population[idx]) == idx
+        assert len(others) == pop_size - 1
+        assert indiv.id not in [other.id for other in others]
+        np.testing.assert_array_equal(others.genotype_matrix, np.delete(population.genotype_matrix, idx, axis=0))
+        assert idx not in others.rows
+
+
+@pytest.mark.parametrize("pop_size", [2, 5, 30])
+@pytest.mark.parametrize("columnar", [False, True])
+def test_context_others_mean_std(pop_size, columnar):
+    objfunc = Sphere(5)
+    population = make_population(objfunc, pop_size)
+    if columnar:
+        population = Population.from_individuals(population)
+    context = PopulationContext(population)
+
+    mean, std = genotype_mean_std(context)
+    np.testing.assert_allclose(mean, np.mean(stack_genotypes(population), axis=0))
+    np.testing.assert_allclose(std, np.std(stack_genotypes(population), axis=0))
+
+    # The statistics of the rest of the population are obtained without copying their genotypes
+    for idx, indiv in enumerate(population):
+        expected = np.delete(stack_genotypes(population), idx, axis=0)
+        mean, std = genotype_mean_std(context.others(indiv))
+
+        np.testing.assert_allclose(mean, np.mean(expected, axis=0), atol=1e-9)
+        np.testing.assert_allclose(std, np.std(expected, axis=0), atol=1e-5)
+
+
+def test_context_columnar_non_batch_operator():
+    objfunc = Sphere(10)
+    population = Population(objfunc, np.array([np.random.permutation(10) for _ in range(10)]))
+    context = PopulationContext(population)
+
+    partners = []
+    context_others = context.others
+    context.others = lambda indiv: partners.append((indiv.id, [other.id for other in context_others(indiv)])) or context_others(indiv)
+
+    operator = OperatorPerm("PMX")
+    for indiv in population:
+        new_indiv = operator(indiv, context, objfunc, None, None)
+        assert sorted(new_indiv.genotype) == list(range(10))
+
+    # No individual can be crossed with itself
+    assert len(partners) == 10
+    for indiv_id, other_ids in partners:
+        assert len(other_ids) == 9
+        assert indiv_id not in other_ids
+
+
+def test_context_outsider():
+    objfunc = Sphere(5)
+    population = make_population(objfunc, 10)
+    context = PopulationContext(population)
+    outsider = Individual(objfunc, np.zeros(5))
+
+    assert len(other_individuals(context, outsider)) == 10
+    assert other_individuals(population, population[0]) == population[1:]
+
+
+def test_context_best():
+    objfunc = Sphere(5)
+    population = make_population(objfunc, 20)
+    context = PopulationContext(population)
+
+    fitness = [i.fitness for i in population]
+    assert context.best() is population[int(np.argmax(fitness))]
+    np.testing.assert_array_equal(context.fitness, fitness)
+    np.testing.assert_array_equal(context.fitness[context.fitness_order], np.sort(fitness)[::-1])
+
+
+@pytest.mark.parametrize("P", [0.05, 0.3, 1])
+def test_pbest_matches_list(P):
+    objfunc = Sphere(5)
+    population = make_population(objfunc, 40)
+    context = PopulationContext(population)
+
+    upper_idx = max(1, int(np.ceil(len(population) * P)))
+    top = sorted(population, key=lambda x: x.fitness, reverse=True)[:upper_idx]
+
+    for _ in range(20):
+        assert vec_ops._pbest_of(context, P) in top
+        assert vec_ops._pbest_of(population, P) in top
+
+
+@pytest.mark.parametrize(
+    "op_method", ["DE/best/1", "DE/best/2", "DE/current-to-best/1", "DE/current-to-pbest/1", "Multicross", "RandSample"]
+)
+def test_operators_with_context(op_method):
+    objfunc = Sphere(5)
+    population = make_population(objfunc, 20)
+    context = PopulationContext(population)
+
+    op = OperatorReal(op_method, {"F": 0.8, "Cr": 0.8, "P": 0.1, "Nindiv": 3, "distrib": "Gauss"})
+    for indiv in population:
+        new_indiv = op(indiv, context, objfunc, None, None)
+        assert new_indiv.genotype.shape == (5,)
+        assert new_indiv is not indiv
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        StaticPopulation(
+            UniformVectorInitializer(5, -100, 100, pop_size=20), OperatorInt("DE/current-to-pbest/1", {"F": 0.8, "Cr": 0.8, "P": 0.1})
+        ),
+        CRO_SL(
+            UniformVectorInitializer(5, -100, 100, pop_size=20),
+            [OperatorReal("DE/best/1", {"F": 0.8, "Cr": 0.8}), OperatorReal("Multipoint")],
+            {"rho": 0.8, "Fb": 0.98, "Fd": 0.1, "Pd": 0.1, "attempts": 3},
+        ),
+        DPCRO_SL(
+            UniformVectorInitializer(5, -100, 100, pop_size=20),
+            [OperatorReal("DE/best/1", {"F": 0.8, "Cr": 0.8}), OperatorReal("Multipoint")],
+            {
+                "rho": 0.8,
+                "Fb": 0.98,
+                "Fd": 0.1,
+                "Pd": 0.1,
+                "attempts": 3,
+                "group_subs": True,
+                "dyn_method": "fitness",
+                "dyn_metric": "avg",
+                "dyn_steps": 10,
+                "prob_amp": 0.1,
+            },
+        ),
+    ],
+)
+def test_strategies_with_context(strategy):
+    objfunc = Sphere(5)
+    population = strategy.initialize(objfunc)
+    population = strategy.evaluate_population(population, objfunc)
+
+    offspring = strategy.perturb(population, objfunc)
+
+    assert len(offspring) == len(population)
+    assert all(isinstance(indiv, Individual) for indiv in offspring)
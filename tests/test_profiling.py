@@ -0,0 +1,249 @@
+import pytest
+
+import json
+import pickle
+import threading
+import numpy as np
+from metaheuristic_designer import Profiler
+from metaheuristic_designer.profiling import LatencyHistogram, TimeStats, find_operators
+from metaheuristic_designer.algorithms import GeneralAlgorithm, MemeticAlgorithm
+from metaheuristic_designer.benchmarks import Sphere
+from metaheuristic_designer.initializers import UniformVectorInitializer
+from metaheuristic_designer.operators import OperatorReal, OperatorMeta
+from metaheuristic_designer.selectionMethods import ParentSelection, SurvivorSelection
+from metaheuristic_designer.strategies import GA, HillClimb, CRO_SL
+from metaheuristic_designer.utils import NumpyEncoder
+import metaheuristic_designer as mhd
+
+mhd.reset_seed(0)
+
+STEP_PHASES = ["select_parents", "perturb", "evaluate", "select_individuals", "update_params"]
+
+
+def _ga(pop_size=20):
+    initializer = UniformVectorInitializer(10, -100, 100, pop_size=pop_size)
+    return GA(
+        initializer,
+        OperatorReal("Gauss", {"F": 0.1}),
+        OperatorReal("Multipoint"),
+        ParentSelection("Best", {"amount": 10}),
+        SurvivorSelection("(m+n)"),
+        {"pcross": 0.8, "pmut": 0.2},
+    )
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+
+    latencies = np.concatenate([np.full(90, 1e-5), np.full(10, 1e-2)])
+    for latency in latencies:
+        histogram.record(latency)
+
+    assert histogram.count == 100
+    assert histogram.total == pytest.approx(latencies.sum())
+    assert histogram.mean == pytest.approx(latencies.mean())
+    assert histogram.min == 1e-5 and histogram.max == 1e-2
+
+    # The quantiles are approximated by the center of a bin
+    assert histogram.quantile(0.5) == pytest.approx(1e-5, rel=0.3)
+    assert histogram.quantile(0.95) == pytest.approx(1e-2, rel=0.3)
+
+    histogram.record(1e-3, count=50)
+    assert histogram.count == 150
+    state = histogram.get_state()
+    assert sum(state["histogram"]["counts"]) == 150
+    assert len(state["histogram"]["counts"]) == 3
+
+    # Values out of range are kept in the extreme bins
+    histogram.record(1e5)
+    histogram.record(0)
+    assert histogram.count == 152
+    assert histogram.counts[0] == 1 and histogram.counts[-1] == 1
+
+    histogram.reset()
+    assert histogram.count == 0
+    assert histogram.quantile(0.5) == 0
+
+
+def test_latency_histogram_threads():
+    histogram = LatencyHistogram()
+
+    def record_many():
+        for _ in range(10000):
+            histogram.record(1e-4)
+
+    threads = [threading.Thread(target=record_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert histogram.count == 80000
+    assert sum(histogram.counts) == 80000
+    assert histogram.total == pytest.approx(8.0)
+
+    restored = pickle.loads(pickle.dumps(histogram))
+    restored.record(1e-4)
+    assert restored.count == 80001
+
+
+def test_time_stats():
+    stats = TimeStats()
+    stats.add(1.0, 0.5)
+    stats.add(3.0, 1.5, calls=3)
+
+    state = stats.get_state()
+    assert state["calls"] == 4
+    assert state["wall_time"] == 4.0
+    assert state["cpu_time"] == 2.0
+    assert state["mean_wall_time"] == 1.0
+
+
+def test_find_operators():
+    op1 = OperatorReal("Gauss", {"F": 0.1})
+    op2 = OperatorReal("Multipoint")
+    meta = OperatorMeta("Sequence", [OperatorMeta("Branch", [op1, op2], {"p": 0.5}), op1])
+
+    assert {op.id for op in find_operators([meta])} == {op1.id, op2.id, meta.id, meta.op_list[0].id}
+
+
+def test_phase_timing():
+    mhd.reset_seed(0)
+    objfunc = Sphere(10)
+    algorithm = GeneralAlgorithm(objfunc, _ga(), {"stop_cond": "ngen", "ngen": 10, "verbose": False})
+    algorithm.optimize()
+
+    timing = algorithm.get_state()["timing"]
+    assert set(timing["phases"]) == set(STEP_PHASES + ["initialize", "update"])
+    for phase in STEP_PHASES + ["update"]:
+        assert timing["phases"][phase]["calls"] == 10
+        assert timing["phases"][phase]["wall_time"] >= 0
+
+    # Every evaluation is done in this process, so all of them are measured
+    assert timing["objective_latency"]["count"] == objfunc.true_evaluations
+    assert timing["objective_time"] == pytest.approx(timing["objective_latency"]["total_time"])
+    assert timing["objective_time"] + timing["overhead_time"] == pytest.approx(algorithm.real_time_spent)
+    assert 0 <= timing["overhead_fraction"] <= 1
+    assert "operators" not in timing and "profile" not in timing
+
+    # The objective function is no longer measured after the execution
+    assert objfunc.latency is None
+
+    json.dumps(algorithm.get_state(), cls=NumpyEncoder)
+
+
+def test_timing_disabled():
+    objfunc = Sphere(10)
+    algorithm = GeneralAlgorithm(objfunc, _ga(), {"stop_cond": "ngen", "ngen": 5, "verbose": False, "timing": False})
+    algorithm.optimize()
+
+    assert "timing" not in algorithm.get_state()
+    assert algorithm.profiler.phases == {}
+    assert algorithm.profiler.objective_latency.count == 0
+
+
+def test_restart_resets_timing():
+    algorithm = GeneralAlgorithm(Sphere(10), _ga(), {"stop_cond": "ngen", "ngen": 5, "verbose": False})
+    algorithm.optimize()
+    algorithm.optimize()
+
+    assert algorithm.get_state()["timing"]["phases"]["perturb"]["calls"] == 5
+
+
+@pytest.mark.parametrize("batch", [True, False])
+def test_operator_timing(batch):
+    mhd.reset_seed(0)
+    strategy = _ga()
+    if not batch:
+        strategy = CRO_SL(
+            UniformVectorInitializer(10, -100, 100, pop_size=20),
+            [OperatorReal("Gauss", {"F": 0.1}), OperatorReal("Multipoint")],
+            {"rho": 0.6, "Fb": 0.95, "Fd": 0.1, "Pd": 0.9, "attempts": 3},
+        )
+
+    algorithm = GeneralAlgorithm(Sphere(10), strategy, {"stop_cond": "ngen", "ngen": 5, "verbose": False, "operator_timing": True})
+    algorithm.optimize()
+
+    operators = algorithm.get_state()["timing"]["operators"]
+    assert {op_state["id"] for op_state in operators} == {op.id for op in find_operators(vars(strategy).values())}
+    assert {op_state["name"] for op_state in operators} >= {"Gauss", "Multipoint"}
+    assert all(op_state["calls"] > 0 for op_state in operators if op_state["name"] in ("Gauss", "Multipoint"))
+
+    # The operators are no longer measured after the execution
+    assert all(op.timer is None for op in find_operators(vars(strategy).values()))
+
+
+def test_memetic_phases():
+    mhd.reset_seed(0)
+    local_search = HillClimb(UniformVectorInitializer(10, -100, 100, pop_size=1), OperatorReal("Gauss", {"F": 0.1}), {"iters": 5})
+    algorithm = MemeticAlgorithm(
+        Sphere(10),
+        _ga(),
+        local_search,
+        ParentSelection("Best", {"amount": 2}),
+        {"stop_cond": "ngen", "ngen": 5, "verbose": False, "operator_timing": True},
+    )
+    algorithm.optimize()
+
+    timing = algorithm.get_state()["timing"]
+    assert timing["phases"]["local_search"]["calls"] == len(algorithm.fit_history)
+    assert any(op_state["id"] == local_search.operator.id for op_state in timing["operators"])
+
+
+@pytest.mark.parametrize("profile_memory", [True, False])
+def test_profile_window(profile_memory):
+    params = {"stop_cond": "ngen", "ngen": 10, "verbose": False, "profile_gens": (2, 4), "profile_memory": profile_memory}
+    algorithm = GeneralAlgorithm(Sphere(10), _ga(), params)
+    algorithm.optimize()
+
+    timing = algorithm.get_state()["timing"]
+    assert "GeneralAlgorithm.py" in timing["profile"]
+    assert algorithm.profiler.profile_stats.total_calls > 0
+
+    # Only two generations are profiled
+    step_stats = [stats for func, stats in algorithm.profiler.profile_stats.stats.items() if func[2] == "step"]
+    assert step_stats[0][1] == 2
+
+    if profile_memory:
+        assert timing["memory"]["peak"] > 0
+        assert len(timing["memory"]["top"]) > 0
+    else:
+        assert "memory" not in timing
+
+
+def test_profile_window_not_finished():
+    # The profiling is stopped when the algorithm ends before the end of the window
+    algorithm = GeneralAlgorithm(Sphere(10), _ga(), {"stop_cond": "ngen", "ngen": 3, "verbose": False, "profile_gens": (1, 100)})
+    algorithm.optimize()
+
+    assert algorithm.profiler._cprofile is None
+    assert "profile" in algorithm.get_state()["timing"]
+
+
+def test_display_report(capsys):
+    algorithm = GeneralAlgorithm(Sphere(10), _ga(), {"stop_cond": "ngen", "ngen": 3, "verbose": False, "operator_timing": True})
+    algorithm.optimize()
+    algorithm.display_report(show_plots=False)
+
+    output = capsys.readouterr().out
+    assert "select_parents" in output
+    assert "Framework overhead" in output
+    assert "Gauss" in output
+
+
+def test_profiler_standalone():
+    profiler = Profiler()
+    with profiler.phase("work"):
+        sum(range(1000))
+    with profiler.phase("work"):
+        sum(range(1000))
+
+    state = profiler.get_state()
+    assert state["phases"]["work"]["calls"] == 2
+    assert state["objective_time"] == 0
+    assert state["overhead_fraction"] == pytest.approx(1)
+
+    profiler = Profiler(enabled=False)
+    with profiler.phase("work"):
+        pass
+    assert profiler.get_state()["phases"] == {}
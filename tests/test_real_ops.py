@@ -3,9 +3,11 @@ import pytest
 import numpy as np
 from metaheuristic_designer import Individual
 from metaheuristic_designer.operators import OperatorReal, real_ops_map
+from metaheuristic_designer.operators.vector_operator_functions import sample_other_indices, best_other_indices
 from metaheuristic_designer.benchmarks.benchmark_funcs import Sphere
 from metaheuristic_designer.initializers import UniformVectorInitializer
 import metaheuristic_designer as mhd
+from metaheuristic_designer.utils import RAND_GEN
 
 mhd.reset_seed(0)
 
@@ -132,3 +134,118 @@ def test_randsample(population, distrib, params):
     indiv = population[0]
     new_indiv = operator.evolve(indiv, population, indiv.objfunc, indiv, pop_init)
     assert type(new_indiv.genotype) == np.ndarray
+
+
+real_batch_ops = [i for i in real_ops if OperatorReal(i, "default").supports_batch]
+
+
+@pytest.mark.parametrize("population", [example_populaton1, example_populaton2, example_populaton3])
+@pytest.mark.parametrize("op_method", real_batch_ops)
+@pytest.mark.parametrize("n_indiv", [1, 3, 10, 100])
+def test_batch_working(population, op_method, n_indiv):
+    operator = OperatorReal(op_method, "default")
+
+    pop_matrix = np.vstack([indiv.genotype for indiv in population[:n_indiv]])
+    speed = np.vstack([indiv.speed for indiv in population[:n_indiv]])
+    fitness = np.array([indiv.fitness for indiv in population[:n_indiv]])
+
+    offspring, new_speed = operator.evolve_batch(pop_matrix, fitness, pop_matrix[0], speed, pop_matrix)
+    assert offspring.shape == pop_matrix.shape
+    assert new_speed.shape == pop_matrix.shape
+
+    # Test when global best is not defined
+    offspring, new_speed = operator.evolve_batch(pop_matrix, fitness, None)
+    assert offspring.shape == pop_matrix.shape
+
+
+def test_batch_not_supported():
+    operator = OperatorReal("Firefly", "default")
+    assert not operator.supports_batch
+
+    with pytest.raises(NotImplementedError):
+        operator.evolve_batch(np.zeros((10, 3)), np.zeros(10), None)
+
+
+@pytest.mark.parametrize("pop_size, n_samples", [(2, 1), (4, 3), (10, 5), (1000, 3)])
+def test_sample_other_indices(pop_size, n_samples):
+    sampled = sample_other_indices(pop_size, n_samples)
+
+    assert sampled.shape == (pop_size, n_samples)
+    assert np.all((sampled >= 0) & (sampled < pop_size))
+    assert np.all(sampled != np.arange(pop_size)[:, None])
+    assert all(len(set(row)) == n_samples for row in sampled)
+
+
+def test_best_other_indices():
+    fitness = np.array([3.0, 7.0, 1.0, 5.0])
+    np.testing.assert_array_equal(best_other_indices(fitness), [1, 3, 1, 1])
+
+
+@pytest.mark.parametrize("pop_size, n_samples", [(10, 3), (1000, 3)])
+def test_sample_other_indices_pool(pop_size, n_samples):
+    own_idx = np.array([0, 3, pop_size - 1])
+    sampled = sample_other_indices(pop_size, n_samples, own_idx)
+
+    assert sampled.shape == (3, n_samples)
+    assert np.all((sampled >= 0) & (sampled < pop_size))
+    assert np.all(sampled != own_idx[:, None])
+
+
+def test_best_other_indices_pool():
+    fitness = np.array([3.0, 7.0, 1.0, 5.0])
+    np.testing.assert_array_equal(best_other_indices(fitness, [2, 1]), [1, 3])
+
+
+@pytest.mark.parametrize("op_method", real_batch_ops)
+def test_batch_partner_pool(op_method):
+    operator = OperatorReal(op_method, "default")
+    pop_matrix = RAND_GEN.uniform(-100, 100, (20, 10))
+    fitness = RAND_GEN.uniform(-100, 100, 20)
+    rows = np.array([2, 5, 11])
+
+    offspring, new_speed = operator.evolve_batch(pop_matrix[rows], fitness[rows], None, None, None, pop_matrix, fitness, rows)
+    assert offspring.shape == (3, 10)
+    assert new_speed.shape == (3, 10)
+
+    with pytest.raises(ValueError):
+        operator.evolve_batch(pop_matrix[rows], fitness[rows], None, partner_matrix=pop_matrix, partner_fitness=fitness)
+
+
+@pytest.mark.parametrize("op_method", [i for i in real_batch_ops if i.startswith("de/")])
+def test_batch_de_partner_pool(op_method):
+    pop_matrix = RAND_GEN.uniform(-100, 100, (20, 10))
+    fitness = RAND_GEN.uniform(-100, 100, 20)
+    rows = np.array([2, 5])
+
+    # Two rows aren't enough for DE on their own, but the donors are taken from the pool
+    operator = OperatorReal(op_method, {"F": 0.5, "Cr": 1, "P": 0.1})
+    offspring, _ = operator.evolve_batch(pop_matrix[rows], fitness[rows], None)
+    assert np.all(offspring == pop_matrix[rows])
+
+    offspring, _ = operator.evolve_batch(pop_matrix[rows], fitness[rows], None, None, None, pop_matrix, fitness, rows)
+    assert np.all(offspring != pop_matrix[rows])
+
+
+@pytest.mark.parametrize("op_method", [i for i in real_batch_ops if i.startswith("de/")])
+def test_batch_de_no_cross(op_method):
+    pop_matrix = RAND_GEN.uniform(-100, 100, (20, 10))
+    fitness = RAND_GEN.uniform(-100, 100, 20)
+
+    # Without crossing no component is replaced
+    operator = OperatorReal(op_method, {"F": 0.5, "Cr": 0, "P": 0.1})
+    offspring, _ = operator.evolve_batch(pop_matrix, fitness, None)
+    assert np.all(offspring == pop_matrix)
+
+    operator = OperatorReal(op_method, {"F": 0.5, "Cr": 1, "P": 0.1})
+    offspring, _ = operator.evolve_batch(pop_matrix, fitness, None)
+    assert np.all(offspring != pop_matrix)
+
+
+def test_batch_pso():
+    pop_matrix = np.zeros((10, 4))
+    speed = np.ones((10, 4))
+    operator = OperatorReal("PSO", {"w": 0.5, "c1": 0, "c2": 0})
+
+    offspring, new_speed = operator.evolve_batch(pop_matrix, np.zeros(10), None, speed, pop_matrix)
+    assert np.all(new_speed == 0.5)
+    assert np.all(offspring == 0.5)
@@ -0,0 +1,201 @@
+import pytest
+
+import numpy as np
+from metaheuristic_designer import Individual
+from metaheuristic_designer.operators import OperatorReal, OperatorMeta, OperatorNull
+from metaheuristic_designer.strategies import StaticPopulation, VariablePopulation, CRO, CRO_SL, DPCRO_SL, Reef, SubstrateStatistics
+from metaheuristic_designer.benchmarks import Sphere
+from metaheuristic_designer.initializers import UniformVectorInitializer
+import metaheuristic_designer as mhd
+
+mhd.reset_seed(0)
+
+pop_size = 50
+objfunc = Sphere(10)
+pop_init = UniformVectorInitializer(10, objfunc.low_lim, objfunc.up_lim, pop_size)
+
+
+@pytest.mark.parametrize("op_method", ["DE/rand/1", "DE/best/1", "Gauss", "SBX", "PSO"])
+@pytest.mark.parametrize("strategy_class", [StaticPopulation, VariablePopulation])
+def test_batch_perturb(op_method, strategy_class):
+    strategy = strategy_class(pop_init, OperatorReal(op_method, "default"))
+    population = strategy.initialize(objfunc)
+    population = strategy.evaluate_population(population, objfunc)
+
+    offspring = strategy.perturb(population, objfunc)
+
+    assert len(offspring) == pop_size
+    for indiv in offspring:
+        assert isinstance(indiv, Individual)
+        assert indiv.genotype.shape == (10,)
+        assert np.all(indiv.genotype <= objfunc.up_lim) and np.all(indiv.genotype >= objfunc.low_lim)
+
+
+def test_batch_perturb_keeps_unchanged():
+    branch_op = OperatorMeta("Branch", [OperatorReal("Gauss", {"F": 1}), OperatorNull()], {"p": 0.5})
+    strategy = StaticPopulation(pop_init, branch_op)
+    population = strategy.initialize(objfunc)
+    population = strategy.evaluate_population(population, objfunc)
+
+    offspring = strategy.perturb(population, objfunc)
+
+    for parent, indiv in zip(population, offspring):
+        if indiv is parent:
+            assert indiv.fitness_calculated
+        else:
+            assert not indiv.fitness_calculated
+            assert np.any(indiv.genotype != parent.genotype)
+
+
+def test_reef():
+    strategy = StaticPopulation(pop_init, OperatorReal("Gauss", {"F": 1}))
+    population = strategy.evaluate_population(strategy.initialize(objfunc), objfunc)
+    offspring = strategy.evaluate_population(strategy.perturb(population, objfunc), objfunc)
+
+    reef = Reef(80)
+    reef.place(pop_size)
+    assert len(reef) == pop_size
+
+    new_population = reef.select(population, offspring, 3, 0.1, 1)
+    candidates = {indiv.id for indiv in population} | {indiv.id for indiv in offspring}
+
+    assert len(new_population) == len(reef) <= 80
+    assert all(indiv.id in candidates for indiv in new_population)
+    np.testing.assert_array_equal(reef.fitness[reef.occupied], [indiv.fitness for indiv in new_population])
+    assert np.all(np.isneginf(reef.fitness[~reef.occupied]))
+
+    # The larvae that remain in the reef are marked
+    new_ids = {indiv.id for indiv in new_population}
+    np.testing.assert_array_equal(reef.larva_survived, [indiv.id in new_ids for indiv in offspring])
+
+    with pytest.raises(ValueError):
+        reef.place(81)
+
+
+@pytest.mark.parametrize("strategy_class", [CRO, CRO_SL, DPCRO_SL])
+def test_cro_reef(strategy_class):
+    params = {"rho": 0.6, "Fb": 0.9, "Fd": 0.2, "Pd": 0.5, "attempts": 3}
+    params.update({"group_subs": True, "dyn_method": "success", "dyn_metric": "avg", "dyn_steps": 5, "prob_amp": 0.1})
+    operators = [OperatorReal("Gauss", {"F": 1}), OperatorReal("Multipoint")]
+
+    if strategy_class is CRO:
+        strategy = CRO(pop_init, operators[0], operators[1], params)
+    else:
+        strategy = strategy_class(pop_init, operators, params)
+
+    population = strategy.evaluate_population(strategy.initialize(objfunc), objfunc)
+    assert len(population) == len(strategy.reef) == round(pop_size * 0.6)
+    assert strategy.reef.size == pop_size
+
+    for _ in range(5):
+        offspring = strategy.evaluate_population(strategy.perturb(population, objfunc), objfunc)
+        population = strategy.select_individuals(population, offspring)
+        strategy.population = population
+        strategy.update_params(progress=0.5)
+
+        assert len(population) == len(strategy.reef)
+
+
+@pytest.mark.parametrize("grouped", [False, True])
+def test_evolve_substrates(grouped):
+    batch_op = OperatorReal("Gauss", {"F": 1})
+    single_op = OperatorReal("Perm", {"N": 2})
+    params = {"rho": 1, "Fb": 0.9, "Fd": 0.2, "Pd": 0.5, "attempts": 3}
+    strategy = CRO_SL(pop_init, [batch_op, single_op, OperatorReal("Multipoint")], params)
+
+    population = strategy.evaluate_population(strategy.initialize(objfunc), objfunc)
+    substrates = np.arange(pop_size) % 3
+
+    batch_calls = []
+    partner_sizes = []
+    apply_batch = batch_op.apply_batch
+
+    def count_apply_batch(pop_matrix, *args):
+        batch_calls.append(len(pop_matrix))
+        partner_sizes.append(len(args[4]) if len(args) > 4 else None)
+        return apply_batch(pop_matrix, *args)
+
+    batch_op.apply_batch = count_apply_batch
+
+    offspring = strategy.evolve_substrates(population, objfunc, substrates, grouped=grouped)
+
+    # The batch operator is called once, only with the corals of its own group, taking partners from the reef if not grouped
+    assert batch_calls == [np.count_nonzero(substrates == 0)]
+    assert partner_sizes == [None if grouped else pop_size]
+    assert len(offspring) == pop_size
+    for indiv, parent, substrate in zip(offspring, population, substrates):
+        assert indiv.genotype.shape == parent.genotype.shape
+        if substrate == 1:
+            assert set(indiv.genotype) == set(parent.genotype)
+
+
+def test_substrate_statistics():
+    params = {"rho": 1, "Fb": 0.9, "Fd": 0.2, "Pd": 0.5, "attempts": 3}
+    strategy = CRO_SL(pop_init, [OperatorReal("Gauss", {"F": 1}), OperatorReal("Multipoint"), OperatorReal("Perm", {"N": 2})], params)
+    population = strategy.evaluate_population(strategy.initialize(objfunc), objfunc)
+
+    strategy.operator_idx = [idx % 2 for idx in range(pop_size)]
+    offspring = strategy.evaluate_population(strategy.perturb(population, objfunc), objfunc)
+    stats = strategy.substrate_statistics(offspring)
+
+    fitness = np.array([indiv.fitness for indiv in offspring])
+    np.testing.assert_array_equal(stats["count"], [pop_size // 2, pop_size // 2, 0])
+    assert stats["mean"][0] == pytest.approx(fitness[strategy.larva_substrates == 0].mean())
+    assert stats["best"][1] == fitness[strategy.larva_substrates == 1].max()
+    assert stats["worst"][1] == fitness[strategy.larva_substrates == 1].min()
+    assert np.isnan(stats["mean"][2]) and np.isnan(stats["best"][2])
+
+
+def test_substrate_statistics_accumulators():
+    stats = SubstrateStatistics(3, sample_size=50)
+    substrates = np.array([0, 1, 0, 1, 0, 1, 0])
+    fitness = np.array([1, 2, 3, 4, 5, 6, 10], dtype=float)
+
+    stats.add(substrates, fitness, substrates == 0)
+    stats.add(substrates[:2], fitness[:2] - 10)
+
+    np.testing.assert_array_equal(stats.count, [5, 4, 0])
+    np.testing.assert_array_equal(stats.success, [4, 0, 0])
+    np.testing.assert_allclose(stats.mean[:2], [10 / 5, 4 / 4])
+    np.testing.assert_array_equal(stats.median[:2], [3, 3])
+    np.testing.assert_array_equal(stats.metric("best"), [10, 6, 0])
+    np.testing.assert_array_equal(stats.metric("worse"), [-9, -8, 0])
+    np.testing.assert_array_equal(stats.metric("med"), [3, 3, 0])
+    assert stats.total_metric("med") == 3
+    assert stats.total_metric("avg") == pytest.approx(14 / 9)
+    assert np.isnan(stats.success_rate[2])
+
+    stats.reset()
+    assert stats.total_metric("best") == 0
+    np.testing.assert_array_equal(stats.metric("avg"), [0, 0, 0])
+
+
+def test_substrate_statistics_sample():
+    stats = SubstrateStatistics(2, sample_size=200)
+    for _ in range(50):
+        stats.add(np.zeros(100, dtype=int), np.random.random(100))
+
+    # With more values than the size of the sample, the median is estimated
+    assert stats.count[0] == 5000
+    assert stats.median[0] == pytest.approx(0.5, abs=0.1)
+    assert np.isnan(stats.median[1])
+
+
+@pytest.mark.parametrize("dyn_method", ["success", "fitness", "diff"])
+@pytest.mark.parametrize("dyn_metric", ["best", "avg", "med", "worse"])
+def test_dpcro_sl_operator_stats(dyn_method, dyn_metric):
+    params = {"rho": 0.6, "Fb": 0.9, "Fd": 0.2, "Pd": 0.5, "attempts": 3, "weight_history_size": 4}
+    params.update({"group_subs": False, "dyn_method": dyn_method, "dyn_metric": dyn_metric, "dyn_steps": 5, "prob_amp": 0.1})
+    strategy = DPCRO_SL(pop_init, [OperatorReal("Gauss", {"F": 1}), OperatorReal("Multipoint")], params)
+
+    population = strategy.evaluate_population(strategy.initialize(objfunc), objfunc)
+    for gen in range(10):
+        offspring = strategy.evaluate_population(strategy.perturb(population, objfunc), objfunc)
+        population = strategy.select_individuals(population, offspring)
+        strategy.population = population
+        strategy.update_params(progress=gen / 10)
+
+    assert len(strategy.operator_w_history) == 4
+    assert strategy.operator_w_history.n_appended == 10
+    assert strategy.operator_weight.sum() == pytest.approx(1)
+    assert np.all(np.isfinite(strategy.operator_metric))
@@ -1,7 +1,18 @@
 import pytest
 import numpy as np
-from metaheuristic_designer import Individual
+from metaheuristic_designer import Individual, Population
+from metaheuristic_designer.benchmarks import Sphere
 from metaheuristic_designer.selectionMethods import SurvivorSelection
+from metaheuristic_designer.selectionMethods import (
+    one_to_one_indices,
+    elitism_indices,
+    cond_elitism_indices,
+    lamb_plus_mu_indices,
+    lamb_comma_mu_indices,
+    depredation_mask,
+    cro_indices,
+)
+from metaheuristic_designer.utils import RAND_GEN
 import metaheuristic_designer as mhd
 
 mhd.reset_seed(0)
@@ -138,3 +149,78 @@ def test_cro_selection(population, offspring, fd, pd, attempts):
     surv_fit_avg = sum([i.fitness for i in survivors]) / len(survivors)
     if fd != 1 and pd != 1:
         assert pop_fit_avg < surv_fit_avg
+
+
+def test_one_to_one_indices():
+    parent_fitness = np.array([5, 1, 3, 7], dtype=float)
+    offspring_fitness = np.array([4, 2, 9], dtype=float)
+
+    # The last parent has no child and is kept
+    indices = one_to_one_indices(parent_fitness, offspring_fitness)
+    np.testing.assert_array_equal(indices, [0, 5, 6, 3])
+
+    indices = one_to_one_indices(parent_fitness, offspring_fitness, p=1)
+    np.testing.assert_array_equal(indices, [4, 5, 6, 3])
+
+
+def test_elitism_indices():
+    parent_fitness = np.array([5, 1, 3, 7], dtype=float)
+    offspring_fitness = np.array([4, 2, 9, 0, 8], dtype=float)
+
+    np.testing.assert_array_equal(elitism_indices(parent_fitness, offspring_fitness, 1), [3, 6, 8, 4])
+    np.testing.assert_array_equal(cond_elitism_indices(parent_fitness, offspring_fitness, 2), [6, 8, 4, 5])
+    np.testing.assert_array_equal(cond_elitism_indices(parent_fitness, offspring_fitness - 5, 2), [3, 0, 6, 8])
+
+
+def test_mu_lambda_indices():
+    parent_fitness = np.array([5, 1, 3, 7], dtype=float)
+    offspring_fitness = np.array([4, 2, 9, 0, 8], dtype=float)
+
+    np.testing.assert_array_equal(lamb_plus_mu_indices(parent_fitness, offspring_fitness), [6, 8, 3, 0])
+    np.testing.assert_array_equal(lamb_comma_mu_indices(parent_fitness, offspring_fitness), [6, 8, 4, 5])
+
+
+@pytest.mark.parametrize("method", ["Elitism", "CondElitism", "One-to-one", "Prob-one-to-one", "(m+n)", "(m,n)", "Generational"])
+def test_select_population(method):
+    objfunc = Sphere(5)
+    population = Population(objfunc, RAND_GEN.uniform(-10, 10, size=(30, 5))).evaluate()
+    offspring = Population(objfunc, RAND_GEN.uniform(-10, 10, size=(30, 5))).evaluate()
+
+    surv_selection = SurvivorSelection(method, {"amount": 5, "p": 0.1})
+    survivors = surv_selection.select(population, offspring)
+    indices = surv_selection.select_indices(population, offspring)
+
+    assert isinstance(survivors, Population)
+    assert len(survivors) == len(indices) == 30
+    assert np.all(np.isin(survivors.ids, np.concatenate([population.ids, offspring.ids])))
+
+    if method == "(m+n)":
+        all_fitness = np.concatenate([population.fitness, offspring.fitness])
+        np.testing.assert_array_equal(survivors.fitness, np.sort(all_fitness)[::-1][:30])
+
+
+def test_depredation_mask():
+    reef_fitness = np.array([5, 1, -np.inf, 3, 0, 7], dtype=float)
+    occupied = np.array([True, True, False, True, True, True])
+
+    # The two worst corals are always removed with Pd = 1
+    dead = depredation_mask(reef_fitness, occupied, 0.4, 1)
+    np.testing.assert_array_equal(dead, [False, True, False, False, True, False])
+
+    assert not depredation_mask(reef_fitness, occupied, 0.4, 0).any()
+
+    # At least 2 corals are kept
+    dead = depredation_mask(reef_fitness, occupied, 1, 1)
+    np.testing.assert_array_equal(dead, [False, True, False, True, True, False])
+
+
+@pytest.mark.parametrize("attempts", [1, 3])
+def test_cro_indices(attempts):
+    parent_fitness = RAND_GEN.random(20)
+    offspring_fitness = RAND_GEN.random(20) + 1
+
+    indices = cro_indices(parent_fitness, offspring_fitness, 0.2, 0.5, attempts, 30)
+
+    assert np.unique(indices).size == indices.size
+    assert 2 <= indices.size <= 30
+    assert np.all((indices >= 0) & (indices < 40))